@@ -2,12 +2,18 @@ import logging
 import sys
 import typing
 
-from logger import CrashHandler, LogManager, install_crash_handler, setup_logging
+from lib.startup_profiler import profiler
 
-install_crash_handler()
+with profiler.phase("import logger"):
+    from logger import CrashHandler, LogManager, install_crash_handler, setup_logging
 
-from lib.panels.mainWindow import MainWindow  # noqa: E402
-from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: E402
+with profiler.phase("install_crash_handler"):
+    install_crash_handler()
+
+with profiler.phase("import main_window"):
+    from lib.panels.mainWindow import MainWindow  # noqa: E402
+    from lib.perf_hud import hud  # noqa: E402
+    from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: E402
 
 
 class BlocksScreenApp(QtWidgets.QApplication):
@@ -15,6 +21,8 @@ class BlocksScreenApp(QtWidgets.QApplication):
 
     def notify(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:  # type: ignore[override]
         try:
+            if hud.enabled:
+                return hud.notify(super().notify, a0, a1)
             return super().notify(a0, a1)
         except Exception:
             exc_type, exc_value, exc_tb = sys.exc_info()
@@ -64,12 +72,16 @@ if __name__ == "__main__":
     )
     _logger = logging.getLogger(__name__)
     _logger.info("============ BlocksScreen Initializing ============")
-    BlocksScreen = BlocksScreenApp([])
+    with profiler.phase("qapplication"):
+        BlocksScreen = BlocksScreenApp([])
     BlocksScreen.setApplicationName("BlocksScreen")
     BlocksScreen.setApplicationDisplayName("BlocksScreen")
     BlocksScreen.setDesktopFileName("BlocksScreen")
-    main_window = MainWindow()
+    with profiler.phase("main_window"):
+        main_window = MainWindow()
+    profiler.mark("main_window")
     BlocksScreen.processEvents()
     BlocksScreen.aboutToQuit.connect(on_quit)
     main_window.show()
+    profiler.mark("show")
     sys.exit(BlocksScreen.exec())
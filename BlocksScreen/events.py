@@ -452,3 +452,24 @@ class NetworkScan(QEvent):
     def type() -> QEvent.Type:
         """Return event type"""
         return QEvent.Type(NetworkScan.NetworkScanEvent)
+
+
+class WebSocketHandoff(QEvent):
+    """Wakes the GUI thread up to drain queued websocket messages
+
+    Args:
+        data (any): Data or message to pass onto the event
+    """
+
+    WebSocketHandoffEvent = QEvent.Type(QEvent.registerEventType())
+
+    def __init__(self, data=None, *args, **kwargs):
+        super(WebSocketHandoff, self).__init__(WebSocketHandoff.WebSocketHandoffEvent)
+        self.data = data
+        self.args = args
+        self.kwargs = kwargs
+
+    @staticmethod
+    def type() -> QEvent.Type:
+        """Return event type"""
+        return QEvent.Type(WebSocketHandoff.WebSocketHandoffEvent)
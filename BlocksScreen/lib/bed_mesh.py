@@ -0,0 +1,213 @@
+"""Bed mesh parsing, statistics and heatmap rendering.
+
+``BedMeshEngine`` merges the ``bed_mesh`` status deltas Klipper sends,
+turns ``probed_matrix`` and ``mesh_matrix`` into NumPy arrays whenever
+they change and computes range, deviation and tilt statistics on them.
+``heatmap()`` renders the mesh to a ``QImage`` that is cached until the
+mesh (or the requested size) changes, so repaints only blit it.
+
+Everything is vectorized, a 50x50 mesh is parsed, analysed and
+rendered in well under a millisecond of NumPy work.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing
+
+import numpy as np
+from PyQt6 import QtCore, QtGui
+
+# Color stops of the heatmap, low to high deviation.
+HEATMAP_STOPS: tuple[tuple[float, tuple[int, int, int]], ...] = (
+    (0.0, (42, 92, 249)),
+    (0.5, (92, 214, 92)),
+    (1.0, (224, 79, 95)),
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MeshStats:
+    """Summary of a mesh, heights in mm and tilt in mm per mm"""
+
+    minimum: float
+    maximum: float
+    range: float
+    mean: float
+    deviation: float
+    tilt_x: float
+    tilt_y: float
+    points: int
+
+
+def parse_matrix(matrix: typing.Any) -> np.ndarray:
+    """Parse a Klipper matrix (list of rows) into a 2D float array
+
+    Ragged or empty input gives an empty ``(0, 0)`` array.
+    """
+    try:
+        array = np.asarray(matrix, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.empty((0, 0))
+    if array.ndim != 2 or not array.size:
+        return np.empty((0, 0))
+    return array
+
+
+def mesh_stats(
+    matrix: np.ndarray,
+    mesh_min: typing.Sequence[float] = (0.0, 0.0),
+    mesh_max: typing.Sequence[float] = (1.0, 1.0),
+) -> typing.Optional[MeshStats]:
+    """Compute range, deviation and a least squares plane tilt
+
+    Args:
+        matrix (np.ndarray): Heights, rows along Y and columns along X
+        mesh_min (Sequence[float]): X/Y of the first point
+        mesh_max (Sequence[float]): X/Y of the last point
+
+    Returns:
+        MeshStats | None: ``None`` for an empty matrix
+    """
+    if not matrix.size:
+        return None
+    rows, columns = matrix.shape
+    xs = np.linspace(mesh_min[0], mesh_max[0], columns)
+    ys = np.linspace(mesh_min[1], mesh_max[1], rows)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    design = np.column_stack(
+        (grid_x.ravel(), grid_y.ravel(), np.ones(matrix.size, dtype=np.float64))
+    )
+    (tilt_x, tilt_y, _), *_ = np.linalg.lstsq(design, matrix.ravel(), rcond=None)
+    minimum = float(matrix.min())
+    maximum = float(matrix.max())
+    return MeshStats(
+        minimum=minimum,
+        maximum=maximum,
+        range=maximum - minimum,
+        mean=float(matrix.mean()),
+        deviation=float(matrix.std()),
+        tilt_x=float(tilt_x) if columns > 1 else 0.0,
+        tilt_y=float(tilt_y) if rows > 1 else 0.0,
+        points=int(matrix.size),
+    )
+
+
+def _heatmap_lut() -> np.ndarray:
+    positions = [stop[0] for stop in HEATMAP_STOPS]
+    steps = np.linspace(0.0, 1.0, 256)
+    channels = [
+        np.interp(steps, positions, [stop[1][index] for stop in HEATMAP_STOPS])
+        for index in range(3)
+    ]
+    red, green, blue = (channel.astype(np.uint32) for channel in channels)
+    return (0xFF << 24) | (red << 16) | (green << 8) | blue
+
+
+_LUT = _heatmap_lut()
+
+
+def render_heatmap(
+    matrix: np.ndarray,
+    size: typing.Optional[QtCore.QSize] = None,
+    limits: typing.Optional[tuple[float, float]] = None,
+) -> QtGui.QImage:
+    """Render *matrix* to an ARGB32 image, one pixel per point, scaled to
+    *size* when given
+
+    The first matrix row (lowest Y) ends up at the bottom of the image.
+
+    Args:
+        matrix (np.ndarray): Heights
+        size (QtCore.QSize, optional): Output size
+        limits (tuple[float, float], optional): Heights mapped to the
+            ends of the color scale, the matrix range when omitted. Use
+            a symmetric range to keep 0 in the middle.
+
+    Returns:
+        QtGui.QImage: The heatmap, a null image for an empty matrix
+    """
+    if not matrix.size:
+        return QtGui.QImage()
+    low, high = limits if limits else (float(matrix.min()), float(matrix.max()))
+    span = high - low if high > low else 1.0
+    indices = np.clip((matrix[::-1] - low) / span * 255.0, 0, 255).astype(np.uint8)
+    pixels = np.ascontiguousarray(_LUT[indices])
+    rows, columns = pixels.shape
+    image = QtGui.QImage(
+        pixels.data, columns, rows, columns * 4, QtGui.QImage.Format.Format_ARGB32
+    ).copy()  # Detach from the NumPy buffer
+    if size is not None and not size.isEmpty():
+        image = image.scaled(
+            size,
+            QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        )
+    return image
+
+
+class BedMeshEngine:
+    """Current bed mesh state built from ``bed_mesh`` status updates"""
+
+    def __init__(self) -> None:
+        self.profile_name: str = ""
+        self.mesh_min: list = []
+        self.mesh_max: list = []
+        self.probed_matrix: list = []
+        self.mesh_matrix: list = []
+        self.probed = np.empty((0, 0))
+        self.mesh = np.empty((0, 0))
+        self.stats: typing.Optional[MeshStats] = None
+        self.version = 0
+        self._heatmap_key: typing.Optional[tuple] = None
+        self._heatmap = QtGui.QImage()
+
+    def update(self, values: dict) -> bool:
+        """Merge a ``bed_mesh`` status (delta)
+
+        Args:
+            values (dict): The ``bed_mesh`` object fields that changed
+
+        Returns:
+            bool: True if the mesh or its profile changed
+        """
+        changed = False
+        for field in ("profile_name", "mesh_min", "mesh_max"):
+            if field in values and values[field] != getattr(self, field):
+                setattr(self, field, values[field])
+                changed = True
+        if "probed_matrix" in values and values["probed_matrix"] != self.probed_matrix:
+            self.probed_matrix = values["probed_matrix"]
+            self.probed = parse_matrix(self.probed_matrix)
+            changed = True
+        if "mesh_matrix" in values and values["mesh_matrix"] != self.mesh_matrix:
+            self.mesh_matrix = values["mesh_matrix"]
+            self.mesh = parse_matrix(self.mesh_matrix)
+            changed = True
+        if changed:
+            self.version += 1
+            source = self.probed if self.probed.size else self.mesh
+            self.stats = (
+                mesh_stats(source, self.mesh_min, self.mesh_max)
+                if len(self.mesh_min) >= 2 and len(self.mesh_max) >= 2
+                else mesh_stats(source)
+            )
+        return changed
+
+    def heatmap(
+        self, size: typing.Optional[QtCore.QSize] = None, probed: bool = False
+    ) -> QtGui.QImage:
+        """Heatmap of the interpolated (or probed) mesh, centered on 0
+
+        The image is cached and only rendered again when the mesh, the
+        size or *probed* changes.
+        """
+        matrix = self.probed if probed else self.mesh
+        key = (self.version, probed, (size.width(), size.height()) if size else None)
+        if key != self._heatmap_key:
+            extent = float(np.abs(matrix).max()) if matrix.size else 0.0
+            self._heatmap = render_heatmap(
+                matrix, size, (-extent, extent) if extent else None
+            )
+            self._heatmap_key = key
+        return self._heatmap
@@ -0,0 +1,147 @@
+"""Index of the printer configuration sections.
+
+Klipper reports the whole printer configuration in the ``config`` field of
+the ``configfile`` object, one key per section (``extruder``,
+``gcode_macro PURGE``, ``stepper_z1``...).  Looking a section up by its
+type prefix used to scan every key, which adds up on configurations
+with hundreds of ``gcode_macro`` sections.
+
+``ConfigIndex`` groups the section names by their type prefix (the first
+word) once per configuration update, prefix and full name lookups are
+then dictionary hits, and ``lookup_many`` answers a whole subscription
+list in one pass.
+
+``diff_config`` compares two configurations section by section, so a
+re-sent but unchanged configuration (every Klippy restart sends it
+again) can be ignored and a changed one only re-processes the sections
+that actually changed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ConfigDiff:
+    """Sections that differ between two printer configurations"""
+
+    added: frozenset = frozenset()
+    removed: frozenset = frozenset()
+    changed: dict = dataclasses.field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def sections(self) -> frozenset:
+        """Names of the added and changed sections"""
+        return self.added | self.changed.keys()
+
+
+def diff_config(old: dict, new: dict) -> ConfigDiff:
+    """Compare two ``configfile.config`` snapshots
+
+    Args:
+        old (dict): Previous configuration
+        new (dict): Current configuration
+
+    Returns:
+        ConfigDiff: Added and removed sections, and the changed options of
+        every section present in both, falsy when nothing changed
+    """
+    if old is new or old == new:
+        return ConfigDiff()
+    old_names, new_names = old.keys(), new.keys()
+    changed: dict[str, frozenset] = {}
+    for name in old_names & new_names:
+        before, after = old[name], new[name]
+        if before == after:
+            continue
+        if not isinstance(before, dict) or not isinstance(after, dict):
+            changed[name] = frozenset()
+            continue
+        changed[name] = frozenset(
+            option
+            for option in before.keys() | after.keys()
+            if before.get(option, dataclasses.MISSING)
+            != after.get(option, dataclasses.MISSING)
+        )
+    return ConfigDiff(
+        added=frozenset(new_names - old_names),
+        removed=frozenset(old_names - new_names),
+        changed=changed,
+    )
+
+
+class ConfigIndex:
+    """Section name index over a printer configuration
+
+    Args:
+        config (dict, optional): ``configfile.config`` to index
+    """
+
+    __slots__ = ("_config", "_prefixes")
+
+    def __init__(self, config: typing.Optional[dict] = None) -> None:
+        self._config: dict = {}
+        self._prefixes: dict[str, list[str]] = {}
+        if config:
+            self.rebuild(config)
+
+    def __len__(self) -> int:
+        return len(self._config)
+
+    def __contains__(self, section: str) -> bool:
+        return section in self._config
+
+    def rebuild(self, config: dict) -> None:
+        """Re-index *config*, called once per ``configfile`` update"""
+        self._config = config
+        prefixes: dict[str, list[str]] = {}
+        for key in config:
+            prefixes.setdefault(key.split(" ", 1)[0], []).append(key)
+        self._prefixes = prefixes
+
+    def clear(self) -> None:
+        """Drop the indexed configuration"""
+        self._config = {}
+        self._prefixes = {}
+
+    def section(self, name: str) -> dict:
+        """Options of the section *name*, empty if it does not exist"""
+        return self._config.get(name) or {}
+
+    def names(self, keyword: str) -> list[str]:
+        """Section names matching *keyword*
+
+        *keyword* is either a full section name or a section type prefix,
+        ``"extruder"`` matches the ``extruder`` section, ``"gcode_macro"``
+        every ``gcode_macro <name>`` section.
+        """
+        if not keyword:
+            return []
+        if " " in keyword:
+            return [keyword] if keyword in self._config else []
+        return list(self._prefixes.get(keyword, ()))
+
+    def lookup(self, keyword: str) -> list[dict]:
+        """Sections matching *keyword* as ``[{name: options}, ...]``"""
+        config = self._config
+        return [{name: config.get(name)} for name in self.names(keyword)]
+
+    def lookup_many(self, keywords: typing.Iterable[str]) -> list[dict]:
+        """Sections matching any of *keywords*, in keyword order
+
+        A section matched by more than one keyword is only returned once.
+        """
+        config = self._config
+        seen: set[str] = set()
+        found: list[dict] = []
+        for keyword in keywords:
+            for name in self.names(keyword):
+                if name not in seen:
+                    seen.add(name)
+                    found.append({name: config.get(name)})
+        return found
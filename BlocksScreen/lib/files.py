@@ -9,6 +9,7 @@ from pathlib import Path
 
 import events
 from events import ReceivedFileData
+from lib.gcode_metadata import LocalMetadataParser
 from lib.moonrakerComm import MoonWebSocket
 from PyQt6 import QtCore, QtGui, QtWidgets
 
@@ -211,6 +212,8 @@ class Files(QtCore.QObject):
         # Track pending USB preload requests (ordered FIFO queue)
         self._pending_usb_preloads: set[str] = set()
         self._usb_preload_queue: deque[str] = deque()
+        # Parses the slicer comments locally where Moonraker's metascan fails
+        self.local_metadata = LocalMetadataParser(self)
 
         self._connect_signals()
         self._install_event_filter()
@@ -223,6 +226,7 @@ class Files(QtCore.QObject):
         self.request_dir_info[str, bool].connect(self.ws.api.get_dir_information)
         self.request_dir_info[str].connect(self.ws.api.get_dir_information)
         self.request_file_metadata.connect(self.ws.api.get_gcode_metadata)
+        self.local_metadata.parsed.connect(self._on_local_metadata)
 
     def _install_event_filter(self) -> None:
         """Install event filter on application instance."""
@@ -333,7 +337,7 @@ class Files(QtCore.QObject):
         self.file_added.emit(item)
 
         # Request metadata (will update later)
-        self.request_file_metadata.emit(path.removeprefix("/"))
+        self._request_metadata(path.removeprefix("/"))
         logger.info(f"File created: {path}")
 
     def _handle_file_deleted(self, item: dict, _: dict) -> None:
@@ -362,7 +366,7 @@ class Files(QtCore.QObject):
         self._files[path] = item
         self._files_metadata.pop(path.removeprefix("/"), None)
 
-        self.request_file_metadata.emit(path.removeprefix("/"))
+        self._request_metadata(path.removeprefix("/"))
         self.file_modified.emit(item)
         logger.info(f"File modified: {path}")
 
@@ -462,7 +466,7 @@ class Files(QtCore.QObject):
         # Request metadata only for gcode files (async update)
         for path in self._files:
             if path.lower().endswith(self.GCODE_EXTENSION):
-                self.request_file_metadata.emit(path.removeprefix("/"))
+                self._request_metadata(path.removeprefix("/"))
 
     def _process_metadata(self, data: dict) -> None:
         """Process file metadata response."""
@@ -492,11 +496,35 @@ class Files(QtCore.QObject):
         self.fileinfo.emit(metadata.to_dict())
         logger.debug(f"Metadata loaded for: {filename}")
 
+    def _request_metadata(self, filename: str) -> None:
+        """Request a file's metadata, USB files are also parsed locally"""
+        self.request_file_metadata.emit(filename)
+        if self._is_usb_mount(filename.split("/", 1)[0]):
+            self._parse_metadata_locally(filename)
+
+    def _parse_metadata_locally(self, filename: str) -> None:
+        """Parse a file's metadata locally if none was loaded yet"""
+        if filename not in self._files_metadata:
+            self.local_metadata.request(filename, self.gcode_path / filename)
+
+    @QtCore.pyqtSlot(str, dict, list, name="on_local_metadata")
+    def _on_local_metadata(
+        self, filename: str, data: dict, thumbnails: list[QtGui.QImage]
+    ) -> None:
+        """Use locally parsed metadata until Moonraker's arrives"""
+        if filename in self._files_metadata:
+            return
+        metadata = FileMetadata.from_dict(data, thumbnails)
+        self._files_metadata[filename] = metadata
+        self.fileinfo.emit(metadata.to_dict())
+        logger.debug(f"Local metadata loaded for: {filename}")
+
     def handle_metadata_error(self, error_data: typing.Union[str, dict]) -> None:
         """
         Handle metadata request error from Moonraker.
 
-        Parses the filename from the error message and emits metadata_error signal.
+        Parses the filename from the error message, parses the file's
+        metadata locally instead and emits metadata_error signal.
         Called directly from MainWindow error handler.
 
         Args:
@@ -520,6 +548,7 @@ class Files(QtCore.QObject):
         if start > 0 and end > start:
             filename = text[start:end]
             clean_filename = filename.removeprefix("/")
+            self._parse_metadata_locally(clean_filename)
             self.metadata_error.emit(clean_filename)
             logger.debug(f"Metadata error for: {clean_filename}")
 
@@ -568,7 +597,7 @@ class Files(QtCore.QObject):
 
                 full_path = f"{usb_path}/{filename}"
                 if filename.lower().endswith(self.GCODE_EXTENSION):
-                    self.request_file_metadata.emit(full_path)
+                    self._request_metadata(full_path)
 
         # Cache the files
         self._usb_files_cache[usb_path] = files
@@ -615,7 +644,7 @@ class Files(QtCore.QObject):
         # Request metadata only for gcode files (async update)
         for filename in self._files:
             if filename.lower().endswith(self.GCODE_EXTENSION):
-                self.request_file_metadata.emit(filename.removeprefix("/"))
+                self._request_metadata(filename.removeprefix("/"))
 
     @QtCore.pyqtSlot(str, str, name="on_request_delete_file")
     def on_request_delete_file(self, filename: str, directory: str = "gcodes") -> None:
@@ -639,7 +668,7 @@ class Files(QtCore.QObject):
         if cached:
             self.fileinfo.emit(cached.to_dict())
         else:
-            self.request_file_metadata.emit(clean_filename)
+            self._request_metadata(clean_filename)
 
     @QtCore.pyqtSlot(name="get_dir_info")
     @QtCore.pyqtSlot(str, name="get_dir_info")
@@ -0,0 +1,157 @@
+"""Frame tick scheduler for widget updates.
+
+Printer objects report several times a second and each report used to
+``setText`` or ``update`` the widgets straight from the signal handler,
+so a busy Moonraker connection repainted the temperature displays many
+more times than the screen could show them.  Handlers now hand the new
+value to ``frames`` instead::
+
+    frames.set(self.bed_display, "text", f"{temperature:.1f}")
+    frames.set(self.bed_display, "secondary_text", f"{target:.0f}")
+    frames.update(self.label)
+
+Only the latest value of each widget property is kept and all of them
+are applied together once per tick.  A value equal to what the widget
+already shows is dropped, as are updates of widgets deleted in the
+meantime.  Ticks only run while something is pending and stop while the
+screen is blanked, pending values are applied on wake up.
+
+The rate is set in ``BlocksScreen.cfg``::
+
+    [frame_scheduler]
+    rate: 30
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+
+from PyQt6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 30.0
+# Key of a pending ``update()`` call, not a property
+UPDATE = "__update__"
+
+
+def _current(target: QtCore.QObject, key: str) -> typing.Any:
+    """Value *target* shows for *key*, through ``key()`` or the attribute"""
+    value = getattr(target, key)
+    return value() if callable(value) else value
+
+
+def _apply(target: QtCore.QObject, key: str, value: typing.Any) -> None:
+    """Apply *value* through ``setKey`` when it exists, else the attribute"""
+    setter = getattr(target, f"set{key[:1].upper()}{key[1:]}", None)
+    if callable(setter):
+        setter(value)
+    else:
+        setattr(target, key, value)
+
+
+class FrameScheduler(QtCore.QObject):
+    """Applies the latest value of each dirty widget property once per tick
+
+    Args:
+        rate (float): Ticks per second
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE) -> None:
+        super().__init__()
+        self._pending: dict[tuple[int, str], tuple[QtCore.QObject, typing.Any]] = {}
+        self._paused = False
+        self.requested = 0
+        self.applied = 0
+        self.skipped = 0
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.flush)
+        self.rate = rate
+
+    @property
+    def rate(self) -> float:
+        """Ticks per second"""
+        return 1000.0 / self._timer.interval()
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        self._timer.setInterval(max(1, round(1000.0 / max(rate, 1.0))))
+
+    @property
+    def paused(self) -> bool:
+        """Whether ticks are stopped, see ``set_paused``"""
+        return self._paused
+
+    @property
+    def pending(self) -> int:
+        """Number of widget properties waiting for the next tick"""
+        return len(self._pending)
+
+    def configure(self, config: typing.Any) -> None:
+        """Apply the ``[frame_scheduler]`` section
+
+        Args:
+            config: ``BlocksScreenConfig`` of the whole file
+        """
+        section = config.get_section("frame_scheduler", fallback=None)
+        if section is None:
+            return
+        self.rate = section.getfloat("rate", default=DEFAULT_RATE)
+
+    def set(self, target: QtCore.QObject, key: str, value: typing.Any) -> None:
+        """Show *value* as the *key* of *target* on the next tick
+
+        *key* is applied with ``target.setKey(value)`` when that method
+        exists and assigned as an attribute otherwise.
+        """
+        self.requested += 1
+        self._pending[(id(target), key)] = (target, value)
+        self._schedule()
+
+    def update(self, target: QtCore.QObject) -> None:
+        """Call ``target.update()`` on the next tick"""
+        self.requested += 1
+        self._pending[(id(target), UPDATE)] = (target, None)
+        self._schedule()
+
+    def discard(self, target: QtCore.QObject) -> None:
+        """Forget the pending values of *target*"""
+        for key in [key for key in self._pending if key[0] == id(target)]:
+            del self._pending[key]
+
+    @QtCore.pyqtSlot(bool, name="set-paused")
+    def set_paused(self, paused: bool) -> None:
+        """Stop ticking while *paused*, apply what is pending on resume"""
+        self._paused = paused
+        if paused:
+            self._timer.stop()
+        elif self._pending:
+            self.flush()
+
+    @QtCore.pyqtSlot(name="flush")
+    def flush(self) -> None:
+        """Apply every pending value now"""
+        pending, self._pending = self._pending, {}
+        for (_, key), (target, value) in pending.items():
+            try:
+                if key == UPDATE:
+                    target.update()
+                elif _current(target, key) == value:
+                    self.skipped += 1
+                    continue
+                else:
+                    _apply(target, key, value)
+            except RuntimeError:
+                # Deleted on the C++ side since it was scheduled
+                continue
+            self.applied += 1
+
+    def _schedule(self) -> None:
+        if not self._paused and not self._timer.isActive():
+            self._timer.start()
+
+
+frames = FrameScheduler()
@@ -0,0 +1,259 @@
+"""Byte offset to layer index of gcode files.
+
+Klipper reports how far into the file the print is
+(``virtual_sdcard.file_position``) but not which layer that is, unless
+the slicer emits ``SET_PRINT_STATS_INFO``.  Dividing the Z position by
+the layer height is wrong with variable layer heights, z-hop and
+sequentially printed objects.
+
+``build_layer_index`` memory maps the file and records the byte offset
+at which every layer starts, with its Z, in two NumPy arrays.  Layer
+change comments (``;LAYER_CHANGE`` from PrusaSlicer and OrcaSlicer,
+``;LAYER:<n>`` from Cura) are found with a single regex scan of the map.
+Files without them fall back to following the moves: a layer starts
+where the first extruding move at a new Z was set, travel moves (z-hop)
+never start one.  The current layer is then a binary search on
+``file_position``.
+
+``GcodeLayerIndexer`` builds indexes in a background thread and caches
+them per file version (path, size and modification time).
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import dataclasses
+import logging
+import mmap
+import os
+import re
+import threading
+import typing
+
+import numpy as np
+from PyQt6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+LAYER_MARKER = re.compile(rb"^;(?:LAYER_CHANGE|LAYER:-?\d+)[^\n]*", re.MULTILINE)
+MARKER_Z = re.compile(rb"^;Z:(-?[\d.]+)", re.MULTILINE)
+MOVE_Z = re.compile(rb"^G[0-3][^\n;]*?Z(-?[\d.]+)", re.MULTILINE)
+COMMAND = re.compile(rb"^(G[0-3]|G92|M82|M83)(?![\d.])([^\n;]*)", re.MULTILINE)
+AXIS = re.compile(rb"([ZE])(-?[\d.]+)")
+
+# How far after a layer marker its Z is looked for
+MARKER_Z_WINDOW: int = 64 * 1024
+# Z changes smaller than this do not start a new layer
+Z_TOLERANCE: float = 1e-4
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class LayerIndex:
+    """Start offset and Z of every layer of a gcode file"""
+
+    offsets: np.ndarray  # int64, ascending
+    heights: np.ndarray  # float32, NaN when unknown
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def layer_at(self, position: int) -> int:
+        """Layer being printed at byte *position*, 1 based
+
+        Returns:
+            int: 0 before the first layer starts
+        """
+        return int(np.searchsorted(self.offsets, position, side="right"))
+
+    def height(self, layer: int) -> float:
+        """Z of the 1 based *layer*, NaN if unknown"""
+        if not 1 <= layer <= len(self.offsets):
+            return float("nan")
+        return float(self.heights[layer - 1])
+
+
+def _check(number: int, cancelled: typing.Optional[threading.Event]) -> None:
+    if number & 0xFFF == 0 and cancelled is not None and cancelled.is_set():
+        raise InterruptedError("Layer indexing cancelled")
+
+
+def _marker_layers(
+    data: typing.Any, cancelled: typing.Optional[threading.Event] = None
+) -> typing.Optional[LayerIndex]:
+    offsets: list[int] = []
+    heights: list[float] = []
+    for number, marker in enumerate(LAYER_MARKER.finditer(data)):
+        _check(number, cancelled)
+        start = marker.start()
+        end = min(len(data), marker.end() + MARKER_Z_WINDOW)
+        match = MARKER_Z.search(data, marker.end(), end) or MOVE_Z.search(
+            data, marker.end(), end
+        )
+        offsets.append(start)
+        heights.append(float(match.group(1)) if match else float("nan"))
+    if not offsets:
+        return None
+    return LayerIndex(
+        np.asarray(offsets, dtype=np.int64), np.asarray(heights, dtype=np.float32)
+    )
+
+
+def _move_layers(
+    data: typing.Any, cancelled: typing.Optional[threading.Event] = None
+) -> LayerIndex:
+    offsets: list[int] = []
+    heights: list[float] = []
+    relative_e = False
+    z = 0.0
+    z_offset = 0  # Where the current Z was set
+    e = 0.0
+    layer_z: typing.Optional[float] = None
+    for number, match in enumerate(COMMAND.finditer(data)):
+        _check(number, cancelled)
+        command = match.group(1)
+        if command == b"M82":
+            relative_e = False
+            continue
+        if command == b"M83":
+            relative_e = True
+            continue
+        axes = dict(AXIS.findall(match.group(2)))
+        if command == b"G92":
+            if not match.group(2).strip():  # A bare G92 zeroes every axis
+                axes = {b"Z": b"0", b"E": b"0"}
+            if b"E" in axes:
+                e = float(axes[b"E"])
+            if b"Z" in axes:
+                # The nozzle does not move, only the coordinates shift
+                new_z = float(axes[b"Z"])
+                if layer_z is not None:
+                    layer_z += new_z - z
+                z = new_z
+            continue
+        if b"Z" in axes:
+            new_z = float(axes[b"Z"])
+            if new_z != z:
+                z = new_z
+                z_offset = match.start()
+        if b"E" not in axes:
+            continue
+        value = float(axes[b"E"])
+        extruding = value > 0.0 if relative_e else value > e
+        if not relative_e:
+            e = value
+        if extruding and (layer_z is None or abs(z - layer_z) > Z_TOLERANCE):
+            layer_z = z
+            offsets.append(z_offset)
+            heights.append(z)
+    return LayerIndex(
+        np.asarray(offsets, dtype=np.int64), np.asarray(heights, dtype=np.float32)
+    )
+
+
+def build_layer_index(
+    path: typing.Union[str, os.PathLike],
+    cancelled: typing.Optional[threading.Event] = None,
+) -> LayerIndex:
+    """Index the layers of the gcode file at *path*
+
+    Args:
+        path (str | os.PathLike): The gcode file
+        cancelled (threading.Event, optional): Stops indexing when set
+
+    Raises:
+        OSError: The file can not be read
+        InterruptedError: *cancelled* was set
+    """
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            return _move_layers(b"")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _marker_layers(data, cancelled) or _move_layers(data, cancelled)
+
+
+def file_version(path: typing.Union[str, os.PathLike]) -> tuple[str, int, int]:
+    """Cache key of the current version of the file at *path*"""
+    stat = os.stat(path)
+    return os.fspath(path), stat.st_size, stat.st_mtime_ns
+
+
+class GcodeLayerIndexer(QtCore.QObject):
+    """Builds layer indexes in the background and caches them
+
+    Args:
+        parent (QtCore.QObject, optional): Parent object
+        cache_size (int): Number of file versions kept
+    """
+
+    index_ready: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        str, "PyQt_PyObject", name="index_ready"
+    )
+
+    def __init__(
+        self, parent: typing.Optional[QtCore.QObject] = None, cache_size: int = 8
+    ) -> None:
+        super().__init__(parent)
+        self.cache_size = cache_size
+        self._cache: collections.OrderedDict[tuple, LayerIndex] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._pending: set[tuple] = set()
+        self._cancelled = threading.Event()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="GcodeLayerIndexer"
+        )
+
+    def get(self, path: str) -> typing.Optional[LayerIndex]:
+        """Cached index of the current version of *path*, if built"""
+        try:
+            key = file_version(path)
+        except OSError:
+            return None
+        with self._lock:
+            index = self._cache.get(key)
+            if index is not None:
+                self._cache.move_to_end(key)
+            return index
+
+    def request(self, path: str) -> None:
+        """Emit ``index_ready`` for *path*, building the index if needed"""
+        try:
+            key = file_version(path)
+        except OSError as e:
+            logger.debug("Unable to index %s: %s", path, e)
+            return
+        index = self.get(path)
+        if index is not None:
+            self.index_ready.emit(path, index)
+            return
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        self._executor.submit(self._build, key)
+
+    def _build(self, key: tuple) -> None:
+        path = key[0]
+        try:
+            index = build_layer_index(path, self._cancelled)
+        except InterruptedError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug("Unable to index %s: %s", path, e)
+            return
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+        with self._lock:
+            self._cache[key] = index
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        logger.debug("Indexed %d layers of %s", len(index), path)
+        self.index_ready.emit(path, index)
+
+    def shutdown(self) -> None:
+        """Stop the worker thread, the running and pending builds are dropped"""
+        self._cancelled.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
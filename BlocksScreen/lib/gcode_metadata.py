@@ -0,0 +1,312 @@
+"""Local gcode metadata parser.
+
+Moonraker's ``server.files.metadata`` needs a metascan of the file
+first, which lags, or fails, for files that were just uploaded or sit
+on a USB drive.  Slicers write everything the files page shows into the
+comments at the start and end of the file, so ``parse_gcode_metadata``
+memory maps the file and only reads its first ``HEAD_BYTES`` and last
+``TAIL_BYTES``.  It understands PrusaSlicer (and SuperSlicer), OrcaSlicer
+(and Bambu Studio) and Cura comments, returns the same keys Moonraker
+uses and decodes the embedded base64 thumbnails.
+
+``LocalMetadataParser`` runs the parser in a small worker pool and
+caches the results per file version.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import collections
+import concurrent.futures
+import logging
+import mmap
+import os
+import re
+import threading
+import typing
+
+from PyQt6 import QtCore, QtGui
+
+logger = logging.getLogger(__name__)
+
+HEAD_BYTES: int = 384 * 1024
+TAIL_BYTES: int = 256 * 1024
+
+SLICER = re.compile(
+    rb"^;\s*(?:generated by|Generated with)\s+([A-Za-z_ ]+?)[ _]v?(\d[\w.\-+]*)",
+    re.MULTILINE | re.IGNORECASE,
+)
+# ``; key = value`` (PrusaSlicer, OrcaSlicer) and ``;KEY:value`` (Cura, and
+# some OrcaSlicer summary lines)
+KEY_VALUE = re.compile(rb"^;\s*([\w \[\]().-]+?)\s*=\s*([^\r\n]*)", re.MULTILINE)
+CURA_VALUE = re.compile(rb"^;\s*([A-Za-z_][\w .\[\]]*?)\s*:([^\r\n]*)", re.MULTILINE)
+ORCA_TIME = re.compile(rb"^;.*total estimated time:\s*([^\r\n;]+)", re.MULTILINE)
+ORCA_LAYERS = re.compile(rb"^;\s*total layer number:\s*(\d+)", re.MULTILINE)
+LAYER_Z = re.compile(rb"^;Z:(-?[\d.]+)", re.MULTILINE)
+THUMBNAIL = re.compile(
+    rb"^;\s*thumbnail(?:_(?:PNG|JPG|QOI))?\s+begin\s+(\d+)x(\d+)\s+\d+\s*$"
+    rb"(.*?)^;\s*thumbnail(?:_(?:PNG|JPG|QOI))?\s+end",
+    re.MULTILINE | re.DOTALL,
+)
+DURATION = re.compile(r"(\d+(?:\.\d+)?)\s*([dhms])")
+
+# Comment keys, lower case, mapped to the Moonraker metadata field
+KEY_FIELDS: dict[str, str] = {
+    # PrusaSlicer / SuperSlicer
+    "estimated printing time (normal mode)": "estimated_time",
+    "filament_type": "filament_type",
+    "filament used [mm]": "filament_total",
+    "filament used [g]": "filament_weight_total",
+    "total filament used [g]": "filament_weight_total",
+    "layer_height": "layer_height",
+    "first_layer_height": "first_layer_height",
+    "first_layer_temperature": "first_layer_extruder_temp",
+    "first_layer_bed_temperature": "first_layer_bed_temp",
+    "chamber_temperature": "chamber_temp",
+    "nozzle_diameter": "nozzle_diameter",
+    "filament_settings_id": "filament_name",
+    # OrcaSlicer / Bambu Studio
+    "total filament length [mm]": "filament_total",
+    "total filament weight [g]": "filament_weight_total",
+    "initial_layer_print_height": "first_layer_height",
+    "nozzle_temperature_initial_layer": "first_layer_extruder_temp",
+    "hot_plate_temp_initial_layer": "first_layer_bed_temp",
+    "chamber_temperatures": "chamber_temp",
+    # Cura
+    "time": "estimated_time",
+    "filament used": "filament_total",
+    "layer height": "layer_height",
+    "layer_count": "layer_count",
+    "maxz": "object_height",
+    "extruder_train.0.initial_temperature": "first_layer_extruder_temp",
+    "build_plate.initial_temperature": "first_layer_bed_temp",
+    "extruder_train.0.nozzle.diameter": "nozzle_diameter",
+    "extruder_train.0.material.name": "filament_name",
+    "material.type": "filament_type",
+}
+
+NUMERIC_FIELDS: frozenset[str] = frozenset(
+    {
+        "filament_total",
+        "filament_weight_total",
+        "layer_height",
+        "first_layer_height",
+        "first_layer_extruder_temp",
+        "first_layer_bed_temp",
+        "chamber_temp",
+        "nozzle_diameter",
+        "object_height",
+    }
+)
+
+
+def parse_duration(text: str) -> int:
+    """Seconds in a slicer duration, ``"1d 2h 3m 4s"`` or plain seconds"""
+    text = text.strip()
+    try:
+        return int(float(text))
+    except ValueError:
+        pass
+    factors = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+    return int(
+        sum(float(value) * factors[unit] for value, unit in DURATION.findall(text))
+    )
+
+
+def _first_number(text: str) -> typing.Optional[float]:
+    """First number of a possibly comma separated (multi extruder) value"""
+    match = re.search(r"-?\d+(?:\.\d+)?", text)
+    return float(match.group()) if match else None
+
+
+def _convert(field: str, key: str, value: str) -> typing.Any:
+    if field == "estimated_time":
+        return parse_duration(value)
+    if field == "layer_count":
+        return int(value) if value.strip().isdigit() else None
+    if field == "filament_total" and key == "filament used":
+        # Cura reports meters, ``1.234m``
+        number = _first_number(value)
+        return number * 1000.0 if number is not None else None
+    if field in NUMERIC_FIELDS:
+        return _first_number(value)
+    return value.strip().strip('"').split(";")[0] or None
+
+
+def _gcode_bounds(head: bytes, tail: bytes, tail_start: int) -> tuple[int, int]:
+    """Byte range of the gcode between the header and footer comments"""
+    if not tail:  # The whole file fits in the head
+        tail, tail_start = head, 0
+    start = 0
+    for line in head.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped and not stripped.startswith(b";"):
+            break
+        start += len(line)
+    end = tail_start + len(tail)
+    for line in reversed(tail.splitlines(keepends=True)):
+        stripped = line.strip()
+        if stripped and not stripped.startswith(b";"):
+            break
+        end -= len(line)
+    return start, max(start, end)
+
+
+def decode_thumbnails(data: bytes) -> list[QtGui.QImage]:
+    """Decode the embedded thumbnails, smallest first"""
+    images = []
+    for match in THUMBNAIL.finditer(data):
+        encoded = b"".join(
+            line.strip().lstrip(b";").strip() for line in match.group(3).splitlines()
+        )
+        try:
+            raw = base64.b64decode(encoded, validate=False)
+        except (binascii.Error, ValueError):
+            continue
+        image = QtGui.QImage()
+        if image.loadFromData(raw):
+            images.append(image)
+    images.sort(key=lambda image: image.width() * image.height())
+    return images
+
+
+def parse_gcode_metadata(
+    path: typing.Union[str, os.PathLike],
+    head_bytes: int = HEAD_BYTES,
+    tail_bytes: int = TAIL_BYTES,
+) -> tuple[dict, list[QtGui.QImage]]:
+    """Parse the slicer metadata of the gcode file at *path*
+
+    Args:
+        path (str | os.PathLike): The gcode file
+        head_bytes (int): Bytes read from the start of the file
+        tail_bytes (int): Bytes read from the end of the file
+
+    Returns:
+        tuple[dict, list[QtGui.QImage]]: Metadata with Moonraker's keys,
+        only the fields found, and the thumbnails
+
+    Raises:
+        OSError: The file can not be read
+    """
+    with open(path, "rb") as file:
+        stat = os.fstat(file.fileno())
+        size = stat.st_size
+        if not size:
+            head = tail = b""
+            tail_start = 0
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                head = data[:head_bytes]
+                tail_start = max(len(head), size - tail_bytes)
+                tail = data[tail_start:]
+    metadata: dict[str, typing.Any] = {
+        "size": size,
+        "modified": stat.st_mtime,
+    }
+    match = SLICER.search(head)
+    if match:
+        metadata["slicer"] = match.group(1).decode(errors="replace").strip()
+        metadata["slicer_version"] = match.group(2).decode(errors="replace")
+    for chunk in (head, tail):
+        for pattern in (KEY_VALUE, CURA_VALUE):
+            for key, value in pattern.findall(chunk):
+                name = key.decode(errors="replace").strip().lower()
+                field = KEY_FIELDS.get(name)
+                if field is None or field in metadata:
+                    continue
+                converted = _convert(field, name, value.decode(errors="replace"))
+                if converted is not None:
+                    metadata[field] = converted
+    if "estimated_time" not in metadata:
+        match = ORCA_TIME.search(head) or ORCA_TIME.search(tail)
+        if match:
+            metadata["estimated_time"] = parse_duration(match.group(1).decode())
+    if "layer_count" not in metadata:
+        match = ORCA_LAYERS.search(head) or ORCA_LAYERS.search(tail)
+        if match:
+            metadata["layer_count"] = int(match.group(1))
+    if "object_height" not in metadata:
+        heights = LAYER_Z.findall(tail or head)
+        if heights:
+            metadata["object_height"] = float(heights[-1])
+    if size:
+        start, end = _gcode_bounds(head, tail, tail_start)
+        metadata["gcode_start_byte"] = start
+        metadata["gcode_end_byte"] = end
+    return metadata, decode_thumbnails(head)
+
+
+class LocalMetadataParser(QtCore.QObject):
+    """Parses gcode metadata in a worker pool
+
+    Args:
+        parent (QtCore.QObject, optional): Parent object
+        max_workers (int): Files parsed concurrently
+        cache_size (int): Parsed file versions kept
+    """
+
+    parsed: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        str, dict, list, name="parsed"
+    )
+
+    def __init__(
+        self,
+        parent: typing.Optional[QtCore.QObject] = None,
+        max_workers: int = 2,
+        cache_size: int = 512,
+    ) -> None:
+        super().__init__(parent)
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._cache: collections.OrderedDict[tuple, tuple[dict, list]] = (
+            collections.OrderedDict()
+        )
+        self._pending: set[tuple] = set()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="LocalMetadataParser"
+        )
+
+    def request(self, filename: str, path: typing.Union[str, os.PathLike]) -> bool:
+        """Parse *path* and emit ``parsed`` with *filename*
+
+        Returns:
+            bool: False if the file does not exist locally
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        key = (os.fspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                if key in self._pending:
+                    return True
+                self._pending.add(key)
+        if cached is not None:
+            self.parsed.emit(filename, *cached)
+            return True
+        self._executor.submit(self._parse, filename, key)
+        return True
+
+    def _parse(self, filename: str, key: tuple) -> None:
+        try:
+            metadata, thumbnails = parse_gcode_metadata(key[0])
+        except (OSError, ValueError) as e:
+            logger.debug("Unable to parse metadata of %s: %s", filename, e)
+            return
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+        metadata["filename"] = filename
+        with self._lock:
+            self._cache[key] = (metadata, thumbnails)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        self.parsed.emit(filename, metadata, thumbnails)
+
+    def shutdown(self) -> None:
+        """Stop the workers, pending files are dropped"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
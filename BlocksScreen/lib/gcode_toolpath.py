@@ -0,0 +1,402 @@
+"""Streaming gcode toolpath parser with an on-disk cache.
+
+``parse_toolpath`` reads a gcode file line by line, keeping only the
+current layer in Python lists, and turns the ``G0``/``G1`` moves and the
+``G2``/``G3`` arcs (linearized) into XY segments.  Every layer is flushed
+into NumPy arrays as soon as the next one starts, so memory stays
+bounded on 200 MB files.  The layers are the ones ``gcode_layers``
+finds, slicer layer markers first, so the preview and the job page
+count layers alike, and the layer being printed can be found from
+``virtual_sdcard.file_position``.
+
+``ToolpathLoader`` parses in a worker thread and stores the arrays as an
+``.npz`` file per file version, browsing layers afterwards only slices
+the cached arrays.  A new request on a channel cancels the parse of the
+file the channel asked for before.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import dataclasses
+import hashlib
+import logging
+import math
+import os
+import pathlib
+import re
+import threading
+import typing
+
+import numpy as np
+from lib.gcode_layers import build_layer_index
+from PyQt6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached arrays change meaning
+CACHE_FORMAT: int = 2
+DEFAULT_CACHE_DIR = pathlib.Path("~/.cache/BlocksScreen/toolpaths")
+COMMAND = re.compile(rb"([GM]\d+)(?![\d.])")
+WORD = re.compile(rb"([XYZEIJ])\s*(-?\d*\.?\d+)")
+# Arcs are split in chords of at most this angle
+ARC_STEP: float = math.radians(10.0)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Toolpath:
+    """XY segments of every layer of a gcode file"""
+
+    segments: np.ndarray  # float32 (N, 4): x0, y0, x1, y1
+    extruding: np.ndarray  # bool (N,)
+    layer_starts: np.ndarray  # int64 (layers + 1,): segment ranges
+    heights: np.ndarray  # float32 (layers,), NaN when unknown
+    offsets: np.ndarray  # int64 (layers,): byte offset of each layer
+    bounds: np.ndarray  # float32 (4,): min x, min y, max x, max y
+
+    def __len__(self) -> int:
+        return len(self.heights)
+
+    def layer(self, layer: int) -> tuple[np.ndarray, np.ndarray]:
+        """Segments and extrusion flags of the 1 based *layer*"""
+        if not 1 <= layer <= len(self):
+            empty = np.empty((0, 4), dtype=np.float32)
+            return empty, np.empty(0, dtype=bool)
+        start, end = self.layer_starts[layer - 1], self.layer_starts[layer]
+        return self.segments[start:end], self.extruding[start:end]
+
+    def layer_at(self, position: int) -> int:
+        """Layer being printed at byte *position*, 0 before the first one"""
+        return int(np.searchsorted(self.offsets, position, side="right"))
+
+    def save(self, path: typing.Union[str, os.PathLike]) -> None:
+        """Store the arrays, uncompressed so loading is a plain read"""
+        np.savez(
+            path, **{f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+        )
+
+    @classmethod
+    def load(cls, path: typing.Union[str, os.PathLike]) -> Toolpath:
+        """Load arrays stored by ``save``"""
+        with np.load(path) as data:
+            return cls(**{f.name: data[f.name] for f in dataclasses.fields(cls)})
+
+
+def _arc(
+    x: float, y: float, end_x: float, end_y: float, i: float, j: float, clockwise: bool
+) -> list[tuple[float, float]]:
+    """Points along a ``G2``/``G3`` arc, the end point included"""
+    center_x, center_y = x + i, y + j
+    radius = math.hypot(i, j)
+    start = math.atan2(y - center_y, x - center_x)
+    end = math.atan2(end_y - center_y, end_x - center_x)
+    sweep = end - start
+    if clockwise and sweep >= 0.0:
+        sweep -= 2.0 * math.pi
+    elif not clockwise and sweep <= 0.0:
+        sweep += 2.0 * math.pi
+    steps = max(1, math.ceil(abs(sweep) / ARC_STEP))
+    points = [
+        (
+            center_x + radius * math.cos(start + sweep * step / steps),
+            center_y + radius * math.sin(start + sweep * step / steps),
+        )
+        for step in range(1, steps)
+    ]
+    points.append((end_x, end_y))
+    return points
+
+
+class _Builder:
+    """Accumulates the current layer and flushes finished ones to arrays"""
+
+    def __init__(self) -> None:
+        self.chunks: list[np.ndarray] = []
+        self.flags: list[np.ndarray] = []
+        self.layer_starts: list[int] = [0]
+        self.heights: list[float] = []
+        self.offsets: list[int] = []
+        self.segments: list[tuple[float, float, float, float]] = []
+        self.extruding: list[bool] = []
+        self.count = 0
+
+    def flush(self) -> None:
+        if self.segments:
+            self.chunks.append(np.asarray(self.segments, dtype=np.float32))
+            self.flags.append(np.asarray(self.extruding, dtype=bool))
+            self.count += len(self.segments)
+            self.segments = []
+            self.extruding = []
+
+    def new_layer(self, z: float, offset: int) -> None:
+        self.flush()
+        if self.heights:
+            self.layer_starts.append(self.count)
+        self.heights.append(z)
+        self.offsets.append(offset)
+
+    def build(self) -> Toolpath:
+        self.flush()
+        if self.heights:
+            self.layer_starts.append(self.count)
+        segments = (
+            np.concatenate(self.chunks) if self.chunks else np.empty((0, 4), np.float32)
+        )
+        extruding = np.concatenate(self.flags) if self.flags else np.empty(0, bool)
+        printed = segments[extruding]
+        if len(printed):
+            xs = np.concatenate((printed[:, 0], printed[:, 2]))
+            ys = np.concatenate((printed[:, 1], printed[:, 3]))
+            bounds = np.array([xs.min(), ys.min(), xs.max(), ys.max()], np.float32)
+        else:
+            bounds = np.zeros(4, np.float32)
+        return Toolpath(
+            segments=segments,
+            extruding=extruding,
+            layer_starts=np.asarray(self.layer_starts, dtype=np.int64),
+            heights=np.asarray(self.heights, dtype=np.float32),
+            offsets=np.asarray(self.offsets, dtype=np.int64),
+            bounds=bounds,
+        )
+
+
+def parse_toolpath(
+    path: typing.Union[str, os.PathLike],
+    cancelled: typing.Optional[threading.Event] = None,
+) -> Toolpath:
+    """Parse the moves of the gcode file at *path*
+
+    The layers are split where ``build_layer_index`` says they start.
+    Moves before the first layer belong to it.
+
+    Args:
+        path (str | os.PathLike): The gcode file
+        cancelled (threading.Event, optional): Stops parsing when set
+
+    Raises:
+        OSError: The file can not be read
+        InterruptedError: *cancelled* was set
+    """
+    index = build_layer_index(path, cancelled)
+    starts = index.offsets.tolist()
+    heights = index.heights.tolist()
+    builder = _Builder()
+    x = y = z = e = 0.0
+    relative = relative_e = False
+    offset = 0
+    with open(path, "rb") as file:
+        for number, line in enumerate(file):
+            line_offset = offset
+            offset += len(line)
+            if number & 0xFFFF == 0 and cancelled is not None and cancelled.is_set():
+                raise InterruptedError(path)
+            while len(builder.heights) < len(starts) and (
+                line_offset >= starts[len(builder.heights)]
+            ):
+                layer = len(builder.heights)
+                builder.new_layer(heights[layer], starts[layer])
+            line = line.lstrip()
+            match = COMMAND.match(line)
+            if match is None:
+                continue
+            command = match.group(1)
+            arguments = line[match.end() :].split(b";", 1)[0]
+            if command in (b"G0", b"G1", b"G2", b"G3"):
+                words = {key: float(value) for key, value in WORD.findall(arguments)}
+            elif command == b"G90":
+                relative = False
+                continue
+            elif command == b"G91":
+                relative = True
+                continue
+            elif command == b"M82":
+                relative_e = False
+                continue
+            elif command == b"M83":
+                relative_e = True
+                continue
+            elif command == b"G92":
+                words = {key: float(value) for key, value in WORD.findall(arguments)}
+                if not arguments.strip():  # A bare G92 zeroes every axis
+                    words = {b"X": 0.0, b"Y": 0.0, b"Z": 0.0, b"E": 0.0}
+                x = words.get(b"X", x)
+                y = words.get(b"Y", y)
+                z = words.get(b"Z", z)
+                e = words.get(b"E", e)
+                continue
+            else:
+                continue
+            new_x = x + words.get(b"X", 0.0) if relative else words.get(b"X", x)
+            new_y = y + words.get(b"Y", 0.0) if relative else words.get(b"Y", y)
+            if b"Z" in words:
+                z = z + words[b"Z"] if relative else words[b"Z"]
+            extruding = False
+            if b"E" in words:
+                value = words[b"E"]
+                if relative_e or relative:
+                    extruding = value > 0.0
+                else:
+                    extruding = value > e
+                    e = value
+            if extruding and builder.heights and math.isnan(builder.heights[-1]):
+                builder.heights[-1] = z  # The marker had no Z
+            if command in (b"G2", b"G3"):
+                points = _arc(
+                    x,
+                    y,
+                    new_x,
+                    new_y,
+                    words.get(b"I", 0.0),
+                    words.get(b"J", 0.0),
+                    command == b"G2",
+                )
+                last_x, last_y = x, y
+                for point_x, point_y in points:
+                    builder.segments.append((last_x, last_y, point_x, point_y))
+                    builder.extruding.append(extruding)
+                    last_x, last_y = point_x, point_y
+            elif new_x != x or new_y != y:
+                builder.segments.append((x, y, new_x, new_y))
+                builder.extruding.append(extruding)
+            x, y = new_x, new_y
+    return builder.build()
+
+
+def cache_key(path: typing.Union[str, os.PathLike]) -> str:
+    """Name of the cache file for the current version of *path*"""
+    stat = os.stat(path)
+    identity = f"{os.path.realpath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return f"{hashlib.sha1(identity.encode()).hexdigest()}-{CACHE_FORMAT}.npz"
+
+
+class ToolpathLoader(QtCore.QObject):
+    """Loads toolpaths from the disk cache or parses them in the background
+
+    Args:
+        parent (QtCore.QObject, optional): Parent object
+        cache_dir (str | os.PathLike): Directory of the cached arrays
+        max_cache_bytes (int): Oldest cache files are removed above this
+        memory_items (int): Toolpaths also kept in memory
+    """
+
+    toolpath_ready: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        str, "PyQt_PyObject", name="toolpath_ready"
+    )
+
+    def __init__(
+        self,
+        parent: typing.Optional[QtCore.QObject] = None,
+        cache_dir: typing.Union[str, os.PathLike] = DEFAULT_CACHE_DIR,
+        max_cache_bytes: int = 256 * 1024 * 1024,
+        memory_items: int = 2,
+    ) -> None:
+        super().__init__(parent)
+        self.cache_dir = pathlib.Path(cache_dir).expanduser()
+        self.max_cache_bytes = max_cache_bytes
+        self.memory_items = memory_items
+        self._lock = threading.Lock()
+        self._memory: collections.OrderedDict[str, Toolpath] = collections.OrderedDict()
+        # Cancel event of every (name, key) being loaded
+        self._pending: dict[tuple[str, str], threading.Event] = {}
+        # Cancel event of the latest request of every channel
+        self._channels: dict[str, threading.Event] = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ToolpathLoader"
+        )
+
+    def request(
+        self,
+        name: str,
+        path: typing.Union[str, os.PathLike],
+        channel: typing.Optional[str] = None,
+    ) -> bool:
+        """Emit ``toolpath_ready`` with *name* once *path* is loaded
+
+        ``None`` is emitted if the file can not be parsed.
+
+        Args:
+            name (str): Emitted with the toolpath
+            path (str | os.PathLike): The gcode file
+            channel (str, optional): The previous request on the same
+                channel is cancelled, nothing is emitted for it
+
+        Returns:
+            bool: False if the file does not exist locally
+        """
+        try:
+            key = cache_key(path)
+        except OSError:
+            return False
+        job = (name, key)
+        with self._lock:
+            cancelled = self._pending.get(job)
+            if cancelled is not None and cancelled.is_set():
+                cancelled = None  # Superseded before, load it again
+            if channel is not None:
+                previous = self._channels.pop(channel, None)
+                if previous is not None and previous is not cancelled:
+                    previous.set()
+            toolpath = self._memory.get(key)
+            submit = toolpath is None and cancelled is None
+            if submit:
+                cancelled = self._pending[job] = threading.Event()
+            if toolpath is None and channel is not None:
+                self._channels[channel] = cancelled
+        if toolpath is not None:
+            self.toolpath_ready.emit(name, toolpath)
+        elif submit:
+            self._executor.submit(self._load, name, os.fspath(path), key, cancelled)
+        return True
+
+    def _load(self, name: str, path: str, key: str, cancelled: threading.Event) -> None:
+        toolpath: typing.Optional[Toolpath] = None
+        cached = self.cache_dir / key
+        try:
+            if cached.exists():
+                toolpath = Toolpath.load(cached)
+            else:
+                toolpath = parse_toolpath(path, cancelled)
+                self._store(cached, toolpath)
+        except InterruptedError:
+            return
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug("Unable to load the toolpath of %s: %s", path, e)
+        finally:
+            with self._lock:
+                if self._pending.get((name, key)) is cancelled:
+                    del self._pending[(name, key)]
+                if toolpath is not None:
+                    self._memory[key] = toolpath
+                    while len(self._memory) > self.memory_items:
+                        self._memory.popitem(last=False)
+        self.toolpath_ready.emit(name, toolpath)
+
+    def _store(self, cached: pathlib.Path, toolpath: Toolpath) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temporary = cached.with_suffix(".tmp.npz")
+            toolpath.save(temporary)
+            os.replace(temporary, cached)
+            self._prune()
+        except OSError as e:
+            logger.debug("Unable to cache toolpath %s: %s", cached, e)
+
+    def _prune(self) -> None:
+        files = sorted(
+            (entry.stat().st_mtime, entry.stat().st_size, entry)
+            for entry in self.cache_dir.glob("*.npz")
+        )
+        total = sum(size for _, size, _ in files)
+        for _, size, entry in files:
+            if total <= self.max_cache_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def shutdown(self) -> None:
+        """Stop parsing, pending requests are dropped"""
+        with self._lock:
+            for cancelled in self._pending.values():
+                cancelled.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
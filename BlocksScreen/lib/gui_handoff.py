@@ -0,0 +1,210 @@
+"""Bounded handoff of websocket events to the GUI thread.
+
+``MoonWebSocket`` used to post one ``QEvent`` per frame straight into
+the Qt event queue.  When the GUI thread is busy (building the files
+page, network scans) those events pile up and the screen ends up
+showing temperatures that are seconds old.
+
+``GuiHandoff`` keeps its own queue in between.  The websocket thread
+``put``\\s events and only posts a single ``WebSocketHandoff`` wake up
+event while the queue is non-empty; the GUI thread drains everything
+queued in one go and delivers it to the target with ``sendEvent``.
+Every entry carries its enqueue time so the age at delivery, the GUI
+lag, is known.
+
+When the oldest queued entry is older than *lag_threshold* or more than
+*max_pending* entries are waiting, a new ``notify_status_update`` delta
+is merged into the status delta at the tail of the queue instead of
+being appended, the superseded values are dropped.  Responses, other
+notifications and status deltas that carry a ``state`` field
+(``print_stats``, ``webhooks``, ``idle_timeout`` transitions) are
+never merged or dropped and keep their order.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import time
+import typing
+
+from events import WebSocketHandoff, WebSocketMessageReceived
+from PyQt6 import QtCore, QtWidgets
+
+logger = logging.getLogger(__name__)
+
+STATUS_UPDATE = "notify_status_update"
+
+
+class _Entry:
+    __slots__ = ("event", "mergeable", "queued")
+
+    def __init__(self, event: QtCore.QEvent, mergeable: bool) -> None:
+        self.queued = time.monotonic()
+        self.event = event
+        self.mergeable = mergeable
+
+
+def is_mergeable(event: QtCore.QEvent) -> bool:
+    """Whether *event* is a status delta that a newer one may supersede
+
+    Args:
+        event (QtCore.QEvent): The event about to be queued
+
+    Returns:
+        bool: True for ``notify_status_update`` messages without state
+        transitions
+    """
+    if not isinstance(event, WebSocketMessageReceived):
+        return False
+    if event.method != STATUS_UPDATE or not isinstance(event.data, dict):
+        return False
+    params = event.data.get("params")
+    if not isinstance(params, list) or not params or not isinstance(params[0], dict):
+        return False
+    return not any(
+        isinstance(fields, dict) and "state" in fields for fields in params[0].values()
+    )
+
+
+def merge_status(older: dict, newer: dict) -> int:
+    """Merge the ``notify_status_update`` message *newer* into *older*
+
+    Args:
+        older (dict): Queued message, updated in place
+        newer (dict): Message that supersedes it
+
+    Returns:
+        int: Number of fields whose queued value was superseded
+    """
+    status, newer_status = older["params"][0], newer["params"][0]
+    superseded = 0
+    for name, fields in newer_status.items():
+        current = status.setdefault(name, {})
+        superseded += sum(1 for field in fields if field in current)
+        current.update(fields)
+    older["params"][1:] = newer["params"][1:]
+    return superseded
+
+
+class GuiHandoff(QtCore.QObject):
+    """Queue between the websocket thread and the GUI thread.
+
+    Must be created in the GUI thread, the wake up event is delivered to
+    this object's thread.
+
+    Args:
+        target (QtCore.QObject): Object the queued events are sent to
+        lag_threshold (float): Age, in seconds, of the oldest queued event
+            above which status deltas start being merged
+        max_pending (int): Queue length above which status deltas are
+            merged regardless of the lag
+        metrics: Optional ``WebSocketMetrics`` that receives the lag and
+            drop counts
+    """
+
+    def __init__(
+        self,
+        target: QtCore.QObject,
+        lag_threshold: float = 0.25,
+        max_pending: int = 200,
+        metrics: typing.Any = None,
+    ) -> None:
+        super().__init__()
+        self._target = target
+        self.lag_threshold = lag_threshold
+        self.max_pending = max_pending
+        self._metrics = metrics
+        self._lock = threading.Lock()
+        self._queue: collections.deque[_Entry] = collections.deque()
+        self._wakeup_pending = False
+        self.queued = 0
+        self.delivered = 0
+        self.merged = 0
+        self.superseded_fields = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def put(self, event: QtCore.QEvent) -> None:
+        """Queue *event* for the GUI thread, called from any thread"""
+        mergeable = is_mergeable(event)
+        with self._lock:
+            self.queued += 1
+            if (
+                mergeable
+                and self._queue
+                and self._queue[-1].mergeable
+                and self._behind()
+            ):
+                self.superseded_fields += merge_status(
+                    self._queue[-1].event.data, event.data
+                )
+                self.merged += 1
+                if self._metrics is not None:
+                    self._metrics.status_dropped()
+                return
+            self._queue.append(_Entry(event, mergeable))
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+        instance = QtWidgets.QApplication.instance()
+        if instance is None:
+            logger.info("Unable to hand websocket events over, no QApplication")
+            return
+        instance.postEvent(self, WebSocketHandoff())
+
+    def _behind(self) -> bool:
+        return (
+            len(self._queue) >= self.max_pending
+            or time.monotonic() - self._queue[0].queued > self.lag_threshold
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting for the GUI thread"""
+        with self._lock:
+            return len(self._queue)
+
+    def drain(self) -> int:
+        """Deliver every queued event to the target, GUI thread only
+
+        Returns:
+            int: Number of events delivered
+        """
+        with self._lock:
+            entries = list(self._queue)
+            self._queue.clear()
+            self._wakeup_pending = False
+        if not entries:
+            return 0
+        now = time.monotonic()
+        lag = now - entries[0].queued
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        if self._metrics is not None:
+            self._metrics.gui_lag(lag)
+        for entry in entries:
+            QtWidgets.QApplication.sendEvent(self._target, entry.event)
+        self.delivered += len(entries)
+        return len(entries)
+
+    def stats(self) -> dict:
+        """Snapshot of the handoff counters"""
+        with self._lock:
+            return {
+                "queued": self.queued,
+                "delivered": self.delivered,
+                "merged": self.merged,
+                "superseded_fields": self.superseded_fields,
+                "pending": len(self._queue),
+                "last_lag_ms": round(self.last_lag * 1000.0, 3),
+                "max_lag_ms": round(self.max_lag * 1000.0, 3),
+            }
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        """Drains the queue on the wake up event"""
+        if event.type() == WebSocketHandoff.type():
+            self.drain()
+            return True
+        return super().event(event)
@@ -0,0 +1,365 @@
+"""Application wide cache of rasterized icons.
+
+Widgets used to scale their ``QPixmap`` with a smooth transformation on
+every paint and panels built ``QtGui.QPixmap(":/...svg")`` again for each
+entry they add.  ``icons`` keeps the results instead, keyed by source,
+size, device pixel ratio and tint color, in an LRU bounded by the bytes
+of the pixmaps it holds:
+
+* ``icons.pixmap(path)`` loads a resource at its natural size once, these
+  are kept for the whole run, like the widgets holding them, and are
+  not counted against the LRU
+* ``icons.icon(path, size, ratio, tint)`` rasterizes an SVG directly at
+  the size it is drawn at, fitted in *size* with its aspect ratio kept
+* ``icons.scaled(pixmap, size, ratio, tint)`` is the same for a pixmap a
+  widget was given; pixmaps from ``icons.pixmap`` are rasterized again
+  from their source, any other pixmap is smooth scaled
+
+Rasterized icons can also be written as PNG files to a disk cache on
+first use, which later runs load instead of rendering the SVG again::
+
+    [icon_cache]
+    memory_mb: 16
+    disk: true
+    # directory: ~/.cache/BlocksScreen/icons
+
+Pixmaps are GUI thread objects, only the PNG files are written in the
+background.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import hashlib
+import logging
+import os
+import pathlib
+import threading
+import typing
+
+from PyQt6 import QtCore, QtGui, QtSvg
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_DISK_DIR = "~/.cache/BlocksScreen/icons"
+DEFAULT_DISK_MAX_BYTES = 32 * 1024 * 1024
+
+# (source, width, height, device pixel ratio, tint rgba), the source is a
+# resource path or the ``cacheKey`` of a pixmap
+IconKey = tuple[typing.Union[str, int], int, int, float, typing.Optional[int]]
+
+
+def _fit(source: QtCore.QSize, bounds: QtCore.QSize) -> QtCore.QSize:
+    if source.isEmpty():
+        return QtCore.QSize(bounds)
+    return source.scaled(bounds, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+
+
+def _tinted(image: QtGui.QImage, tint: QtGui.QColor) -> QtGui.QImage:
+    """*image* with *tint* painted over its opaque pixels"""
+    painter = QtGui.QPainter(image)
+    painter.setCompositionMode(
+        QtGui.QPainter.CompositionMode.CompositionMode_SourceAtop
+    )
+    painter.fillRect(image.rect(), tint)
+    painter.end()
+    return image
+
+
+class IconCache:
+    """Byte bounded LRU of rasterized icons, with an optional disk cache
+
+    Args:
+        max_bytes (int): Memory held by the cached pixmaps
+        disk_dir (str | os.PathLike, optional): Directory of the PNG
+            cache, disabled when ``None``
+        disk_max_bytes (int): Oldest PNG files are removed above this
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: typing.Optional[typing.Union[str, os.PathLike]] = None,
+        disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_dir: typing.Optional[pathlib.Path] = None
+        self._entries: collections.OrderedDict[
+            typing.Hashable, tuple[QtGui.QPixmap, int]
+        ] = collections.OrderedDict()
+        self._bytes = 0
+        self._natural: dict[str, QtGui.QPixmap] = {}
+        # ``cacheKey`` of the pixmaps from ``pixmap`` to their resource path
+        self._sources: dict[int, str] = {}
+        self._on_disk: set[str] = set()
+        self._executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._disk_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if disk_dir is not None:
+            self.enable_disk(disk_dir)
+
+    def configure(self, config: typing.Any) -> None:
+        """Apply the ``[icon_cache]`` section
+
+        Args:
+            config: ``BlocksScreenConfig`` of the whole file
+        """
+        section = config.get_section("icon_cache", fallback=None)
+        if section is None:
+            return
+        self.max_bytes = int(
+            section.getfloat("memory_mb", default=self.max_bytes / 2**20) * 2**20
+        )
+        self.disk_max_bytes = int(
+            section.getfloat("disk_mb", default=self.disk_max_bytes / 2**20) * 2**20
+        )
+        self._evict()
+        if section.getboolean("disk", default=False):
+            self.enable_disk(
+                section.get("directory", parser=str, default=DEFAULT_DISK_DIR)
+            )
+
+    def enable_disk(self, directory: typing.Union[str, os.PathLike]) -> None:
+        """Load and store rasterized icons as PNG files in *directory*"""
+        self.disk_dir = pathlib.Path(directory).expanduser()
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._on_disk = {entry.name for entry in self.disk_dir.glob("*.png")}
+        except OSError as e:
+            logger.warning("Icon disk cache %s unavailable: %s", self.disk_dir, e)
+            self.disk_dir = None
+            return
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="IconCache"
+            )
+
+    @property
+    def used_bytes(self) -> int:
+        """Bytes held by the cached pixmaps"""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: typing.Hashable) -> typing.Optional[QtGui.QPixmap]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _insert(self, key: typing.Hashable, pixmap: QtGui.QPixmap) -> QtGui.QPixmap:
+        size = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        if size > self.max_bytes:
+            return pixmap
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+        self._entries[key] = (pixmap, size)
+        self._bytes += size
+        self._evict()
+        return pixmap
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def clear(self) -> None:
+        """Drop every rasterized pixmap held in memory"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def pixmap(self, path: str) -> QtGui.QPixmap:
+        """The resource *path* at its natural size"""
+        pixmap = self._natural.get(path)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(path)
+            self._natural[path] = pixmap
+            if not pixmap.isNull():
+                self._sources[pixmap.cacheKey()] = path
+        return pixmap
+
+    def icon(
+        self,
+        path: str,
+        size: QtCore.QSize,
+        ratio: float = 1.0,
+        tint: typing.Optional[QtGui.QColor] = None,
+    ) -> QtGui.QPixmap:
+        """The resource *path* rasterized to fit *size*
+
+        Args:
+            path (str): Resource path, SVG or raster image
+            size (QtCore.QSize): Bounds in device independent pixels
+            ratio (float): Device pixel ratio of the target
+            tint (QtGui.QColor, optional): Color painted over the icon,
+                its alpha sets the strength
+
+        Returns:
+            QtGui.QPixmap: The icon, null if *path* can not be loaded or
+            *size* is empty
+        """
+        if size.isEmpty():
+            return QtGui.QPixmap()
+        key: IconKey = (
+            path,
+            size.width(),
+            size.height(),
+            ratio,
+            None if tint is None else tint.rgba(),
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        image = self._load_disk(key)
+        if image is None:
+            image = self._rasterize(path, size * ratio)
+            if image.isNull():
+                return QtGui.QPixmap()
+            if tint is not None:
+                image = _tinted(image, tint)
+            self._store_disk(key, image)
+        pixmap = QtGui.QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        return self._insert(key, pixmap)
+
+    def scaled(
+        self,
+        pixmap: QtGui.QPixmap,
+        size: QtCore.QSize,
+        ratio: float = 1.0,
+        tint: typing.Optional[QtGui.QColor] = None,
+    ) -> QtGui.QPixmap:
+        """*pixmap* fitted in *size*, its aspect ratio kept
+
+        Pixmaps from ``pixmap`` are rasterized again from their source at
+        the target size, others are smooth scaled.
+
+        Args:
+            pixmap (QtGui.QPixmap): Pixmap the widget was given
+            size (QtCore.QSize): Bounds in device independent pixels
+            ratio (float): Device pixel ratio of the target
+            tint (QtGui.QColor, optional): Color painted over the icon
+
+        Returns:
+            QtGui.QPixmap: The scaled pixmap, its device pixel ratio set
+        """
+        if pixmap.isNull() or size.isEmpty():
+            return QtGui.QPixmap()
+        source = self._sources.get(pixmap.cacheKey())
+        if source is not None:
+            return self.icon(source, size, ratio, tint)
+        key: IconKey = (
+            pixmap.cacheKey(),
+            size.width(),
+            size.height(),
+            ratio,
+            None if tint is None else tint.rgba(),
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        image = pixmap.toImage().scaled(
+            _fit(pixmap.size(), size * ratio),
+            QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        )
+        if tint is not None:
+            image = _tinted(
+                image.convertToFormat(QtGui.QImage.Format.Format_ARGB32_Premultiplied),
+                tint,
+            )
+        result = QtGui.QPixmap.fromImage(image)
+        result.setDevicePixelRatio(ratio)
+        return self._insert(key, result)
+
+    @staticmethod
+    def _rasterize(path: str, bounds: QtCore.QSize) -> QtGui.QImage:
+        if path.lower().endswith(".svg"):
+            renderer = QtSvg.QSvgRenderer(path)
+            if not renderer.isValid():
+                return QtGui.QImage()
+            image = QtGui.QImage(
+                _fit(renderer.defaultSize(), bounds),
+                QtGui.QImage.Format.Format_ARGB32_Premultiplied,
+            )
+            image.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(image)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+            renderer.render(painter)
+            painter.end()
+            return image
+        image = QtGui.QImage(path)
+        if image.isNull():
+            return image
+        return image.scaled(
+            _fit(image.size(), bounds),
+            QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        ).convertToFormat(QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+    @staticmethod
+    def _disk_name(key: IconKey) -> str:
+        # Resource timestamps change whenever the resources are rebuilt
+        info = QtCore.QFileInfo(typing.cast(str, key[0]))
+        stamp = f"{key!r}:{info.size()}:{info.lastModified().toMSecsSinceEpoch()}"
+        return hashlib.sha1(stamp.encode()).hexdigest() + ".png"
+
+    def _load_disk(self, key: IconKey) -> typing.Optional[QtGui.QImage]:
+        if self.disk_dir is None:
+            return None
+        name = self._disk_name(key)
+        if name not in self._on_disk:
+            return None
+        image = QtGui.QImage(os.fspath(self.disk_dir / name))
+        if image.isNull():
+            self._on_disk.discard(name)
+            return None
+        return image.convertToFormat(QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+    def _store_disk(self, key: IconKey, image: QtGui.QImage) -> None:
+        if self.disk_dir is None or self._executor is None:
+            return
+        name = self._disk_name(key)
+        self._on_disk.add(name)
+        self._executor.submit(self._write, self.disk_dir / name, image.copy())
+
+    def _write(self, target: pathlib.Path, image: QtGui.QImage) -> None:
+        temporary = target.with_suffix(".tmp.png")
+        with self._disk_lock:
+            try:
+                if not image.save(os.fspath(temporary), "PNG"):
+                    raise OSError("PNG encoding failed")
+                os.replace(temporary, target)
+                self._prune(target.parent)
+            except OSError as e:
+                logger.debug("Unable to cache icon %s: %s", target, e)
+
+    def _prune(self, directory: pathlib.Path) -> None:
+        files = sorted(
+            (entry.stat().st_mtime, entry.stat().st_size, entry)
+            for entry in directory.glob("*.png")
+        )
+        total = sum(size for _, size, _ in files)
+        for _, size, entry in files:
+            if total <= self.disk_max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def shutdown(self) -> None:
+        """Finish the pending disk writes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+icons = IconCache()
@@ -2,6 +2,7 @@
 import json
 import logging
 import threading
+import time
 
 import websocket
 from events import (
@@ -11,7 +12,16 @@ from events import (
     WebSocketOpen,
 )
 from lib.moonrest import MoonRest
+from lib.gui_handoff import GuiHandoff
+from lib.request_coalescer import Disposition, RequestCoalescer
+from lib.session_recorder import (
+    FRAME_IN,
+    FRAME_OUT,
+    SessionRecorder,
+    SessionReplayer,
+)
 from lib.utils.RepeatedTimer import RepeatedTimer
+from lib.ws_metrics import WebSocketMetrics
 from PyQt6 import QtCore, QtWidgets
 
 logger = logging.getLogger(__name__)
@@ -56,11 +66,48 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
         self._wst = None
         self._request_id = 0
         self.request_table = {}
+        self.coalescer = RequestCoalescer()
+        self.metrics = WebSocketMetrics()
+        self.handoff = GuiHandoff(parent, metrics=self.metrics)
+        _handoff_config = parent.config.get_section("gui_handoff", fallback=None)
+        if _handoff_config:
+            self.handoff.lag_threshold = (
+                _handoff_config.getint("lag_threshold", default=250) / 1000.0
+            )
+            self.handoff.max_pending = _handoff_config.getint(
+                "max_pending", default=200
+            )
         self._moonRest = MoonRest(host=self._host, port=self._port)
         self.api: MoonAPI = MoonAPI(self)
         self._retry_timer: RepeatedTimer
         websocket.setdefaulttimeout(self.timeout)
 
+        self.recorder: SessionRecorder | None = None
+        self._replayer: SessionReplayer | None = None
+        self._replay_path: str = ""
+        self._replay_speed: float = 1.0
+        _session_config = parent.config.get_section("session_recorder", fallback=None)
+        if _session_config:
+            self._replay_path = _session_config.get("replay", parser=str, default="")
+            self._replay_speed = _session_config.getfloat("replay_speed", default=1.0)
+            _record_path = _session_config.get("record", parser=str, default="")
+            if _record_path and not self._replay_path:
+                self.recorder = SessionRecorder(_record_path)
+
+        self._metrics_file: str = ""
+        self._metrics_timer: RepeatedTimer | None = None
+        _metrics_config = parent.config.get_section("websocket_metrics", fallback=None)
+        if _metrics_config:
+            self._metrics_file = _metrics_config.get("file", parser=str, default="")
+            _interval = _metrics_config.getfloat("interval", default=60.0)
+            if _interval > 0:
+                self._metrics_timer = RepeatedTimer(
+                    _interval,
+                    self.metrics.dump,
+                    "websocket-metrics",
+                    self._metrics_file,
+                )
+
         self.query_server_info_signal.connect(self.api.api_query_server_info)
         self.query_klippy_status_timer = RepeatedTimer(
             self.QUERY_KLIPPY_TIMEOUT, self.query_server_info_signal.emit
@@ -79,6 +126,8 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
 
     def try_connection(self):
         """Try connecting to websocket"""
+        if self._replay_path:
+            return self.start_replay()
         self.connecting = True
         self._retry_timer = RepeatedTimer(self.timeout, self.reconnect)
         return self.connect()
@@ -156,8 +205,47 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
             return False
         return True
 
+    def start_replay(self) -> bool:
+        """Replay a recorded session instead of connecting to Moonraker
+
+        Returns:
+            bool: True if the replay was started
+        """
+        if self._replayer is not None and self._replayer.is_alive():
+            return False
+        self.connecting = False
+        self.connected = True
+        self._replayer = SessionReplayer(
+            self, self._replay_path, speed=self._replay_speed
+        )
+        self._post_event(WebSocketOpen(data="Connected"))
+        self.connected_signal.emit()
+        self._replayer.start()
+        return True
+
+    def replay_request(self, frame: str) -> None:
+        """Register a recorded outgoing request so its recorded response
+        is routed like a live one
+
+        Args:
+            frame (str): The raw request frame
+        """
+        packet = json.loads(frame)
+        if "id" in packet and "method" in packet:
+            self.request_table[packet["id"]] = [
+                packet["method"],
+                packet.get("params", {}),
+            ]
+
     def wb_disconnect(self) -> None:
         """Websocket disconnect"""
+        if self._replayer is not None:
+            self._replayer.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self._metrics_timer is not None:
+            self._metrics_timer.stopTimer()
+            self.metrics.dump(self._metrics_file)
         if self._wst is not None and self.ws is not None:
             self.ws.close()
             if self._wst.is_alive():
@@ -186,22 +274,17 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
         _close_message = args[2] if len(args) == 3 else None
         self.connected = False
         self.ws.keep_running = False
+        logger.debug("Request coalescing stats: %s", self.coalescer.stats())
+        logger.debug("GUI handoff stats: %s", self.handoff.stats())
+        self.coalescer.reset()
+        self.metrics.connection_lost()
         self.connection_lost[str].emit(
             f"code: {_close_status_code} | message {_close_message}"
         )
         close_event = WebSocketDisconnected(
             data="Disconnected", args=[_close_status_code, _close_message]
         )
-        try:
-            instance = QtWidgets.QApplication.instance()
-            if instance is not None:
-                instance.postEvent(self.parent(), close_event)
-            else:
-                raise TypeError("QApplication.instance expected non None value")
-        except Exception as e:
-            logger.info(
-                f"Unexpected error when sending websocket close_event on disconnection: {e}"
-            )
+        self._post_event(close_event)  # After the messages still queued
 
         logger.info(
             f"Websocket closed, code: {_close_status_code}, message: {_close_message}"
@@ -223,15 +306,7 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
         self.connecting = False
         self.connected = True
         self.evaluate_klippy_status()
-        open_event = WebSocketOpen(data="Connected")
-        try:
-            instance = QtWidgets.QApplication.instance()
-            if instance is not None:
-                instance.postEvent(self.parent(), open_event)
-            else:
-                raise TypeError("QApplication.instance expected non None value")
-        except Exception as e:
-            logger.info(f"Unexpected error opening websocket: {e}")
+        self._post_event(WebSocketOpen(data="Connected"))
 
         self.connected_signal.emit()
         self._retry_timer.stopTimer()
@@ -246,8 +321,18 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
         _message = (
             args[1] if len(args) == 2 else args[0]
         )  # First argument is ws second is message
+        if self.recorder is not None:
+            self.recorder.record(FRAME_IN, _message)
 
+        _decode_start = time.perf_counter()
         response: dict = json.loads(_message)
+        _decode_time = time.perf_counter() - _decode_start
+        if "id" in response:
+            self.metrics.response_received(response["id"])
+            _kind = "error" if "error" in response else "response"
+        else:
+            _kind = str(response.get("method", "unknown"))
+        self.metrics.message_received(_kind, len(_message), _decode_time)
         if "id" in response and response["id"] in self.request_table:
             _entry = self.request_table.pop(response["id"])
             if "server.info" in _entry[0]:
@@ -266,24 +351,25 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
                 )
                 self.klippy_state_signal.emit(response["result"]["klippy_state"])
                 return
-            else:
-                if "error" in response:
-                    message_event = WebSocketMessageReceived(
-                        method="error",
-                        data=response["error"],
-                        metadata=_entry,
-                    )
-                else:
-                    message_event = WebSocketMessageReceived(
-                        method=str(_entry[0]),
-                        data=response["result"],
-                        metadata=_entry,
+            self._post_response(_entry, response)
+            # Fan the response out to identical requests that were coalesced
+            for _waiter_id in self.coalescer.resolve(response["id"], response):
+                _waiter_entry = self.request_table.pop(_waiter_id, None)
+                if _waiter_entry is not None:
+                    self._post_response(
+                        _waiter_entry, self.coalescer.waiter_response(response)
                     )
+            return
         elif "method" in response:
+            _notification = str(response["method"]).lower()
             if (
-                str(response["method"]).lower() == "notify_klippy_disconnected"
+                _notification == "notify_klippy_disconnected"
             ):  # Checkout for notify_klippy_disconnect
                 self.evaluate_klippy_status()
+            if _notification == "notify_filelist_changed":
+                self.coalescer.invalidate("server.files.")
+            elif _notification.startswith("notify_klippy"):
+                self.coalescer.invalidate("printer.")
 
             message_event = (
                 WebSocketMessageReceived(  # mainly used to pass websocket notifications
@@ -292,13 +378,35 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
                     metadata=None,
                 )
             )
+            self._post_event(message_event)
+
+    def _post_response(self, entry: list, response: dict) -> None:
+        """Post the response to a request as a message event
+
+        Args:
+            entry (list): The `[method, params]` request table entry
+            response (dict): The JSON-RPC response
+        """
+        if "error" in response:
+            message_event = WebSocketMessageReceived(
+                method="error",
+                data=response["error"],
+                metadata=entry,
+            )
+        else:
+            message_event = WebSocketMessageReceived(
+                method=str(entry[0]),
+                data=response["result"],
+                metadata=entry,
+            )
+        self._post_event(message_event)
 
+    def _post_event(self, message_event: QtCore.QEvent) -> None:
+        """Hand an event over to the parent object through the GUI handoff
+        queue, keeping the order of everything received before it
+        """
         try:
-            instance = QtWidgets.QApplication.instance()
-            if instance:
-                instance.postEvent(self.parent(), message_event)
-            else:
-                raise TypeError("QApplication.instance expected non None value")
+            self.handoff.put(message_event)
         except Exception as e:
             logger.info(f"Unexpected error while creating websocket message event: {e}")
 
@@ -317,13 +425,26 @@ class MoonWebSocket(QtCore.QObject, threading.Thread):
 
         self._request_id += 1
         self.request_table[self._request_id] = [method, params]
+        _disposition, _cached = self.coalescer.submit(self._request_id, method, params)
+        if _disposition is Disposition.JOINED:
+            # Answered when the identical in-flight request is resolved
+            return True
+        if _disposition is Disposition.CACHED:
+            self._post_response(
+                self.request_table.pop(self._request_id), {"result": _cached}
+            )
+            return True
         packet = {
             "jsonrpc": "2.0",
             "method": method,
             "params": params,
             "id": self._request_id,
         }
-        self.ws.send(json.dumps(packet))
+        _frame = json.dumps(packet)
+        if self.recorder is not None:
+            self.recorder.record(FRAME_OUT, _frame)
+        self.metrics.request_sent(self._request_id, method, len(_frame))
+        self.ws.send(_frame)
         return True
 
 
@@ -5,6 +5,7 @@ import typing
 from functools import partial
 
 from helper_methods import normalize
+from lib.frame_scheduler import frames
 from lib.moonrakerComm import MoonWebSocket
 from lib.panels.widgets.numpadPage import CustomNumpad
 from lib.panels.widgets.optionCardWidget import OptionCard
@@ -13,8 +14,10 @@ from lib.panels.widgets.printcorePage import SwapPrintcorePage
 from lib.panels.widgets.probeHelperPage import ProbeHelper
 from lib.panels.widgets.slider_selector_page import SliderPage
 from lib.printer import Printer
+from lib.printer_state import Heater
 from lib.ui.controlStackedWidget_ui import Ui_controlStackedWidget
 from lib.utils.display_button import DisplayButton
+from lib.utils.temperature_chart import TemperatureChart
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -62,14 +65,22 @@ class ControlTab(QtWidgets.QStackedWidget):
         self.panel.setupUi(self)
 
         self.popup = Popup(self)
+        self.temperature_chart = TemperatureChart(self.panel.temperature_page)
+        self.temperature_chart.setObjectName("temperature_chart")
+        # The chart takes the place of the spacer between the temperature
+        # cards and the cooldown buttons
+        grid = self.panel.gridLayout
+        for position in range(grid.count() - 1, -1, -1):
+            row, column, _, _ = grid.getItemPosition(position)
+            if (row, column) == (1, 0) and grid.itemAt(position).spacerItem():
+                grid.takeAt(position)
+        grid.addWidget(self.temperature_chart, 1, 0, 1, 2)
 
         self.ws: MoonWebSocket = ws
         self.printer: Printer = printer
         self.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
         self.timers = []
         self.ztilt_state = False
-        self.extruder_info: dict = {}
-        self.bed_info: dict = {}
         self.toolhead_info: dict = {}
         self.extrude_length: int = 10
         self.extrude_feedrate: int = 2
@@ -112,7 +123,11 @@ class ControlTab(QtWidgets.QStackedWidget):
         self.probe_helper_page.subscribe_config[list, "PyQt_PyObject"].connect(
             self.printer.on_subscribe_config
         )
-        self.printer.extruder_update.connect(self.probe_helper_page.on_extruder_update)
+        self.printer.state.subscribe(
+            "extruder",
+            self.probe_helper_page.on_extruder_changed,
+            ("temperature", "target"),
+        )
         self.printer.gcode_move_update.connect(
             self.probe_helper_page.on_gcode_move_update
         )
@@ -124,8 +139,12 @@ class ControlTab(QtWidgets.QStackedWidget):
             self.probe_helper_page.handle_gcode_response
         )
         self.printer.toolhead_update[str, list].connect(self.on_toolhead_update)
-        self.printer.extruder_update.connect(self.on_extruder_update)
-        self.printer.heater_bed_update.connect(self.on_heater_bed_update)
+        self.printer.state.subscribe(
+            "extruder", self.on_extruder_changed, ("temperature", "target")
+        )
+        self.printer.state.subscribe(
+            "heater_bed", self.on_heater_bed_changed, ("temperature", "target")
+        )
         self.panel.cp_motion_btn.clicked.connect(
             partial(self.change_page, self.indexOf(self.panel.motion_page))
         )
@@ -374,7 +393,7 @@ class ControlTab(QtWidgets.QStackedWidget):
 
         if fan_card:
             value_percent = new_value * 100 if new_value <= 1 else new_value
-            fan_card.secondtext.setText(f"{value_percent:.0f}%")
+            frames.set(fan_card.secondtext, "text", f"{value_percent:.0f}%")
 
     @QtCore.pyqtSlot(str, int, "PyQt_PyObject", name="on_slidePage_request")
     @QtCore.pyqtSlot(str, int, "PyQt_PyObject", int, int, name="on_slidePage_request")
@@ -602,7 +621,7 @@ class ControlTab(QtWidgets.QStackedWidget):
         Args:
             extrude (bool): If True extrudes otherwise unextrudes.
         """
-        can_extrude = bool(self.printer.heaters_object["extruder"]["can_extrude"])
+        can_extrude = bool(self.printer.state.value("extruder", "can_extrude", False))
         if not can_extrude:
             self.extrude_page_message = "Temperature too cold to extrude"
             self.panel.exp_info_label.setText(self.extrude_page_message)
@@ -657,33 +676,34 @@ class ControlTab(QtWidgets.QStackedWidget):
     def on_toolhead_update(self, field: str, values: list) -> None:
         """Handles updated from toolhead printer object"""
         if field == "position":
-            self.panel.mva_x_value_label.setText(f"{values[0]:.2f}")
-            self.panel.mva_y_value_label.setText(f"{values[1]:.2f}")
-            self.panel.mva_z_value_label.setText(f"{values[2]:.3f}")
+            frames.set(self.panel.mva_x_value_label, "text", f"{values[0]:.2f}")
+            frames.set(self.panel.mva_y_value_label, "text", f"{values[1]:.2f}")
+            frames.set(self.panel.mva_z_value_label, "text", f"{values[2]:.3f}")
 
             if values[0] == "252,50" and values[1] == "250" and values[2] == "50":
                 self.call_load_panel.emit(False, "")
         self.toolhead_info.update({f"{field}": values})
 
-    @QtCore.pyqtSlot(str, str, float, name="on-extruder-update")
-    def on_extruder_update(
-        self, extruder_name: str, field: str, new_value: float
+    def on_extruder_changed(
+        self, name: str, extruder: Heater, changed: frozenset
     ) -> None:
         """Handles updates from extruder printer object"""
-        if extruder_name == "extruder" and field == "temperature":
-            self.panel.extruder_temp_display.setText(f"{new_value:.1f}")
-        if extruder_name == "extruder" and field == "target":
-            self.panel.extruder_temp_display.secondary_text = f"{new_value:.1f}"
-        self.extruder_info.update({f"{extruder_name}": {f"{field}": new_value}})
-
-    @QtCore.pyqtSlot(str, str, float, name="on-heater-bed-update")
-    def on_heater_bed_update(self, name: str, field: str, new_value: float) -> None:
+        self._show_heater(self.panel.extruder_temp_display, extruder, changed)
+
+    def on_heater_bed_changed(
+        self, name: str, heater_bed: Heater, changed: frozenset
+    ) -> None:
         """Handles updated from heater_bed printer object"""
-        if field == "temperature":
-            self.panel.bed_temp_display.setText(f"{new_value:.1f}")
-        if field == "target":
-            self.panel.bed_temp_display.secondary_text = f"{new_value:.1f}"
-        self.bed_info.update({f"{name}": {f"{field}": new_value}})
+        self._show_heater(self.panel.bed_temp_display, heater_bed, changed)
+
+    @staticmethod
+    def _show_heater(
+        display: QtWidgets.QWidget, heater: Heater, changed: frozenset
+    ) -> None:
+        if "temperature" in changed:
+            frames.set(display, "text", f"{heater.temperature:.1f}")
+        if "target" in changed:
+            frames.set(display, "secondary_text", f"{heater.target:.1f}")
 
     def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
         """Handles ControlTab Widget painting"""
@@ -3,6 +3,7 @@ from functools import partial
 
 
 from lib.printer import Printer
+from lib.printer_state import Heater
 from lib.filament import Filament
 from lib.ui.filamentStackedWidget_ui import Ui_filamentStackedWidget
 
@@ -73,7 +74,9 @@ class FilamentTab(QtWidgets.QStackedWidget):
             lambda: self.unload_filament(toolhead=0, temp=250)
         )
         self.run_gcode.connect(self.ws.api.run_gcode)
-        self.printer.extruder_update.connect(self.on_extruder_update)
+        self.printer.state.subscribe(
+            "extruder", self.on_extruder_changed, ("temperature", "target")
+        )
         self.printer.unload_filament_update.connect(self.on_unload_filament)
         self.printer.load_filament_update.connect(self.on_load_filament)
         self.printer.filament_switch_sensor_update.connect(
@@ -117,9 +120,8 @@ class FilamentTab(QtWidgets.QStackedWidget):
                 self._filament_state = new_state
                 self.handle_filament_state()
 
-    @QtCore.pyqtSlot(str, str, float, name="on_extruder_update")
-    def on_extruder_update(
-        self, extruder_name: str, field: str, new_value: float
+    def on_extruder_changed(
+        self, name: str, extruder: Heater, changed: frozenset
     ) -> None:
         """Handle extruder update"""
         if not self.isVisible:
@@ -132,15 +134,16 @@ class FilamentTab(QtWidgets.QStackedWidget):
                             True, "Extruder heated up \n Please wait"
                         )
                     return
-                if field == "temperature":
-                    self.current_temp = round(new_value, 0)
+                if "temperature" in changed:
+                    self.current_temp = round(extruder.temperature, 0)
                     if self.isVisible:
                         self.call_load_panel.emit(
                             True,
-                            f"Heating up ({new_value}/{self.target_temp}) \n Please wait",
+                            f"Heating up ({extruder.temperature}/{self.target_temp})"
+                            " \n Please wait",
                         )
-            if field == "target":
-                self.target_temp = round(new_value, 0)
+            if "target" in changed:
+                self.target_temp = round(extruder.target, 0)
                 if self.isVisible:
                     self.call_load_panel.emit(True, "Heating up \n Please wait")
 
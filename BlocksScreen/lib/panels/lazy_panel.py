@@ -0,0 +1,233 @@
+"""Deferred construction of heavy panels.
+
+Building every tab, the network window and the overlay pages in
+``MainWindow.__init__`` delays the first frame by the sum of all of them.
+``PanelRegistry`` holds a ``LazyPanel`` per panel instead, each one
+built the first time it is used: its tab is shown, one of its pages is
+requested, or it is reached through ``get``.  Once the window painted
+its first frame the remaining panels are prefetched, one per event loop
+iteration, so input stays responsive while they are built.
+
+Connections are kept working through the deferral: ``LazyPanel.when_built``
+runs wiring code against the panel once it exists, and
+``LazyPanel.slot`` returns a proxy that can be connected right away and
+forwards calls to the panel, queueing them until it is built.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import time
+import typing
+
+from lib.startup_profiler import profiler
+from PyQt6 import QtCore, QtWidgets
+
+logger = logging.getLogger(__name__)
+
+# Calls queued per proxy slot before the panel is built
+QUEUE_LIMIT: int = 64
+
+
+class LazyPanel(QtCore.QObject):
+    """A panel built on first use
+
+    Args:
+        name (str): Panel name, used in logs
+        factory (typing.Callable[[], QtWidgets.QWidget]): Builds the panel
+        page (QtWidgets.QWidget, optional): Tab page that shows the panel
+        parent (QtCore.QObject, optional): Parent object
+    """
+
+    built: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        "PyQt_PyObject", name="built"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        factory: typing.Callable[[], QtWidgets.QWidget],
+        page: typing.Optional[QtWidgets.QWidget] = None,
+        parent: typing.Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.name = name
+        self.page = page
+        self._factory = factory
+        self._instance: typing.Optional[QtWidgets.QWidget] = None
+        self._building = False
+        self._callbacks: list[typing.Callable[[QtWidgets.QWidget], None]] = []
+        self._queued: collections.deque[tuple[str, tuple]] = collections.deque()
+
+    @property
+    def instance(self) -> typing.Optional[QtWidgets.QWidget]:
+        """The panel, ``None`` until it is built"""
+        return self._instance
+
+    def get(self) -> QtWidgets.QWidget:
+        """The panel, built now if needed"""
+        if self._instance is None:
+            self._build()
+        return typing.cast(QtWidgets.QWidget, self._instance)
+
+    def _build(self) -> None:
+        if self._building:
+            raise RuntimeError(f"Panel {self.name} used while it is being built")
+        self._building = True
+        start = time.perf_counter()
+        try:
+            with profiler.phase(f"panel {self.name}"):
+                instance = self._factory()
+        finally:
+            self._building = False
+        self._instance = instance
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(instance)
+        queued, self._queued = self._queued, collections.deque()
+        for name, args in queued:
+            self._resolve(name)(*args)
+        logger.debug(
+            "Built panel %s in %.1f ms", self.name, (time.perf_counter() - start) * 1e3
+        )
+        self.built.emit(instance)
+
+    def when_built(self, callback: typing.Callable[[QtWidgets.QWidget], None]) -> None:
+        """Call *callback* with the panel, now if it is already built"""
+        if self._instance is not None:
+            callback(self._instance)
+        else:
+            self._callbacks.append(callback)
+
+    def _resolve(self, name: str) -> typing.Callable:
+        target: typing.Any = self._instance
+        for attribute in name.split("."):
+            target = getattr(target, attribute)
+        return target
+
+    def slot(self, name: str, queue: bool = True) -> typing.Callable[..., None]:
+        """Proxy for the panel method *name*, connectable before the build
+
+        Args:
+            name (str): Method name, dotted for methods of a child widget
+            queue (bool): Replay calls made before the build, otherwise
+                they are dropped
+
+        Returns:
+            typing.Callable[..., None]: Forwards calls to the panel
+        """
+
+        def proxy(*args: typing.Any) -> None:
+            if self._instance is not None:
+                self._resolve(name)(*args)
+                return
+            if not queue:
+                return
+            if len(self._queued) >= QUEUE_LIMIT:
+                logger.debug("Dropping a queued call to %s.%s", self.name, name)
+                self._queued.popleft()
+            self._queued.append((name, args))
+
+        proxy.__name__ = f"{self.name}.{name}"
+        return proxy
+
+
+class PanelRegistry(QtCore.QObject):
+    """Lazy panels of the main window
+
+    Args:
+        parent (QtCore.QObject, optional): Parent object
+    """
+
+    prefetched: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        name="prefetched"
+    )
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._panels: dict[str, LazyPanel] = {}
+        self._prefetching = False
+        self._watched: typing.Optional[QtWidgets.QWidget] = None
+
+    def __getitem__(self, name: str) -> LazyPanel:
+        return self._panels[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._panels
+
+    def add(
+        self,
+        name: str,
+        factory: typing.Callable[[], QtWidgets.QWidget],
+        page: typing.Optional[QtWidgets.QWidget] = None,
+    ) -> LazyPanel:
+        """Register a panel, built in registration order when prefetching"""
+        panel = LazyPanel(name, factory, page, self)
+        self._panels[name] = panel
+        return panel
+
+    def get(self, name: str) -> QtWidgets.QWidget:
+        """The panel *name*, built now if needed"""
+        return self._panels[name].get()
+
+    def instances(self) -> list[QtWidgets.QWidget]:
+        """The panels built so far"""
+        return [
+            panel.instance
+            for panel in self._panels.values()
+            if panel.instance is not None
+        ]
+
+    @property
+    def pending(self) -> list[str]:
+        """Names of the panels not built yet"""
+        return [name for name, panel in self._panels.items() if panel.instance is None]
+
+    @QtCore.pyqtSlot(int, name="on_tab_changed")
+    def on_tab_changed(self, index: int) -> None:
+        """Build the panel of the tab being shown"""
+        tabs = self.sender()
+        if not isinstance(tabs, QtWidgets.QTabWidget):
+            return
+        page = tabs.widget(index)
+        for panel in self._panels.values():
+            if panel.page is not None and panel.page is page:
+                panel.get()
+
+    def prefetch_after_first_paint(self, window: QtWidgets.QWidget) -> None:
+        """Start prefetching once *window* painted its first frame"""
+        self._watched = window
+        window.installEventFilter(self)
+
+    def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
+        """Catch the first paint of the watched window"""
+        if a0 is self._watched and a1.type() == QtCore.QEvent.Type.Paint:
+            a0.removeEventFilter(self)
+            self._watched = None
+            QtCore.QTimer.singleShot(0, self.prefetch)
+        return super().eventFilter(a0, a1)
+
+    @QtCore.pyqtSlot(name="prefetch")
+    def prefetch(self) -> None:
+        """Build the pending panels, one per event loop iteration
+
+        ``prefetched`` is emitted once all of them are built.
+        """
+        if self._prefetching:
+            return
+        self._prefetching = True
+        self._prefetch_next()
+
+    def _prefetch_next(self) -> None:
+        pending = self.pending
+        if not pending:
+            self._prefetching = False
+            self.prefetched.emit()
+            return
+        try:
+            self._panels[pending[0]].get()
+        except Exception:
+            self._prefetching = False
+            raise
+        QtCore.QTimer.singleShot(0, self._prefetch_next)
@@ -6,11 +6,14 @@ import events
 from configfile import BlocksScreenConfig, get_configparser
 from devices.storage import USBManager
 from lib.files import Files
+from lib.frame_scheduler import frames
+from lib.icon_cache import icons
 from lib.machine import MachineControl
 from lib.moonrakerComm import MoonWebSocket
 from lib.network import WifiIconKey
 from lib.panels.controlTab import ControlTab
 from lib.panels.filamentTab import FilamentTab
+from lib.panels.lazy_panel import PanelRegistry
 from lib.panels.networkWindow import NetworkControlWindow, PixmapCache
 from lib.panels.printTab import PrintTab
 from lib.panels.utilitiesTab import UtilitiesTab
@@ -20,15 +23,14 @@ from lib.panels.widgets.connectionPage import ConnectionPage
 from lib.panels.widgets.loadWidget import LoadingOverlayWidget
 from lib.panels.widgets.notificationPage import NotificationPage
 from lib.panels.widgets.updatePage import UpdatePage
+from lib.perf_hud import hud
 from lib.printer import Printer
+from lib.printer_state import Heater
+from lib.resource_loader import load_resources, resource_mode
+from lib.stall_watchdog import watchdog
+from lib.startup_profiler import profiler
+from lib.temperature_history import TemperatureHistory
 from lib.ui.mainWindow_ui import Ui_MainWindow  # With header
-from lib.ui.resources.background_resources_rc import *
-from lib.ui.resources.font_rc import *
-from lib.ui.resources.graphic_resources_rc import *
-from lib.ui.resources.icon_resources_rc import *
-from lib.ui.resources.main_menu_resources_rc import *
-from lib.ui.resources.system_resources_rc import *
-from lib.ui.resources.top_bar_resources_rc import *
 from PyQt6 import QtCore, QtGui, QtWidgets
 from screensaver import ScreenSaver
 
@@ -105,12 +107,27 @@ class MainWindow(QtWidgets.QMainWindow):
     call_load_panel = QtCore.pyqtSignal(bool, str, name="call-load-panel")
 
     def __init__(self):
-        """Set up UI, instantiate subsystems, and wire all inter-component signals."""
+        """Set up UI, instantiate subsystems, and wire all inter-component signals.
+
+        The tabs, the network window and the overlay pages are registered in
+        ``self.panels`` and built on first use or prefetched after the first
+        frame, the websocket connection starts once all of them exist.
+        """
         super(MainWindow, self).__init__()
-        self.config: BlocksScreenConfig = get_configparser()
-        self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
+        with profiler.phase("config"):
+            self.config: BlocksScreenConfig = get_configparser()
+        profiler.configure(self.config)
+        icons.configure(self.config)
+        frames.configure(self.config)
+        watchdog.configure(self.config)
+        hud.configure(self.config)
+        with profiler.phase("resources"):
+            load_resources(resource_mode(self.config))
+        with profiler.phase("setup_ui"):
+            self.ui = Ui_MainWindow()
+            self.ui.setupUi(self)
         self.screensaver = ScreenSaver(self)
+        self.screensaver.blanked.connect(frames.set_paused)
         self._popup_toggle: bool = False
         self.ui.main_content_widget.setCurrentIndex(0)
 
@@ -119,46 +136,39 @@ class MainWindow(QtWidgets.QMainWindow):
         if usb_config:
             gdir = usb_config.get("gcodes_dir", default=None)
 
-        self.usb_manager: USBManager = USBManager(parent=self, gcodes_dir=gdir)
-        self.ws = MoonWebSocket(self)
-        self.notiPage = NotificationPage(self)
-        self.mc = MachineControl(self)
-        self.file_data = Files(self, self.ws)
-        self.index_stack = deque(maxlen=4)
-        self.printer = Printer(self, self.ws)
-        self.conn_window = ConnectionPage(self, self.ws)
-        self.update_page = UpdatePage(self)
-        self.update_page.hide()
+        with profiler.phase("usb_manager"):
+            self.usb_manager: USBManager = USBManager(parent=self, gcodes_dir=gdir)
+        with profiler.phase("subsystems"):
+            self.ws = MoonWebSocket(self)
+            self.notiPage = NotificationPage(self)
+            self.mc = MachineControl(self)
+            self.file_data = Files(self, self.ws)
+            self.index_stack = deque(maxlen=4)
+            self.printer = Printer(self, self.ws)
+            self.temperature_history = TemperatureHistory(self, self.ws)
+            self.conn_window = ConnectionPage(self, self.ws)
         self.conn_window.call_cancel_panel.connect(self.handle_cancel_print)
         self.installEventFilter(self.conn_window)
-        self.printPanel = PrintTab(
-            self.ui.printTab, self.file_data, self.ws, self.printer
-        )
         QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CursorShape.BlankCursor)
-        self.filamentPanel = FilamentTab(self.ui.filamentTab, self.printer, self.ws)
-        self.controlPanel = ControlTab(self.ui.controlTab, self.ws, self.printer)
-        self.utilitiesPanel = UtilitiesTab(self.ui.utilitiesTab, self.ws, self.printer)
-        self.networkPanel = NetworkControlWindow(self)
-        self.bo_ws_startup.connect(slot=self.bo_start_websocket_connection)
+
+        self.panels = PanelRegistry(self)
+        self.panels.add("print", self._create_print_panel, self.ui.printTab)
+        self.panels.add("filament", self._create_filament_panel, self.ui.filamentTab)
+        self.panels.add("control", self._create_control_panel, self.ui.controlTab)
+        self.panels.add("utilities", self._create_utilities_panel, self.ui.utilitiesTab)
+        self.panels.add("network", self._create_network_panel)
+        self.panels.add("update", self._create_update_page)
+        self.panels.add("cancel", self._create_cancel_page)
+        self.panels.add("loadscreen", self._create_loadscreen)
+        self.ui.main_content_widget.currentChanged.connect(self.panels.on_tab_changed)
+
         self.ws.connecting_signal.connect(self.conn_window.on_websocket_connecting)
         self.ws.connected_signal.connect(
             self.conn_window.on_websocket_connection_achieved
         )
         self.ws.connection_lost.connect(self.conn_window.on_websocket_connection_lost)
         self.printer.webhooks_update.connect(self.conn_window.webhook_update)
-        self.printPanel.request_back.connect(slot=self.global_back)
-        self.printPanel.on_cancel_print.connect(slot=self.on_cancel_print)
-
         self.show_notifications.connect(self.notiPage.new_notication)
-
-        self.printPanel.request_change_page.connect(slot=self.global_change_page)
-        self.filamentPanel.request_back.connect(slot=self.global_back)
-        self.filamentPanel.request_change_page.connect(slot=self.global_change_page)
-        self.controlPanel.request_back_button.connect(slot=self.global_back)
-        self.controlPanel.request_change_page.connect(slot=self.global_change_page)
-        self.utilitiesPanel.request_back.connect(slot=self.global_back)
-        self.utilitiesPanel.request_change_page.connect(slot=self.global_change_page)
-        self.utilitiesPanel.update_available.connect(self.on_update_available)
         self.ui.notification_btn.clicked.connect(self.notiPage.show_notification_panel)
         self.ui.extruder_temp_display.clicked.connect(
             lambda: self.global_change_page(
@@ -195,88 +205,197 @@ class MainWindow(QtWidgets.QMainWindow):
         self.printer_object_report_signal.connect(
             self.printer.on_object_report_received
         )
+        self.printer_object_report_signal.connect(
+            self.temperature_history.on_object_report
+        )
+        self.ws.klippy_state_signal.connect(self.temperature_history.on_klippy_state)
         self.gcode_response.connect(self.printer.gcode_response)
         self.query_object_list.connect(self.printer.on_object_list)
-        self.query_object_list.connect(self.utilitiesPanel.on_object_list)
-        self.printer.extruder_update.connect(self.on_extruder_update)
-        self.printer.heater_bed_update.connect(self.on_heater_bed_update)
+        self.query_object_list.connect(self.panels["utilities"].slot("on_object_list"))
+        self.printer.state.subscribe(
+            "extruder", self.on_header_heater_changed, ("temperature", "target")
+        )
+        self.printer.state.subscribe(
+            "heater_bed", self.on_header_heater_changed, ("temperature", "target")
+        )
         self.run_gcode_signal.connect(self.ws.api.run_gcode)
 
         self.ui.main_content_widget.currentChanged.connect(slot=self.reset_tab_indexes)
-        self.call_network_panel.connect(self.networkPanel.show_network_panel)
+        self.call_network_panel.connect(
+            self.panels["network"].slot("show_network_panel")
+        )
         self.call_notification_panel.connect(self.notiPage.show_notification_panel)
-        self.networkPanel.update_wifi_icon.connect(self.change_wifi_icon)
         self.conn_window.wifi_button_clicked.connect(self.call_network_panel.emit)
         self.conn_window.notification_btn_clicked.connect(
             self.call_notification_panel.emit
         )
         self.ui.wifi_button.clicked.connect(self.call_network_panel.emit)
         self.handle_error_response.connect(
-            self.controlPanel.probe_helper_page.handle_error_response
-        )
-        self.controlPanel.disable_popups.connect(self.popup_toggle)
-        self.on_update_message.connect(self.update_page.handle_update_message)
-        self.update_page.request_full_update.connect(self.ws.api.full_update)
-        self.update_page.request_recover_repo[str].connect(
-            self.ws.api.recover_corrupt_repo
-        )
-        self.update_page.request_recover_repo[str, bool].connect(
-            self.ws.api.recover_corrupt_repo
-        )
-        self.update_page.request_refresh_update.connect(
-            self.ws.api.refresh_update_status
-        )
-        self.update_page.request_refresh_update[str].connect(
-            self.ws.api.refresh_update_status
-        )
-        self.update_page.request_rollback_update.connect(self.ws.api.rollback_update)
-        self.update_page.request_update_client.connect(self.ws.api.update_client)
-        self.update_page.request_update_klipper.connect(self.ws.api.update_klipper)
-        self.update_page.request_update_moonraker.connect(self.ws.api.update_moonraker)
-        self.update_page.request_update_status.connect(self.ws.api.update_status)
-        self.update_page.request_update_system.connect(self.ws.api.update_system)
-        self.update_page.update_back_btn.clicked.connect(self.update_page.hide)
-        self.utilitiesPanel.show_update_page.connect(self.show_update_page)
+            self.panels["control"].slot(
+                "probe_helper_page.handle_error_response", queue=False
+            )
+        )
+        self.on_update_message.connect(
+            self.panels["update"].slot("handle_update_message")
+        )
         self.conn_window.update_button_clicked.connect(self.show_update_page)
         self.ui.extruder_temp_display.display_format = "upper_downer"
         self.ui.bed_temp_display.display_format = "upper_downer"
-
-        self.controlPanel.call_load_panel.connect(self.show_LoadScreen)
-        self.filamentPanel.call_load_panel.connect(self.show_LoadScreen)
-        self.printPanel.call_load_panel.connect(self.show_LoadScreen)
-        self.utilitiesPanel.call_load_panel.connect(self.show_LoadScreen)
         self.conn_window.call_load_panel.connect(self.show_LoadScreen)
 
-        self.loadscreen = BasePopup(self, floating=False, dialog=False)
-        self.loadwidget = LoadingOverlayWidget(
-            self, LoadingOverlayWidget.AnimationGIF.DEFAULT
-        )
-        self.loadscreen.add_widget(self.loadwidget)
-        self.controlPanel.toggle_conn_page.connect(self.conn_window.set_toggle)
-        self.cancelpage = CancelPage(self, ws=self.ws)
-        self.cancelpage.request_file_info.connect(self.file_data.on_request_fileinfo)
-        self.cancelpage.run_gcode.connect(self.ws.api.run_gcode)
+        cancel = self.panels["cancel"]
         self.printer.print_stats_update[str, str].connect(
-            self.cancelpage.on_print_stats_update
+            cancel.slot("on_print_stats_update")
         )
         self.printer.print_stats_update[str, dict].connect(
-            self.cancelpage.on_print_stats_update
+            cancel.slot("on_print_stats_update")
         )
         self.printer.print_stats_update[str, float].connect(
-            self.cancelpage.on_print_stats_update
+            cancel.slot("on_print_stats_update")
+        )
+        self.file_data.fileinfo.connect(
+            cancel.slot("_show_screen_thumbnail", queue=False)
         )
-        self.file_data.fileinfo.connect(self.cancelpage._show_screen_thumbnail)
-        self.printPanel.call_cancel_panel.connect(self.handle_cancel_print)
 
         if self.config.has_section("server"):
-            self.bo_ws_startup.emit()
-        self.reset_tab_indexes()
+            self.panels.prefetched.connect(self.bo_ws_startup.emit)
+        self.bo_ws_startup.connect(slot=self.bo_start_websocket_connection)
+        self.panels.prefetch_after_first_paint(self)
+        profiler.watch(self, self.ws)
+        # Beats only once the event loop runs
+        QtCore.QTimer.singleShot(0, watchdog.start)
+        hud.attach(self, self.ws)
+
+    @property
+    def printPanel(self) -> PrintTab:
+        """Print tab, built on first access"""
+        return typing.cast(PrintTab, self.panels.get("print"))
+
+    @property
+    def filamentPanel(self) -> FilamentTab:
+        """Filament tab, built on first access"""
+        return typing.cast(FilamentTab, self.panels.get("filament"))
+
+    @property
+    def controlPanel(self) -> ControlTab:
+        """Control tab, built on first access"""
+        return typing.cast(ControlTab, self.panels.get("control"))
+
+    @property
+    def utilitiesPanel(self) -> UtilitiesTab:
+        """Utilities tab, built on first access"""
+        return typing.cast(UtilitiesTab, self.panels.get("utilities"))
+
+    @property
+    def networkPanel(self) -> NetworkControlWindow:
+        """Network window, built on first access"""
+        return typing.cast(NetworkControlWindow, self.panels.get("network"))
+
+    @property
+    def update_page(self) -> UpdatePage:
+        """Update page, built on first access"""
+        return typing.cast(UpdatePage, self.panels.get("update"))
+
+    @property
+    def cancelpage(self) -> CancelPage:
+        """Print cancelled page, built on first access"""
+        return typing.cast(CancelPage, self.panels.get("cancel"))
+
+    @property
+    def loadscreen(self) -> BasePopup:
+        """Loading overlay popup, built on first access"""
+        return typing.cast(BasePopup, self.panels.get("loadscreen"))
+
+    def _configure_chart(self, chart) -> None:
+        chart_config = self.config.get_section("temperature_chart", fallback=None)
+        if chart_config:
+            chart.window = chart_config.getint("window", default=30) * 60.0
+            chart.set_max_fps(chart_config.getint("max_fps", default=5))
+        chart.set_history(self.temperature_history)
+
+    def _create_print_panel(self) -> PrintTab:
+        panel = PrintTab(self.ui.printTab, self.file_data, self.ws, self.printer)
+        panel.request_back.connect(slot=self.global_back)
+        panel.on_cancel_print.connect(slot=self.on_cancel_print)
+        panel.request_change_page.connect(slot=self.global_change_page)
+        panel.call_load_panel.connect(self.show_LoadScreen)
+        panel.call_cancel_panel.connect(self.handle_cancel_print)
+        self._configure_chart(panel.tune_page.temperature_chart)
+        panel.show()
+        return panel
+
+    def _create_filament_panel(self) -> FilamentTab:
+        panel = FilamentTab(self.ui.filamentTab, self.printer, self.ws)
+        panel.request_back.connect(slot=self.global_back)
+        panel.request_change_page.connect(slot=self.global_change_page)
+        panel.call_load_panel.connect(self.show_LoadScreen)
+        panel.show()
+        return panel
+
+    def _create_control_panel(self) -> ControlTab:
+        panel = ControlTab(self.ui.controlTab, self.ws, self.printer)
+        panel.request_back_button.connect(slot=self.global_back)
+        panel.request_change_page.connect(slot=self.global_change_page)
+        panel.call_load_panel.connect(self.show_LoadScreen)
+        panel.disable_popups.connect(self.popup_toggle)
+        panel.toggle_conn_page.connect(self.conn_window.set_toggle)
+        self._configure_chart(panel.temperature_chart)
+        panel.show()
+        return panel
+
+    def _create_utilities_panel(self) -> UtilitiesTab:
+        panel = UtilitiesTab(self.ui.utilitiesTab, self.ws, self.printer)
+        panel.request_back.connect(slot=self.global_back)
+        panel.request_change_page.connect(slot=self.global_change_page)
+        panel.update_available.connect(self.on_update_available)
+        panel.show_update_page.connect(self.show_update_page)
+        panel.call_load_panel.connect(self.show_LoadScreen)
+        panel.show()
+        return panel
+
+    def _create_network_panel(self) -> NetworkControlWindow:
+        panel = NetworkControlWindow(self)
+        panel.update_wifi_icon.connect(self.change_wifi_icon)
+        return panel
+
+    def _create_update_page(self) -> UpdatePage:
+        page = UpdatePage(self)
+        page.hide()
+        page.request_full_update.connect(self.ws.api.full_update)
+        page.request_recover_repo[str].connect(self.ws.api.recover_corrupt_repo)
+        page.request_recover_repo[str, bool].connect(self.ws.api.recover_corrupt_repo)
+        page.request_refresh_update.connect(self.ws.api.refresh_update_status)
+        page.request_refresh_update[str].connect(self.ws.api.refresh_update_status)
+        page.request_rollback_update.connect(self.ws.api.rollback_update)
+        page.request_update_client.connect(self.ws.api.update_client)
+        page.request_update_klipper.connect(self.ws.api.update_klipper)
+        page.request_update_moonraker.connect(self.ws.api.update_moonraker)
+        page.request_update_status.connect(self.ws.api.update_status)
+        page.request_update_system.connect(self.ws.api.update_system)
+        page.update_back_btn.clicked.connect(page.hide)
+        return page
+
+    def _create_cancel_page(self) -> CancelPage:
+        page = CancelPage(self, ws=self.ws)
+        page.hide()
+        page.request_file_info.connect(self.file_data.on_request_fileinfo)
+        page.run_gcode.connect(self.ws.api.run_gcode)
+        return page
+
+    def _create_loadscreen(self) -> BasePopup:
+        loadscreen = BasePopup(self, floating=False, dialog=False)
+        self.loadwidget = LoadingOverlayWidget(
+            self, LoadingOverlayWidget.AnimationGIF.DEFAULT
+        )
+        loadscreen.add_widget(self.loadwidget)
+        return loadscreen
 
     @QtCore.pyqtSlot(bool, name="show-cancel-page")
     def handle_cancel_print(self, show: bool = True):
         """Slot for displaying update Panel"""
         if not show:
-            self.cancelpage.hide()
+            if self.panels["cancel"].instance is not None:
+                self.cancelpage.hide()
             return
 
         self.cancelpage.setGeometry(0, 0, self.width(), self.height())
@@ -289,25 +408,17 @@ class MainWindow(QtWidgets.QMainWindow):
     def show_LoadScreen(self, show: bool = True, msg: str = ""):
         """Show or hide the loading overlay, guarded by the calling panel's visibility."""
         _sender = self.sender()
+        if _sender in self.panels.instances() and not _sender.isVisible():
+            return
+        if not show and self.panels["loadscreen"].instance is None:
+            return
 
-        if _sender == self.filamentPanel:
-            if not self.filamentPanel.isVisible():
-                return
-        if _sender == self.controlPanel:
-            if not self.controlPanel.isVisible():
-                return
-        if _sender == self.printPanel:
-            if not self.printPanel.isVisible():
-                return
-        if _sender == self.utilitiesPanel:
-            if not self.utilitiesPanel.isVisible():
-                return
-
+        loadscreen = self.loadscreen
         self.loadwidget.set_status_message(msg)
         if show:
-            self.loadscreen.show()
+            loadscreen.show()
         else:
-            self.loadscreen.hide()
+            loadscreen.hide()
 
     @QtCore.pyqtSlot(bool, name="show-update-page")
     def show_update_page(self, fullscreen: bool):
@@ -437,12 +548,12 @@ class MainWindow(QtWidgets.QMainWindow):
         Used to grantee all tabs reset to their
         first page once the user leaves the tab
         """
-        self.update_page.hide()
-        self.printPanel.setCurrentIndex(0)
-        self.filamentPanel.setCurrentIndex(0)
-        self.controlPanel.setCurrentIndex(0)
-        self.utilitiesPanel.setCurrentIndex(0)
-        self.networkPanel.setCurrentIndex(0)
+        if self.panels["update"].instance is not None:
+            self.update_page.hide()
+        for name in ("print", "filament", "control", "utilities", "network"):
+            panel = self.panels[name].instance
+            if panel is not None:
+                panel.setCurrentIndex(0)
 
     def current_panel_index(self) -> int:
         """Helper function to get the index of the current page in the current tab
@@ -570,6 +681,9 @@ class MainWindow(QtWidgets.QMainWindow):
     @api_handler
     def _handle_server_message(self, method, data, metadata) -> None:
         """Route file-related WebSocket messages to the Files subsystem."""
+        if "temperature_store" in method:
+            self.temperature_history.seed(data)
+            return
         if "file" in method:
             file_data_event = events.ReceivedFileData(data, method, metadata)
             try:
@@ -734,7 +848,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         # Directory not found - navigate back + show popup
-        if "does not exist" in lower_text:
+        if "does not exist" in lower_text and self.panels["print"].instance is not None:
             self.printPanel.filesPage_widget.on_directory_error()
 
         # Show popup for all other errors (including directory errors)
@@ -771,26 +885,19 @@ class MainWindow(QtWidgets.QMainWindow):
         _object_report = data["params"]
         self.printer_object_report_signal[list].emit(_object_report)
 
-    @QtCore.pyqtSlot(str, str, float, name="on-extruder-update")
-    def on_extruder_update(
-        self, extruder_name: str, field: str, new_value: float
+    def on_header_heater_changed(
+        self, name: str, heater: Heater, changed: frozenset
     ) -> None:
-        """Handles extruder printer object updates"""
-        if extruder_name == "extruder":
-            if field == "temperature":
-                self.ui.extruder_temp_display.setText(f"{new_value:.1f}")
-            elif field == "target":
-                self.ui.extruder_temp_display.secondary_text = (
-                    f"{round(int(new_value)):.0f}"
-                )
-
-    @QtCore.pyqtSlot(str, str, float, name="on-heater-bed-update")
-    def on_heater_bed_update(self, name: str, field: str, new_value: float) -> None:
-        """Handles heater_bed printer object updates"""
-        if field == "temperature":
-            self.ui.bed_temp_display.setText(f"{new_value:.1f}")
-        elif field == "target":
-            self.ui.bed_temp_display.secondary_text = f"{round(int(new_value)):.0f}"
+        """Updates the header extruder and bed temperature displays"""
+        display = (
+            self.ui.extruder_temp_display
+            if name == "extruder"
+            else self.ui.bed_temp_display
+        )
+        if "temperature" in changed:
+            frames.set(display, "text", f"{heater.temperature:.1f}")
+        if "target" in changed:
+            frames.set(display, "secondary_text", f"{round(int(heater.target)):.0f}")
 
     @QtCore.pyqtSlot(str, name="set-header-filament-type")
     def set_header_filament_type(self, type: str):
@@ -807,10 +914,18 @@ class MainWindow(QtWidgets.QMainWindow):
     def closeEvent(self, a0: QtGui.QCloseEvent | None) -> None:
         """Handles GUI closing"""
         try:
-            self.networkPanel.close()
+            if self.panels["network"].instance is not None:
+                self.networkPanel.close()
             self.usb_manager.close()
         except Exception as e:
             _logger.warning("Error shutting down: %s", e)
+        profiler.finish("closed before Klippy was ready")
+        icons.shutdown()
+        self.file_data.local_metadata.shutdown()
+        if self.panels["print"].instance is not None:
+            self.printPanel.layer_indexer.shutdown()
+            self.printPanel.toolpath_loader.shutdown()
+        watchdog.stop()
         self.ws.wb_disconnect()
         if a0 is None:
             return
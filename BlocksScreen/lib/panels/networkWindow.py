@@ -6,6 +6,7 @@ import struct
 from dataclasses import replace
 from functools import partial
 
+from lib.icon_cache import icons
 from lib.network import (
     ConnectionPriority,
     ConnectionResult,
@@ -46,9 +47,11 @@ STATUS_CHECK_INTERVAL_MS = 2_000
 class PixmapCache:
     """Process-wide cache for QPixmaps loaded from Qt resource paths.
 
-    Every SVG is decoded exactly once. Qt's implicit sharing means the
-    same QPixmap can be safely referenced by any number of widgets.
-    Must only be called after QApplication is created.
+    Every SVG is decoded exactly once, through ``lib.icon_cache`` so the
+    widgets showing them rasterize the SVG at their own size. Qt's
+    implicit sharing means the same QPixmap can be safely referenced by
+    any number of widgets. Must only be called after QApplication is
+    created.
     """
 
     _cache: dict[str, QtGui.QPixmap] = {}
@@ -57,7 +60,7 @@ class PixmapCache:
     def get(cls, path: str) -> QtGui.QPixmap:
         """Return the cached QPixmap for *path*, loading it on first access."""
         if path not in cls._cache:
-            cls._cache[path] = QtGui.QPixmap(path)
+            cls._cache[path] = icons.pixmap(path)
         return cls._cache[path]
 
     @classmethod
@@ -5,6 +5,8 @@ from functools import partial
 
 from configfile import BlocksScreenConfig, get_configparser
 from lib.files import Files
+from lib.gcode_layers import GcodeLayerIndexer, LayerIndex
+from lib.gcode_toolpath import Toolpath, ToolpathLoader
 from lib.moonrakerComm import MoonWebSocket
 from lib.panels.widgets.babystepPage import BabystepPage
 from lib.panels.widgets.basePopup import BasePopup
@@ -15,6 +17,7 @@ from lib.panels.widgets.numpadPage import CustomNumpad
 from lib.panels.widgets.sensorsPanel import SensorsWindow
 from lib.panels.widgets.slider_selector_page import SliderPage
 from lib.panels.widgets.tunePage import TuneWidget
+from lib.print_eta import PrintEta
 from lib.printer import Printer
 from lib.utils.blocks_button import BlocksCustomButton
 from lib.utils.display_button import DisplayButton
@@ -162,6 +165,23 @@ class PrintTab(QtWidgets.QStackedWidget):
             self.file_data.on_request_fileinfo
         )
         self.file_data.fileinfo.connect(self.jobStatusPage_widget.on_fileinfo)
+        self.print_eta = PrintEta(self.printer.state, self)
+        self.file_data.fileinfo.connect(self.print_eta.on_fileinfo)
+        self.print_eta.eta_update.connect(self.jobStatusPage_widget.on_eta_update)
+        self.layer_indexer = GcodeLayerIndexer(self)
+        self.layer_indexer.index_ready.connect(self.on_layer_index_ready)
+        self.printer.state.subscribe(
+            "virtual_sdcard", self.on_print_file_changed, ("file_path",)
+        )
+        self.toolpath_loader = ToolpathLoader(self)
+        self.toolpath_loader.toolpath_ready.connect(
+            self.confirmPage_widget.on_toolpath_ready
+        )
+        self.toolpath_loader.toolpath_ready.connect(self.on_toolpath_ready)
+        self.confirmPage_widget.request_toolpath.connect(self.on_file_toolpath_request)
+        self.jobStatusPage_widget.request_toolpath.connect(
+            self.on_print_toolpath_request
+        )
         self.jobStatusPage_widget.print_start.connect(self.ws.api.start_print)
         self.jobStatusPage_widget.print_resume.connect(self.ws.api.resume_print)
         self.jobStatusPage_widget.print_cancel.connect(self.handle_cancel_print)
@@ -171,23 +191,15 @@ class PrintTab(QtWidgets.QStackedWidget):
             self.ws.api.object_query
         )
 
-        self.printer.virtual_sdcard_update[str, bool].connect(
-            self.jobStatusPage_widget.virtual_sdcard_update
-        )
-        self.printer.virtual_sdcard_update[str, float].connect(
-            self.jobStatusPage_widget.virtual_sdcard_update
-        )
-        self.printer.virtual_sdcard_update.connect(
-            self.jobStatusPage_widget.virtual_sdcard_update
-        )
-        self.printer.print_stats_update[str, str].connect(
-            self.jobStatusPage_widget.on_print_stats_update
+        self.printer.state.subscribe(
+            "virtual_sdcard",
+            self.jobStatusPage_widget.on_virtual_sdcard_changed,
+            ("progress", "file_position"),
         )
-        self.printer.print_stats_update[str, dict].connect(
-            self.jobStatusPage_widget.on_print_stats_update
-        )
-        self.printer.print_stats_update[str, float].connect(
-            self.jobStatusPage_widget.on_print_stats_update
+        self.printer.state.subscribe(
+            "print_stats",
+            self.jobStatusPage_widget.on_print_stats_changed,
+            ("filename", "state", "info", "total_duration"),
         )
         self.printer.print_stats_update[str, str].connect(self.on_print_stats_update)
         self.printer.print_stats_update[str, dict].connect(self.on_print_stats_update)
@@ -205,11 +217,15 @@ class PrintTab(QtWidgets.QStackedWidget):
             lambda: self.change_page(self.indexOf(self.tune_page))
         )
         self.tune_page.request_back.connect(self.back_button)
-        self.printer.extruder_update.connect(
-            self.tune_page.on_extruder_temperature_change
+        self.printer.state.subscribe(
+            "extruder",
+            self.tune_page.on_extruder_temperature_change,
+            ("temperature", "target"),
         )
-        self.printer.heater_bed_update.connect(
-            self.tune_page.on_heater_bed_temperature_change
+        self.printer.state.subscribe(
+            "heater_bed",
+            self.tune_page.on_heater_bed_temperature_change,
+            ("temperature", "target"),
         )
         self.printer.fan_update[str, str, float].connect(
             self.tune_page.on_fan_object_update
@@ -269,6 +285,44 @@ class PrintTab(QtWidgets.QStackedWidget):
         self.save_config_btn.clicked.connect(self.save_config)
         self.BasePopup_z_offset.accepted.connect(self.update_configuration_file)
 
+    def on_print_file_changed(
+        self, name: str, sdcard: typing.Any, changed: frozenset
+    ) -> None:
+        """Index the layers of the file loaded on the virtual sdcard"""
+        self.jobStatusPage_widget.set_layer_index(None)
+        self.jobStatusPage_widget.set_toolpath(None)
+        if sdcard.file_path:
+            self.layer_indexer.request(sdcard.file_path)
+
+    @QtCore.pyqtSlot(str, "PyQt_PyObject", name="on_layer_index_ready")
+    def on_layer_index_ready(self, path: str, index: LayerIndex) -> None:
+        """Hand the layer index over if it is still the loaded file's"""
+        if path == self.printer.state.value("virtual_sdcard", "file_path"):
+            self.jobStatusPage_widget.set_layer_index(index)
+
+    @QtCore.pyqtSlot(str, name="on_file_toolpath_request")
+    def on_file_toolpath_request(self, filename: str) -> None:
+        """Load the toolpath of a file selected on the files page"""
+        if not self.toolpath_loader.request(
+            filename, os.path.join(self.gcode_path, filename), channel="files"
+        ):
+            self.confirmPage_widget.on_toolpath_ready(filename, None)
+
+    @QtCore.pyqtSlot(name="on_print_toolpath_request")
+    def on_print_toolpath_request(self) -> None:
+        """Load the toolpath of the file loaded on the virtual sdcard"""
+        path = self.printer.state.value("virtual_sdcard", "file_path")
+        if not path or not self.toolpath_loader.request(path, path, channel="print"):
+            self.jobStatusPage_widget.set_toolpath(None, "Preview unavailable")
+
+    @QtCore.pyqtSlot(str, "PyQt_PyObject", name="on_toolpath_ready")
+    def on_toolpath_ready(self, path: str, toolpath: Toolpath | None) -> None:
+        """Hand the toolpath over if it is still the loaded file's"""
+        if path == self.printer.state.value("virtual_sdcard", "file_path"):
+            self.jobStatusPage_widget.set_toolpath(
+                toolpath, "" if toolpath is not None else "Preview unavailable"
+            )
+
     @QtCore.pyqtSlot(str, dict, name="on_print_stats_update")
     @QtCore.pyqtSlot(str, float, name="on_print_stats_update")
     @QtCore.pyqtSlot(str, str, name="on_print_stats_update")
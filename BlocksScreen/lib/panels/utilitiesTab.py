@@ -4,9 +4,11 @@ from enum import Enum, auto
 from functools import partial
 
 from lib.moonrakerComm import MoonWebSocket
+from lib.perf_hud import hud
 from lib.panels.widgets.troubleshootPage import TroubleshootPage
 from lib.printer import Printer
 from lib.ui.utilitiesStackedWidget_ui import Ui_utilitiesStackedWidget
+from lib.utils.bed_mesh_view import BedMeshView
 from lib.utils.blocks_button import BlocksCustomButton
 from lib.utils.toggleAnimatedButton import ToggleAnimatedButton
 from PyQt6 import QtCore, QtGui, QtWidgets
@@ -161,6 +163,48 @@ class UtilitiesTab(QtWidgets.QStackedWidget):
             self.troubleshoot_page.tb_back_btn, self.panel.utilities_page
         )
 
+        # --- Performance HUD ---
+        self.hud_label = QtWidgets.QLabel(
+            "Performance HUD", parent=self.panel.info_page
+        )
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.hud_label.setFont(font)
+        self.hud_label.setStyleSheet("color:white")
+        self.hud_toggle = ToggleAnimatedButton(self.panel.info_page)
+        self.hud_toggle.setMinimumSize(QtCore.QSize(100, 50))
+        self.hud_toggle.setMaximumSize(QtCore.QSize(100, 50))
+        self.hud_toggle.state = (
+            ToggleAnimatedButton.State.ON
+            if hud.enabled
+            else ToggleAnimatedButton.State.OFF
+        )
+        self.hud_toggle.stateChange.connect(
+            lambda state: hud.set_enabled(state == ToggleAnimatedButton.State.ON)
+        )
+        hud_layout = QtWidgets.QHBoxLayout()
+        hud_layout.addStretch()
+        hud_layout.addWidget(self.hud_label)
+        hud_layout.addWidget(self.hud_toggle)
+        hud_layout.addStretch()
+
+        # --- Bed Mesh ---
+        # Shown with the HUD toggle next to the printer info frame
+        self.bed_mesh_view = BedMeshView(self.printer.bed_mesh, self.panel.info_page)
+        self.bed_mesh_view.setMinimumSize(QtCore.QSize(300, 200))
+        self.bed_mesh_view.setMaximumSize(QtCore.QSize(330, 230))
+        info_column = QtWidgets.QVBoxLayout()
+        info_column.addWidget(self.bed_mesh_view)
+        info_column.addLayout(hud_layout)
+        self.panel.info_content_layout.removeWidget(self.panel.frame)
+        info_row = QtWidgets.QHBoxLayout()
+        info_row.addStretch()
+        info_row.addWidget(self.panel.frame)
+        info_row.addLayout(info_column)
+        info_row.addStretch()
+        self.panel.info_content_layout.insertLayout(0, info_row)
+        self.printer.bed_mesh_update.connect(self.bed_mesh_view.on_bed_mesh_update)
+
         # --- Routines ---
         self.panel.rc_fans.clicked.connect(partial(self.run_routine, Process.FAN))
         self.panel.rc_bheat.clicked.connect(
@@ -198,6 +242,7 @@ class UtilitiesTab(QtWidgets.QStackedWidget):
 
         # --- Initialize Printer Communication ---
         self.printer.printer_config.connect(self.on_printer_config_received)
+        self.printer.printer_config_removed.connect(self.on_printer_config_removed)
         self.printer.gcode_move_update.connect(self.on_gcode_move_update)
 
         self.panel.update_btn.setPixmap(
@@ -390,12 +435,22 @@ class UtilitiesTab(QtWidgets.QStackedWidget):
                         }
 
     def on_printer_config_received(self, config: dict) -> None:
-        """Handle printer configuration"""
+        """Handle printer configuration, only the changed sections"""
+        if not {"stepper_x", "stepper_y", "stepper_z"} & config.keys():
+            return
+        for name in config:
+            self.stepper_limits.pop(name, None)  # Read again below
         for axis in ("x", "y", "z"):
             self.subscribe_config[str, "PyQt_PyObject"].emit(
                 f"stepper_{axis}", self.on_object_config
             )
 
+    @QtCore.pyqtSlot(list, name="on_printer_config_removed")
+    def on_printer_config_removed(self, sections: list) -> None:
+        """Forget the limits of removed stepper sections"""
+        for name in sections:
+            self.stepper_limits.pop(name, None)
+
     @QtCore.pyqtSlot(str, list, name="on_gcode_move_update")
     def on_gcode_move_update(self, name: str, value: list) -> None:
         """Handle gcode move"""
@@ -6,6 +6,7 @@ from lib.utils.blocks_button import BlocksCustomButton
 from lib.utils.blocks_frame import BlocksCustomFrame
 from lib.utils.blocks_label import BlocksLabel
 from lib.utils.icon_button import IconButton
+from lib.utils.layer_preview import LayerPreview
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -19,6 +20,9 @@ class ConfirmWidget(QtWidgets.QWidget):
     on_delete: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
         str, str, name="delete_file"
     )
+    request_toolpath: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        str, name="request_toolpath"
+    )
 
     def __init__(self, parent) -> None:
         super().__init__(parent)
@@ -29,6 +33,9 @@ class ConfirmWidget(QtWidgets.QWidget):
         self._thumbnails: typing.List = []
         self.directory = "gcodes"
         self.filename = ""
+        self._preview_path = ""
+        self.cf_thumbnail.viewport().installEventFilter(self)
+        self.layer_preview.clicked.connect(self.show_thumbnail)
         self.confirm_button.clicked.connect(
             lambda: self.on_accept.emit(
                 str(os.path.join(self.directory, self.filename))
@@ -49,6 +56,9 @@ class ConfirmWidget(QtWidgets.QWidget):
         self.directory = directory
         self.filename = filename
         self.cf_file_name.setText(self.filename)
+        self._preview_path = text
+        self.layer_preview.set_toolpath(None)
+        self.show_thumbnail()
         self._thumbnails = filedata.get("thumbnail_images", [])
         if self._thumbnails:
             _biggest_thumbnail = self._thumbnails[-1]  # Show last which is biggest
@@ -87,6 +97,41 @@ class ConfirmWidget(QtWidgets.QWidget):
         self.cf_info_tr.setText(f"{time_label}")
         self.repaint()
 
+    def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
+        """Show the layer preview when the thumbnail is tapped"""
+        if (
+            a0 is self.cf_thumbnail.viewport()
+            and a1.type() == QtCore.QEvent.Type.MouseButtonPress
+        ):
+            self.show_layer_preview()
+            return True
+        return super().eventFilter(a0, a1)
+
+    def show_layer_preview(self) -> None:
+        """Replace the thumbnail with the layer preview, parsed on demand"""
+        if not self._preview_path:
+            return
+        if self.layer_preview.toolpath is None:
+            self.layer_preview.set_toolpath(None, "Loading preview...")
+            self.request_toolpath.emit(self._preview_path)
+        self.cf_thumbnail.hide()
+        self.layer_preview.show()
+
+    @QtCore.pyqtSlot(name="show_thumbnail")
+    def show_thumbnail(self) -> None:
+        """Show the thumbnail again"""
+        self.layer_preview.hide()
+        self.cf_thumbnail.show()
+
+    @QtCore.pyqtSlot(str, "PyQt_PyObject", name="on_toolpath_ready")
+    def on_toolpath_ready(self, path: str, toolpath) -> None:
+        """Show the parsed toolpath if it belongs to the shown file"""
+        if path != self._preview_path:
+            return
+        self.layer_preview.set_toolpath(
+            toolpath, "" if toolpath is not None else "Preview unavailable"
+        )
+
     def estimate_print_time(self, seconds: int) -> list:
         """Convert time in seconds format to days, hours, minutes, seconds.
 
@@ -318,6 +363,16 @@ class ConfirmWidget(QtWidgets.QWidget):
             0,
             QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter,
         )
+        self.layer_preview = LayerPreview(self)
+        self.layer_preview.setMinimumSize(QtCore.QSize(400, 300))
+        self.layer_preview.setMaximumSize(QtCore.QSize(400, 300))
+        self.layer_preview.setObjectName("layer_preview")
+        self.layer_preview.hide()
+        self.cf_content_vertical_layout.addWidget(
+            self.layer_preview,
+            0,
+            QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter,
+        )
         self.verticalLayout_4.addLayout(self.cf_content_vertical_layout)
         self._blocksthumbnail = QtGui.QImage(
             "BlocksScreen/lib/ui/resources/media/logoblocks400x300.png"
@@ -635,13 +635,15 @@ class FilesPage(QtWidgets.QWidget):
         sorted_files = sorted(
             self._file_list, key=lambda x: x.get("modified", 0), reverse=True
         )
+        # Names already listed, scanning the model per file is quadratic
+        listed = {entry.text for entry in self._model.entries}
         for file_item in sorted_files:
             filename = file_item.get("filename", file_item.get("path", ""))
             if not filename:
                 continue
 
             # Add file to list immediately with basic info
-            self._add_file_to_list(file_item)
+            self._add_file_to_list(file_item, listed)
 
             # Request metadata for gcode files (will update display later)
             if filename.lower().endswith(self.GCODE_EXTENSION):
@@ -654,8 +656,16 @@ class FilesPage(QtWidgets.QWidget):
         """Update scrollbar after model changes."""
         QtCore.QTimer.singleShot(10, self._setup_scrollbar)
 
-    def _add_file_to_list(self, file_item: dict) -> None:
-        """Add a file entry to the list with basic info."""
+    def _add_file_to_list(
+        self, file_item: dict, listed: typing.Optional[set[str]] = None
+    ) -> None:
+        """Add a file entry to the list with basic info.
+
+        Args:
+            file_item (dict): File entry of the Moonraker file list
+            listed (set[str] | None): Names already in the model, kept up
+                to date, the model is scanned when not given
+        """
         filename = file_item.get("filename", file_item.get("path", ""))
         if not filename or not filename.lower().endswith(self.GCODE_EXTENSION):
             return
@@ -664,7 +674,11 @@ class FilesPage(QtWidgets.QWidget):
         display_name = self._get_display_name(filename)
 
         # Check if already in list
-        if self._model_contains_item(display_name):
+        if listed is not None:
+            if display_name in listed:
+                return
+            listed.add(display_name)
+        elif self._model_contains_item(display_name):
             return
 
         # Use cached metadata if available, otherwise show unknown
@@ -1,13 +1,21 @@
 import logging
+import time
 import typing
 
 import events
 from helper_methods import calculate_current_layer, estimate_print_time
+from lib.gcode_layers import LayerIndex
+from lib.gcode_toolpath import Toolpath
+from lib.frame_scheduler import frames
+from lib.icon_cache import icons
 from lib.panels.widgets.basePopup import BasePopup
+from lib.print_eta import PrintEstimate
+from lib.printer_state import PrintStats, VirtualSdcard
 from lib.utils.blocks_button import BlocksCustomButton
 from lib.utils.blocks_label import BlocksLabel
 from lib.utils.blocks_progressbar import CustomProgressBar
 from lib.utils.display_button import DisplayButton
+from lib.utils.layer_preview import LayerPreview
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 logger = logging.getLogger(__name__)
@@ -53,6 +61,9 @@ class JobStatusWidget(QtWidgets.QWidget):
     request_file_info: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
         str, name="request_file_info"
     )
+    request_toolpath: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        name="request_toolpath"
+    )
     call_cancel_panel = QtCore.pyqtSignal(bool, name="call-load-panel")
 
     _internal_print_status: str = ""
@@ -64,7 +75,12 @@ class JobStatusWidget(QtWidgets.QWidget):
         super().__init__(parent)
         self.thumbnail_graphics = []
         self.layer_fallback = False
+        self.layer_index: typing.Optional[LayerIndex] = None
+        self._file_position = 0
         self._setupUI()
+        self.layer_preview = LayerPreview(self)
+        self.layer_preview.hide()
+        self.layer_preview.clicked.connect(self.collapse_thumbnail)
         self.cancel_print_dialog = BasePopup(self, floating=True)
         self.tune_menu_btn.clicked.connect(self.tune_clicked.emit)
         self.pause_printing_btn.clicked.connect(self.pause_resume_print)
@@ -83,6 +99,12 @@ class JobStatusWidget(QtWidgets.QWidget):
             self.btnWidget.hide()
             self.headerWidget.hide()
             return
+        self.collapse_thumbnail()
+
+    @QtCore.pyqtSlot(name="collapse_thumbnail")
+    def collapse_thumbnail(self) -> None:
+        """Leave the expanded thumbnail or layer preview"""
+        self.layer_preview.hide()
         self.thumbnail_view.hide()
         self.progressWidget.show()
         self.contentWidget.show()
@@ -105,10 +127,30 @@ class JobStatusWidget(QtWidgets.QWidget):
             sender_obj == self.thumbnail_view
             and event.type() == QtCore.QEvent.Type.MouseButtonPress
         ):
-            self.toggle_thumbnail_expansion()
+            self.show_layer_preview()
             return True
         return super().eventFilter(sender_obj, event)
 
+    def show_layer_preview(self) -> None:
+        """Replace the expanded thumbnail with the layer being printed"""
+        if self.layer_preview.toolpath is None:
+            self.layer_preview.set_toolpath(None, "Loading preview...")
+            self.request_toolpath.emit()
+        self.layer_preview.set_position(self._file_position)
+        self.thumbnail_view.hide()
+        self.layer_preview.setGeometry(self.rect())
+        self.layer_preview.show()
+        self.layer_preview.raise_()
+
+    def set_toolpath(
+        self, toolpath: typing.Optional[Toolpath], placeholder: str = ""
+    ) -> None:
+        """Use *toolpath*, the toolpath of the file being printed, for the
+        layer preview
+        """
+        self.layer_preview.set_toolpath(toolpath, placeholder)
+        self.layer_preview.set_position(self._file_position)
+
     def _load_thumbnails(self, *thumbnails) -> None:
         """Pre-load available thumbnails for the current print object"""
         self.thumbnail_graphics = list(
@@ -165,8 +207,9 @@ class JobStatusWidget(QtWidgets.QWidget):
         """Start a print job, show job status page"""
         self._current_file_name = file
         self.js_file_name_label.setText(self._current_file_name)
-        self.layer_display_button.setText("?")
-        self.print_time_display_button.setText("?")
+        frames.set(self.layer_display_button, "text", "?")
+        frames.set(self.print_time_display_button, "text", "?")
+        frames.set(self.print_time_display_button, "secondary_text", "")
         self.printing_progress_bar.reset()
         self._internal_print_status = "printing"
         self.request_file_info.emit(file)
@@ -189,8 +232,8 @@ class JobStatusWidget(QtWidgets.QWidget):
         if not self.isVisible():
             return
         self.total_layers = str(fileinfo.get("layer_count", "---"))
-        self.layer_display_button.setText("---")
-        self.layer_display_button.secondary_text = str(self.total_layers)
+        frames.set(self.layer_display_button, "text", "---")
+        frames.set(self.layer_display_button, "secondary_text", str(self.total_layers))
         self.file_metadata = fileinfo
         self._load_thumbnails(*fileinfo.get("thumbnail_images", []))
 
@@ -217,12 +260,12 @@ class JobStatusWidget(QtWidgets.QWidget):
             if lstate == "paused":
                 self.pause_printing_btn.setText(" Resume")
                 self.pause_printing_btn.setPixmap(
-                    QtGui.QPixmap(":/ui/media/btn_icons/play.svg")
+                    icons.pixmap(":/ui/media/btn_icons/play.svg")
                 )
             elif lstate == "printing":
                 self.pause_printing_btn.setText("Pause")
                 self.pause_printing_btn.setPixmap(
-                    QtGui.QPixmap(":/ui/media/btn_icons/pause.svg")
+                    icons.pixmap(":/ui/media/btn_icons/pause.svg")
                 )
             self.pause_printing_btn.setEnabled(True)
             self.request_query_print_stats.emit({"print_stats": ["filename"]})
@@ -235,6 +278,9 @@ class JobStatusWidget(QtWidgets.QWidget):
             self._internal_print_status = ""
             self._current_file_name = ""
             self.total_layers = "?"
+            self.layer_index = None
+            self.layer_preview.set_toolpath(None)
+            self.layer_preview.hide()
             self.file_metadata.clear()
             self.hide_request.emit()
             # if hasattr(self, "thumbnail_view"):
@@ -253,36 +299,40 @@ class JobStatusWidget(QtWidgets.QWidget):
                 str("Print" + lstate.capitalize()),
             )
 
-    @QtCore.pyqtSlot(str, dict, name="on_print_stats_update")
-    @QtCore.pyqtSlot(str, float, name="on_print_stats_update")
-    @QtCore.pyqtSlot(str, str, name="on_print_stats_update")
-    def on_print_stats_update(self, field: str, value: dict | float | str) -> None:
+    def on_print_stats_changed(
+        self, name: str, stats: PrintStats, changed: frozenset
+    ) -> None:
         """Processes the information that comes from the printer object "print_stats"
             Displays information on the ui accordingly.
 
         Args:
-            field (str): The name of the updated field.
-            value (dict | float | str): The value for the field.
+            name (str): Name of the printer object.
+            stats (PrintStats): Current state of the print stats.
+            changed (frozenset): Names of the updated fields.
         """
-        if isinstance(value, str):
-            if "state" in field:
-                self._handle_print_state(value)
-            if "filename" in field:
-                self._current_file_name = value
-                if self.js_file_name_label.text().lower() != value.lower():
-                    self.js_file_name_label.setText(self._current_file_name)
-                if self.isVisible():
-                    self.request_file_info.emit(value)
+        if "filename" in changed:
+            self._current_file_name = stats.filename
+            if self.js_file_name_label.text().lower() != stats.filename.lower():
+                self.js_file_name_label.setText(self._current_file_name)
+            if self.isVisible():
+                self.request_file_info.emit(stats.filename)
+        if "state" in changed:
+            self._handle_print_state(stats.state)
         if not self.file_metadata:
             return
         if not self.isVisible():
             return
-        if isinstance(value, dict):
+        if "info" in changed and isinstance(stats.info, dict):
+            value = stats.info
             self.layer_fallback = False
             if "total_layer" in value.keys():
                 self.total_layers = value["total_layer"]
                 if value["total_layer"] is not None:
-                    self.layer_display_button.secondary_text = str(self.total_layers)
+                    frames.set(
+                        self.layer_display_button,
+                        "secondary_text",
+                        str(self.total_layers),
+                    )
 
                 else:
                     self.total_layers = "---"
@@ -291,19 +341,34 @@ class JobStatusWidget(QtWidgets.QWidget):
             if "current_layer" in value.keys():
                 if value["current_layer"] is not None:
                     _current_layer = value["current_layer"]
-                    self.layer_display_button.setText(f"{int(_current_layer)}")
+                    frames.set(
+                        self.layer_display_button, "text", f"{int(_current_layer)}"
+                    )
                 else:
-                    self.layer_display_button.setText("---")
+                    frames.set(self.layer_display_button, "text", "---")
                     self.layer_fallback = True
-        elif isinstance(value, float):
-            if "total_duration" in field:
-                _time = estimate_print_time(int(value))
-                _print_time_string = (
-                    f"{_time[0]}Day {_time[1]}H {_time[2]}min {_time[3]} s"
-                    if _time[0] != 0
-                    else f"{_time[1]}H {_time[2]}min {_time[3]}s"
-                )
-                self.print_time_display_button.setText(_print_time_string)
+        if "total_duration" in changed:
+            _time = estimate_print_time(int(stats.total_duration))
+            _print_time_string = (
+                f"{_time[0]}Day {_time[1]}H {_time[2]}min {_time[3]} s"
+                if _time[0] != 0
+                else f"{_time[1]}H {_time[2]}min {_time[3]}s"
+            )
+            frames.set(self.print_time_display_button, "text", _print_time_string)
+
+    @QtCore.pyqtSlot("PyQt_PyObject", name="on_eta_update")
+    def on_eta_update(self, estimate: PrintEstimate) -> None:
+        """Show the expected completion time of the job"""
+        if not self.isVisible():
+            return
+        if estimate.remaining < 0:
+            frames.set(self.print_time_display_button, "secondary_text", "")
+            return
+        frames.set(
+            self.print_time_display_button,
+            "secondary_text",
+            "ETA " + time.strftime("%H:%M", time.localtime(estimate.completion)),
+        )
 
     @QtCore.pyqtSlot(str, list, name="on_gcode_move_update")
     def on_gcode_move_update(self, field: str, value: list) -> None:
@@ -312,7 +377,9 @@ class JobStatusWidget(QtWidgets.QWidget):
             return
         if "gcode_position" in field:
             if self._internal_print_status == "printing":
-                if self.layer_fallback:
+                if self.layer_fallback and self.layer_index is not None:
+                    self._show_indexed_layer()
+                elif self.layer_fallback:
                     object_height = float(self.file_metadata.get("object_height", -1.0))
                     layer_height = float(self.file_metadata.get("layer_height", -1.0))
                     first_layer_height = float(
@@ -328,26 +395,58 @@ class JobStatusWidget(QtWidgets.QWidget):
                     total_layer = (
                         (object_height) / layer_height if layer_height > 0 else -1
                     )
-                    self.layer_display_button.secondary_text = (
-                        f"{int(total_layer)}" if total_layer != -1 else "---"
+                    frames.set(
+                        self.layer_display_button,
+                        "secondary_text",
+                        f"{int(total_layer)}" if total_layer != -1 else "---",
                     )
-                    self.layer_display_button.setText(
-                        f"{int(_current_layer)}" if _current_layer != -1 else "---"
+                    frames.set(
+                        self.layer_display_button,
+                        "text",
+                        f"{int(_current_layer)}" if _current_layer != -1 else "---",
                     )
 
-    @QtCore.pyqtSlot(str, float, name="virtual_sdcard_update")
-    @QtCore.pyqtSlot(str, bool, name="virtual_sdcard_update")
-    def virtual_sdcard_update(self, field: str, value: float | bool) -> None:
+    def on_virtual_sdcard_changed(
+        self, name: str, sdcard: VirtualSdcard, changed: frozenset
+    ) -> None:
         """Handle virtual sdcard
 
         Args:
-            field (str): Name of the updated field on the virtual_sdcard object
-            value (float | bool): The updated information for the corresponding field
+            name (str): Name of the printer object
+            sdcard (VirtualSdcard): Current state of the virtual sdcard
+            changed (frozenset): Names of the updated fields
         """
+        if "file_position" in changed:
+            self._file_position = int(sdcard.file_position)
+            self.layer_preview.set_position(self._file_position)
         if not self.isVisible():
             return
-        if "progress" == field:
-            self.printing_progress_bar.setValue(value)
+        if "progress" in changed:
+            self.printing_progress_bar.setValue(float(sdcard.progress))
+        elif "file_position" in changed:
+            if self.layer_fallback and self.layer_index is not None:
+                self._show_indexed_layer()
+
+    def set_layer_index(self, index: typing.Optional[LayerIndex]) -> None:
+        """Use *index*, the layer index of the file being printed, for the
+        layer display when the slicer does not report layers
+        """
+        self.layer_index = index
+        if self.layer_fallback and index is not None and self.isVisible():
+            self._show_indexed_layer()
+
+    def _show_indexed_layer(self) -> None:
+        if self.layer_index is None or not len(self.layer_index):
+            return
+        _current_layer = self.layer_index.layer_at(self._file_position)
+        frames.set(
+            self.layer_display_button, "secondary_text", f"{len(self.layer_index)}"
+        )
+        frames.set(
+            self.layer_display_button,
+            "text",
+            f"{_current_layer}" if _current_layer else "---",
+        )
 
     def _setupUI(self) -> None:
         """Setup widget ui"""
@@ -405,7 +504,7 @@ class JobStatusWidget(QtWidgets.QWidget):
         self.js_file_name_icon.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.js_file_name_icon.setProperty(
             "icon_pixmap",
-            QtGui.QPixmap(":/files/media/btn_icons/file_icon.svg"),
+            icons.pixmap(":/files/media/btn_icons/file_icon.svg"),
         )
         self.js_file_name_icon.setObjectName("js_file_name_icon")
         self.js_file_name_label = BlocksLabel(parent=self)
@@ -426,7 +525,7 @@ class JobStatusWidget(QtWidgets.QWidget):
         self.pause_printing_btn.setMaximumSize(QtCore.QSize(200, 80))
         self.pause_printing_btn.setFont(font)
         self.pause_printing_btn.setProperty(
-            "icon_pixmap", QtGui.QPixmap(":/ui/media/btn_icons/pause.svg")
+            "icon_pixmap", icons.pixmap(":/ui/media/btn_icons/pause.svg")
         )
         self.pause_printing_btn.setObjectName("pause_printing_btn")
         self.stop_printing_btn = BlocksCustomButton(self)
@@ -435,7 +534,7 @@ class JobStatusWidget(QtWidgets.QWidget):
         self.stop_printing_btn.setMaximumSize(QtCore.QSize(200, 80))
         self.stop_printing_btn.setFont(font)
         self.stop_printing_btn.setProperty(
-            "icon_pixmap", QtGui.QPixmap(":/ui/media/btn_icons/stop.svg")
+            "icon_pixmap", icons.pixmap(":/ui/media/btn_icons/stop.svg")
         )
         self.stop_printing_btn.setObjectName("stop_printing_btn")
         self.tune_menu_btn = BlocksCustomButton(self)
@@ -444,7 +543,7 @@ class JobStatusWidget(QtWidgets.QWidget):
         self.tune_menu_btn.setMaximumSize(QtCore.QSize(200, 80))
         self.tune_menu_btn.setFont(font)
         self.tune_menu_btn.setProperty(
-            "icon_pixmap", QtGui.QPixmap(":/ui/media/btn_icons/tune.svg")
+            "icon_pixmap", icons.pixmap(":/ui/media/btn_icons/tune.svg")
         )
         self.tune_menu_btn.setObjectName("tune_menu_btn")
         self.job_status_btn_layout.addWidget(self.pause_printing_btn)
@@ -464,16 +563,17 @@ class JobStatusWidget(QtWidgets.QWidget):
         self.layer_display_button.setSizePolicy(sizePolicy)
         self.layer_display_button.setMinimumSize(QtCore.QSize(200, 80))
         self.layer_display_button.setProperty(
-            "icon_pixmap", QtGui.QPixmap(":/ui/media/btn_icons/layers.svg")
+            "icon_pixmap", icons.pixmap(":/ui/media/btn_icons/layers.svg")
         )
         self.layer_display_button.setObjectName("layer_display_button")
         self.print_time_display_button = DisplayButton(self)
-        self.print_time_display_button.button_type = "normal"
+        self.print_time_display_button.button_type = "display_secondary"
+        self.print_time_display_button.display_format = "upper_downer"
         self.print_time_display_button.setEnabled(False)
         self.print_time_display_button.setSizePolicy(sizePolicy)
         self.print_time_display_button.setMinimumSize(QtCore.QSize(200, 80))
         self.print_time_display_button.setProperty(
-            "icon_pixmap", QtGui.QPixmap(":/ui/media/btn_icons/time.svg")
+            "icon_pixmap", icons.pixmap(":/ui/media/btn_icons/time.svg")
         )
         self.print_time_display_button.setObjectName("print_time_display_button")
         self.job_stats_display_layout.addWidget(
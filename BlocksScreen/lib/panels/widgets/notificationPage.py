@@ -1,3 +1,4 @@
+from lib.icon_cache import icons
 from lib.utils.blocks_frame import BlocksCustomFrame
 from lib.utils.blocks_button import BlocksCustomButton
 from lib.utils.icon_button import IconButton
@@ -83,21 +84,21 @@ class NotificationPage(QtWidgets.QWidget):
         match priority:
             case 1:
                 self._add_notif_entry(
-                    message, "#1A8FBF", QtGui.QPixmap(":/ui/media/btn_icons/info.svg")
+                    message, "#1A8FBF", icons.pixmap(":/ui/media/btn_icons/info.svg")
                 )
             case 2:
                 self._add_notif_entry(
                     message,
                     "#E7E147",
-                    QtGui.QPixmap(":/ui/media/btn_icons/troubleshoot.svg"),
+                    icons.pixmap(":/ui/media/btn_icons/troubleshoot.svg"),
                 )
             case 3:
                 self._add_notif_entry(
-                    message, "#CA4949", QtGui.QPixmap(":/ui/media/btn_icons/error.svg")
+                    message, "#CA4949", icons.pixmap(":/ui/media/btn_icons/error.svg")
                 )
             case _:
                 self._add_notif_entry(
-                    message, "#a4a4a4", QtGui.QPixmap(":/ui/media/btn_icons/info.svg")
+                    message, "#a4a4a4", icons.pixmap(":/ui/media/btn_icons/info.svg")
                 )
 
         self.model.setData(self.model.index(0), True, EntryListModel.EnableRole)
@@ -237,7 +238,7 @@ class NotificationPage(QtWidgets.QWidget):
         self.update_back_btn.setMinimumSize(QtCore.QSize(60, 60))
         self.update_back_btn.setMaximumSize(QtCore.QSize(60, 60))
         self.update_back_btn.setFlat(True)
-        self.update_back_btn.setPixmap(QtGui.QPixmap(":/ui/media/btn_icons/back.svg"))
+        self.update_back_btn.setPixmap(icons.pixmap(":/ui/media/btn_icons/back.svg"))
         self.header_content_layout.addWidget(
             self.update_back_btn
         )  # alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -379,9 +380,7 @@ class NotificationPage(QtWidgets.QWidget):
         self.delete_btn.setSizePolicy(sizePolicy)
         self.delete_btn.setText("Delete")
         self.delete_btn.setEnabled(False)
-        self.delete_btn.setPixmap(
-            QtGui.QPixmap(":/ui/media/btn_icons/garbage-icon.svg")
-        )
+        self.delete_btn.setPixmap(icons.pixmap(":/ui/media/btn_icons/garbage-icon.svg"))
         self.button_box.addWidget(
             self.delete_btn, 0, QtCore.Qt.AlignmentFlag.AlignCenter
         )
@@ -395,7 +394,7 @@ class NotificationPage(QtWidgets.QWidget):
         self.delete_all_btn.setSizePolicy(sizePolicy)
         self.delete_all_btn.setText("Delete all")
         self.delete_all_btn.setPixmap(
-            QtGui.QPixmap(":/ui/media/btn_icons/garbage-icon.svg")
+            icons.pixmap(":/ui/media/btn_icons/garbage-icon.svg")
         )
         self.button_box.addWidget(
             self.delete_all_btn, 0, QtCore.Qt.AlignmentFlag.AlignCenter
@@ -1,6 +1,7 @@
 import typing
 
 from lib.panels.widgets.optionCardWidget import OptionCard
+from lib.printer_state import Heater
 from lib.utils.blocks_button import BlocksCustomButton
 from lib.utils.blocks_label import BlocksLabel
 from lib.utils.check_button import BlocksCustomCheckButton
@@ -309,13 +310,18 @@ class ProbeHelper(QtWidgets.QWidget):
 
     @QtCore.pyqtSlot(dict, name="on_printer_config")
     def on_printer_config(self, config: dict) -> None:
-        """Handle received printer config"""
+        """Handle received printer config, only the changed sections are
+        received so nothing is done unless a section of interest changed
+        """
         _probe_types = [
             "probe",
             "bltouch",
             "smart_effector",
             "probe_eddy_current",
         ]
+        _sections = {*_probe_types, "stepper_z", "safe_z_home", "bed_mesh"}
+        if not any(name.split(" ", 1)[0] in _sections for name in config):
+            return
 
         self.subscribe_config[list, "PyQt_PyObject"].emit(
             _probe_types, self.on_object_config
@@ -455,9 +461,8 @@ class ProbeHelper(QtWidgets.QWidget):
                 )
         self.run_gcode_signal.emit(_cmd)
 
-    @QtCore.pyqtSlot(str, str, float, name="on_extruder_update")
-    def on_extruder_update(
-        self, extruder_name: str, field: str, new_value: float
+    def on_extruder_changed(
+        self, name: str, extruder: Heater, changed: frozenset
     ) -> None:
         """Handle extruder update"""
         if not self.helper_initialize:
@@ -469,15 +474,16 @@ class ProbeHelper(QtWidgets.QWidget):
                 if self.isVisible:
                     self.call_load_panel.emit(True, "Extruder heated up \n Please wait")
                 return
-            if field == "temperature":
-                self.current_temp = round(new_value, 0)
+            if "temperature" in changed:
+                self.current_temp = round(extruder.temperature, 0)
                 if self.isVisible:
                     self.call_load_panel.emit(
                         True,
-                        f"Heating up ({new_value}/{self.target_temp}) \n Please wait",
+                        f"Heating up ({extruder.temperature}/{self.target_temp})"
+                        " \n Please wait",
                     )
-        if field == "target":
-            self.target_temp = round(new_value, 0)
+        if "target" in changed:
+            self.target_temp = round(extruder.target, 0)
             if self.isVisible:
                 self.call_load_panel.emit(True, "Cleaning the nozzle \n Please wait")
 
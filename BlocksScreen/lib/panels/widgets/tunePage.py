@@ -2,9 +2,12 @@ import re
 import typing
 
 from helper_methods import normalize
+from lib.frame_scheduler import frames
+from lib.printer_state import Heater
 from lib.utils.blocks_button import BlocksCustomButton
 from lib.utils.display_button import DisplayButton
 from lib.utils.icon_button import IconButton
+from lib.utils.temperature_chart import TemperatureChart
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -159,7 +162,11 @@ class TuneWidget(QtWidgets.QWidget):
             if not _display_button:
                 return
             _display_button.update({"speed": int(round(new_value * 100))})
-            _display_button.get("display_button").setText(f"{new_value * 100:.0f}%")
+            frames.set(
+                _display_button.get("display_button"),
+                "text",
+                f"{new_value * 100:.0f}%",
+            )
 
     def create_display_button(self, name: str) -> DisplayButton:
         """Create and return a DisplayButton
@@ -184,44 +191,50 @@ class TuneWidget(QtWidgets.QWidget):
         """Handle gcode move update"""
         if "speed_factor" in field:
             self.speed_factor_override = value
-            self.speed_display.setText(str(f"{int(self.speed_factor_override * 100)}%"))
+            frames.set(
+                self.speed_display,
+                "text",
+                f"{int(self.speed_factor_override * 100)}%",
+            )
 
-    @QtCore.pyqtSlot(str, str, float, name="on_extruder_update")
     def on_extruder_temperature_change(
-        self, extruder_name: str, field: str, new_value: float
+        self, name: str, extruder: Heater, changed: frozenset
     ) -> None:
         """Processes the information that comes from the printer object "extruder"
 
         Args:
-            extruder_name (str): Name of the extruder object
-            field (str): Name of the updated field
-            new_value (float): New value for the field
+            name (str): Name of the extruder object
+            extruder (Heater): Current state of the extruder
+            changed (frozenset): Names of the updated fields
         """
-        if field == "temperature":
-            self.extruder_display.setText(f"{new_value:.1f}")
-        if field == "target":
-            self.extruder_target = int(new_value)
+        if "temperature" in changed:
+            frames.set(self.extruder_display, "text", f"{extruder.temperature:.1f}")
+        if "target" in changed:
+            self.extruder_target = int(extruder.target)
 
-    @QtCore.pyqtSlot(str, str, float, name="on_heater_bed_update")
     def on_heater_bed_temperature_change(
-        self, name: str, field: str, new_value: float
+        self, name: str, heater_bed: Heater, changed: frozenset
     ) -> None:
         """Processes the information that comes from the printer object "heater_bed"
 
         Args:
             name (str): Name of the heater bed object.
-            field (str): Name od the updated field.
-            new_value (float): New value for the fields.
+            heater_bed (Heater): Current state of the heater bed.
+            changed (frozenset): Names of the updated fields.
         """
-        if field == "temperature":
-            self.bed_display.setText(f"{new_value:.1f}")
-        if field == "target":
-            self.bed_target = int(new_value)
+        if "temperature" in changed:
+            frames.set(self.bed_display, "text", f"{heater_bed.temperature:.1f}")
+        if "target" in changed:
+            self.bed_target = int(heater_bed.target)
 
     def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
         """Re-implemented method, paint widget"""
         if self.isVisible():
-            self.speed_display.setText(str(f"{int(self.speed_factor_override * 100)}%"))
+            frames.set(
+                self.speed_display,
+                "text",
+                f"{int(self.speed_factor_override * 100)}%",
+            )
 
     def _setupUI(self) -> None:
         sizePolicy = QtWidgets.QSizePolicy(
@@ -430,6 +443,9 @@ class TuneWidget(QtWidgets.QWidget):
         )
         self.speed_display.setObjectName("speed_display")
         self.tune_display_vertical_child_layout_3.addWidget(self.speed_display)
+        self.temperature_chart = TemperatureChart(parent=self)
+        self.temperature_chart.setObjectName("tune_temperature_chart")
+        self.tune_display_vertical_child_layout_3.addWidget(self.temperature_chart, 1)
         self.tune_content.addLayout(self.tune_display_horizontal_parent_layout, 1)
         self.tune_display_horizontal_parent_layout.setStretch(0, 0)
         self.tune_display_horizontal_parent_layout.setStretch(1, 0)
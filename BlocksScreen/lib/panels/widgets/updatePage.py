@@ -1,6 +1,7 @@
 import copy
 import typing
 
+from lib.icon_cache import icons
 from lib.panels.widgets.loadWidget import LoadingOverlayWidget
 from lib.utils.blocks_button import BlocksCustomButton
 from lib.utils.blocks_frame import BlocksCustomFrame
@@ -281,7 +282,7 @@ class UpdatePage(QtWidgets.QWidget):
         """Adds a new item to the list model"""
         item = ListItem(
             text=cli_name,
-            right_icon=QtGui.QPixmap(":/ui/media/btn_icons/info.svg"),
+            right_icon=icons.pixmap(":/ui/media/btn_icons/info.svg"),
             selected=False,
             _lfontsize=17,
             _rfontsize=12,
@@ -319,7 +320,7 @@ class UpdatePage(QtWidgets.QWidget):
         self.reload_btn.setMinimumSize(QtCore.QSize(60, 60))
         self.reload_btn.setMaximumSize(QtCore.QSize(60, 60))
         self.reload_btn.setFlat(True)
-        self.reload_btn.setPixmap(QtGui.QPixmap(":/ui/media/btn_icons/refresh.svg"))
+        self.reload_btn.setPixmap(icons.pixmap(":/ui/media/btn_icons/refresh.svg"))
         self.header_content_layout.addWidget(
             self.reload_btn
         )  # alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -349,7 +350,7 @@ class UpdatePage(QtWidgets.QWidget):
         self.update_back_btn.setMinimumSize(QtCore.QSize(60, 60))
         self.update_back_btn.setMaximumSize(QtCore.QSize(60, 60))
         self.update_back_btn.setFlat(True)
-        self.update_back_btn.setPixmap(QtGui.QPixmap(":/ui/media/btn_icons/back.svg"))
+        self.update_back_btn.setPixmap(icons.pixmap(":/ui/media/btn_icons/back.svg"))
         self.header_content_layout.addWidget(
             self.update_back_btn
         )  # alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -611,7 +612,7 @@ class UpdatePage(QtWidgets.QWidget):
         self.action_btn.setSizePolicy(sizePolicy)
         self.action_btn.setText("Update")
         self.action_btn.setPixmap(
-            QtGui.QPixmap(":/system/media/btn_icons/update-software-icon.svg")
+            icons.pixmap(":/system/media/btn_icons/update-software-icon.svg")
         )
         self.button_box.addWidget(
             self.action_btn, 0, QtCore.Qt.AlignmentFlag.AlignCenter
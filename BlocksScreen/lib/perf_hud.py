@@ -0,0 +1,298 @@
+"""On-screen performance HUD for field diagnosis.
+
+``hud`` draws a small overlay in the top left corner of the main window
+with, refreshed twice a second:
+
+- frames painted per second and the largest event loop lag
+- websocket events waiting for the GUI thread and status updates/s
+- the share of status deltas merged by the websocket handoff and of
+  widget updates saved by the frame scheduler
+- resident memory and the garbage collector counters
+- the five slowest event handlers of the last ten seconds
+
+The overlay is an opaque child widget that renders its text into a
+pixmap only when the numbers are sampled, repaints of the widgets below
+it just blit that pixmap.  Handler timing happens in
+``BlocksScreenApp.notify`` and only while the HUD is shown.
+
+Toggled from the utilities info page or in ``BlocksScreen.cfg``::
+
+    [performance_hud]
+    enabled: true
+"""
+
+from __future__ import annotations
+
+import collections
+import gc
+import heapq
+import logging
+import os
+import time
+import typing
+
+from lib.frame_scheduler import frames
+from lib.stall_watchdog import watchdog
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL_MS = 500
+# Seconds of event handler timings kept for the slowest list
+SLOW_WINDOW = 10.0
+# Handlers faster than this, in seconds, are not recorded
+SLOW_MINIMUM = 0.002
+SLOW_TOP = 5
+
+
+def rss_bytes() -> int:
+    """Resident set size of the process, 0 where ``/proc`` is missing"""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def handler_name(receiver: QtCore.QObject, event: QtCore.QEvent) -> str:
+    """Label of an event handler, the receiver class, name and event type"""
+    try:
+        name = receiver.objectName()
+    except RuntimeError:
+        # Deleted by its own handler, deferred deletes
+        name = ""
+    kind = getattr(event.type(), "name", str(event.type()))
+    if name:
+        return f"{type(receiver).__name__}({name}).{kind}"
+    return f"{type(receiver).__name__}.{kind}"
+
+
+class SlowHandlers:
+    """Durations of the slow event handlers of the last ``window`` seconds"""
+
+    def __init__(self, window: float = SLOW_WINDOW) -> None:
+        self.window = window
+        self._records: collections.deque[tuple[float, float, str]] = collections.deque()
+
+    def add(
+        self, name: str, seconds: float, now: typing.Optional[float] = None
+    ) -> None:
+        """Record that *name* ran for *seconds*"""
+        self._records.append((time.monotonic() if now is None else now, seconds, name))
+
+    def top(
+        self, count: int = SLOW_TOP, now: typing.Optional[float] = None
+    ) -> list[tuple[str, float]]:
+        """Slowest run of the *count* slowest handlers, in seconds"""
+        oldest = (time.monotonic() if now is None else now) - self.window
+        while self._records and self._records[0][0] < oldest:
+            self._records.popleft()
+        slowest: dict[str, float] = {}
+        for _, seconds, name in self._records:
+            if seconds > slowest.get(name, 0.0):
+                slowest[name] = seconds
+        return heapq.nlargest(count, slowest.items(), key=lambda item: item[1])
+
+
+class HudOverlay(QtWidgets.QWidget):
+    """Opaque overlay showing the lines of the last sample"""
+
+    def __init__(self, parent: QtWidgets.QWidget) -> None:
+        super().__init__(parent)
+        self.setObjectName("performance_hud")
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_NoSystemBackground)
+        font = QtGui.QFont("Monospace")
+        font.setStyleHint(QtGui.QFont.StyleHint.TypeWriter)
+        font.setPixelSize(11)
+        self.setFont(font)
+        self._layer = QtGui.QPixmap()
+        self.lines: list[str] = []
+
+    def set_lines(self, lines: list[str]) -> None:
+        """Render *lines* into the layer and resize to fit"""
+        self.lines = lines
+        metrics = self.fontMetrics()
+        width = max(metrics.horizontalAdvance(line) for line in lines) + 8
+        height = metrics.lineSpacing() * len(lines) + 6
+        ratio = self.devicePixelRatioF()
+        self._layer = QtGui.QPixmap(round(width * ratio), round(height * ratio))
+        self._layer.setDevicePixelRatio(ratio)
+        self._layer.fill(QtGui.QColor(0, 0, 0, 255))
+        painter = QtGui.QPainter(self._layer)
+        painter.setFont(self.font())
+        painter.setPen(QtGui.QColor("#7CFC00"))
+        for row, line in enumerate(lines):
+            painter.drawText(
+                4, 3 + metrics.ascent() + row * metrics.lineSpacing(), line
+            )
+        painter.end()
+        if self.size() != QtCore.QSize(width, height):
+            self.resize(width, height)
+        self.raise_()
+        self.update()
+
+    def paintEvent(self, a0: typing.Optional[QtGui.QPaintEvent]) -> None:
+        """Re-implemented method, blit the rendered layer"""
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._layer)
+        painter.end()
+
+
+class PerformanceHud(QtCore.QObject):
+    """Collects the HUD numbers and drives the overlay"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.enabled = False
+        self.slow = SlowHandlers()
+        self._window: typing.Optional[QtWidgets.QWidget] = None
+        self._ws: typing.Any = None
+        self._overlay: typing.Optional[HudOverlay] = None
+        self._depth = 0
+        self._frames = 0
+        self._last: dict[str, float] = {}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(SAMPLE_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    @property
+    def overlay(self) -> typing.Optional[HudOverlay]:
+        """The overlay widget, created when first shown"""
+        return self._overlay
+
+    def configure(self, config: typing.Any) -> None:
+        """Apply the ``[performance_hud]`` section
+
+        Args:
+            config: ``BlocksScreenConfig`` of the whole file
+        """
+        section = config.get_section("performance_hud", fallback=None)
+        if section is None:
+            return
+        self.enabled = section.getboolean("enabled", default=False)
+
+    def attach(self, window: QtWidgets.QWidget, ws: typing.Any = None) -> None:
+        """Draw over *window*, reading the websocket counters of *ws*"""
+        self._window = window
+        self._ws = ws
+        self.set_enabled(self.enabled)
+
+    @QtCore.pyqtSlot(bool, name="set-enabled")
+    def set_enabled(self, enabled: bool) -> None:
+        """Show or hide the HUD"""
+        self.enabled = enabled
+        if self._window is None:
+            return
+        if not enabled:
+            self._timer.stop()
+            self._window.removeEventFilter(self)
+            if self._overlay is not None:
+                self._overlay.hide()
+            return
+        if self._overlay is None:
+            self._overlay = HudOverlay(self._window)
+        self._window.installEventFilter(self)
+        self._last = {}
+        self.refresh()
+        self._overlay.show()
+        self._timer.start()
+
+    def notify(
+        self,
+        notify: typing.Callable[[QtCore.QObject, QtCore.QEvent], bool],
+        receiver: QtCore.QObject,
+        event: QtCore.QEvent,
+    ) -> bool:
+        """Deliver *event* through *notify*, timing outermost handlers"""
+        if self._depth:
+            return notify(receiver, event)
+        self._depth += 1
+        started = time.perf_counter()
+        try:
+            return notify(receiver, event)
+        finally:
+            self._depth -= 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= SLOW_MINIMUM:
+                self.slow.add(handler_name(receiver, event), elapsed)
+
+    def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
+        """Count the frames of the attached window"""
+        if a1.type() == QtCore.QEvent.Type.UpdateRequest:
+            self._frames += 1
+        return False
+
+    def sample(self) -> list[str]:
+        """Lines of text with the numbers since the previous sample"""
+        now = time.monotonic()
+        seconds = max(now - self._last.get("time", now - 1.0), 1e-3)
+        lines = [
+            f"fps {self._frames / seconds:5.1f}  lag "
+            + (
+                f"{watchdog.take_max_lag() * 1000:4.0f} ms"
+                if watchdog.running
+                else "   - ms"
+            )
+        ]
+        self._frames = 0
+        handoff = getattr(self._ws, "handoff", None)
+        metrics = getattr(self._ws, "metrics", None)
+        status = (
+            metrics.incoming_count("notify_status_update") if metrics is not None else 0
+        )
+        ws_queued = handoff.queued if handoff is not None else 0
+        ws_merged = handoff.merged if handoff is not None else 0
+        lines.append(
+            f"ws queued {handoff.pending if handoff is not None else 0:3d}  "
+            f"status {(status - self._last.get('status', status)) / seconds:5.1f}/s"
+        )
+        lines.append(
+            "coalesced ws "
+            + self._ratio(ws_merged, ws_queued, "ws_merged", "ws_queued")
+            + "  ui "
+            + self._ratio(
+                frames.requested - frames.applied,
+                frames.requested,
+                "ui_saved",
+                "ui_requested",
+            )
+        )
+        counts = gc.get_count()
+        collected = [stats["collections"] for stats in gc.get_stats()]
+        lines.append(
+            f"rss {rss_bytes() / 2**20:5.1f} MiB  gc "
+            + "/".join(str(count) for count in counts)
+            + " ("
+            + "/".join(str(count) for count in collected)
+            + ")"
+        )
+        slowest = self.slow.top()
+        lines.append(f"slowest {SLOW_WINDOW:.0f}s:" if slowest else "slowest: none")
+        lines.extend(f" {seconds * 1000:6.1f} ms {name}" for name, seconds in slowest)
+        self._last.update(
+            time=now,
+            status=status,
+            ws_merged=ws_merged,
+            ws_queued=ws_queued,
+            ui_saved=frames.requested - frames.applied,
+            ui_requested=frames.requested,
+        )
+        return lines
+
+    def _ratio(self, part: int, total: int, part_key: str, total_key: str) -> str:
+        part -= self._last.get(part_key, part)
+        total -= self._last.get(total_key, total)
+        if total <= 0:
+            return "  -"
+        return f"{part * 100 / total:3.0f}%"
+
+    @QtCore.pyqtSlot(name="refresh")
+    def refresh(self) -> None:
+        """Sample the numbers and redraw the overlay"""
+        if self._overlay is not None:
+            self._overlay.set_lines(self.sample())
+
+
+hud = PerformanceHud()
@@ -0,0 +1,255 @@
+"""Print progress and remaining time estimation.
+
+``PrintEta`` follows ``print_stats`` and ``virtual_sdcard`` through the
+``PrinterState`` store and, once per second while a job is active,
+emits a ``PrintEstimate`` with the progress, the remaining time and the
+expected completion time.  Three estimates are blended:
+
+* slicer: the file's ``estimated_time`` scaled by the remaining share of
+  the file, trusted most at the start of the print
+* extrapolation: the elapsed print time scaled by the file progress
+* rate: the remaining bytes over the recent byte rate, itself smoothed
+
+The blend is exponentially smoothed and counts down between updates so
+the displayed value does not jump around.  ``print_duration`` excludes
+pauses, while paused the remaining time is held and only the completion
+time moves.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+import typing
+
+from PyQt6 import QtCore
+
+ACTIVE_STATES: frozenset[str] = frozenset({"printing", "paused"})
+# Below this file progress the extrapolated estimates are too noisy
+MIN_PROGRESS: float = 0.01
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PrintEstimate:
+    """Progress of the current job, times in seconds
+
+    ``remaining`` is ``-1.0`` and ``completion`` ``0.0`` while no estimate
+    is available yet.
+    """
+
+    filename: str = ""
+    state: str = ""
+    progress: float = 0.0
+    print_duration: float = 0.0
+    remaining: float = -1.0
+    completion: float = 0.0  # ``time.time()`` based timestamp
+
+
+def file_progress(
+    position: int, size: int, start_byte: int = 0, end_byte: int = 0
+) -> float:
+    """Share of the gcode (excluding header and footer) already read
+
+    Args:
+        position (int): ``virtual_sdcard.file_position``
+        size (int): File size
+        start_byte (int): First gcode byte, ``gcode_start_byte`` metadata
+        end_byte (int): Last gcode byte, ``gcode_end_byte`` metadata
+
+    Returns:
+        float: Progress between 0 and 1
+    """
+    if end_byte <= start_byte:
+        start_byte, end_byte = 0, size
+    if end_byte <= start_byte:
+        return 0.0
+    return min(1.0, max(0.0, (position - start_byte) / (end_byte - start_byte)))
+
+
+def blend_estimates(
+    progress: float,
+    slicer: typing.Optional[float] = None,
+    extrapolated: typing.Optional[float] = None,
+    rate: typing.Optional[float] = None,
+) -> typing.Optional[float]:
+    """Blend the available remaining time estimates
+
+    The slicer estimate weighs ``1 - progress`` against the average of the
+    measured estimates, which weigh ``progress``.
+
+    Returns:
+        float | None: Remaining seconds, ``None`` without any estimate
+    """
+    measured = [value for value in (extrapolated, rate) if value is not None]
+    if not measured:
+        return slicer
+    observed = sum(measured) / len(measured)
+    if slicer is None:
+        return observed
+    return slicer * (1.0 - progress) + observed * progress
+
+
+class PrintEta(QtCore.QObject):
+    """Remaining time engine for the active print job
+
+    Args:
+        state: ``PrinterState`` of the printer
+        parent (QtCore.QObject, optional): Parent object
+        smoothing (float): Weight of a new blended estimate, 0 to 1
+        interval (int): Update period in milliseconds
+    """
+
+    eta_update: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        "PyQt_PyObject", name="eta_update"
+    )
+
+    def __init__(
+        self,
+        state: typing.Any,
+        parent: typing.Optional[QtCore.QObject] = None,
+        smoothing: float = 0.1,
+        interval: int = 1000,
+    ) -> None:
+        super().__init__(parent)
+        self.smoothing = smoothing
+        self._state = state
+        self._metadata: dict = {}
+        self._pending_metadata: dict = {}
+        self._remaining: typing.Optional[float] = None
+        self._rate: typing.Optional[float] = None  # bytes per print second
+        self._last_sample: typing.Optional[tuple[float, int]] = None
+        self._last_tick: typing.Optional[float] = None
+        self._duration_at: float = time.monotonic()
+        self.estimate = PrintEstimate()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.update)
+        state.subscribe("print_stats", self._on_print_stats, ("state", "filename"))
+        state.subscribe("print_stats", self._on_print_duration, ("print_duration",))
+
+    @property
+    def active(self) -> bool:
+        """Whether a job is printing or paused"""
+        return self._timer.isActive()
+
+    @QtCore.pyqtSlot(dict, name="on_fileinfo")
+    def on_fileinfo(self, fileinfo: dict) -> None:
+        """Use the metadata of the file being printed"""
+        filename = fileinfo.get("filename", "")
+        if not filename:
+            return
+        if filename == self._state.value("print_stats", "filename", ""):
+            self._metadata = fileinfo
+        else:
+            self._pending_metadata = fileinfo
+
+    def _on_print_stats(self, name: str, stats: typing.Any, changed: frozenset) -> None:
+        if "filename" in changed:
+            self._reset()
+            if self._pending_metadata.get("filename") == stats.filename:
+                self._metadata = self._pending_metadata
+        if stats.state in ACTIVE_STATES:
+            if not self._timer.isActive():
+                self._timer.start()
+                self._last_tick = None
+        elif self._timer.isActive():
+            self._timer.stop()
+            self.update()  # Final estimate, complete jobs end at 0
+            self._reset()
+
+    def _on_print_duration(
+        self, name: str, stats: typing.Any, changed: frozenset
+    ) -> None:
+        self._duration_at = time.monotonic()
+
+    def _reset(self) -> None:
+        self._metadata = {}
+        self._remaining = None
+        self._rate = None
+        self._last_sample = None
+        self._last_tick = None
+
+    def _print_duration(self, now: float) -> float:
+        """``print_duration`` extrapolated since it was last reported"""
+        stats = self._state.get("print_stats")
+        if stats is None:
+            return 0.0
+        if stats.state != "printing":
+            return stats.print_duration
+        return stats.print_duration + max(0.0, now - self._duration_at)
+
+    def _update_rate(self, duration: float, position: int) -> None:
+        if self._last_sample is not None:
+            last_duration, last_position = self._last_sample
+            elapsed = duration - last_duration
+            if elapsed <= 0.0:
+                return
+            rate = (position - last_position) / elapsed
+            if rate >= 0.0:
+                self._rate = (
+                    rate
+                    if self._rate is None
+                    else self._rate + self.smoothing * (rate - self._rate)
+                )
+        self._last_sample = (duration, position)
+
+    def compute(self, now: typing.Optional[float] = None) -> PrintEstimate:
+        """Compute the current estimate without emitting it"""
+        now = time.monotonic() if now is None else now
+        stats = self._state.get("print_stats")
+        sdcard = self._state.get("virtual_sdcard")
+        if stats is None:
+            return PrintEstimate()
+        duration = self._print_duration(now)
+        position = sdcard.file_position if sdcard is not None else 0
+        size = sdcard.file_size if sdcard is not None else 0
+        metadata = self._metadata
+        progress = file_progress(
+            position,
+            size or int(metadata.get("size", 0) or 0),
+            int(metadata.get("gcode_start_byte", 0) or 0),
+            int(metadata.get("gcode_end_byte", 0) or 0),
+        )
+        if stats.state == "complete":
+            self._remaining = 0.0
+        elif stats.state not in ACTIVE_STATES:
+            self._remaining = None
+        elif stats.state == "printing":
+            # Sampled on the reported duration, position and duration
+            # arrive together
+            self._update_rate(stats.print_duration, position)
+            estimated_time = float(metadata.get("estimated_time", 0) or 0)
+            slicer = estimated_time * (1.0 - progress) if estimated_time > 0 else None
+            extrapolated = rate = None
+            if progress >= MIN_PROGRESS:
+                extrapolated = duration * (1.0 - progress) / progress
+                if self._rate:
+                    end_byte = int(metadata.get("gcode_end_byte", 0) or 0) or size
+                    rate = max(0.0, end_byte - position) / self._rate
+            blended = blend_estimates(progress, slicer, extrapolated, rate)
+            if blended is not None:
+                if self._remaining is None:
+                    self._remaining = blended
+                else:
+                    # Count down since the last tick, then pull towards
+                    # the new blend
+                    if self._last_tick is not None:
+                        self._remaining -= now - self._last_tick
+                    self._remaining += self.smoothing * (blended - self._remaining)
+                self._remaining = max(0.0, self._remaining)
+        self._last_tick = now if stats.state == "printing" else None
+        remaining = -1.0 if self._remaining is None else self._remaining
+        return PrintEstimate(
+            filename=stats.filename,
+            state=stats.state,
+            progress=progress,
+            print_duration=duration,
+            remaining=remaining,
+            completion=time.time() + remaining if remaining >= 0.0 else 0.0,
+        )
+
+    @QtCore.pyqtSlot(name="update")
+    def update(self) -> None:
+        """Compute and emit the estimate, called every interval"""
+        self.estimate = self.compute()
+        self.eta_update.emit(self.estimate)
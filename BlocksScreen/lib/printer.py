@@ -4,7 +4,10 @@ import logging
 import typing
 
 import events
+from lib.bed_mesh import BedMeshEngine
+from lib.config_index import ConfigIndex, diff_config
 from lib.moonrakerComm import MoonWebSocket
+from lib.printer_state import PrinterState
 from PyQt6 import QtCore, QtWidgets
 
 logger = logging.getLogger(__name__)
@@ -19,8 +22,6 @@ class Printer(QtCore.QObject):
 
     on_printcore_update = QtCore.pyqtSignal(dict, name="on_printcore_update")
 
-    extruder_update = QtCore.pyqtSignal(str, str, float, name="extruder_update")
-    heater_bed_update = QtCore.pyqtSignal(str, str, float, name="heater_bed_update")
     fan_update = QtCore.pyqtSignal(
         [str, str, float], [str, str, int], name="fan_update"
     )
@@ -36,9 +37,6 @@ class Printer(QtCore.QObject):
     toolhead_update = QtCore.pyqtSignal(
         [str, float], [str, list], [str, str], name="toolhead_update"
     )
-    virtual_sdcard_update = QtCore.pyqtSignal(
-        [str, float], [str, bool], name="virtual_sdcard_update"
-    )
     print_stats_update = QtCore.pyqtSignal(
         [str, dict], [str, float], [str, str], name="print_stats_update"
     )
@@ -72,6 +70,9 @@ class Printer(QtCore.QObject):
     printer_config: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
         dict, name="printer_config"
     )
+    printer_config_removed: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        list, name="printer_config_removed"
+    )
 
     configfile_update: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
         dict, name="configfile_update"
@@ -108,20 +109,17 @@ class Printer(QtCore.QObject):
         super(Printer, self).__init__(parent)
 
         self.ws = ws
+        self.bed_mesh = BedMeshEngine()
+        self.state = PrinterState(self)
+        self.config_index = ConfigIndex()
+        # Last configuration received, re-sent but unchanged configurations
+        # are not processed again
+        self._config_snapshot: dict = {}
+        self.config_version: int = 0
         self.active_extruder_name: str = ""
         self.available_filament_sensors: dict = {}
         self.has_chamber: bool = False
 
-        _heater_attributes: dict = {
-            "current_temperature": 0.0,
-            "target_temperature": 0.0,
-            "can_extrude": False,
-        }
-        self.heaters_object: dict = {
-            "extruder": _heater_attributes.copy(),
-            "bed": _heater_attributes.copy(),
-        }
-
         self.ws.klippy_state_signal.connect(self.on_klippy_status)
         self.request_available_objects_signal.connect(self.ws.api.get_available_objects)
         self.request_object_subscription_signal.connect(self.ws.api.object_subscription)
@@ -132,6 +130,11 @@ class Printer(QtCore.QObject):
         self.available_gcode_commands.clear()
         self.available_objects.clear()
         self.configfile.clear()
+        self.config_index.clear()
+        # The configuration sent after a restart is emitted in full again so
+        # listeners read their sections again
+        self._config_snapshot = {}
+        self.state.reset()
         self.printing = False
         self.printing_state = ""
         self.print_file_loaded = False
@@ -175,10 +178,7 @@ class Printer(QtCore.QObject):
         """
         if not section:
             return False
-        _printer_config = self.configfile.get("config", None)
-        if not _printer_config:
-            return False
-        return bool(section in _printer_config)
+        return section in self.config_index
 
     def fetch_config_by_keyword(self, section: str) -> list:
         """Retrieve a section or sections from the printers configfile
@@ -192,20 +192,9 @@ class Printer(QtCore.QObject):
             list: The entire section with the section as key or None if
                             nothing is found
         """
-        if not self.configfile or not section:
-            return []
-        _printer_config = self.configfile.get("config")
-        if not _printer_config:
+        if not section:
             return []
-        return [
-            {key: _printer_config.get(key)}
-            for key in _printer_config
-            if key.startswith(str(section + " ")) or key == section
-        ]
-        # Iterates over every key and checks if it starts
-        # with the prefix -> Complexity O(n*s)
-        # Simple but becomes costly for large n values
-        # since the dictionary is not exactly big, it should be ok
+        return self.config_index.lookup(section)
 
     def get_config(self, section_name: str) -> dict:
         """Gets a printer config section, does not accept prefixes
@@ -218,32 +207,21 @@ class Printer(QtCore.QObject):
         """
         if not section_name:
             return {}
-        if not self.has_config_keyword(section_name):
-            return {}
-        _config = self.fetch_config_by_keyword(section_name)
-        return _config[0].get(section_name, {})
+        return self.config_index.section(section_name)
 
-    def search_config_list(
-        self, search_list: list[str], _objects: typing.Optional[list] = None
-    ) -> list:
-        """
-        Search a list of printer objects recursively
+    def search_config_list(self, search_list: list[str]) -> list:
+        """Search a list of printer objects, with prefixes or full section
+        names, in a single pass
 
         Args:
-                search_list (list): A list of objects to search for.
-                _objects (list, optional): Internal list, should not be directly set or modified.
-        ---
+            search_list (list): A list of objects to search for.
 
         Returns:
             list: A list containing the found objects with their configuration
         """
-        if not _objects:
-            _objects = []
         if not search_list:
-            return _objects
-        key = search_list.pop()
-        _objects.extend(self.fetch_config_by_keyword(key))
-        return self.search_config_list(search_list, _objects)
+            return []
+        return self.config_index.lookup_many(search_list)
 
     @QtCore.pyqtSlot(str, "PyQt_PyObject", name="on_subscribe_config")
     @QtCore.pyqtSlot(list, "PyQt_PyObject", name="on_subscribe_config")
@@ -286,6 +264,7 @@ class Printer(QtCore.QObject):
         if not isinstance(report[0], dict):
             return
         _objects_updated_dict: dict = report[0]
+        self.state.apply(_objects_updated_dict)
         for name, value in _objects_updated_dict.items():
             self._check_callback(name, value)
 
@@ -387,52 +366,6 @@ class Printer(QtCore.QObject):
                 "square_corner_velocity", values["square_corner_velocity"]
             )
 
-    def _extruder_object_updated(
-        self, value: dict, extruder_name: str = "extruder"
-    ) -> None:
-        if "temperature" in value.keys():
-            self.extruder_update.emit(
-                extruder_name, "temperature", value["temperature"]
-            )
-            self.heaters_object[f"{extruder_name}"]["actual_temperature"] = value[
-                "temperature"
-            ]
-        if "target" in value.keys():
-            self.extruder_update.emit(extruder_name, "target", value["target"])
-            self.heaters_object[f"{extruder_name}"]["target_temperature"] = value[
-                "target"
-            ]
-        if "can_extrude" in value.keys():
-            self.heaters_object[f"{extruder_name}"]["can_extrude"] = value[
-                "can_extrude"
-            ]
-        if "power" in value.keys():
-            self.extruder_update.emit(extruder_name, "power", value["power"])
-        if "pressure_advance" in value.keys():
-            self.extruder_update.emit(
-                extruder_name, "pressure_advance", value["pressure_advance"]
-            )
-        if "smooth_time" in value.keys():
-            self.extruder_update.emit(
-                extruder_name, "smooth_time", value["smooth_time"]
-            )
-        if "can_extrude" in value.keys():
-            pass
-
-    def _heater_bed_object_updated(
-        self, value: dict, heater_name: str = "heater_bed"
-    ) -> None:
-        if "temperature" in value.keys():
-            self.heater_bed_update.emit(
-                heater_name, "temperature", value["temperature"]
-            )
-            self.heaters_object["bed"]["actual_temperature"] = value["temperature"]
-        if "target" in value.keys():
-            self.heater_bed_update.emit(heater_name, "target", value["target"])
-            self.heaters_object["bed"]["target_temperature"] = value["target"]
-        if "power" in value.keys():
-            self.heater_bed_update.emit(heater_name, "power", value["power"])
-
     def _chamber_object_updated(self, value: dict, heater_name: str = "chamber"):
         self.has_chamber = True
 
@@ -487,18 +420,6 @@ class Printer(QtCore.QObject):
                 "printing_time", value["printing_time"]
             )
 
-    def _virtual_sdcard_object_updated(
-        self, values: dict, name: str = "virtual_sdcard"
-    ) -> None:
-        if "progress" in values.keys():
-            self.virtual_sdcard_update[str, float].emit("progress", values["progress"])
-        if "is_active" in values.keys():
-            self.virtual_sdcard_update[str, bool].emit("is_active", values["is_active"])
-        if "file_position" in values.keys():
-            self.virtual_sdcard_update[str, float].emit(
-                "file_position", float(values["file_position"])
-            )
-
     def send_print_event(self, event: str):
         """Dispatches a print event throughout the gui
 
@@ -671,8 +592,15 @@ class Printer(QtCore.QObject):
             self.output_pin_update.emit(output_pin_name, "value", values["value"])
 
     def _bed_mesh_object_updated(self, values: dict, name: str = "bed_mesh") -> None:
-        # TODO
-        pass
+        if not self.bed_mesh.update(values):
+            return
+        self.bed_mesh_update.emit(
+            self.bed_mesh.profile_name,
+            list(self.bed_mesh.mesh_min),
+            list(self.bed_mesh.mesh_max),
+            self.bed_mesh.probed_matrix,
+            self.bed_mesh.mesh_matrix,
+        )
 
     def _gcode_macro_object_updated(self, values: dict, gcode_macro_name: str) -> None:
         # * values argument can come with many different types for this macro so handle them in another place
@@ -685,7 +613,26 @@ class Printer(QtCore.QObject):
     ) -> None:
         self.configfile.update(values)
         if "config" in values.keys():
-            self.printer_config.emit(values["config"])
+            values = dict(values)
+            _config = values.pop("config")
+            _diff = diff_config(self._config_snapshot, _config)
+            self._config_snapshot = _config
+            if _diff or not len(self.config_index):
+                self.config_index.rebuild(_config)
+            if _diff:
+                # Only the added and changed sections are emitted
+                self.config_version += 1
+                if _diff.removed:
+                    self.printer_config_removed.emit(sorted(_diff.removed))
+                values["config"] = {name: _config[name] for name in _diff.sections}
+                if values["config"]:
+                    self.printer_config.emit(values["config"])
+                logger.debug(
+                    "Printer config changed: %d added, %d removed, %d changed",
+                    len(_diff.added),
+                    len(_diff.removed),
+                    len(_diff.changed),
+                )
         if "settings" in values.keys():
             # TODO
             ...
@@ -698,7 +645,8 @@ class Printer(QtCore.QObject):
             # TODO
             ...
 
-        self.configfile_update.emit(values)  # Signal config update
+        if values:
+            self.configfile_update.emit(values)  # Signal config update
 
         return
 
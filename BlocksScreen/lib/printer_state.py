@@ -0,0 +1,322 @@
+"""Typed printer object state with changed-field notifications.
+
+``PrinterState`` keeps one ``__slots__`` dataclass per Klipper object
+(``extruder``, ``toolhead``, ``print_stats``...), merges the status
+deltas of each ``notify_status_update`` in place and, once per dispatch,
+tells subscribers which fields of which object changed.
+
+Consumers subscribe to an object, optionally restricted to some of its
+fields, and read the current values straight from the state object::
+
+    printer.state.subscribe("extruder", self.on_extruder, ("temperature",))
+
+
+    def on_extruder(self, name, extruder, changed):
+        self.label.setText(f"{extruder.temperature:.1f}")
+
+Fields Klipper reports that a dataclass does not declare end up in its
+``extra`` dict, objects without a dedicated dataclass use
+``GenericObject`` which only has ``extra``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import typing
+
+from PyQt6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+Callback = typing.Callable[[str, typing.Any, frozenset], None]
+
+
+@dataclasses.dataclass(slots=True)
+class GenericObject:
+    """Any printer object without a dedicated dataclass"""
+
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class Webhooks:
+    """``webhooks`` object"""
+
+    state: str = ""
+    state_message: str = ""
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class PrintStats:
+    """``print_stats`` object"""
+
+    filename: str = ""
+    total_duration: float = 0.0
+    print_duration: float = 0.0
+    filament_used: float = 0.0
+    state: str = ""
+    message: str = ""
+    info: dict = dataclasses.field(default_factory=dict)
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class VirtualSdcard:
+    """``virtual_sdcard`` object"""
+
+    file_path: typing.Optional[str] = None
+    progress: float = 0.0
+    is_active: bool = False
+    file_position: int = 0
+    file_size: int = 0
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class Toolhead:
+    """``toolhead`` object"""
+
+    homed_axes: str = ""
+    print_time: float = 0.0
+    estimated_print_time: float = 0.0
+    extruder: str = ""
+    position: list = dataclasses.field(default_factory=list)
+    max_velocity: float = 0.0
+    max_accel: float = 0.0
+    max_accel_to_decel: float = 0.0
+    minimum_cruise_ratio: float = 0.0
+    square_corner_velocity: float = 0.0
+    axis_minimum: list = dataclasses.field(default_factory=list)
+    axis_maximum: list = dataclasses.field(default_factory=list)
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class GcodeMove:
+    """``gcode_move`` object"""
+
+    speed_factor: float = 1.0
+    speed: float = 0.0
+    extrude_factor: float = 1.0
+    absolute_coordinates: bool = True
+    absolute_extrude: bool = True
+    homing_origin: list = dataclasses.field(default_factory=list)
+    position: list = dataclasses.field(default_factory=list)
+    gcode_position: list = dataclasses.field(default_factory=list)
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class Heater:
+    """``extruder*``, ``heater_bed`` and ``heater_generic`` objects"""
+
+    temperature: float = 0.0
+    target: float = 0.0
+    power: float = 0.0
+    can_extrude: bool = False
+    pressure_advance: float = 0.0
+    smooth_time: float = 0.0
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class TemperatureSensor:
+    """``temperature_sensor`` objects"""
+
+    temperature: float = 0.0
+    measured_min_temp: float = 0.0
+    measured_max_temp: float = 0.0
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class TemperatureFan:
+    """``temperature_fan`` objects"""
+
+    speed: float = 0.0
+    rpm: typing.Optional[float] = None
+    temperature: float = 0.0
+    target: float = 0.0
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class Fan:
+    """``fan``, ``fan_generic``, ``controller_fan`` and ``heater_fan`` objects"""
+
+    speed: float = 0.0
+    rpm: typing.Optional[float] = None
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class IdleTimeout:
+    """``idle_timeout`` object"""
+
+    state: str = ""
+    printing_time: float = 0.0
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(slots=True)
+class DisplayStatus:
+    """``display_status`` object"""
+
+    message: typing.Optional[str] = None
+    progress: float = 0.0
+    extra: dict = dataclasses.field(default_factory=dict)
+
+
+# Object type (first word of the Klipper object name) to dataclass.
+OBJECT_TYPES: dict[str, type] = {
+    "webhooks": Webhooks,
+    "print_stats": PrintStats,
+    "virtual_sdcard": VirtualSdcard,
+    "toolhead": Toolhead,
+    "gcode_move": GcodeMove,
+    "extruder": Heater,
+    "heater_bed": Heater,
+    "heater_generic": Heater,
+    "temperature_sensor": TemperatureSensor,
+    "temperature_fan": TemperatureFan,
+    "fan": Fan,
+    "fan_generic": Fan,
+    "controller_fan": Fan,
+    "heater_fan": Fan,
+    "idle_timeout": IdleTimeout,
+    "display_status": DisplayStatus,
+}
+
+
+def state_class(name: str) -> type:
+    """Dataclass used for the Klipper object *name*"""
+    object_type = name.split(" ", 1)[0]
+    if object_type.startswith("extruder"):
+        object_type = "extruder"
+    return OBJECT_TYPES.get(object_type, GenericObject)
+
+
+def merge_fields(state: typing.Any, values: dict) -> frozenset:
+    """Merge a status delta into *state* in place
+
+    Args:
+        state: A state dataclass
+        values (dict): Field values reported by Klipper
+
+    Returns:
+        frozenset: Names of the fields whose value changed
+    """
+    changed = []
+    extra = state.extra
+    slots = type(state).__slots__
+    for field, value in values.items():
+        if field != "extra" and field in slots:
+            if getattr(state, field) != value:
+                setattr(state, field, value)
+                changed.append(field)
+        elif extra.get(field, dataclasses.MISSING) != value:
+            extra[field] = value
+            changed.append(field)
+    return frozenset(changed)
+
+
+class PrinterState(QtCore.QObject):
+    """Store of every subscribed printer object's current state"""
+
+    objects_changed: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        dict, name="objects_changed"
+    )
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._objects: dict[str, typing.Any] = {}
+        self._subscribers: dict[
+            str, list[tuple[typing.Optional[frozenset], Callback]]
+        ] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._objects
+
+    def get(self, name: str) -> typing.Any:
+        """State of the object *name*, ``None`` if never reported"""
+        return self._objects.get(name)
+
+    def value(self, name: str, field: str, default: typing.Any = None) -> typing.Any:
+        """Current value of a single field"""
+        state = self._objects.get(name)
+        if state is None:
+            return default
+        if field in type(state).__slots__ and field != "extra":
+            return getattr(state, field)
+        return state.extra.get(field, default)
+
+    def subscribe(
+        self,
+        name: str,
+        callback: Callback,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+    ) -> None:
+        """Call *callback* whenever the object *name* changes
+
+        Args:
+            name (str): Klipper object name
+            callback (Callable): Called as ``callback(name, state, changed)``
+                once per dispatch
+            fields (Iterable[str], optional): Only call back when one of
+                these fields changed
+        """
+        self._subscribers.setdefault(name, []).append(
+            (frozenset(fields) if fields is not None else None, callback)
+        )
+
+    def unsubscribe(self, callback: Callback) -> None:
+        """Remove every subscription of *callback*"""
+        for name in list(self._subscribers):
+            entries = [
+                entry for entry in self._subscribers[name] if entry[1] != callback
+            ]
+            if entries:
+                self._subscribers[name] = entries
+            else:
+                del self._subscribers[name]
+
+    def apply(self, status: dict) -> dict[str, frozenset]:
+        """Merge a status report and notify subscribers
+
+        Args:
+            status (dict): ``{object name: {field: value}}``
+
+        Returns:
+            dict[str, frozenset]: Changed fields per object, objects
+            without changes are left out
+        """
+        changes: dict[str, frozenset] = {}
+        for name, values in status.items():
+            if not isinstance(values, dict):
+                continue
+            state = self._objects.get(name)
+            if state is None:
+                state = self._objects[name] = state_class(name)()
+                merge_fields(state, values)
+                changed = frozenset(values)  # First report, everything is new
+            else:
+                changed = merge_fields(state, values)
+            if changed:
+                changes[name] = changed
+        if not changes:
+            return changes
+        for name, changed in changes.items():
+            for fields, callback in self._subscribers.get(name, ()):
+                if fields is None or not fields.isdisjoint(changed):
+                    try:
+                        callback(name, self._objects[name], changed)
+                    except Exception:
+                        logger.exception("Printer state subscriber error on %s", name)
+        self.objects_changed.emit(changes)
+        return changes
+
+    def reset(self) -> None:
+        """Forget every object, e.g. after a Klippy restart"""
+        self._objects.clear()
@@ -0,0 +1,248 @@
+"""In-flight request deduplication and short-lived response cache for
+the Moonraker websocket client.
+
+Several panels ask Moonraker for the same thing at the same time (file
+metadata is requested by ``Files``, ``FilesPage`` and the cancel page,
+directory listings on every files page show).  ``RequestCoalescer``
+sits in front of ``MoonWebSocket.send_request``: identical
+``(method, params)`` pairs issued while one is already in flight are
+attached to that request as waiters instead of being sent again, and
+the single response is fanned out to every waiter.  Idempotent read
+methods are additionally kept in a small TTL cache.  Every waiter and
+every cache hit gets its own copy of the result, so a consumer that
+changes the result it received can not corrupt anyone else's.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+import typing
+from collections import Counter
+from enum import Enum, auto
+
+RequestKey = tuple[str, str]
+# In-flight key, the trailing int is 0 for requests other requests may join.
+InflightKey = tuple[str, str, int]
+
+# Read-only methods whose identical in-flight requests can share a response.
+# Side-effecting requests (``server.files.metascan``...) must never be listed.
+COALESCED_METHODS: frozenset[str] = frozenset(
+    {
+        "printer.info",
+        "printer.objects.list",
+        "printer.objects.query",
+        "printer.gcode.help",
+        "printer.query_endstops.status",
+        "server.files.list",
+        "server.files.roots",
+        "server.files.metadata",
+        "server.files.thumbnails",
+        "server.files.get_directory",
+        "server.temperature_store",
+        "server.announcements.list",
+        "server.webcams.list",
+        "server.notifiers.list",
+        "machine.update.status",
+        "machine.peripherals.usb",
+        "machine.peripherals.serial",
+        "machine.peripherals.video",
+        "machine.peripherals.canbus",
+    }
+)
+
+# Subset of the above whose result stays valid for a short while.
+CACHED_METHODS: frozenset[str] = frozenset(
+    {
+        "printer.objects.list",
+        "printer.gcode.help",
+        "server.files.list",
+        "server.files.roots",
+        "server.files.metadata",
+        "server.files.thumbnails",
+        "server.files.get_directory",
+        "server.webcams.list",
+        "machine.peripherals.usb",
+        "machine.peripherals.serial",
+        "machine.peripherals.video",
+        "machine.peripherals.canbus",
+    }
+)
+
+# Methods whose consumers rely on responses arriving in request order
+# (``Files`` matches USB preload replies against a FIFO queue).
+ORDERED_METHODS: frozenset[str] = frozenset({"server.files.get_directory"})
+
+# Cache namespaces that a mutating request in that namespace invalidates.
+_INVALIDATING_NAMESPACES: tuple[str, ...] = ("server.files.", "server.webcams.")
+
+
+class Disposition(Enum):
+    """What the caller should do with a submitted request."""
+
+    SEND = auto()  # Send it over the wire
+    JOINED = auto()  # Wait on an identical in-flight request
+    CACHED = auto()  # Answer immediately with the cached result
+
+
+def make_key(method: str, params: typing.Optional[dict]) -> RequestKey:
+    """Build a hashable, order-independent key for a request."""
+    return method, json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class RequestCoalescer:
+    """Tracks in-flight requests, their waiters and cached read results.
+
+    All methods are thread safe: requests are submitted from the GUI
+    thread while responses are resolved on the websocket thread.
+    """
+
+    def __init__(self, ttl: float = 2.0) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._inflight: dict[InflightKey, list[int]] = {}
+        self._keys: dict[int, InflightKey] = {}
+        self._latest: dict[str, InflightKey] = {}
+        self._pending: Counter[str] = Counter()
+        self._cache: dict[RequestKey, tuple[float, typing.Any]] = {}
+        self._submitted = 0
+        self._sent = 0
+        self._coalesced = 0
+        self._cache_hits = 0
+
+    def submit(
+        self, request_id: int, method: str, params: typing.Optional[dict] = None
+    ) -> tuple[Disposition, typing.Any]:
+        """Register a request about to be sent.
+
+        Args:
+            request_id (int): Id allocated for this request
+            method (str): Websocket method name
+            params (dict, optional): Method parameters
+
+        Returns:
+            tuple[Disposition, Any]: The disposition and, for
+            ``Disposition.CACHED``, a copy of the cached result.
+        """
+        with self._lock:
+            self._submitted += 1
+            if method not in CACHED_METHODS:
+                self._invalidate_for(method)
+            if method not in COALESCED_METHODS:
+                self._sent += 1
+                return Disposition.SEND, None
+            key = make_key(method, params)
+            ordered = method in ORDERED_METHODS
+            cached = self._cache.get(key)
+            if cached is not None:
+                if time.monotonic() - cached[0] > self.ttl:
+                    del self._cache[key]
+                elif not ordered or not self._pending[method]:
+                    self._cache_hits += 1
+                    return Disposition.CACHED, copy.deepcopy(cached[1])
+            shared: InflightKey = (*key, 0)
+            waiters = self._inflight.get(shared)
+            if waiters is not None and (
+                not ordered or self._latest.get(method) == shared
+            ):
+                waiters.append(request_id)
+                self._keys[request_id] = shared
+                self._coalesced += 1
+                return Disposition.JOINED, None
+            # An ordered request with a newer one sent in between has to go
+            # out on its own, track it under its own id.
+            inflight = shared if waiters is None else (*key, request_id)
+            self._inflight[inflight] = [request_id]
+            self._keys[request_id] = inflight
+            self._pending[method] += 1
+            if ordered:
+                self._latest[method] = inflight
+            self._sent += 1
+            return Disposition.SEND, None
+
+    def resolve(self, request_id: int, response: dict) -> list[int]:
+        """Resolve the request answered by *response*.
+
+        Args:
+            request_id (int): Id carried by the response
+            response (dict): The decoded JSON-RPC response
+
+        Returns:
+            list[int]: Ids of the other requests that were waiting on
+            this response, in the order they were submitted. Each has to
+            be answered with its own copy, see ``waiter_response``.
+        """
+        with self._lock:
+            key = self._keys.pop(request_id, None)
+            if key is None:
+                return []
+            waiters = self._inflight.pop(key, [])
+            method = key[0]
+            self._pending[method] -= 1
+            if self._pending[method] <= 0:
+                del self._pending[method]
+            if self._latest.get(method) == key:
+                del self._latest[method]
+            for waiter in waiters:
+                self._keys.pop(waiter, None)
+            if method in CACHED_METHODS and "result" in response:
+                self._cache[key[:2]] = (
+                    time.monotonic(),
+                    copy.deepcopy(response["result"]),
+                )
+            return [waiter for waiter in waiters if waiter != request_id]
+
+    @staticmethod
+    def waiter_response(response: dict) -> dict:
+        """Copy of *response* for one of the waiters of a request"""
+        return copy.deepcopy(response)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop cached results whose method starts with *prefix*"""
+        with self._lock:
+            self._drop_cached(prefix)
+
+    def reset(self) -> None:
+        """Forget every in-flight request and cached result.
+
+        Used when the connection drops, pending requests will never be
+        answered.
+        """
+        with self._lock:
+            self._inflight.clear()
+            self._keys.clear()
+            self._latest.clear()
+            self._pending.clear()
+            self._cache.clear()
+
+    @property
+    def saved_round_trips(self) -> int:
+        """Number of requests that never had to be sent"""
+        return self._coalesced + self._cache_hits
+
+    def stats(self) -> dict:
+        """Snapshot of the coalescing counters"""
+        with self._lock:
+            return {
+                "submitted": self._submitted,
+                "sent": self._sent,
+                "coalesced": self._coalesced,
+                "cache_hits": self._cache_hits,
+                "saved_round_trips": self._coalesced + self._cache_hits,
+                "in_flight": len(self._inflight),
+                "cached": len(self._cache),
+            }
+
+    def _invalidate_for(self, method: str) -> None:
+        for namespace in _INVALIDATING_NAMESPACES:
+            if method.startswith(namespace):
+                self._drop_cached(namespace)
+
+    def _drop_cached(self, prefix: str) -> None:
+        if not prefix:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[0].startswith(prefix)]:
+            del self._cache[key]
@@ -0,0 +1,180 @@
+"""Qt resource registration from Python modules or binary ``.rcc`` bundles.
+
+The generated ``*_rc.py`` modules hold every icon, background and font as
+``bytes`` literals, several megabytes of source that are unmarshalled
+into the Python heap and then registered on import.  The same resources
+can be written once into binary ``.rcc`` bundles, which
+``QResource.registerResource`` memory maps, so they cost neither import
+time nor resident memory until Qt reads them.
+
+``load_resources`` registers every bundle in the requested mode.  In
+``rcc`` mode a bundle whose ``.rcc`` file is missing, or older than its
+``_rc.py`` module, is imported from the module instead.  ``write_rcc``
+builds the bundles from the modules (``make rcc-binary``), so both
+modes always carry the same data.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import pathlib
+import struct
+import types
+import typing
+
+from PyQt6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_DIR = pathlib.Path(__file__).parent / "ui" / "resources"
+RESOURCE_PACKAGE = "lib.ui.resources"
+BUNDLES: tuple[str, ...] = (
+    "background_resources",
+    "font",
+    "graphic_resources",
+    "icon_resources",
+    "main_menu_resources",
+    "system_resources",
+    "top_bar_resources",
+)
+MODES: tuple[str, ...] = ("python", "rcc")
+# Overrides the ``[resources] mode`` option
+MODE_ENV = "BLOCKSSCREEN_RESOURCES"
+RCC_MAGIC = b"qres"
+# Tree node flags and size, format 2 and later append a timestamp
+RCC_COMPRESSED = 0x01
+RCC_DIRECTORY = 0x02
+RCC_COMPRESSED_ZSTD = 0x04
+RCC_NODE_SIZE = {1: 14, 2: 22, 3: 22}
+
+
+def rcc_bytes(version: int, tree: bytes, names: bytes, data: bytes) -> bytes:
+    """Binary ``.rcc`` image of a resource bundle
+
+    Args:
+        version (int): rcc format version of *tree*, 1 to 3
+        tree (bytes): ``qt_resource_struct`` of the generated module
+        names (bytes): ``qt_resource_name`` of the generated module
+        data (bytes): ``qt_resource_data`` of the generated module
+
+    Returns:
+        bytes: Header followed by the data, names and tree sections
+    """
+    # Magic, version and three section offsets, format 3 adds the flags
+    # of all files
+    header_size = 24 if version >= 3 else 20
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = RCC_MAGIC + struct.pack(
+        ">IIII", version, tree_offset, data_offset, names_offset
+    )
+    if version >= 3:
+        header += struct.pack(">I", _compression_flags(tree, version))
+    return header + data + names + tree
+
+
+def _compression_flags(tree: bytes, version: int) -> int:
+    flags = 0
+    node_size = RCC_NODE_SIZE[version]
+    for offset in range(0, len(tree) - node_size + 1, node_size):
+        (node_flags,) = struct.unpack_from(">H", tree, offset + 4)
+        if not node_flags & RCC_DIRECTORY:
+            flags |= node_flags & (RCC_COMPRESSED | RCC_COMPRESSED_ZSTD)
+    return flags
+
+
+def write_rcc(module: types.ModuleType, path: typing.Union[str, os.PathLike]) -> int:
+    """Write the resources of a generated ``_rc`` *module* to *path*
+
+    Returns:
+        int: Bytes written
+    """
+    # Modules from the Qt 6 rcc hard code format 3 in ``qInitResources``
+    image = rcc_bytes(
+        getattr(module, "rcc_version", 3),
+        module.qt_resource_struct,
+        module.qt_resource_name,
+        module.qt_resource_data,
+    )
+    temporary = pathlib.Path(f"{os.fspath(path)}.tmp")
+    temporary.write_bytes(image)
+    os.replace(temporary, path)
+    return len(image)
+
+
+def rcc_path(bundle: str, directory: pathlib.Path = RESOURCE_DIR) -> pathlib.Path:
+    """Path of the binary bundle of *bundle*"""
+    return directory / f"{bundle}.rcc"
+
+
+def _rcc_is_current(bundle: str, directory: pathlib.Path) -> bool:
+    try:
+        rcc = rcc_path(bundle, directory).stat()
+    except OSError:
+        return False
+    try:
+        module = (directory / f"{bundle}_rc.py").stat()
+    except OSError:
+        return True
+    return rcc.st_mtime_ns >= module.st_mtime_ns
+
+
+def resource_mode(config: typing.Any = None) -> str:
+    """Requested resource mode, from the environment or the config
+
+    Args:
+        config: ``BlocksScreenConfig`` of the whole file, optional
+
+    Returns:
+        str: ``"python"`` or ``"rcc"``
+    """
+    mode = os.environ.get(MODE_ENV, "")
+    if not mode and config is not None:
+        section = config.get_section("resources", fallback=None)
+        if section is not None:
+            mode = section.get("mode", default="python")
+    mode = (mode or "python").strip().lower()
+    if mode not in MODES:
+        logger.warning("Unknown resource mode %r, using python", mode)
+        return "python"
+    return mode
+
+
+def load_resources(
+    mode: str = "python",
+    bundles: typing.Iterable[str] = BUNDLES,
+    directory: pathlib.Path = RESOURCE_DIR,
+    package: str = RESOURCE_PACKAGE,
+) -> dict[str, str]:
+    """Register the Qt resource bundles
+
+    Args:
+        mode (str): ``"rcc"`` registers the binary bundles where current,
+            ``"python"`` imports the ``_rc`` modules
+        bundles (typing.Iterable[str]): Bundle names
+        directory (pathlib.Path): Directory of the ``.rcc`` files
+        package (str): Package of the ``_rc`` modules
+
+    Returns:
+        dict[str, str]: Mode each bundle was registered with
+    """
+    loaded: dict[str, str] = {}
+    for bundle in bundles:
+        if mode == "rcc" and _rcc_is_current(bundle, directory):
+            if QtCore.QResource.registerResource(
+                os.fspath(rcc_path(bundle, directory))
+            ):
+                loaded[bundle] = "rcc"
+                continue
+            logger.warning("Unable to register %s.rcc, importing it", bundle)
+        importlib.import_module(f"{package}.{bundle}_rc")
+        loaded[bundle] = "python"
+    if mode == "rcc" and "python" in loaded.values():
+        logger.info(
+            "Resource bundles without a current .rcc: %s",
+            ", ".join(name for name, used in loaded.items() if used == "python"),
+        )
+    return loaded
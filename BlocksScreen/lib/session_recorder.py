@@ -0,0 +1,184 @@
+"""Websocket session recording and replay.
+
+``SessionRecorder`` stores every frame that goes through
+``MoonWebSocket`` (incoming messages and outgoing requests) with a
+timestamp relative to the start of the recording, one JSON object per
+line in a gzip compressed file::
+
+    {"t": 12.503, "dir": "in", "frame": "{\\"jsonrpc\\": \\"2.0\\", ...}"}
+
+``SessionReplayer`` reads such a file back and feeds the incoming
+frames to ``MoonWebSocket.on_message`` at the recorded pace, or N times
+faster, so a real print's traffic can be reproduced without a live
+Moonraker.
+
+Enabled from ``BlocksScreen.cfg``::
+
+    [session_recorder]
+    record: ~/printer_data/logs/blocksscreen_session.jsonl.gz
+    # replay: ~/sessions/six_hour_print.jsonl.gz
+    # replay_speed: 20
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import pathlib
+import queue
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+FRAME_IN = "in"
+FRAME_OUT = "out"
+FORMAT_VERSION = 1
+
+
+class SessionRecorder:
+    """Writes websocket frames to a gzip compressed JSON-lines file.
+
+    Frames are queued by the calling thread and compressed and written
+    on a background thread so recording does not slow the websocket
+    thread down.
+    """
+
+    def __init__(self, path: typing.Union[str, pathlib.Path]) -> None:
+        self.path = pathlib.Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.frame_count = 0
+        self._start = time.monotonic()
+        self._queue: queue.Queue[tuple[float, str, str] | None] = queue.Queue()
+        self._thread = threading.Thread(
+            name="session-recorder", target=self._worker, daemon=True
+        )
+        self._thread.start()
+        logger.info("Recording websocket session to %s", self.path)
+
+    def record(self, direction: str, frame: str) -> None:
+        """Queue a raw frame for writing
+
+        Args:
+            direction (str): ``FRAME_IN`` or ``FRAME_OUT``
+            frame (str): The frame exactly as sent or received
+        """
+        self.frame_count += 1
+        self._queue.put_nowait((time.monotonic() - self._start, direction, frame))
+
+    def close(self) -> None:
+        """Flush pending frames and close the file"""
+        if not self._thread.is_alive():
+            return
+        self._queue.put_nowait(None)
+        self._thread.join(timeout=5.0)
+        logger.info("Recorded %d frames to %s", self.frame_count, self.path)
+
+    def _worker(self) -> None:
+        """Background writer"""
+        try:
+            with gzip.open(self.path, "wt", encoding="utf-8") as file:
+                header = {"version": FORMAT_VERSION, "started": time.time()}
+                file.write(json.dumps({"t": 0.0, "dir": "meta", "frame": header}))
+                file.write("\n")
+                while True:
+                    entry = self._queue.get()
+                    if entry is None:
+                        break
+                    timestamp, direction, frame = entry
+                    file.write(
+                        json.dumps(
+                            {"t": round(timestamp, 6), "dir": direction, "frame": frame}
+                        )
+                    )
+                    file.write("\n")
+        except OSError as e:
+            logger.error("Unable to write websocket session %s: %s", self.path, e)
+
+
+def read_session(
+    path: typing.Union[str, pathlib.Path],
+) -> typing.Iterator[tuple[float, str, str]]:
+    """Iterate over the frames of a recorded session
+
+    Args:
+        path (str | pathlib.Path): The recorded session file
+
+    Yields:
+        tuple[float, str, str]: Timestamp in seconds, direction and raw frame
+    """
+    with gzip.open(pathlib.Path(path).expanduser(), "rt", encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping malformed session line")
+                continue
+            if entry.get("dir") not in (FRAME_IN, FRAME_OUT):
+                continue
+            yield float(entry["t"]), entry["dir"], entry["frame"]
+
+
+class SessionReplayer(threading.Thread):
+    """Feeds a recorded session back into a websocket client.
+
+    Incoming frames are handed to ``ws.on_message``, outgoing frames to
+    ``ws.replay_request`` so recorded responses can be matched to their
+    request. A *speed* of 0 or less replays as fast as possible.
+    """
+
+    def __init__(
+        self,
+        ws: typing.Any,
+        path: typing.Union[str, pathlib.Path],
+        speed: float = 1.0,
+        on_finished: typing.Optional[typing.Callable[[dict], None]] = None,
+    ) -> None:
+        super().__init__(name="session-replayer", daemon=True)
+        self._ws = ws
+        self.path = pathlib.Path(path).expanduser()
+        self.speed = speed
+        self._on_finished = on_finished
+        self._stop_event = threading.Event()
+        self.stats: dict = {}
+
+    def stop(self) -> None:
+        """Stop the replay after the current frame"""
+        self._stop_event.set()
+
+    def run(self) -> None:
+        """Replay the session"""
+        frames = 0
+        recorded = 0.0
+        start = time.monotonic()
+        logger.info("Replaying websocket session %s at %sx", self.path, self.speed)
+        try:
+            for timestamp, direction, frame in read_session(self.path):
+                if self.speed > 0:
+                    delay = start + timestamp / self.speed - time.monotonic()
+                    if delay > 0 and self._stop_event.wait(delay):
+                        break
+                if self._stop_event.is_set():
+                    break
+                if direction == FRAME_IN:
+                    self._ws.on_message(frame)
+                else:
+                    self._ws.replay_request(frame)
+                frames += 1
+                recorded = timestamp
+        except (OSError, EOFError) as e:
+            logger.error("Unable to replay websocket session %s: %s", self.path, e)
+        elapsed = time.monotonic() - start
+        self.stats = {
+            "frames": frames,
+            "recorded_duration": recorded,
+            "replay_duration": elapsed,
+            "effective_speed": recorded / elapsed if elapsed else 0.0,
+        }
+        logger.info("Websocket session replay finished: %s", self.stats)
+        if self._on_finished is not None:
+            self._on_finished(self.stats)
@@ -0,0 +1,192 @@
+"""Event loop lag monitor and stall watchdog.
+
+A ``QTimer`` in the GUI thread beats every ``interval`` seconds and a
+daemon thread checks the beat.  When the event loop has not beaten for
+``threshold`` seconds the thread captures the Python stack of the GUI
+thread with ``sys._current_frames`` and logs it, so a frozen touchscreen
+leaves a record of what it was doing.  When the loop comes back the stall
+is counted in a duration bucket, the counts are logged on shutdown.
+
+Stalls inside C code that hold the GIL also block the watchdog thread,
+so with ``hard_timeout`` set every beat re-arms
+``faulthandler.dump_traceback_later``, which dumps all threads to the
+fault log of ``logger.CrashHandler`` from C if the loop stays blocked
+that long.
+
+Configured in ``BlocksScreen.cfg``::
+
+    [stall_watchdog]
+    enabled: true
+    threshold: 0.5
+    # interval: 0.1
+    # hard_timeout: 30
+"""
+
+from __future__ import annotations
+
+import bisect
+import faulthandler
+import logging
+import sys
+import threading
+import time
+import traceback
+import typing
+
+from PyQt6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.1
+DEFAULT_THRESHOLD = 0.5
+# Upper bounds in seconds of the stall duration buckets, the last is open
+BUCKETS: tuple[float, ...] = (1.0, 2.0, 5.0, 10.0, 30.0)
+
+
+def bucket_label(index: int) -> str:
+    """Label of the duration bucket *index*, such as ``"1-2s"``"""
+    low = BUCKETS[index - 1] if index else 0.0
+    if index == len(BUCKETS):
+        return f">{low:g}s"
+    return f"{low:g}-{BUCKETS[index]:g}s"
+
+
+class StallWatchdog(QtCore.QObject):
+    """Measures the event loop lag and reports stalls of the GUI thread"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.enabled = True
+        self.interval = DEFAULT_INTERVAL
+        self.threshold = DEFAULT_THRESHOLD
+        self.hard_timeout = 0.0
+        # Lag of the last beat and the largest since ``take_max_lag``
+        self.lag = 0.0
+        self._max_lag = 0.0
+        self.stalls = [0] * (len(BUCKETS) + 1)
+        self.last_stack = ""
+        self._beat = time.monotonic()
+        self._reported: typing.Optional[float] = None
+        self._gui_thread: typing.Optional[int] = None
+        self._thread: typing.Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_beat)
+
+    @property
+    def running(self) -> bool:
+        """Whether the watchdog thread is checking the beat"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def configure(self, config: typing.Any) -> None:
+        """Apply the ``[stall_watchdog]`` section
+
+        Args:
+            config: ``BlocksScreenConfig`` of the whole file
+        """
+        section = config.get_section("stall_watchdog", fallback=None)
+        if section is None:
+            return
+        self.enabled = section.getboolean("enabled", default=True)
+        self.interval = section.getfloat("interval", default=DEFAULT_INTERVAL)
+        self.threshold = section.getfloat("threshold", default=DEFAULT_THRESHOLD)
+        self.hard_timeout = section.getfloat("hard_timeout", default=0.0)
+
+    def start(self) -> None:
+        """Start beating, must be called from the GUI thread"""
+        if not self.enabled or self.running:
+            return
+        self._gui_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start(max(1, round(self.interval * 1000)))
+        self._arm_fault_dump()
+        self._thread = threading.Thread(
+            name="stall-watchdog", target=self._watch, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watchdog and log the stall counts"""
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self.hard_timeout > 0:
+            faulthandler.cancel_dump_traceback_later()
+        if any(self.stalls):
+            logger.info("Event loop stalls: %s", self.summary())
+
+    def take_max_lag(self) -> float:
+        """Largest lag in seconds since the previous call"""
+        value, self._max_lag = self._max_lag, 0.0
+        return value
+
+    def summary(self) -> str:
+        """Stall counts per duration bucket"""
+        return ", ".join(
+            f"{bucket_label(index)} {count}"
+            for index, count in enumerate(self.stalls)
+            if count
+        )
+
+    def record_stall(self, duration: float) -> None:
+        """Count a stall of *duration* seconds"""
+        self.stalls[bisect.bisect_left(BUCKETS, duration)] += 1
+
+    def gui_stack(self) -> str:
+        """Current Python stack of the GUI thread"""
+        frame = sys._current_frames().get(self._gui_thread or 0)
+        if frame is None:
+            return "<GUI thread not running Python code>"
+        return "".join(traceback.format_stack(frame))
+
+    @QtCore.pyqtSlot(name="beat")
+    def _on_beat(self) -> None:
+        now = time.monotonic()
+        blocked = now - self._beat
+        self._beat = now
+        self.lag = max(0.0, blocked - self.interval)
+        self._max_lag = max(self._max_lag, self.lag)
+        if blocked >= self.threshold:
+            self.record_stall(blocked)
+            logger.warning("Event loop was blocked for %.2f s", blocked)
+        self._arm_fault_dump()
+
+    def _arm_fault_dump(self) -> None:
+        if self.hard_timeout <= 0:
+            return
+        from logger import CrashHandler
+
+        handler = CrashHandler._instance
+        fault_file = handler.fault_file if handler is not None else None
+        try:
+            faulthandler.dump_traceback_later(
+                self.hard_timeout,
+                exit=False,
+                file=fault_file or sys.__stderr__,
+            )
+        except (OSError, ValueError) as e:
+            logger.warning("Disabling the stall fault dump: %s", e)
+            self.hard_timeout = 0.0
+
+    def _watch(self) -> None:
+        period = min(self.interval, self.threshold / 2)
+        while not self._stop.wait(period):
+            beat = self._beat
+            if beat == self._reported:
+                continue
+            if time.monotonic() - beat < self.threshold:
+                continue
+            self._reported = beat
+            self.last_stack = self.gui_stack()
+            logger.warning(
+                "Event loop blocked for more than %.2f s, GUI thread stack:\n%s",
+                self.threshold,
+                self.last_stack,
+            )
+
+
+watchdog = StallWatchdog()
@@ -0,0 +1,237 @@
+"""Startup timeline profiler.
+
+``profiler`` timestamps the boot of BlocksScreen, from the start of the
+process through the imports, the crash handler, the steps of
+``MainWindow.__init__`` and each panel build, to the first paint, the
+websocket connection and Klippy reporting ready.  Phases are recorded
+with ``profiler.phase`` as nested spans and single moments with
+``profiler.mark``; both cost a list append, so they are always on.
+
+Output is written once startup finished, or gave up waiting for Klippy,
+and only when enabled in ``BlocksScreen.cfg``::
+
+    [startup_profiler]
+    enabled: true
+    # file: ~/printer_data/logs/blocksscreen_startup.json
+    # timeout: 120
+
+or by setting ``BLOCKSSCREEN_STARTUP_PROFILE`` to ``1`` or to the output
+path.  The file is a Chrome trace (``chrome://tracing``, Perfetto) and a
+one line summary of the milestones goes to the log, so boot time can be
+compared between releases.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+ENV = "BLOCKSSCREEN_STARTUP_PROFILE"
+DEFAULT_FILE = "logs/BlocksScreen_startup.json"
+# Seconds to wait for Klippy after the first paint before writing anyway
+DEFAULT_TIMEOUT = 120.0
+# Marks reported in the summary line, in order
+MILESTONES: tuple[str, ...] = (
+    "main_window",
+    "first_paint",
+    "websocket_connected",
+    "klippy_ready",
+)
+
+
+def _process_age() -> float:
+    """Seconds since the process started, 0 where ``/proc`` is missing"""
+    try:
+        with open("/proc/self/stat", encoding="ascii") as stat:
+            # The command name may hold spaces, fields restart after it
+            fields = stat.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime", encoding="ascii") as uptime:
+            up = float(uptime.read().split()[0])
+        started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return 0.0
+    return max(0.0, up - started)
+
+
+def _thread_id() -> int:
+    """Trace thread id, 0 for the main thread"""
+    if threading.current_thread() is threading.main_thread():
+        return 0
+    return threading.get_ident()
+
+
+class StartupProfiler:
+    """Records the startup timeline
+
+    Times are microseconds since the process started, as estimated when
+    the profiler was created.
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter() - _process_age()
+        self._events: list[dict[str, typing.Any]] = []
+        self._marks: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.enabled = os.environ.get(ENV, "").strip() not in ("", "0")
+        self.path = self._env_path() or DEFAULT_FILE
+        self.timeout = DEFAULT_TIMEOUT
+        self.finished = False
+        self.mark("profiler_import")
+
+    @staticmethod
+    def _env_path() -> str:
+        value = os.environ.get(ENV, "").strip()
+        return value if value not in ("", "0", "1") else ""
+
+    def _now(self) -> float:
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def configure(self, config: typing.Any) -> None:
+        """Apply the ``[startup_profiler]`` section, the environment wins
+
+        Args:
+            config: ``BlocksScreenConfig`` of the whole file
+        """
+        section = config.get_section("startup_profiler", fallback=None)
+        if section is None:
+            return
+        if not os.environ.get(ENV, "").strip():
+            self.enabled = section.getboolean("enabled", default=True)
+        if not self._env_path():
+            self.path = section.get("file", parser=str, default=self.path)
+        self.timeout = section.getfloat("timeout", default=self.timeout)
+
+    def mark(self, name: str) -> None:
+        """Record the moment *name*, the first one of each name counts"""
+        if self.finished:
+            return
+        now = self._now()
+        with self._lock:
+            if name in self._marks:
+                return
+            self._marks[name] = now
+            self._events.append(
+                {"name": name, "ph": "i", "s": "g", "ts": now, "tid": _thread_id()}
+            )
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> typing.Iterator[None]:
+        """Record the duration of the ``with`` block as *name*"""
+        if self.finished:
+            yield
+            return
+        start = self._now()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": start,
+                "dur": self._now() - start,
+                "tid": _thread_id(),
+            }
+            with self._lock:
+                self._events.append(event)
+
+    def elapsed(self, name: str) -> typing.Optional[float]:
+        """Milliseconds from the process start to the mark *name*"""
+        value = self._marks.get(name)
+        return None if value is None else value / 1e3
+
+    def summary(self) -> str:
+        """One line with the milestones reached, in milliseconds"""
+        reached = [
+            f"{name} {self._marks[name] / 1e3:.0f}"
+            for name in MILESTONES
+            if name in self._marks
+        ]
+        slowest = sorted(
+            (event for event in self._events if event["ph"] == "X"),
+            key=lambda event: event["dur"],
+            reverse=True,
+        )[:3]
+        text = "Startup ms: " + ", ".join(reached or ["no milestones"])
+        if slowest:
+            text += "; slowest: " + ", ".join(
+                f"{event['name']} {event['dur'] / 1e3:.0f}" for event in slowest
+            )
+        return text
+
+    def trace(self) -> dict[str, typing.Any]:
+        """The timeline in the Chrome trace event format"""
+        pid = os.getpid()
+        with self._lock:
+            events = [dict(event, pid=pid, cat="startup") for event in self._events]
+        threads = {event["tid"] for event in events}
+        events.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": "main" if tid == 0 else f"thread {tid}"},
+            }
+            for tid in threads
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def finish(self, reason: str = "") -> None:
+        """Stop recording, write the trace and log the summary if enabled"""
+        if self.finished:
+            return
+        self.finished = True
+        if not self.enabled:
+            return
+        summary = self.summary()
+        if reason:
+            summary += f" ({reason})"
+        logger.info(summary)
+        path = pathlib.Path(self.path).expanduser()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.trace()), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Unable to write the startup trace to %s: %s", path, e)
+
+    def watch(self, window: typing.Any, ws: typing.Any) -> None:
+        """Mark the first paint of *window* and the startup of *ws*
+
+        The trace is written when ``ws`` reports Klippy ready, or
+        ``timeout`` seconds after the first paint.
+        """
+        from PyQt6 import QtCore
+
+        profiler = self
+
+        class _FirstPaint(QtCore.QObject):
+            def eventFilter(self, a0, a1) -> bool:
+                if a1.type() == QtCore.QEvent.Type.Paint:
+                    a0.removeEventFilter(self)
+                    profiler.mark("first_paint")
+                    if profiler.timeout > 0:
+                        QtCore.QTimer.singleShot(
+                            int(profiler.timeout * 1000),
+                            lambda: profiler.finish("timed out waiting for Klippy"),
+                        )
+                return False
+
+        window.installEventFilter(_FirstPaint(window))
+        ws.connected_signal.connect(lambda: self.mark("websocket_connected"))
+        ws.klippy_state_signal.connect(self._on_klippy_state)
+
+    def _on_klippy_state(self, state: str) -> None:
+        if state == "ready":
+            self.mark("klippy_ready")
+            self.finish()
+
+
+profiler = StartupProfiler()
@@ -0,0 +1,302 @@
+"""Temperature, target, power and fan speed history.
+
+``TemperatureHistory`` keeps one fixed size NumPy ring buffer per
+``(object, field)`` channel, e.g. ``("extruder", "temperature")`` or
+``("temperature_sensor chamber", "temperature")``.  Object names are the
+full Klipper names, the same keys ``server.temperature_store`` uses.
+
+The buffers are seeded from ``server.temperature_store`` once Klippy is
+ready and appended from the status stream (the ``notify_status_update``
+reports ``Printer`` receives).  Appends are O(1), window statistics and
+chart downsampling are vectorized.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import typing
+
+import numpy as np
+from PyQt6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+Channel = tuple[str, str]
+
+# Status fields recorded, mapped to their ``server.temperature_store`` key.
+TRACKED_FIELDS: dict[str, str] = {
+    "temperature": "temperatures",
+    "target": "targets",
+    "power": "powers",
+    "speed": "speeds",
+}
+
+# Object types (first word of the Klipper object name) that are recorded.
+TRACKED_TYPES: frozenset[str] = frozenset(
+    {
+        "extruder",
+        "heater_bed",
+        "heater_generic",
+        "temperature_sensor",
+        "temperature_fan",
+        "fan",
+        "fan_generic",
+        "controller_fan",
+        "heater_fan",
+    }
+)
+
+# ``server.temperature_store`` holds one sample per second.
+STORE_INTERVAL: float = 1.0
+
+
+def is_tracked(name: str) -> bool:
+    """Whether the Klipper object *name* has a recorded history"""
+    object_type = name.split(" ", 1)[0]
+    if object_type.startswith("extruder"):
+        object_type = "extruder"
+    return object_type in TRACKED_TYPES
+
+
+class RingBuffer:
+    """Fixed capacity ring buffer of ``(timestamp, value)`` samples
+
+    Args:
+        capacity (int): Number of samples kept, older ones are overwritten
+    """
+
+    __slots__ = ("_head", "_size", "_times", "_values", "capacity")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros(capacity, dtype=np.float32)
+        self._head = 0  # Next write position
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, overwriting the oldest once full"""
+        self._times[self._head] = timestamp
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """Add many samples at once, in chronological order"""
+        timestamps = np.asarray(timestamps, dtype=np.float64)[-self.capacity :]
+        values = np.asarray(values, dtype=np.float32)[-self.capacity :]
+        count = len(timestamps)
+        if not count:
+            return
+        positions = (self._head + np.arange(count)) % self.capacity
+        self._times[positions] = timestamps
+        self._values[positions] = values
+        self._head = (self._head + count) % self.capacity
+        self._size = min(self.capacity, self._size + count)
+
+    def clear(self) -> None:
+        """Drop every sample"""
+        self._head = 0
+        self._size = 0
+
+    def last(self) -> typing.Optional[tuple[float, float]]:
+        """Most recent sample, ``None`` when empty"""
+        if not self._size:
+            return None
+        index = (self._head - 1) % self.capacity
+        return float(self._times[index]), float(self._values[index])
+
+    def view(self) -> tuple[np.ndarray, np.ndarray]:
+        """Samples in chronological order
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Timestamps and values, copies
+            only when the buffer has wrapped around
+        """
+        if self._size < self.capacity:
+            return self._times[: self._size], self._values[: self._size]
+        if self._head == 0:
+            return self._times, self._values
+        return (
+            np.concatenate((self._times[self._head :], self._times[: self._head])),
+            np.concatenate((self._values[self._head :], self._values[: self._head])),
+        )
+
+    def window(self, since: float) -> tuple[np.ndarray, np.ndarray]:
+        """Samples with a timestamp at or after *since*"""
+        times, values = self.view()
+        start = int(np.searchsorted(times, since, side="left"))
+        return times[start:], values[start:]
+
+
+class TemperatureHistory(QtCore.QObject):
+    """Per channel temperature history for charts and statistics
+
+    Args:
+        parent (QtCore.QObject): Parent object
+        ws: ``MoonWebSocket`` used to request ``server.temperature_store``
+        capacity (int): Samples kept per channel
+    """
+
+    seeded = QtCore.pyqtSignal(name="temperature_history_seeded")
+
+    def __init__(
+        self,
+        parent: typing.Optional[QtCore.QObject] = None,
+        ws: typing.Any = None,
+        capacity: int = 7200,
+    ) -> None:
+        super().__init__(parent)
+        self.ws = ws
+        self.capacity = capacity
+        self._buffers: dict[Channel, RingBuffer] = {}
+
+    def channels(self) -> list[Channel]:
+        """Recorded ``(object, field)`` channels"""
+        return list(self._buffers)
+
+    def buffer(self, name: str, field: str = "temperature") -> RingBuffer:
+        """Ring buffer of a channel, created empty on first use"""
+        channel = (name, field)
+        buffer = self._buffers.get(channel)
+        if buffer is None:
+            buffer = self._buffers[channel] = RingBuffer(self.capacity)
+        return buffer
+
+    def append(
+        self,
+        name: str,
+        field: str,
+        value: float,
+        timestamp: typing.Optional[float] = None,
+    ) -> None:
+        """Record a single sample
+
+        Args:
+            name (str): Klipper object name
+            field (str): Status field, e.g. ``temperature``
+            value (float): The new value
+            timestamp (float, optional): ``time.monotonic()`` based time,
+                now when omitted
+        """
+        self.buffer(name, field).append(
+            time.monotonic() if timestamp is None else timestamp, value
+        )
+
+    @QtCore.pyqtSlot(list, name="on_object_report")
+    def on_object_report(self, report: list) -> None:
+        """Append tracked fields from a ``notify_status_update`` report"""
+        if not report or not isinstance(report[0], dict):
+            return
+        now = time.monotonic()
+        for name, values in report[0].items():
+            if not isinstance(values, dict) or not is_tracked(name):
+                continue
+            for field in TRACKED_FIELDS.keys() & values.keys():
+                value = values[field]
+                if isinstance(value, (int, float)):
+                    self.buffer(name, field).append(now, value)
+
+    @QtCore.pyqtSlot(str, name="on_klippy_state")
+    def on_klippy_state(self, state: str) -> None:
+        """Request the stored history once Klippy is ready"""
+        if state == "ready" and self.ws is not None:
+            self.ws.api.request_temperature_cached_data()
+
+    def seed(self, store: dict, now: typing.Optional[float] = None) -> None:
+        """Replace the history with a ``server.temperature_store`` result
+
+        The store holds one sample per second, the last one being the
+        current value.
+
+        Args:
+            store (dict): ``{name: {"temperatures": [...], ...}}``
+            now (float, optional): ``time.monotonic()`` based time of the
+                last sample, now when omitted
+        """
+        now = time.monotonic() if now is None else now
+        for name, series in store.items():
+            if not isinstance(series, dict):
+                continue
+            for field, store_key in TRACKED_FIELDS.items():
+                values = series.get(store_key)
+                if not values:
+                    continue
+                data = np.asarray(values, dtype=np.float32)
+                times = now - STORE_INTERVAL * np.arange(len(data) - 1, -1, -1)
+                buffer = self.buffer(name, field)
+                buffer.clear()
+                buffer.extend(times, data)
+        logger.debug("Temperature history seeded with %d channels", len(store))
+        self.seeded.emit()
+
+    def stats(
+        self, name: str, field: str = "temperature", seconds: float = 60.0
+    ) -> typing.Optional[tuple[float, float, float]]:
+        """Minimum, maximum and mean over the last *seconds*
+
+        Returns:
+            tuple[float, float, float] | None: ``None`` when the window is
+            empty
+        """
+        buffer = self._buffers.get((name, field))
+        if buffer is None or not len(buffer):
+            return None
+        _, values = buffer.window(time.monotonic() - seconds)
+        if not len(values):
+            return None
+        return float(values.min()), float(values.max()), float(values.mean())
+
+    def downsample(
+        self,
+        name: str,
+        field: str = "temperature",
+        buckets: int = 300,
+        seconds: typing.Optional[float] = None,
+        now: typing.Optional[float] = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Min/max per time bucket, for drawing a chart one bucket per pixel
+        column
+
+        Args:
+            name (str): Klipper object name
+            field (str): Status field
+            buckets (int): Number of equally wide time buckets
+            seconds (float, optional): Window length, all samples when omitted
+            now (float, optional): End of the window, now when omitted
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Bucket start times,
+            minimums and maximums, empty buckets are left out
+        """
+        empty = np.empty(0, dtype=np.float64)
+        buffer = self._buffers.get((name, field))
+        if buffer is None or not len(buffer) or buckets <= 0:
+            return empty, empty.astype(np.float32), empty.astype(np.float32)
+        now = time.monotonic() if now is None else now
+        if seconds is None:
+            times, values = buffer.view()
+            start = float(times[0])
+        else:
+            start = now - seconds
+            times, values = buffer.window(start)
+        if not len(times):
+            return empty, empty.astype(np.float32), empty.astype(np.float32)
+        edges = np.linspace(start, max(now, float(times[-1])), buckets + 1)
+        bounds = np.searchsorted(times, edges[:-1], side="left")
+        occupied = np.append(bounds[1:] > bounds[:-1], bounds[-1] < len(times))
+        bounds = bounds[occupied]
+        return (
+            edges[:-1][occupied],
+            np.minimum.reduceat(values, bounds),
+            np.maximum.reduceat(values, bounds),
+        )
+
+    def clear(self) -> None:
+        """Forget every channel"""
+        self._buffers.clear()
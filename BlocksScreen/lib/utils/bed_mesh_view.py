@@ -0,0 +1,81 @@
+"""Heatmap view of the current bed mesh.
+
+Draws the heatmap cached by ``BedMeshEngine`` with the profile name and
+the mesh range underneath.  The engine only renders the heatmap again
+when the mesh or the widget size changes, so repaints are a blit.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from lib.bed_mesh import BedMeshEngine
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+MARGIN: int = 6
+LABEL_HEIGHT: int = 24
+
+
+class BedMeshView(QtWidgets.QWidget):
+    """Bed mesh heatmap fed by ``Printer.bed_mesh_update``
+
+    Args:
+        engine (BedMeshEngine): The printer's bed mesh state
+        parent (QtWidgets.QWidget, optional): Parent widget
+    """
+
+    def __init__(
+        self, engine: BedMeshEngine, parent: typing.Optional[QtWidgets.QWidget] = None
+    ) -> None:
+        super().__init__(parent)
+        self.engine = engine
+        self.placeholder: str = "No bed mesh loaded"
+        self.text_color = QtGui.QColor("#FFFFFF")
+
+    @QtCore.pyqtSlot(str, list, list, list, list, name="on_bed_mesh_update")
+    def on_bed_mesh_update(
+        self,
+        profile_name: str,
+        mesh_min: list,
+        mesh_max: list,
+        probed_matrix: list,
+        mesh_matrix: list,
+    ) -> None:
+        """Repaint with the changed mesh"""
+        self.update()
+
+    def _label(self) -> str:
+        stats = self.engine.stats
+        name = self.engine.profile_name or "Bed mesh"
+        if stats is None:
+            return name
+        return f"{name}  range {stats.range:.3f} mm"
+
+    def paintEvent(self, a0: typing.Optional[QtGui.QPaintEvent]) -> None:
+        """Blit the cached heatmap and draw the label"""
+        painter = QtGui.QPainter(self)
+        painter.setPen(self.text_color)
+        font = QtGui.QFont()
+        font.setFamily("Momcake-bold")
+        font.setPointSize(12)
+        painter.setFont(font)
+        if not self.engine.mesh.size:
+            painter.drawText(
+                self.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, self.placeholder
+            )
+            painter.end()
+            return
+        target = QtCore.QRect(
+            MARGIN,
+            MARGIN,
+            self.width() - 2 * MARGIN,
+            self.height() - LABEL_HEIGHT - 2 * MARGIN,
+        )
+        if target.isValid():
+            painter.drawImage(target.topLeft(), self.engine.heatmap(target.size()))
+        painter.drawText(
+            QtCore.QRect(0, self.height() - LABEL_HEIGHT, self.width(), LABEL_HEIGHT),
+            QtCore.Qt.AlignmentFlag.AlignCenter,
+            self._label(),
+        )
+        painter.end()
@@ -1,5 +1,7 @@
-import typing
 import enum
+import typing
+
+from lib.icon_cache import icons
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -179,13 +181,22 @@ class BlocksCustomButton(QtWidgets.QAbstractButton):
             _parent_rect.height() * 0.80,
         )
         if not self.icon_pixmap.isNull():
-            _icon_scaled = self.icon_pixmap.scaled(
+            # Disabled buttons tint their icon with the background color
+            tint = (
+                None
+                if self.isEnabled()
+                else QtGui.QColor(
+                    bg_color.red(), bg_color.green(), bg_color.blue(), 120
+                )
+            )
+            final_pixmap = icons.scaled(
+                self.icon_pixmap,
                 _icon_rect.size().toSize(),
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+                self.devicePixelRatioF(),
+                tint,
             )
-            scaled_width = _icon_scaled.width()
-            scaled_height = _icon_scaled.height()
+            scaled_width = final_pixmap.deviceIndependentSize().width()
+            scaled_height = final_pixmap.deviceIndependentSize().height()
             adjusted_x = (_icon_rect.width() - scaled_width) / 2.0
             adjusted_y = (_icon_rect.height() - scaled_height) / 2.0
             adjusted_icon_rect = QtCore.QRectF(
@@ -194,28 +205,6 @@ class BlocksCustomButton(QtWidgets.QAbstractButton):
                 scaled_width,
                 scaled_height,
             )
-            tinted_icon_pixmap = QtGui.QPixmap(_icon_scaled.size())
-            tinted_icon_pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-            if not self.isEnabled():
-                tinted_icon_pixmap = QtGui.QPixmap(_icon_scaled.size())
-                tinted_icon_pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-                icon_painter = QtGui.QPainter(tinted_icon_pixmap)
-                icon_painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-                icon_painter.setRenderHint(
-                    QtGui.QPainter.RenderHint.SmoothPixmapTransform
-                )
-                icon_painter.drawPixmap(0, 0, _icon_scaled)
-                icon_painter.setCompositionMode(
-                    QtGui.QPainter.CompositionMode.CompositionMode_SourceAtop
-                )
-                tint = QtGui.QColor(
-                    bg_color.red(), bg_color.green(), bg_color.blue(), 120
-                )
-                icon_painter.fillRect(tinted_icon_pixmap.rect(), tint)
-                icon_painter.end()
-                final_pixmap = tinted_icon_pixmap
-            else:
-                final_pixmap = _icon_scaled
             destination_point = adjusted_icon_rect.toRect().topLeft()
             painter.drawPixmap(destination_point, final_pixmap)
         if self.text():
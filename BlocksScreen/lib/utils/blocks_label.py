@@ -1,5 +1,7 @@
 import typing
 
+from lib.frame_scheduler import frames
+from lib.icon_cache import icons
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -38,7 +40,7 @@ class BlocksLabel(QtWidgets.QLabel):
         self.glow_animation.setEasingCurve(QtCore.QEasingCurve().Type.InOutQuart)
         self.glow_animation.setDuration(self.animation_speed)
         self.glow_animation.finished.connect(self.change_glow_direction)
-        self.glow_animation.finished.connect(self.repaint)
+        self.glow_animation.finished.connect(lambda: frames.update(self))
         self.total_scroll_width: float = 0.0
         self.text_width: float = 0.0
         self.label_width: float = 0.0
@@ -129,7 +131,7 @@ class BlocksLabel(QtWidgets.QLabel):
     @glow_color.setter
     def glow_color(self, color: QtGui.QColor) -> None:
         self._glow_color = color
-        self.repaint()
+        frames.update(self)
 
     @QtCore.pyqtSlot(name="start_glow_animation")
     def start_glow_animation(self) -> None:
@@ -177,7 +179,7 @@ class BlocksLabel(QtWidgets.QLabel):
     def stop_scroll(self) -> None:
         """Stop marquee text scroll effect"""
         self.timer.stop()
-        self.repaint()
+        self.update()
 
     def _scroll_text(self) -> None:
         """Smoothly scroll the text leftwards."""
@@ -216,13 +218,11 @@ class BlocksLabel(QtWidgets.QLabel):
                 self.width() - self.icon_margin,
                 self.height() - self.icon_margin,
             )
-            _icon_scaled = self.icon_pixmap.scaled(
-                icon_rect.size().toSize(),
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+            _icon_scaled = icons.scaled(
+                self.icon_pixmap, icon_rect.size().toSize(), self.devicePixelRatioF()
             )
-            scaled_width = _icon_scaled.width()
-            scaled_height = _icon_scaled.height()
+            scaled_width = _icon_scaled.deviceIndependentSize().width()
+            scaled_height = _icon_scaled.deviceIndependentSize().height()
             adjusted_x = (icon_rect.width() - scaled_width) // 2.0
             adjusted_y = (icon_rect.height() - scaled_height) // 2.0
             adjusted_icon = QtCore.QRectF(
@@ -1,10 +1,20 @@
 import typing
-from PyQt6 import QtWidgets, QtGui, QtCore
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+# Start and span of the bar in 1/16th of a degree, open at the bottom
+ARC_START = 236 * 16
+ARC_SPAN = -290 * 16
 
 
 class CustomProgressBar(QtWidgets.QProgressBar):
     """Custom circular progress bar for tracking print jobs
 
+    The background arc is rendered once per size into a cached pixmap and
+    the progress pen is kept until the geometry or color changes, so a
+    progress update only draws the progress arc and the text, and only
+    when the displayed percentage changes.
+
     Args:
         QtWidgets (QtWidget): Parent widget
 
@@ -25,23 +35,34 @@ class CustomProgressBar(QtWidgets.QProgressBar):
         self._padding = 50
         self._pixmap: QtGui.QPixmap = QtGui.QPixmap()
         self._pixmap_cached: QtGui.QPixmap = QtGui.QPixmap()
-        self._pixmap_dirty: bool = True
+        self._background: QtGui.QPixmap = QtGui.QPixmap()
+        self._background_key: typing.Optional[tuple] = None
+        self._progress_pen: typing.Optional[QtGui.QPen] = None
         self._bar_color = QtGui.QColor(223, 223, 223)
+        self._font = QtGui.QFont(self.font())
+        self._font.setPointSize(16)
         self.setMinimumSize(100, 100)
         self._inner_rect: QtCore.QRectF = QtCore.QRectF()
 
     def set_padding(self, value) -> None:
         """Set widget padding"""
         self._padding = value
+        self._progress_pen = None
+        self._scale_pixmap()
         self.update()
 
     def set_pen_width(self, value) -> None:
         """Set widget text pen width"""
         self._pen_width = value
+        self._progress_pen = None
+        self._scale_pixmap()
         self.update()
 
     def _scale_pixmap(self) -> None:
         self._inner_rect = self._calculate_inner_geometry()
+        if self._pixmap.isNull():
+            self._pixmap_cached = QtGui.QPixmap()
+            return
         self._pixmap_cached = self._pixmap.scaled(
             self._inner_rect.size().toSize(),
             QtCore.Qt.AspectRatioMode.KeepAspectRatio,
@@ -54,6 +75,7 @@ class CustomProgressBar(QtWidgets.QProgressBar):
         """
         self._pixmap = pixmap
         self._scale_pixmap()
+        self.update()
 
     def resizeEvent(self, a0) -> None:
         """Reimplemented method, handle widget resize Events
@@ -61,6 +83,7 @@ class CustomProgressBar(QtWidgets.QProgressBar):
         Currently rescales the set pixmap so it has the optimal
         size.
         """
+        self._progress_pen = None
         self._scale_pixmap()
         self.update()
 
@@ -96,8 +119,17 @@ class CustomProgressBar(QtWidgets.QProgressBar):
         if not (0 <= value <= 100):
             raise ValueError("Argument `value` expected value between 0.0 and 1.0 ")
         value *= 100
+        changed = int(value) != int(self.progress_value)
         self.progress_value = value
-        self.update()
+        if changed:
+            self.update(self._dirty_rect())
+
+    def reset(self) -> None:
+        """Re-implemented method, reset the progress to zero"""
+        super().reset()
+        if int(self.progress_value) != 0:
+            self.progress_value = 0
+            self.update(self._dirty_rect())
 
     def set_bar_color(self, red: int, green: int, blue: int) -> None:
         """Set widget progress bar color
@@ -113,7 +145,8 @@ class CustomProgressBar(QtWidgets.QProgressBar):
         if not (0 <= red <= 255 and 0 <= green <= 255 and 0 <= blue <= 255):
             raise ValueError("Color values must be between 0 and 255.")
         self._bar_color = QtGui.QColor(red, green, blue)
-        self.update()
+        self._progress_pen = None
+        self.update(self._dirty_rect())
 
     def _calculate_inner_geometry(self) -> QtCore.QRectF:
         size = min(self.width(), self.height()) - (self._padding * 1.3)
@@ -144,50 +177,83 @@ class CustomProgressBar(QtWidgets.QProgressBar):
         )
         painter.drawPixmap(adjusted_icon, pixmap, pixmap.rect().toRectF())
 
-    def _draw_circular_bar(
-        self,
-        painter: QtGui.QPainter,
-    ) -> None:
+    def _arc_rect(self) -> QtCore.QRectF:
         size = min(self.width(), self.height()) - (self._padding * 1.3)
         x = (self.width() - size) / 2
         y = (self.height() - size) / 2
-        arc_rect = QtCore.QRectF(x, y, size, size)
-        arc_start = 236 * 16
-        arc_span = -290 * 16
+        return QtCore.QRectF(x, y, size, size)
+
+    def _text_rect(self, arc_rect: QtCore.QRectF) -> QtCore.QRectF:
+        return QtCore.QRectF(
+            arc_rect.center().x() - 30,
+            arc_rect.center().y() + arc_rect.height() / 2 - 25,
+            60,
+            40,
+        )
+
+    def _dirty_rect(self) -> QtCore.QRect:
+        """Area changed by a progress update, the arc ring and the text"""
+        arc_rect = self._arc_rect()
+        margin = self._pen_width / 2 + 1
+        ring = arc_rect.adjusted(-margin, -margin, margin, margin)
+        return ring.united(self._text_rect(arc_rect)).toAlignedRect()
+
+    def _background_layer(self) -> QtGui.QPixmap:
+        """Background arc, rendered once per geometry and pixel ratio"""
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio, self._padding, self._pen_width)
+        if key == self._background_key:
+            return self._background
+        pixmap = QtGui.QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
         bg_pen = QtGui.QPen(QtGui.QColor(20, 20, 20))
         bg_pen.setWidth(self._pen_width)
         bg_pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
         painter.setPen(bg_pen)
-        painter.drawArc(arc_rect, arc_start, arc_span)
-        if self.progress_value is not None:
+        painter.drawArc(self._arc_rect(), ARC_START, ARC_SPAN)
+        painter.end()
+        self._background = pixmap
+        self._background_key = key
+        return pixmap
+
+    def _pen(self, arc_rect: QtCore.QRectF) -> QtGui.QPen:
+        """Progress pen with its gradient, kept until the geometry changes"""
+        if self._progress_pen is None:
             gradient = QtGui.QConicalGradient(arc_rect.center(), -90)
             gradient.setColorAt(0.0, self._bar_color)
             gradient.setColorAt(1.0, QtGui.QColor(100, 100, 100))
-            progress_pen = QtGui.QPen()
-            progress_pen.setWidth(self._pen_width)
-            progress_pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-            progress_pen.setBrush(QtGui.QBrush(gradient))
-            painter.setPen(progress_pen)
-            # scale only over arc span
-            progress_span = int(arc_span * self.progress_value / 100)
-            painter.drawArc(arc_rect, arc_start, progress_span)
-        progress_text = f"{int(self.progress_value)}%"
-        painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0)))
-        font = painter.font()
-        font.setPointSize(16)
-        bg_pen = QtGui.QPen(QtGui.QColor(255, 255, 255))
-        painter.setPen(bg_pen)
-        painter.setFont(font)
-        text_x = arc_rect.center().x()
-        text_y = arc_rect.center().y()
-        text_rect = QtCore.QRectF(
-            text_x - 30, text_y + arc_rect.height() / 2 - 25, 60, 40
+            self._progress_pen = QtGui.QPen()
+            self._progress_pen.setWidth(self._pen_width)
+            self._progress_pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
+            self._progress_pen.setBrush(QtGui.QBrush(gradient))
+        return self._progress_pen
+
+    def _draw_circular_bar(
+        self,
+        painter: QtGui.QPainter,
+    ) -> None:
+        arc_rect = self._arc_rect()
+        # The arc follows the displayed percentage, updates are skipped
+        # until it changes
+        percentage = int(self.progress_value)
+        if percentage:
+            painter.setPen(self._pen(arc_rect))
+            painter.drawArc(arc_rect, ARC_START, int(ARC_SPAN * percentage / 100))
+        painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255)))
+        painter.setFont(self._font)
+        painter.drawText(
+            self._text_rect(arc_rect),
+            QtCore.Qt.AlignmentFlag.AlignCenter,
+            f"{percentage}%",
         )
-        painter.drawText(text_rect, QtCore.Qt.AlignmentFlag.AlignCenter, progress_text)
 
     def paintEvent(self, _) -> None:
         """Re-implemented method, paint widget"""
         painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._background_layer())
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
         self._draw_circular_bar(painter)
         self._draw_cached_pixmap(painter, self._pixmap_cached, self._inner_rect)
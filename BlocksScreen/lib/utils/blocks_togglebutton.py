@@ -1,3 +1,4 @@
+from lib.icon_cache import icons
 from lib.utils.blocks_label import BlocksLabel
 from lib.utils.toggleAnimatedButton import ToggleAnimatedButton
 from PyQt6 import QtCore, QtGui, QtWidgets
@@ -13,7 +14,7 @@ class NetworkWidgetbuttons(QtWidgets.QWidget):
         self._icon_label = None
         self._text_label = None
         self._text: str = "la test"
-        self.icon_pixmap_fp: QtGui.QPixmap = QtGui.QPixmap(
+        self.icon_pixmap_fp: QtGui.QPixmap = icons.pixmap(
             ":/filament_related/media/btn_icons/filament_sensor_turn_on.svg"
         )
 
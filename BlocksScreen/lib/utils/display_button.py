@@ -1,5 +1,6 @@
 import typing
 
+from lib.icon_cache import icons
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -122,16 +123,15 @@ class DisplayButton(QtWidgets.QPushButton):
             _rect.height() - 5,
         )
 
-        _icon_scaled = self.icon_pixmap.scaled(
-            int(_icon_rect.width()),
-            int(_icon_rect.height()),
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
+        _icon_scaled = icons.scaled(
+            self.icon_pixmap,
+            QtCore.QSize(int(_icon_rect.width()), int(_icon_rect.height())),
+            self.devicePixelRatioF(),
         )
 
         # Calculate the actual QRect for the scaled pixmap (centering it if needed)
-        scaled_width = _icon_scaled.width()
-        scaled_height = _icon_scaled.height()
+        scaled_width = _icon_scaled.deviceIndependentSize().width()
+        scaled_height = _icon_scaled.deviceIndependentSize().height()
 
         adjusted_x = (_icon_rect.width() - scaled_width) / 2.0
         adjusted_y = (_icon_rect.height() - scaled_height) / 2.0
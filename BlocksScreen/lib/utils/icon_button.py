@@ -1,4 +1,6 @@
 import typing
+
+from lib.icon_cache import icons
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -68,13 +70,11 @@ class IconButton(QtWidgets.QPushButton):
             _icon_rect = QtCore.QRectF(0.0, 0.0, (self.width()), (self.height() - y))
 
         if not self.icon_pixmap.isNull():
-            _icon_scaled = self.icon_pixmap.scaled(
-                _icon_rect.size().toSize(),
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+            _icon_scaled = icons.scaled(
+                self.icon_pixmap, _icon_rect.size().toSize(), self.devicePixelRatioF()
             )
-            scaled_width = _icon_scaled.width()
-            scaled_height = _icon_scaled.height()
+            scaled_width = _icon_scaled.deviceIndependentSize().width()
+            scaled_height = _icon_scaled.deviceIndependentSize().height()
             adjusted_x = (_icon_rect.width() - scaled_width) / 2.0
             adjusted_y = (_icon_rect.height() - scaled_height) / 2.0
             adjusted_icon_rect = QtCore.QRectF(
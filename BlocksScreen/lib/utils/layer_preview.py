@@ -0,0 +1,159 @@
+"""Single layer toolpath preview drawn from a ``Toolpath``.
+
+Only the extruding segments of the current layer are drawn, the
+previous layer is drawn dimmed underneath for context.  The result is
+kept in a pixmap keyed by layer and widget size, so repaints while
+nothing changes are a single blit.  Tapping the left or right third of
+the widget steps through the layers, tapping the middle emits
+``clicked``.
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+
+import numpy as np
+from lib.gcode_toolpath import Toolpath
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+MARGIN: int = 12
+LABEL_HEIGHT: int = 28
+
+
+def _lines(segments: np.ndarray) -> list[QtCore.QLineF]:
+    return [QtCore.QLineF(*row) for row in segments.tolist()]
+
+
+class LayerPreview(QtWidgets.QWidget):
+    """Browsable layer by layer preview of a gcode toolpath"""
+
+    clicked: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(name="clicked")
+    layer_changed: typing.ClassVar[QtCore.pyqtSignal] = QtCore.pyqtSignal(
+        int, name="layer_changed"
+    )
+
+    def __init__(self, parent: typing.Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self.toolpath: typing.Optional[Toolpath] = None
+        self.placeholder: str = ""
+        self.line_color = QtGui.QColor("#2AC9F9")
+        self.previous_color = QtGui.QColor(255, 255, 255, 60)
+        self.text_color = QtGui.QColor("#FFFFFF")
+        self._layer: int = 0
+        self._pixmap: typing.Optional[QtGui.QPixmap] = None
+        self._pixmap_key: typing.Optional[tuple] = None
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_AcceptTouchEvents, True)
+
+    @property
+    def layer(self) -> int:
+        """Shown 1 based layer, 0 when there is nothing to show"""
+        return self._layer
+
+    def set_toolpath(
+        self, toolpath: typing.Optional[Toolpath], placeholder: str = ""
+    ) -> None:
+        """Show *toolpath* from its top layer, or *placeholder* without one"""
+        self.toolpath = toolpath
+        self.placeholder = placeholder
+        self._pixmap = None
+        self._pixmap_key = None
+        self._layer = len(toolpath) if toolpath is not None else 0
+        self.update()
+
+    def set_layer(self, layer: int) -> None:
+        """Show the 1 based *layer*, clamped to the toolpath's layers"""
+        if self.toolpath is None or not len(self.toolpath):
+            return
+        layer = max(1, min(len(self.toolpath), layer))
+        if layer == self._layer:
+            return
+        self._layer = layer
+        self.layer_changed.emit(layer)
+        self.update()
+
+    def set_position(self, position: int) -> None:
+        """Show the layer printed at byte *position* of the file"""
+        if self.toolpath is not None:
+            self.set_layer(self.toolpath.layer_at(position))
+
+    def mousePressEvent(self, a0: typing.Optional[QtGui.QMouseEvent]) -> None:
+        """Step layers on the sides, emit ``clicked`` in the middle"""
+        if a0 is None:
+            return
+        third = self.width() / 3
+        x = a0.position().x()
+        if self.toolpath is not None and x < third:
+            self.set_layer(self._layer - 1)
+        elif self.toolpath is not None and x > 2 * third:
+            self.set_layer(self._layer + 1)
+        else:
+            self.clicked.emit()
+        a0.accept()
+
+    def _render(self) -> QtGui.QPixmap:
+        """Draw the current layer fitted to the widget"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        toolpath = self.toolpath
+        if toolpath is None or not self._layer:
+            return pixmap
+        min_x, min_y, max_x, max_y = (float(value) for value in toolpath.bounds)
+        area = QtCore.QRectF(self.rect()).adjusted(
+            MARGIN, MARGIN, -MARGIN, -MARGIN - LABEL_HEIGHT
+        )
+        width, height = max(max_x - min_x, 1e-3), max(max_y - min_y, 1e-3)
+        scale = min(area.width() / width, area.height() / height)
+        transform = QtGui.QTransform()
+        # Bed coordinates have Y up
+        transform.translate(
+            area.center().x() - (min_x + width / 2) * scale,
+            area.center().y() + (min_y + height / 2) * scale,
+        )
+        transform.scale(scale, -scale)
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        painter.setTransform(transform)
+        for layer, color in (
+            (self._layer - 1, self.previous_color),
+            (self._layer, self.line_color),
+        ):
+            segments, extruding = toolpath.layer(layer)
+            pen = QtGui.QPen(color, 1.5)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawLines(_lines(segments[extruding]))
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, a0: typing.Optional[QtGui.QPaintEvent]) -> None:
+        """Blit the cached layer and draw the layer label"""
+        painter = QtGui.QPainter(self)
+        painter.setPen(self.text_color)
+        font = QtGui.QFont()
+        font.setFamily("Momcake-bold")
+        font.setPointSize(14)
+        painter.setFont(font)
+        toolpath = self.toolpath
+        if toolpath is None or not len(toolpath):
+            painter.drawText(
+                self.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, self.placeholder
+            )
+            painter.end()
+            return
+        key = (id(toolpath), self._layer, self.size(), self.devicePixelRatioF())
+        if self._pixmap is None or self._pixmap_key != key:
+            self._pixmap = self._render()
+            self._pixmap_key = key
+        painter.drawPixmap(0, 0, self._pixmap)
+        label = QtCore.QRectF(
+            0, self.height() - LABEL_HEIGHT - MARGIN / 2, self.width(), LABEL_HEIGHT
+        )
+        text = f"Layer {self._layer}/{len(toolpath)}"
+        height = float(toolpath.heights[self._layer - 1])
+        if not math.isnan(height):  # Unknown for a marker without a Z
+            text += f"  Z {height:.2f} mm"
+        painter.drawText(label, QtCore.Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
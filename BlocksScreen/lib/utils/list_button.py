@@ -1,3 +1,4 @@
+from lib.icon_cache import icons
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -144,21 +145,18 @@ class ListCustomButton(QtWidgets.QPushButton):
                 ellipse_rect.width() - icon_margin,
                 ellipse_rect.height() - icon_margin,
             )
-            icon_scaled = self.icon_pixmap.scaled(
-                icon_rect.size().toSize(),
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+            icon_scaled = icons.scaled(
+                self.icon_pixmap, icon_rect.size().toSize(), self.devicePixelRatioF()
             )
+            icon_size = icon_scaled.deviceIndependentSize()
             # Center the icon in the ellipse
-            adjusted_x = icon_rect.x() + (icon_rect.width() - icon_scaled.width()) / 2.0
-            adjusted_y = (
-                icon_rect.y() + (icon_rect.height() - icon_scaled.height()) / 2.0
-            )
+            adjusted_x = icon_rect.x() + (icon_rect.width() - icon_size.width()) / 2.0
+            adjusted_y = icon_rect.y() + (icon_rect.height() - icon_size.height()) / 2.0
             adjusted_icon_rect = QtCore.QRectF(
                 adjusted_x,
                 adjusted_y,
-                icon_scaled.width(),
-                icon_scaled.height(),
+                icon_size.width(),
+                icon_size.height(),
             )
             painter.drawPixmap(
                 adjusted_icon_rect, icon_scaled, icon_scaled.rect().toRectF()
@@ -166,15 +164,16 @@ class ListCustomButton(QtWidgets.QPushButton):
 
         # Draw second icon (on the left, if present)
         if not self.second_icon_pixmap.isNull():
-            left_icon_scaled = self.second_icon_pixmap.scaled(
+            left_icon_scaled = icons.scaled(
+                self.second_icon_pixmap,
                 left_icon_rect.size().toSize(),
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+                self.devicePixelRatioF(),
             )
+            left_icon_size = left_icon_scaled.deviceIndependentSize()
             # Center the icon in the rect
             adjusted_x = (
                 left_icon_rect.x()
-                + (left_icon_rect.width() - left_icon_scaled.width()) // 2.0
+                + (left_icon_rect.width() - left_icon_size.width()) // 2.0
             )
             adjusted_y = (
                 # left_icon_rect.y()
@@ -184,8 +183,8 @@ class ListCustomButton(QtWidgets.QPushButton):
             adjusted_left_icon_rect = QtCore.QRectF(
                 adjusted_x,
                 adjusted_y,
-                left_icon_scaled.width(),
-                left_icon_scaled.height(),
+                left_icon_size.width(),
+                left_icon_size.height(),
             )
             painter.drawPixmap(
                 adjusted_left_icon_rect,
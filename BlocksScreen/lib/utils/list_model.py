@@ -1,6 +1,7 @@
 import typing
 from dataclasses import dataclass, field
 
+from lib.icon_cache import icons
 from PyQt6 import QtCore, QtGui, QtWidgets  # pylint: disable=import-error
 
 
@@ -32,12 +33,55 @@ class ListItem:
     height: int = 60
     notificate: bool = False
 
-    # stores width and heitgh of the button so we dont need to recalculate it every time
-    _cache: typing.Dict[int, int] = field(default_factory=dict)
+    _cache: typing.Dict[int, typing.Any] = field(default_factory=dict)
+    # Measured layouts of the delegate, see ``EntryLayout``
+    _layouts: typing.Dict[tuple, "EntryLayout"] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     def clear_cache(self):
-        """Call this if text or font size changes dynamically"""
+        """Drop the cached values and measured layouts"""
         self._cache.clear()
+        self._layouts.clear()
+
+
+# Layouts kept per item, one per view width and font in practice
+LAYOUTS_PER_ITEM = 4
+
+
+def _layout_state(item: ListItem) -> tuple:
+    """Item content a layout depends on"""
+    return (
+        item.text,
+        item.right_text,
+        item._lfontsize,
+        item._rfontsize,
+        item.height,
+        bool(item.left_icon),
+        bool(item.right_icon),
+        item.is_expanded,
+    )
+
+
+@dataclass(slots=True)
+class EntryLayout:
+    """Measured text and geometry of a ``ListItem``
+
+    Painted layouts are relative to the top of the row, ``state`` is the
+    item content they were measured for, they are stale once it changes.
+    """
+
+    state: tuple
+    size: QtCore.QSize = field(default_factory=QtCore.QSize)
+    needs_expansion: bool = False
+    right_icon_rect: QtCore.QRectF = field(default_factory=QtCore.QRectF)
+    left_icon_rect: QtCore.QRectF = field(default_factory=QtCore.QRectF)
+    text_rect: QtCore.QRectF = field(default_factory=QtCore.QRectF)
+    text: str = ""
+    text_flags: int = 0
+    font: QtGui.QFont = field(default_factory=QtGui.QFont)
+    right_font: QtGui.QFont = field(default_factory=QtGui.QFont)
+    right_text_pos: QtCore.QPoint = field(default_factory=QtCore.QPoint)
 
 
 class EntryListModel(QtCore.QAbstractListModel):
@@ -300,6 +344,8 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
         self.prev_index: int = 0
         self.height: int = 60
         self._scaled_cache: dict[tuple[int, int, int], QtGui.QPixmap] = {}
+        self._fonts: dict[tuple[str, int], tuple[QtGui.QFont, QtGui.QFontMetrics]] = {}
+        self._backgrounds: dict[tuple[int, int, bool, float], QtGui.QPixmap] = {}
 
     def _get_scaled(
         self,
@@ -331,6 +377,59 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
                 del self._scaled_cache[k]
         return scaled
 
+    def _font(
+        self, base: QtGui.QFont, point_size: int
+    ) -> tuple[QtGui.QFont, QtGui.QFontMetrics]:
+        """*base* at *point_size*, unchanged when not positive, and its metrics"""
+        key = (base.key(), point_size)
+        cached = self._fonts.get(key)
+        if cached is None:
+            font = QtGui.QFont(base)
+            if point_size > 0:
+                font.setPointSize(point_size)
+            cached = self._fonts[key] = (font, QtGui.QFontMetrics(font))
+        return cached
+
+    def _background(
+        self, size: QtCore.QSize, selected: bool, ratio: float
+    ) -> QtGui.QPixmap:
+        """Rounded item background, rendered once per size, state and ratio"""
+        key = (size.width(), size.height(), selected, ratio)
+        pixmap = self._backgrounds.get(key)
+        if pixmap is not None:
+            return pixmap
+        if len(self._backgrounds) > 16:
+            self._backgrounds.clear()
+        pixmap = QtGui.QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        pressed_color = QtGui.QColor("#1A8FBF")
+        pressed_color.setAlpha(90 if selected else 20)
+        path = QtGui.QPainterPath()
+        path.addRoundedRect(QtCore.QRectF(0, 0, size.width(), size.height()), 12, 12)
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        painter.fillPath(path, pressed_color)
+        painter.end()
+        self._backgrounds[key] = pixmap
+        return pixmap
+
+    def _layout(
+        self,
+        item: ListItem,
+        key: tuple,
+        measure: typing.Callable[[EntryLayout], None],
+    ) -> EntryLayout:
+        """Layout *key* of *item*, measured again when the item changed"""
+        state = _layout_state(item)
+        layout = item._layouts.get(key)
+        if layout is None or layout.state != state:
+            if len(item._layouts) >= LAYOUTS_PER_ITEM:
+                item._layouts.clear()
+            layout = item._layouts[key] = EntryLayout(state)
+            measure(layout)
+        return layout
+
     def clear(self) -> None:
         """Clears delegate indexing"""
         self.prev_index = 0
@@ -343,6 +442,22 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
         """
         item: ListItem = index.data(QtCore.Qt.ItemDataRole.UserRole)
         target_width = option.rect.width()
+        layout = self._layout(
+            item,
+            ("size", target_width, option.font.key()),
+            lambda layout: self._measure(layout, item, option),
+        )
+        item.needs_expansion = layout.needs_expansion
+        return layout.size
+
+    def _measure(
+        self,
+        layout: EntryLayout,
+        item: ListItem,
+        option: QtWidgets.QStyleOptionViewItem,
+    ) -> None:
+        """Fill the size hint of *layout*"""
+        target_width = option.rect.width()
 
         base_h = item.height
         ellipse_size = base_h * 0.8
@@ -354,17 +469,13 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
             left_reserved = (base_h * 0.1) + ellipse_size + 8
 
         if item._lfontsize > 0 and item._lfontsize != option.font.pointSize():
-            f = QtGui.QFont(option.font)
-            f.setPointSize(item._lfontsize)
-            fm = QtGui.QFontMetrics(f)
+            _, fm = self._font(option.font, item._lfontsize)
         else:
             fm = option.fontMetrics
 
         if item.right_text:
             if item._rfontsize > 0 and item._rfontsize != option.font.pointSize():
-                fr = QtGui.QFont(option.font)
-                fr.setPointSize(item._rfontsize)
-                fmr = QtGui.QFontMetrics(fr)
+                _, fmr = self._font(option.font, item._rfontsize)
             else:
                 fmr = option.fontMetrics
             right_reserved += fmr.horizontalAdvance(item.right_text) + 10
@@ -378,10 +489,11 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
 
         single_line_width = fm.horizontalAdvance(item.text)
 
-        item.needs_expansion = single_line_width > text_avail_width
+        layout.needs_expansion = single_line_width > text_avail_width
 
         if not item.is_expanded:
-            return QtCore.QSize(target_width, int(item.height * 1.1))
+            layout.size = QtCore.QSize(target_width, int(item.height * 1.1))
+            return
 
         text_rect = fm.boundingRect(
             QtCore.QRect(0, 0, int(text_avail_width), 0),
@@ -390,47 +502,16 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
         )
 
         final_height = max(item.height, text_rect.height() - 1)
-        # Cache it
-        item._cache[target_width] = final_height + 20
-        return QtCore.QSize(target_width, int(final_height * 1.2))
+        layout.size = QtCore.QSize(target_width, int(final_height * 1.2))
 
-    def paint(
+    def _geometry(
         self,
-        painter: QtGui.QPainter,
-        option: QtWidgets.QStyleOptionViewItem,
-        index: QtCore.QModelIndex,
-    ):
-        """Renders each item"""
-        painter.save()
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, True)
-
-        item = index.data(QtCore.Qt.ItemDataRole.UserRole)
-        rect = option.rect.adjusted(2, 2, -2, -2)
-
-        path = QtGui.QPainterPath()
-        path.addRoundedRect(QtCore.QRectF(rect), 12, 12)
-
-        if item.not_clickable:
-            painter.restore()
-            return
-        if item.allow_expand and item.needs_expansion:
-            item.right_icon = (
-                QtGui.QPixmap(":/arrow_icons/media/btn_icons/arrow_down.svg")
-                if item.is_expanded
-                else QtGui.QPixmap(":/arrow_icons/media/btn_icons/arrow_right.svg")
-            )
-
-        # Background Color
-        pressed_color = QtGui.QColor("#1A8FBF")
-        pressed_color.setAlpha(90 if item.selected else 20)
-
-        painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.setBrush(pressed_color)
-        painter.fillPath(path, pressed_color)
-
-        # Geometry Calc
-
+        layout: EntryLayout,
+        item: ListItem,
+        rect: QtCore.QRect,
+        font: QtGui.QFont,
+    ) -> None:
+        """Fill the painted geometry of *layout* for the row *rect*"""
         # ICON SPACEEE
         ellipse_size = item.height * 0.8
         ellipse_margin = (item.height - ellipse_size) / 2
@@ -440,17 +521,7 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
             ellipse_size,
             ellipse_size,
         )
-
-        if item.right_icon:
-            icon_scaled = item.right_icon.scaled(
-                ellipse_rect.size().toSize(),
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-            painter.drawPixmap(
-                ellipse_rect.toRect(),
-                icon_scaled,
-            )
+        layout.right_icon_rect = ellipse_rect
 
         left_margin = 10
         left_icon_rect = QtCore.QRectF(
@@ -459,40 +530,13 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
             ellipse_size,
             ellipse_size,
         )
-
-        if item.left_icon:
-            l_icon_scaled = item.left_icon.scaled(
-                int(left_icon_rect.width()),
-                int(left_icon_rect.height()),
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-
-            if item.color_left_icon:
-                tinted = QtGui.QPixmap(l_icon_scaled.size())
-                tinted.fill(QtCore.Qt.GlobalColor.transparent)
-                p2 = QtGui.QPainter(tinted)
-                p2.drawPixmap(0, 0, l_icon_scaled)
-                p2.setCompositionMode(
-                    QtGui.QPainter.CompositionMode.CompositionMode_SourceIn
-                )
-                p2.fillRect(tinted.rect(), QtGui.QColor(item.color))
-                p2.end()
-                painter.drawPixmap(
-                    left_icon_rect.toRect(),
-                    tinted,
-                )
-            else:
-                painter.drawPixmap(
-                    left_icon_rect.toRect(),
-                    l_icon_scaled,
-                )
+        layout.left_icon_rect = left_icon_rect
 
         text_margin = int(
             rect.right() - ellipse_size - ellipse_margin - rect.height() * 0.10
         )
 
-        text_rect = QtCore.QRectF(
+        layout.text_rect = QtCore.QRectF(
             rect.left()
             + left_margin
             + (left_icon_rect.width() if item.left_icon else 0),
@@ -504,20 +548,8 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
             rect.height(),
         )
 
-        painter.setPen(QtGui.QColor(255, 255, 255))
-
-        _font = painter.font()
-        if item._lfontsize > 0:
-            _font.setPointSize(item._lfontsize)
-        painter.setFont(_font)
-
-        metrics = QtGui.QFontMetrics(_font)
-
-        right_font = QtGui.QFont(_font)
-        if item._rfontsize > 0:
-            right_font.setPointSize(item._rfontsize)
-
-        right_metrics = QtGui.QFontMetrics(right_font)
+        layout.font, metrics = self._font(font, item._lfontsize)
+        layout.right_font, right_metrics = self._font(layout.font, item._rfontsize)
 
         right_text_x = (
             ellipse_rect.right()
@@ -525,42 +557,106 @@ class EntryDelegate(QtWidgets.QStyledItemDelegate):
             - left_icon_rect.width()
             - left_margin
         )
+        layout.right_text_pos = QtCore.QPoint(
+            int(right_text_x),
+            int(
+                ellipse_rect.top()
+                + (ellipse_rect.height() + right_metrics.ascent()) / 2
+            ),
+        )
 
         text = item.text.replace("\n", "")
         # Logic: If not expanded, OR if expansion is not needed, draw single line
         if not item.is_expanded:
             max_main_text_width = right_text_x - left_margin
-            text = metrics.elidedText(
+            layout.text = metrics.elidedText(
                 text,
                 QtCore.Qt.TextElideMode.ElideRight,
                 int(max_main_text_width),
             )
-            painter.drawText(
-                text_rect,
-                QtCore.Qt.AlignmentFlag.AlignVCenter,
-                text,
-            )
+            layout.text_flags = QtCore.Qt.AlignmentFlag.AlignVCenter.value
         else:
             # Expanded mode
-            painter.drawText(
-                text_rect,
-                QtCore.Qt.AlignmentFlag.AlignLeft
-                | QtCore.Qt.AlignmentFlag.AlignVCenter
-                | QtCore.Qt.TextFlag.TextWordWrap,
-                text,
+            layout.text = text
+            layout.text_flags = (
+                QtCore.Qt.AlignmentFlag.AlignLeft.value
+                | QtCore.Qt.AlignmentFlag.AlignVCenter.value
+                | QtCore.Qt.TextFlag.TextWordWrap.value
             )
 
-        if item.right_text:
-            painter.setFont(right_font)
-            painter.setPen(QtGui.QColor(160, 160, 160))
-            painter.drawText(
-                int(right_text_x),
-                int(
-                    ellipse_rect.top()
-                    + (ellipse_rect.height() + right_metrics.ascent()) / 2
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ):
+        """Renders each item"""
+        item = index.data(QtCore.Qt.ItemDataRole.UserRole)
+        if item.not_clickable:
+            return
+        if item.allow_expand and item.needs_expansion:
+            item.right_icon = (
+                icons.pixmap(":/arrow_icons/media/btn_icons/arrow_down.svg")
+                if item.is_expanded
+                else icons.pixmap(":/arrow_icons/media/btn_icons/arrow_right.svg")
+            )
+
+        # The layout is measured for a row at the top, only moved down here
+        top = option.rect.top()
+        rect = option.rect.adjusted(2, 2, -2, -2).translated(0, -top)
+        font = painter.font()
+        layout = self._layout(
+            item,
+            ("paint", rect.left(), rect.width(), rect.height(), font.key()),
+            lambda layout: self._geometry(layout, item, rect, font),
+        )
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, True)
+        painter.translate(0, top)
+
+        painter.drawPixmap(
+            rect.topLeft(),
+            self._background(
+                rect.size(), item.selected, painter.device().devicePixelRatioF()
+            ),
+        )
+
+        if item.right_icon:
+            icon_scaled = icons.scaled(
+                item.right_icon,
+                layout.right_icon_rect.size().toSize(),
+                painter.device().devicePixelRatioF(),
+            )
+            painter.drawPixmap(
+                layout.right_icon_rect.toRect(),
+                icon_scaled,
+            )
+
+        if item.left_icon:
+            l_icon_scaled = icons.scaled(
+                item.left_icon,
+                QtCore.QSize(
+                    int(layout.left_icon_rect.width()),
+                    int(layout.left_icon_rect.height()),
                 ),
-                item.right_text,
+                painter.device().devicePixelRatioF(),
+                QtGui.QColor(item.color) if item.color_left_icon else None,
             )
+            painter.drawPixmap(
+                layout.left_icon_rect.toRect(),
+                l_icon_scaled,
+            )
+
+        painter.setPen(QtGui.QColor(255, 255, 255))
+        painter.setFont(layout.font)
+        painter.drawText(layout.text_rect, layout.text_flags, layout.text)
+
+        if item.right_text:
+            painter.setFont(layout.right_font)
+            painter.setPen(QtGui.QColor(160, 160, 160))
+            painter.drawText(layout.right_text_pos, item.right_text)
 
         if item.notificate:
             dot_diameter = rect.height() * 0.3
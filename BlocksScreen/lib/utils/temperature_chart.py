@@ -0,0 +1,286 @@
+"""Real-time temperature chart drawn from a ``TemperatureHistory``.
+
+Samples are decimated to one min/max pair per pixel column.  Columns are
+anchored to absolute time (``column = timestamp // seconds_per_pixel``)
+so the chart scrolls by changing the painter transform, and each
+series keeps a ``QPainterPath`` in column/data coordinates that only
+gets the newly completed columns appended.  The path is rebuilt when
+the widget is resized, when the history is re-seeded and, amortized,
+once it holds twice the visible width.  Repaints are throttled to
+*max_fps*.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+import typing
+
+import numpy as np
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+SERIES_COLORS: tuple[str, ...] = (
+    "#2AC9F9",
+    "#F98F2A",
+    "#5CD65C",
+    "#E04F5F",
+    "#B57EDC",
+    "#F9E22A",
+)
+
+
+class _Series:
+    """Cached decimated path of a single history channel"""
+
+    __slots__ = ("color", "field", "maxs", "mins", "name", "next_column", "path")
+
+    def __init__(self, name: str, field: str, color: QtGui.QColor) -> None:
+        self.name = name
+        self.field = field
+        self.color = color
+        self.path = QtGui.QPainterPath()
+        self.next_column = 0  # First column not yet committed to the path
+        self.mins = np.empty(0, dtype=np.float32)
+        self.maxs = np.empty(0, dtype=np.float32)
+
+    def reset(self, first_column: int) -> None:
+        self.path = QtGui.QPainterPath()
+        self.next_column = first_column
+        self.mins = np.empty(0, dtype=np.float32)
+        self.maxs = np.empty(0, dtype=np.float32)
+
+
+def decimate(
+    times: np.ndarray, values: np.ndarray, seconds_per_column: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce samples to one min/max pair per absolute time column
+
+    Args:
+        times (np.ndarray): Sample timestamps, ascending
+        values (np.ndarray): Sample values
+        seconds_per_column (float): Time covered by one pixel column
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Column indices,
+        minimums and maximums of the non empty columns
+    """
+    if not len(times):
+        empty = np.empty(0, dtype=np.float32)
+        return np.empty(0, dtype=np.int64), empty, empty
+    columns = np.floor(times / seconds_per_column).astype(np.int64)
+    starts = np.flatnonzero(np.diff(columns, prepend=columns[0] - 1))
+    return (
+        columns[starts],
+        np.minimum.reduceat(values, starts),
+        np.maximum.reduceat(values, starts),
+    )
+
+
+class TemperatureChart(QtWidgets.QWidget):
+    """Scrolling chart of heater and sensor temperatures
+
+    Args:
+        parent (QtWidgets.QWidget, optional): Parent widget
+        window (float): Time span shown, in seconds
+        max_fps (int): Maximum repaints per second
+    """
+
+    def __init__(
+        self,
+        parent: typing.Optional[QtWidgets.QWidget] = None,
+        window: float = 1800.0,
+        max_fps: int = 5,
+    ) -> None:
+        super().__init__(parent)
+        self._history: typing.Any = None
+        self._series: list[_Series] = []
+        self._auto_series = True
+        self.window = window
+        self._seconds_per_column = 1.0
+        self._columns = 1
+        self._margins = QtCore.QMargins(36, 6, 6, 16)
+        self._grid_color = QtGui.QColor(255, 255, 255, 40)
+        self._text_color = QtGui.QColor(255, 255, 255, 160)
+        self._font = QtGui.QFont()
+        self._font.setPointSize(8)
+        self._dirty = True
+        self._painted_column = 0
+        self.last_frame_time = 0.0
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self._on_frame_timer)
+        self.set_max_fps(max_fps)
+        self.setMinimumHeight(80)
+        self.setSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Expanding,
+            QtWidgets.QSizePolicy.Policy.Expanding,
+        )
+
+    def set_history(self, history: typing.Any) -> None:
+        """Draw from *history*, a ``TemperatureHistory``"""
+        if self._history is not None:
+            self._history.seeded.disconnect(self.rebuild)
+        self._history = history
+        if history is not None:
+            history.seeded.connect(self.rebuild)
+        self.rebuild()
+
+    def set_series(self, channels: typing.Iterable[tuple[str, str]]) -> None:
+        """Draw only the given ``(object, field)`` channels, in order
+
+        Without a call every ``temperature`` channel of the history is
+        drawn, up to the number of available colors.
+        """
+        self._auto_series = False
+        self._series = [
+            _Series(name, field, QtGui.QColor(SERIES_COLORS[index % 6]))
+            for index, (name, field) in enumerate(channels)
+        ]
+        self.rebuild()
+
+    def set_max_fps(self, fps: int) -> None:
+        """Cap repaints to *fps* frames per second"""
+        self._timer.setInterval(max(1, int(1000 / max(1, fps))))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @QtCore.pyqtSlot(name="rebuild")
+    def rebuild(self) -> None:
+        """Drop the cached paths, they are rebuilt on the next frame"""
+        self._dirty = True
+        self.update()
+
+    def _discover_series(self) -> None:
+        if not self._auto_series or self._history is None:
+            return
+        known = {(series.name, series.field) for series in self._series}
+        for name, field in self._history.channels():
+            if len(self._series) >= len(SERIES_COLORS):
+                break
+            if field == "temperature" and (name, field) not in known:
+                color = QtGui.QColor(SERIES_COLORS[len(self._series)])
+                self._series.append(_Series(name, field, color))
+                self._dirty = True
+
+    def _plot_rect(self) -> QtCore.QRect:
+        return self.rect().marginsRemoved(self._margins)
+
+    def _now_column(self, now: float) -> int:
+        return math.floor(now / self._seconds_per_column)
+
+    def _extend(self, series: _Series, now_column: int) -> None:
+        """Append every completed column since the last frame to the path"""
+        if series.next_column >= now_column:
+            return
+        buffer = self._history.buffer(series.name, series.field)
+        times, values = buffer.window(series.next_column * self._seconds_per_column)
+        end = int(np.searchsorted(times, now_column * self._seconds_per_column))
+        columns, mins, maxs = decimate(
+            times[:end], values[:end], self._seconds_per_column
+        )
+        series.next_column = now_column
+        if not len(columns):
+            return
+        path = series.path
+        for column, low, high in zip(columns.tolist(), mins.tolist(), maxs.tolist()):
+            if not path.elementCount():
+                path.moveTo(column, low)
+            else:
+                path.lineTo(column, low)
+            if high != low:
+                path.lineTo(column, high)
+        series.mins = np.append(series.mins, mins)
+        series.maxs = np.append(series.maxs, maxs)
+
+    def _prepare(self, now: float) -> int:
+        """Bring every series path up to date, returns the current column"""
+        plot = self._plot_rect()
+        columns = max(1, plot.width())
+        if columns != self._columns:
+            self._columns = columns
+            self._dirty = True
+        self._seconds_per_column = self.window / self._columns
+        now_column = self._now_column(now)
+        self._discover_series()
+        first_column = now_column - self._columns
+        for series in self._series:
+            overgrown = series.path.elementCount() > 4 * self._columns
+            if self._dirty or overgrown:
+                series.reset(first_column)
+            self._extend(series, now_column)
+        self._dirty = False
+        return now_column
+
+    def _value_range(self) -> tuple[float, float]:
+        lows = [
+            float(s.mins[-self._columns :].min()) for s in self._series if len(s.mins)
+        ]
+        highs = [
+            float(s.maxs[-self._columns :].max()) for s in self._series if len(s.maxs)
+        ]
+        if not lows:
+            return 0.0, 100.0
+        low = math.floor(min(lows) / 10.0) * 10.0
+        high = math.ceil(max(highs) / 10.0) * 10.0
+        return (low, high) if high > low else (low, low + 10.0)
+
+    @QtCore.pyqtSlot(name="on_frame_timer")
+    def _on_frame_timer(self) -> None:
+        if not self.isVisible() or self._history is None:
+            return
+        # Only completed columns are drawn, nothing changes in between
+        if self._dirty or self._now_column(time.monotonic()) != self._painted_column:
+            self.update()
+
+    def paintEvent(self, a0: typing.Optional[QtGui.QPaintEvent]) -> None:
+        """Re-implemented method, paint widget"""
+        started = time.perf_counter()
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        painter.setFont(self._font)
+        plot = self._plot_rect()
+        now = time.monotonic()
+        now_column = self._prepare(now) if self._history is not None else 0
+        self._painted_column = now_column
+        low, high = self._value_range()
+        scale_y = plot.height() / (high - low)
+
+        painter.setPen(QtGui.QPen(self._grid_color, 1))
+        step = max(10.0, math.ceil((high - low) / 4.0 / 10.0) * 10.0)
+        value = low
+        while value <= high:
+            y = plot.bottom() - (value - low) * scale_y
+            painter.drawLine(
+                QtCore.QPointF(plot.left(), y), QtCore.QPointF(plot.right(), y)
+            )
+            painter.setPen(self._text_color)
+            painter.drawText(
+                QtCore.QRectF(0, y - 8, self._margins.left() - 4, 16),
+                QtCore.Qt.AlignmentFlag.AlignRight
+                | QtCore.Qt.AlignmentFlag.AlignVCenter,
+                f"{value:.0f}",
+            )
+            painter.setPen(QtGui.QPen(self._grid_color, 1))
+            value += step
+        painter.setPen(self._text_color)
+        painter.drawText(
+            QtCore.QRectF(
+                plot.left(), plot.bottom(), plot.width(), self._margins.bottom()
+            ),
+            QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            f"-{self.window / 60:.0f} min",
+        )
+
+        # Column/data space to widget space, the newest column ends at the
+        # right edge of the plot.
+        transform = QtGui.QTransform()
+        transform.translate(plot.right() - now_column, plot.bottom() + low * scale_y)
+        transform.scale(1.0, -scale_y)
+        painter.setClipRect(plot)
+        painter.setTransform(transform)
+        for series in self._series:
+            pen = QtGui.QPen(series.color, 2)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawPath(series.path)
+        painter.end()
+        self.last_frame_time = time.perf_counter() - started
@@ -1,5 +1,7 @@
 import enum
 import typing
+
+from lib.icon_cache import icons
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
@@ -254,14 +256,12 @@ class ToggleAnimatedButton(QtWidgets.QAbstractButton):
                 self.handle_ellipseRect.width() * 0.90,
                 self.handle_ellipseRect.height() * 0.90,
             )
-            _icon_scaled = self.icon_pixmap.scaled(
-                _icon_rect.size().toSize(),
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+            _icon_scaled = icons.scaled(
+                self.icon_pixmap, _icon_rect.size().toSize(), self.devicePixelRatioF()
             )
             # Calculate the actual QRect for the scaled pixmap (centering it if needed)
-            scaled_width = _icon_scaled.width()
-            scaled_height = _icon_scaled.height()
+            scaled_width = _icon_scaled.deviceIndependentSize().width()
+            scaled_height = _icon_scaled.deviceIndependentSize().height()
             adjusted_x = (_icon_rect.width() - scaled_width) // 2.0
             adjusted_y = (_icon_rect.height() - scaled_height) // 2.0
             adjusted_icon_rect = QtCore.QRectF(
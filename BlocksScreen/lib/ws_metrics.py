@@ -0,0 +1,263 @@
+"""Traffic and latency instrumentation for the Moonraker websocket client.
+
+``WebSocketMetrics`` is fed by ``MoonWebSocket``:
+
+* round-trip latency per method, from ``send_request`` to the matching
+  response, in a fixed log-spaced histogram
+* message counts and payload bytes per incoming message type
+  (``response``, ``error`` or the notification method name) and for
+  outgoing requests
+* JSON decode time of incoming frames
+* GUI lag, the age of events when ``GuiHandoff`` delivers them, and the
+  number of status updates it dropped
+
+``snapshot()`` returns everything as plain dicts.  Periodic dumps to the
+log, or appended as JSON lines to a metrics file, are enabled from
+``BlocksScreen.cfg``::
+
+    [websocket_metrics]
+    interval: 60
+    # file: ~/printer_data/logs/blocksscreen_metrics.jsonl
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import pathlib
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in milliseconds, the last bucket catches everything slower.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+    1000,
+    2000,
+    5000,
+    10000,
+)
+
+
+class LatencyHistogram:
+    """Fixed bucket histogram of durations in milliseconds"""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: list[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, value_ms: float) -> None:
+        """Record a single duration"""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Approximate percentile, the upper bound of the bucket it falls in
+
+        Args:
+            fraction (float): Percentile as a fraction, e.g. ``0.95``
+
+        Returns:
+            float: Bucket upper bound in milliseconds, the observed maximum
+            for the overflow bucket and 0.0 when nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return min(float(LATENCY_BUCKETS_MS[index]), self.max)
+                break
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Summary and bucket counts as a plain dict"""
+        buckets = {
+            f"le_{bound:g}": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)
+        }
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class WebSocketMetrics:
+    """Thread safe collection of websocket latency and traffic counters.
+
+    Requests are sent from the GUI thread while responses arrive on the
+    websocket thread, every method takes the lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._sent_at: dict[int, tuple[str, float]] = {}
+        self._latency: dict[str, LatencyHistogram] = {}
+        self._incoming: dict[str, list[int]] = {}
+        self._outgoing: dict[str, list[int]] = {}
+        self._decode = LatencyHistogram()
+        self._gui_lag = LatencyHistogram()
+        self._dropped_status = 0
+        self._unanswered = 0
+
+    def request_sent(self, request_id: int, method: str, size: int) -> None:
+        """Record an outgoing request
+
+        Args:
+            request_id (int): JSON-RPC id of the request
+            method (str): Websocket method name
+            size (int): Frame size in bytes
+        """
+        with self._lock:
+            self._sent_at[request_id] = (method, time.perf_counter())
+            counter = self._outgoing.setdefault(method, [0, 0])
+            counter[0] += 1
+            counter[1] += size
+
+    def response_received(self, request_id: int) -> typing.Optional[float]:
+        """Close the round trip of *request_id*
+
+        Returns:
+            float | None: Round-trip time in milliseconds, ``None`` for ids
+            that were not sent over the wire (cached or replayed).
+        """
+        now = time.perf_counter()
+        with self._lock:
+            sent = self._sent_at.pop(request_id, None)
+            if sent is None:
+                return None
+            method, started = sent
+            elapsed_ms = (now - started) * 1000.0
+            self._latency.setdefault(method, LatencyHistogram()).add(elapsed_ms)
+            return elapsed_ms
+
+    def message_received(self, kind: str, size: int, decode_seconds: float) -> None:
+        """Record an incoming frame
+
+        Args:
+            kind (str): ``response``, ``error`` or the notification method
+            size (int): Frame size in bytes
+            decode_seconds (float): Time spent in ``json.loads``
+        """
+        with self._lock:
+            counter = self._incoming.setdefault(kind, [0, 0])
+            counter[0] += 1
+            counter[1] += size
+            self._decode.add(decode_seconds * 1000.0)
+
+    def incoming_count(self, kind: str) -> int:
+        """Number of frames of *kind* received so far"""
+        with self._lock:
+            return self._incoming.get(kind, (0, 0))[0]
+
+    def gui_lag(self, lag_seconds: float) -> None:
+        """Record the age of the oldest event in a GUI handoff batch"""
+        with self._lock:
+            self._gui_lag.add(lag_seconds * 1000.0)
+
+    def status_dropped(self) -> None:
+        """Count a status update superseded before reaching the GUI"""
+        with self._lock:
+            self._dropped_status += 1
+
+    def connection_lost(self) -> None:
+        """Forget pending round trips, they will never be answered"""
+        with self._lock:
+            self._unanswered += len(self._sent_at)
+            self._sent_at.clear()
+
+    def snapshot(self) -> dict:
+        """Current counters and histograms as plain, JSON serializable dicts"""
+        with self._lock:
+            return {
+                "timestamp": time.time(),
+                "uptime": round(time.monotonic() - self._started, 3),
+                "latency": {
+                    method: histogram.to_dict()
+                    for method, histogram in sorted(self._latency.items())
+                },
+                "incoming": {
+                    kind: {"count": count, "bytes": size}
+                    for kind, (count, size) in sorted(self._incoming.items())
+                },
+                "outgoing": {
+                    method: {"count": count, "bytes": size}
+                    for method, (count, size) in sorted(self._outgoing.items())
+                },
+                "decode": self._decode.to_dict(),
+                "gui_lag": self._gui_lag.to_dict(),
+                "dropped_status_updates": self._dropped_status,
+                "in_flight": len(self._sent_at),
+                "unanswered": self._unanswered,
+            }
+
+    def summary(self, top: int = 5) -> str:
+        """One line summary of the slowest methods and traffic totals"""
+        snapshot = self.snapshot()
+        slowest = sorted(
+            snapshot["latency"].items(),
+            key=lambda item: item[1]["p95_ms"],
+            reverse=True,
+        )[:top]
+        latency = ", ".join(
+            f"{method} n={stats['count']} p50={stats['p50_ms']:g}ms "
+            f"p95={stats['p95_ms']:g}ms max={stats['max_ms']:g}ms"
+            for method, stats in slowest
+        )
+        incoming = snapshot["incoming"].values()
+        return (
+            f"in {sum(item['count'] for item in incoming)} msgs "
+            f"{sum(item['bytes'] for item in incoming) / 1024:.1f} KiB, "
+            f"decode p95={snapshot['decode']['p95_ms']:g}ms, "
+            f"gui lag p95={snapshot['gui_lag']['p95_ms']:g}ms "
+            f"max={snapshot['gui_lag']['max_ms']:g}ms, "
+            f"dropped {snapshot['dropped_status_updates']} status updates, "
+            f"in flight {snapshot['in_flight']} | {latency or 'no round trips'}"
+        )
+
+    def dump(
+        self, path: typing.Optional[typing.Union[str, pathlib.Path]] = None
+    ) -> None:
+        """Log a summary and, if *path* is given, append the full snapshot
+        to it as a JSON line
+        """
+        logger.info("Websocket metrics: %s", self.summary())
+        if not path:
+            return
+        try:
+            target = pathlib.Path(path).expanduser()
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with target.open("a", encoding="utf-8") as file:
+                file.write(json.dumps(self.snapshot()) + "\n")
+        except OSError as e:
+            logger.error("Unable to write websocket metrics to %s: %s", path, e)
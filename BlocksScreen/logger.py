@@ -313,6 +313,11 @@ class CrashHandler:
         self._original_threading_excepthook = getattr(threading, "excepthook", None)
         self._fault_file: TextIO | None = None
 
+    @property
+    def fault_file(self) -> TextIO | None:
+        """Open fault log faulthandler writes to, None when using stderr."""
+        return self._fault_file
+
     @classmethod
     def install(
         cls,
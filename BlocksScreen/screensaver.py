@@ -3,6 +3,7 @@ from PyQt6 import QtCore, QtWidgets
 
 
 class ScreenSaver(QtCore.QObject):
+    blanked = QtCore.pyqtSignal(bool, name="blanked")
     timer = QtCore.QTimer()
     dpms_off_timeout = helper_methods.get_dpms_timeouts().get("off_timeout")
     dpms_suspend_timeout = helper_methods.get_dpms_timeouts().get("suspend_timeout")
@@ -52,6 +53,7 @@ class ScreenSaver(QtCore.QObject):
                     self.touch_blocked = False
                     helper_methods.set_dpms_mode(helper_methods.DPMSState.ON)
                     self.timer.start()
+                    self.blanked.emit(False)
                     return True  # filter out the event, block touch events on the application
             else:
                 self.timer.stop()
@@ -63,3 +65,4 @@ class ScreenSaver(QtCore.QObject):
         self.touch_blocked = True
         helper_methods.set_dpms_mode(helper_methods.DPMSState.STANDBY)
         self.timer.stop()
+        self.blanked.emit(True)
@@ -0,0 +1,162 @@
+"""Headless rendering benchmark harness.
+
+Benchmarks are deselected by default, run them on their own with
+``make bench`` or::
+
+    pytest -m benchmark tests/benchmarks
+
+Each benchmark builds a panel or widget at a fixed size and records, in
+milliseconds, the median over ``BLOCKSSCREEN_BENCH_ROUNDS`` builds of
+the construction and of the first paint, and the median steady state
+repaint.  The results are written as JSON to ``BLOCKSSCREEN_BENCH_JSON``
+(``benchmark-results.json`` by default), ``tools/bench_compare.py``
+compares two such files.
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from PyQt6 import QtCore, QtWidgets
+
+RESULTS_ENV = "BLOCKSSCREEN_BENCH_JSON"
+ROUNDS_ENV = "BLOCKSSCREEN_BENCH_ROUNDS"
+DEFAULT_RESULTS = "benchmark-results.json"
+REPAINTS = 20
+# Screen of the printers BlocksScreen ships on
+SCREEN = (800, 480)
+
+_results: dict[str, dict] = {}
+# Closed main windows, see ``_dispose``
+_kept: list[QtWidgets.QWidget] = []
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks when ``lib`` is stubbed
+
+    The network conftest replaces ``lib`` with an empty package, the
+    panels cannot be imported in the same session.
+    """
+    lib = sys.modules.get("lib")
+    if lib is None or list(getattr(lib, "__path__", [])):
+        return
+    here = Path(__file__).parent
+    for item in items:
+        if here in Path(item.fspath).parents:
+            item.add_marker(pytest.mark.skip(reason="run the benchmarks on their own"))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the results file"""
+    if not _results:
+        return
+    path = Path(os.environ.get(RESULTS_ENV, DEFAULT_RESULTS))
+    from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+
+    path.write_text(
+        json.dumps(
+            {
+                "meta": {
+                    "timestamp": time.time(),
+                    "python": platform.python_version(),
+                    "qt": QT_VERSION_STR,
+                    "pyqt": PYQT_VERSION_STR,
+                    "machine": platform.machine(),
+                    "platform": QtWidgets.QApplication.platformName()
+                    if QtWidgets.QApplication.instance()
+                    else "",
+                    "rounds": _rounds(),
+                    "repaints": REPAINTS,
+                },
+                "results": dict(sorted(_results.items())),
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+
+def _rounds() -> int:
+    return max(1, int(os.environ.get(ROUNDS_ENV, "3")))
+
+
+def _dispose(widget: QtWidgets.QWidget) -> None:
+    widget.close()
+    if isinstance(widget, QtWidgets.QMainWindow):
+        # The main window lives until the application exits and is not
+        # built to be destroyed before it, keep it closed instead
+        _kept.append(widget)
+        return
+    widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(
+        None, QtCore.QEvent.Type.DeferredDelete.value
+    )
+    gc.collect()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def resources(qapp):
+    """Register the Qt resource bundles the panels draw from
+
+    Also puts BlocksScreen/ on ``sys.path`` so ``from lib...`` resolves,
+    only once benchmarks run as it shadows the ``BlocksScreen`` package.
+    """
+    source_dir = str(Path(__file__).resolve().parents[2] / "BlocksScreen")
+    if source_dir not in sys.path:
+        sys.path.insert(0, source_dir)
+    from lib.resource_loader import load_resources
+
+    load_resources()
+
+
+@pytest.fixture
+def render_bench(qapp):
+    """Measure a widget, call with a name and a factory
+
+    Args:
+        name (str): Key of the result
+        factory: Returns the widget to measure, timed as construction
+        size (tuple[int, int]): Fixed size of the widget
+        step: Called with the widget before each steady state repaint,
+            for example to scroll a list
+    """
+
+    def run(name, factory, size=SCREEN, step=None):
+        construct, first_paint = [], []
+        widget = None
+        for _ in range(_rounds()):
+            if widget is not None:
+                _dispose(widget)
+            gc.collect()
+            started = time.perf_counter()
+            widget = factory()
+            construct.append(time.perf_counter() - started)
+            widget.resize(*size)
+            widget.show()
+            started = time.perf_counter()
+            widget.grab()
+            first_paint.append(time.perf_counter() - started)
+        repaint = []
+        for _ in range(REPAINTS):
+            if step is not None:
+                step(widget)
+            started = time.perf_counter()
+            widget.grab()
+            repaint.append(time.perf_counter() - started)
+        _dispose(widget)
+        result = {
+            "size": list(size),
+            "construct_ms": round(statistics.median(construct) * 1e3, 3),
+            "first_paint_ms": round(statistics.median(first_paint) * 1e3, 3),
+            "repaint_ms": round(statistics.median(repaint) * 1e3, 3),
+        }
+        _results[name] = result
+        return result
+
+    return run
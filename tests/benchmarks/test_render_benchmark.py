@@ -0,0 +1,153 @@
+"""Rendering benchmarks of the panels and heavy widgets."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+pytestmark = pytest.mark.benchmark
+
+
+class _NoUsb(QtCore.QObject):
+    def __init__(self, parent=None, gcodes_dir=None):
+        super().__init__(parent)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def no_devices():
+    """Keep udev and NetworkManager out of the measured panels
+
+    Module wide, the kept main windows still build their lazy panels
+    after their own benchmark.
+    """
+    import lib.panels.mainWindow as main_window
+    from lib.panels.networkWindow import NetworkControlWindow
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(main_window, "USBManager", _NoUsb)
+        patch.setattr(
+            NetworkControlWindow,
+            "_init_network_manager",
+            lambda self: setattr(self, "_nm", MagicMock()),
+        )
+        yield
+
+
+def _files(count):
+    return [
+        {
+            "path": f"parts/part_{index:05d}.gcode",
+            "filename": f"part_{index:05d}.gcode",
+            "modified": 1.7e9 + index,
+            "size": 1_000_000 + index,
+        }
+        for index in range(count)
+    ]
+
+
+def _entry_list(count):
+    from lib.icon_cache import icons
+    from lib.utils.list_model import EntryDelegate, EntryListModel, ListItem
+
+    arrow = icons.pixmap(":/arrow_icons/media/btn_icons/right_arrow.svg")
+    model = EntryListModel()
+    for index in range(count):
+        model.add_item(
+            ListItem(
+                text=f"Entry {index:05d} with a fairly long name to elide",
+                right_text=f"{index % 97} min",
+                right_icon=arrow,
+                _lfontsize=17,
+                _rfontsize=12,
+                height=80,
+                allow_expand=index % 7 == 0,
+            )
+        )
+    view = QtWidgets.QListView()
+    view.setModel(model)
+    view.setItemDelegate(EntryDelegate())
+    view.setUniformItemSizes(False)
+    # Keep the model and delegate alive with the view
+    view.entries_model = model
+    return view
+
+
+def _scroll(view):
+    bar = view.verticalScrollBar()
+    bar.setValue((bar.value() + 240) % max(bar.maximum(), 1))
+
+
+@pytest.mark.parametrize("count", [1_000, 10_000], ids=["1k", "10k"])
+def test_files_page(render_bench, count):
+    from lib.panels.widgets.filesPage import FilesPage
+
+    files = _files(count)
+
+    def build():
+        page = FilesPage()
+        page.resize(800, 420)
+        page.show()
+        page.on_file_list(files)
+        page.on_directories([{"dirname": f"folder_{index}"} for index in range(20)])
+        return page
+
+    result = render_bench(f"files_page_{count // 1000}k", build, size=(800, 420))
+
+    assert result["repaint_ms"] > 0
+
+
+def test_network_window(render_bench, no_devices):
+    from lib.panels.networkWindow import NetworkControlWindow
+
+    render_bench("network_window", NetworkControlWindow)
+
+
+def test_job_status_page(render_bench):
+    from lib.panels.widgets.jobStatusPage import JobStatusWidget
+
+    def build():
+        page = JobStatusWidget(None)
+        page.printing_progress_bar.setValue(0.42)
+        return page
+
+    render_bench("job_status_page", build, size=(800, 420))
+
+
+@pytest.mark.parametrize("scroll", [False, True], ids=["static", "scroll"])
+def test_entry_delegate_list(render_bench, scroll):
+    render_bench(
+        "entry_list_1k" + ("_scroll" if scroll else ""),
+        lambda: _entry_list(1_000),
+        size=(720, 420),
+        step=_scroll if scroll else None,
+    )
+
+
+def test_circular_progress_bar(render_bench):
+    from lib.utils.blocks_progressbar import CustomProgressBar
+
+    def build():
+        bar = CustomProgressBar()
+        bar.set_inner_pixmap(QtGui.QPixmap(":/ui/media/btn_icons/back.svg"))
+        bar.setValue(0.42)
+        return bar
+
+    render_bench("circular_progress_bar", build, size=(300, 300))
+
+
+def test_keyboard_page(render_bench):
+    from lib.panels.widgets.keyboardPage import CustomQwertyKeyboard
+
+    render_bench("keyboard_page", lambda: CustomQwertyKeyboard(None))
+
+
+# Last, the closed main windows are kept alive until the end
+def test_main_window(render_bench, no_devices):
+    from lib.panels.mainWindow import MainWindow
+
+    result = render_bench("main_window", MainWindow)
+
+    assert result["construct_ms"] > 0
@@ -223,11 +223,13 @@ class _KeyboardStub(QtWidgets.QWidget):
 
 
 # Register parent packages first (must be real modules, not MagicMock).
+# Their path is the real package directory, so the modules that are not
+# stubbed below still import.
 _lib_parent_packages = ("lib", "lib.panels", "lib.panels.widgets", "lib.utils")
 for _pkg in _lib_parent_packages:
     if _pkg not in sys.modules:
         _pm = types.ModuleType(_pkg)
-        _pm.__path__ = []
+        _pm.__path__ = [str(_project_root.joinpath("BlocksScreen", *_pkg.split(".")))]
         _pm.__package__ = _pkg
         sys.modules[_pkg] = _pm
 
@@ -274,11 +276,16 @@ _STUB_MODULES = {
     },
 }
 
+# Stubbed under the short path only, so test_list_model_unit.py imports the
+# real module via ``BlocksScreen.lib.utils.list_model``.
+_SHORT_PATH_ONLY = frozenset({"lib.utils.list_model"})
+
 for _mod_name, _attrs in _STUB_MODULES.items():
     _stub = _make_stub_module(_mod_name, _attrs)
     # Register under BOTH short (lib.*) and long (BlocksScreen.lib.*) paths.
     sys.modules[_mod_name] = _stub
-    sys.modules["BlocksScreen." + _mod_name] = _stub
+    if _mod_name not in _SHORT_PATH_ONLY:
+        sys.modules["BlocksScreen." + _mod_name] = _stub
 
 
 # Mock lib.qrcode_gen (short path only) — networkWindow.py imports it as
@@ -311,6 +318,16 @@ from BlocksScreen.lib.network.models import (  # noqa: E402
 # Alias so ``from lib.network import ...`` works.
 sys.modules["lib.network"] = sys.modules["BlocksScreen.lib.network"]
 
+# The icon cache has no widget dependencies, the real module is used.
+import BlocksScreen.lib.icon_cache  # noqa: E402
+
+sys.modules["lib.icon_cache"] = sys.modules["BlocksScreen.lib.icon_cache"]
+
+# Same for the frame scheduler, a plain QObject
+import BlocksScreen.lib.frame_scheduler  # noqa: E402
+
+sys.modules["lib.frame_scheduler"] = sys.modules["BlocksScreen.lib.frame_scheduler"]
+
 
 # AsyncProxyMock — sdbus_async D-Bus proxy mock
 
@@ -0,0 +1,124 @@
+"""Unit tests for BlocksScreen.lib.bed_mesh."""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PyQt6 import QtCore
+
+from BlocksScreen.lib import bed_mesh
+from BlocksScreen.lib.bed_mesh import BedMeshEngine, mesh_stats, parse_matrix
+
+# BlocksScreen/ must be on sys.path so ``from lib...`` resolves, the
+# network conftest may have stubbed the ``lib`` package already
+_bs_dir = str(Path(__file__).resolve().parents[2] / "BlocksScreen")
+if _bs_dir not in sys.path:
+    sys.path.insert(0, _bs_dir)
+sys.modules.setdefault("lib.bed_mesh", bed_mesh)
+
+from BlocksScreen.lib.utils.bed_mesh_view import BedMeshView  # noqa: E402
+
+
+def _tilted(rows=5, columns=5, slope_x=0.001, slope_y=-0.002):
+    xs = np.linspace(0.0, 200.0, columns)
+    ys = np.linspace(0.0, 200.0, rows)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    return (slope_x * grid_x + slope_y * grid_y).round(6).tolist()
+
+
+@pytest.mark.unit
+class TestParsing:
+    def test_parse_matrix(self):
+        assert parse_matrix([[0.1, 0.2], [0.3, 0.4]]).shape == (2, 2)
+
+    @pytest.mark.parametrize("matrix", [[], [[]], [[1.0], [1.0, 2.0]], None])
+    def test_invalid_matrix_is_empty(self, matrix):
+        assert parse_matrix(matrix).size == 0
+
+    def test_stats(self):
+        stats = mesh_stats(
+            np.array(_tilted()), mesh_min=(0.0, 0.0), mesh_max=(200.0, 200.0)
+        )
+        assert stats.tilt_x == pytest.approx(0.001)
+        assert stats.tilt_y == pytest.approx(-0.002)
+        assert stats.range == pytest.approx(0.6)
+        assert stats.points == 25
+
+    def test_stats_empty(self):
+        assert mesh_stats(np.empty((0, 0))) is None
+
+
+@pytest.mark.unit
+class TestBedMeshEngine:
+    def test_update_merges_deltas(self):
+        engine = BedMeshEngine()
+        assert engine.update(
+            {
+                "profile_name": "default",
+                "mesh_min": [0.0, 0.0],
+                "mesh_max": [200.0, 200.0],
+                "probed_matrix": _tilted(),
+                "mesh_matrix": _tilted(10, 10),
+            }
+        )
+        assert engine.mesh.shape == (10, 10)
+        assert engine.stats.tilt_y == pytest.approx(-0.002)
+        assert engine.update({"profile_name": "other"})
+        assert engine.mesh.shape == (10, 10)
+
+    def test_unchanged_update_is_ignored(self):
+        engine = BedMeshEngine()
+        engine.update({"mesh_matrix": _tilted()})
+        version = engine.version
+        assert not engine.update({"mesh_matrix": _tilted()})
+        assert engine.version == version
+
+    def test_heatmap_is_cached_until_mesh_changes(self, qapp):
+        engine = BedMeshEngine()
+        engine.update({"mesh_matrix": _tilted()})
+        size = QtCore.QSize(100, 100)
+        image = engine.heatmap(size)
+        assert image.size() == size
+        assert engine.heatmap(size) is image
+        engine.update({"mesh_matrix": _tilted(slope_x=0.003)})
+        assert engine.heatmap(size) is not image
+
+    def test_heatmap_orientation(self, qapp):
+        engine = BedMeshEngine()
+        engine.update({"mesh_matrix": [[-1.0, -1.0], [1.0, 1.0]]})
+        image = engine.heatmap()
+        # Row 0 (low Y, lowest values) is drawn at the bottom in blue
+        assert image.pixelColor(0, 1).blue() > image.pixelColor(0, 1).red()
+        assert image.pixelColor(0, 0).red() > image.pixelColor(0, 0).blue()
+
+    def test_large_mesh_is_fast(self, qapp):
+        engine = BedMeshEngine()
+        matrix = np.random.default_rng(0).normal(0, 0.05, (50, 50)).tolist()
+        started = time.perf_counter()
+        engine.update(
+            {"mesh_min": [0, 0], "mesh_max": [300, 300], "mesh_matrix": matrix}
+        )
+        engine.heatmap(QtCore.QSize(300, 300))
+        assert time.perf_counter() - started < 0.1
+
+
+@pytest.mark.unit
+def test_view_blits_the_cached_heatmap(qtbot):
+    engine = BedMeshEngine()
+    view = BedMeshView(engine)
+    qtbot.addWidget(view)
+    view.resize(200, 150)
+    view.grab()  # Placeholder, nothing to render
+    engine.update({"profile_name": "default", "mesh_matrix": _tilted()})
+    view.on_bed_mesh_update("default", [], [], [], engine.mesh_matrix)
+    with patch.object(bed_mesh, "render_heatmap", wraps=bed_mesh.render_heatmap) as (
+        render
+    ):
+        image = view.grab().toImage()
+        view.grab()
+    assert render.call_count == 1
+    assert image.pixelColor(100, 60) != image.pixelColor(100, 145)
+    assert "default" in view._label()
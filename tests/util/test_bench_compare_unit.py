@@ -0,0 +1,55 @@
+"""Unit tests for tools/bench_compare.py."""
+
+import json
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2] / "tools"))
+
+import bench_compare
+
+
+def _write(path, results):
+    path.write_text(json.dumps({"meta": {}, "results": results}))
+    return path
+
+
+@pytest.mark.unit
+def test_compare_flags_only_large_slowdowns():
+    baseline = {
+        "page": {"construct_ms": 10.0, "first_paint_ms": 2.0, "repaint_ms": 1.0}
+    }
+    results = {
+        # +50 % and +5 ms, +50 % but only +1 ms, faster
+        "page": {"construct_ms": 15.0, "first_paint_ms": 3.0, "repaint_ms": 0.5}
+    }
+
+    lines, regressions = bench_compare.compare(
+        baseline, results, threshold=0.25, min_delta=1.5
+    )
+
+    assert len(lines) == 3
+    assert len(regressions) == 1
+    assert "construct_ms" in regressions[0]
+
+
+@pytest.mark.unit
+def test_main_exit_status(tmp_path, capsys):
+    baseline = _write(
+        tmp_path / "baseline.json",
+        {"page": {"repaint_ms": 4.0}, "gone": {"repaint_ms": 1.0}},
+    )
+    same = _write(
+        tmp_path / "same.json",
+        {"page": {"repaint_ms": 4.2}, "new": {"repaint_ms": 1.0}},
+    )
+    slower = _write(tmp_path / "slower.json", {"page": {"repaint_ms": 8.0}})
+
+    assert bench_compare.main([str(baseline), str(same)]) == 0
+    output = capsys.readouterr().out
+    assert "gone" in output and "missing" in output
+    assert "new, no baseline" in output
+    assert bench_compare.main([str(baseline), str(slower)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,78 @@
+"""Unit tests for BlocksScreen.lib.utils.blocks_progressbar."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6 import QtCore, QtGui
+
+from BlocksScreen.lib.utils.blocks_progressbar import CustomProgressBar
+
+
+@pytest.fixture
+def bar(qtbot):
+    widget = CustomProgressBar()
+    qtbot.addWidget(widget)
+    widget.resize(300, 300)
+    return widget
+
+
+@pytest.mark.unit
+def test_update_only_when_percentage_changes(bar):
+    bar.update = MagicMock()
+
+    bar.setValue(0.421)
+    bar.setValue(0.428)
+    bar.setValue(0.43)
+
+    assert bar.update.call_count == 2
+    assert int(bar.progress_value) == 43
+
+
+@pytest.mark.unit
+def test_update_is_limited_to_the_ring_and_text(bar):
+    bar.update = MagicMock()
+
+    bar.setValue(0.5)
+
+    (dirty,) = bar.update.call_args.args
+    assert isinstance(dirty, QtCore.QRect)
+    assert bar.rect().contains(dirty) and dirty != bar.rect()
+    assert dirty.contains(bar._text_rect(bar._arc_rect()).toAlignedRect())
+
+
+@pytest.mark.unit
+def test_background_is_rendered_once_per_size(bar):
+    bar.grab()
+    background = bar._background_layer()
+    bar.setValue(0.2)
+    bar.set_bar_color(10, 200, 10)
+    bar.grab()
+
+    assert bar._background_layer().cacheKey() == background.cacheKey()
+    bar.resize(200, 200)
+    assert bar._background_layer().cacheKey() != background.cacheKey()
+
+
+@pytest.mark.unit
+def test_paint_shows_background_and_progress(bar):
+    bar.set_bar_color(255, 0, 0)
+    arc = bar._arc_rect()
+    # Left end of the ring, reached at about 20% of the bar
+    point = QtCore.QPoint(int(arc.left()), int(arc.center().y()))
+    background = QtGui.QColor(20, 20, 20)
+    assert bar.grab().toImage().pixelColor(point) == background
+
+    bar.setValue(0.1)
+    assert bar.grab().toImage().pixelColor(point) == background
+    bar.setValue(0.3)
+    assert bar.grab().toImage().pixelColor(point) != background
+
+
+@pytest.mark.unit
+def test_reset_clears_progress(bar):
+    bar.setValue(0.75)
+    bar.reset()
+
+    assert bar.progress_value == 0
+    with pytest.raises(ValueError):
+        bar.setValue(101)
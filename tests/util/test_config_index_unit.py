@@ -0,0 +1,71 @@
+"""Unit tests for BlocksScreen.lib.config_index."""
+
+import pytest
+
+from BlocksScreen.lib.config_index import ConfigIndex, diff_config
+
+CONFIG = {
+    "extruder": {"nozzle_diameter": "0.4"},
+    "extruder1": {"nozzle_diameter": "0.6"},
+    "stepper_z": {"position_max": "250"},
+    "stepper_z1": {"step_pin": "PD4"},
+    "gcode_macro PURGE": {"gcode": "G1 X0"},
+    "gcode_macro PARK": {"gcode": "G1 X10"},
+    "bltouch": {"z_offset": "1.2"},
+}
+
+
+@pytest.mark.unit
+class TestConfigIndex:
+    def test_full_name_and_prefix(self):
+        index = ConfigIndex(CONFIG)
+        assert index.names("extruder") == ["extruder"]
+        assert index.names("gcode_macro") == ["gcode_macro PURGE", "gcode_macro PARK"]
+        assert index.names("gcode_macro PARK") == ["gcode_macro PARK"]
+        assert index.names("gcode_macro NOPE") == []
+        assert index.names("") == []
+
+    def test_section(self):
+        index = ConfigIndex(CONFIG)
+        assert "stepper_z" in index
+        assert index.section("stepper_z") == {"position_max": "250"}
+        assert index.section("probe") == {}
+
+    def test_lookup_many_single_pass(self):
+        index = ConfigIndex(CONFIG)
+        found = index.lookup_many(["probe", "bltouch", "stepper_z", "bltouch"])
+        assert found == [
+            {"bltouch": {"z_offset": "1.2"}},
+            {"stepper_z": {"position_max": "250"}},
+        ]
+
+    def test_rebuild_and_clear(self):
+        index = ConfigIndex(CONFIG)
+        index.rebuild({"probe": {}})
+        assert index.names("extruder") == []
+        assert len(index) == 1
+        index.clear()
+        assert "probe" not in index
+
+
+@pytest.mark.unit
+class TestDiffConfig:
+    def test_unchanged(self):
+        diff = diff_config(CONFIG, {name: dict(v) for name, v in CONFIG.items()})
+        assert not diff
+        assert diff.sections == frozenset()
+
+    def test_sections_and_options(self):
+        new = {name: dict(v) for name, v in CONFIG.items() if name != "bltouch"}
+        new["stepper_z"]["position_max"] = "240"
+        new["stepper_z"]["position_min"] = "-2"
+        new["probe"] = {"z_offset": "1.0"}
+        diff = diff_config(CONFIG, new)
+        assert diff
+        assert diff.added == {"probe"}
+        assert diff.removed == {"bltouch"}
+        assert diff.changed == {"stepper_z": {"position_max", "position_min"}}
+        assert diff.sections == {"probe", "stepper_z"}
+
+    def test_everything_added_from_empty(self):
+        assert diff_config({}, CONFIG).added == CONFIG.keys()
@@ -0,0 +1,121 @@
+"""Unit tests for tools/fake_moonraker.py."""
+
+import asyncio
+import json
+import pathlib
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2] / "tools"))
+
+import fake_moonraker
+import requests
+import websocket
+
+
+@pytest.fixture
+def server():
+    config = fake_moonraker.FakePrinterConfig(
+        extruders=2,
+        temperature_sensors=3,
+        macros=5,
+        update_rate=50.0,
+        file_count=12,
+        files_per_dir=5,
+    )
+    fake = fake_moonraker.FakeMoonraker(config, port=0)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(fake.start())
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert started.wait(5)
+    yield fake
+    asyncio.run_coroutine_threadsafe(fake.stop(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+
+
+def _call(ws, request_id, method, params=None):
+    ws.send(
+        json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params or {},
+            }
+        )
+    )
+    while True:
+        message = json.loads(ws.recv())
+        if message.get("id") == request_id:
+            return message
+
+
+@pytest.mark.unit
+class TestFakePrinter:
+    def test_objects_follow_config(self):
+        printer = fake_moonraker.FakePrinter(
+            fake_moonraker.FakePrinterConfig(
+                extruders=3, temperature_sensors=4, macros=7
+            )
+        )
+        names = printer.object_names()
+        assert {"extruder", "extruder1", "extruder2"} <= set(names)
+        assert sum(name.startswith("temperature_sensor ") for name in names) == 4
+        assert sum(name.startswith("gcode_macro ") for name in names) == 7
+
+    def test_directory_split(self):
+        printer = fake_moonraker.FakePrinter(
+            fake_moonraker.FakePrinterConfig(file_count=12, files_per_dir=5)
+        )
+        root = printer.list_directory("gcodes")
+        assert len(root["files"]) == 5
+        assert [d["dirname"] for d in root["dirs"]] == ["batch_001", "batch_002"]
+        assert len(printer.list_directory("gcodes/batch_002")["files"]) == 2
+
+    def test_print_progress_advances(self):
+        printer = fake_moonraker.FakePrinter(fake_moonraker.FakePrinterConfig())
+        printer.start_print("part_00000.gcode", 0.0)
+        delta = printer.tick(1.0)
+        assert delta["virtual_sdcard"]["progress"] > 0
+        assert delta["print_stats"]["print_duration"] == 1.0
+
+
+@pytest.mark.unit
+def test_http_and_websocket_roundtrip(server):
+    base = f"http://127.0.0.1:{server.port}"
+    token = requests.get(f"{base}/access/oneshot_token", timeout=5).json()["result"]
+    assert token
+    assert requests.get(f"{base}/nope", timeout=5).status_code == 404
+
+    ws = websocket.create_connection(
+        f"ws://127.0.0.1:{server.port}/websocket?token={token}", timeout=5
+    )
+    try:
+        info = _call(ws, 1, "server.info")
+        assert info["result"]["klippy_state"] == "ready"
+        assert _call(ws, 2, "no.such.method")["error"]["code"] == -32601
+        subscribed = _call(
+            ws, 3, "printer.objects.subscribe", {"objects": {"extruder1": None}}
+        )
+        assert "temperature" in subscribed["result"]["status"]["extruder1"]
+        while True:
+            message = json.loads(ws.recv())
+            if message.get("method") == "notify_status_update":
+                break
+        status, eventtime = message["params"]
+        assert list(status) == ["extruder1"]
+        assert eventtime > 0
+    finally:
+        ws.close()
+    assert server.stats["requests"] == 3
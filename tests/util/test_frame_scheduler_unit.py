@@ -0,0 +1,85 @@
+"""Unit tests for BlocksScreen.lib.frame_scheduler."""
+
+import pytest
+from PyQt6 import QtWidgets, sip
+
+from BlocksScreen.lib.frame_scheduler import FrameScheduler
+
+
+class Display(QtWidgets.QPushButton):
+    def __init__(self):
+        super().__init__()
+        self.secondary_text = ""
+        self.texts = []
+        self.updates = 0
+
+    def setText(self, text):
+        self.texts.append(text)
+        super().setText(text)
+
+    def update(self):
+        self.updates += 1
+        super().update()
+
+
+@pytest.mark.unit
+def test_latest_value_is_applied_once_per_tick(qtbot):
+    frames = FrameScheduler(rate=100)
+    display = Display()
+    for value in ("20.1", "20.2", "20.3"):
+        frames.set(display, "text", value)
+    frames.set(display, "secondary_text", "60")
+
+    assert display.texts == []
+    qtbot.waitUntil(lambda: frames.pending == 0, timeout=1000)
+
+    assert display.texts == ["20.3"]
+    assert display.secondary_text == "60"
+
+
+@pytest.mark.unit
+def test_unchanged_values_are_skipped(qapp):
+    frames = FrameScheduler()
+    display = Display()
+    display.setText("20.0")
+    frames.set(display, "text", "20.0")
+    frames.set(display, "secondary_text", "")
+    frames.flush()
+
+    assert display.texts == ["20.0"]
+    assert frames.skipped == 2 and frames.applied == 0
+
+
+@pytest.mark.unit
+def test_updates_are_coalesced(qapp):
+    frames = FrameScheduler()
+    display = Display()
+    for _ in range(5):
+        frames.update(display)
+    frames.flush()
+
+    assert display.updates == 1
+
+
+@pytest.mark.unit
+def test_paused_scheduler_applies_on_resume(qtbot):
+    frames = FrameScheduler(rate=100)
+    display = Display()
+    frames.set_paused(True)
+    frames.set(display, "text", "21.0")
+    qtbot.wait(50)
+
+    assert display.texts == [] and frames.pending == 1
+    frames.set_paused(False)
+    assert display.texts == ["21.0"]
+
+
+@pytest.mark.unit
+def test_deleted_widgets_are_dropped(qapp):
+    frames = FrameScheduler()
+    label = QtWidgets.QLabel()
+    frames.set(label, "text", "gone")
+    sip.delete(label)
+    frames.flush()
+
+    assert frames.applied == 0 and frames.pending == 0
@@ -0,0 +1,108 @@
+"""Unit tests for BlocksScreen.lib.gcode_layers."""
+
+import threading
+
+import pytest
+
+from BlocksScreen.lib.gcode_layers import GcodeLayerIndexer, build_layer_index
+
+PRUSA = b"""; generated by PrusaSlicer
+G28
+;LAYER_CHANGE
+;Z:0.2
+;HEIGHT:0.2
+G1 Z0.2 F720
+G1 X10 Y10 E1.0
+;LAYER_CHANGE
+;Z:0.35
+;HEIGHT:0.15
+G1 Z0.35
+G1 X20 Y10 E2.0
+;LAYER_CHANGE
+;Z:0.5
+G1 Z0.5
+G1 X20 Y20 E3.0
+"""
+
+# No layer comments, z-hop travels and a variable layer height
+PLAIN = b"""G28
+M83
+G1 Z0.2 F720
+G1 X10 Y10 E0.5
+G1 Z0.6
+G1 X50 Y50
+G1 Z0.2
+G1 X60 Y50 E0.5
+G1 Z0.3
+G1 X10 Y10 E0.5
+G10
+G1 Z0.42
+G1 X20 Y10 E0.5
+"""
+
+
+@pytest.mark.unit
+class TestBuildLayerIndex:
+    def test_slicer_markers(self, tmp_path):
+        path = tmp_path / "part.gcode"
+        path.write_bytes(PRUSA)
+        index = build_layer_index(path)
+        assert len(index) == 3
+        assert index.heights.tolist() == pytest.approx([0.2, 0.35, 0.5])
+        assert index.layer_at(0) == 0
+        assert index.layer_at(PRUSA.index(b"G1 X20 Y10")) == 2
+        assert index.layer_at(len(PRUSA)) == 3
+        assert index.height(2) == pytest.approx(0.35)
+
+    def test_move_fallback_ignores_z_hop(self, tmp_path):
+        path = tmp_path / "plain.gcode"
+        path.write_bytes(PLAIN)
+        index = build_layer_index(path)
+        assert index.heights.tolist() == pytest.approx([0.2, 0.3, 0.42])
+        assert index.layer_at(PLAIN.index(b"G1 X60")) == 1
+        assert index.layer_at(PLAIN.index(b"G1 Z0.3")) == 2
+        assert index.layer_at(PLAIN.index(b"G1 X20 Y10")) == 3
+
+    def test_absolute_extrusion(self, tmp_path):
+        path = tmp_path / "absolute.gcode"
+        path.write_bytes(
+            b"M82\nG92 E0\nG1 Z0.2\nG1 X1 E1\nG1 Z0.4\nG1 X2 E1\nG1 X3 E2\n"
+        )
+        assert build_layer_index(path).heights.tolist() == pytest.approx([0.2, 0.4])
+
+    def test_g92_resets(self, tmp_path):
+        path = tmp_path / "reset.gcode"
+        path.write_bytes(
+            b"M82\nG1 Z0.2\nG1 X1 E5\nG92\nG1 Z0.2\nG1 X2 E1\n"
+            b"G92 Z1.2\nG1 X3 E2\nG1 Z1.4\nG1 X4 E3\n"
+        )
+        index = build_layer_index(path)
+        # A bare G92 zeroes E and Z, G92 Z does not start a layer
+        assert index.heights.tolist() == pytest.approx([0.2, 0.2, 1.4])
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.gcode"
+        path.write_bytes(b"")
+        assert len(build_layer_index(path)) == 0
+
+    def test_cancelled(self, tmp_path):
+        path = tmp_path / "plain.gcode"
+        path.write_bytes(PLAIN)
+        cancelled = threading.Event()
+        cancelled.set()
+        with pytest.raises(InterruptedError):
+            build_layer_index(path, cancelled)
+
+
+@pytest.mark.unit
+def test_indexer_caches_per_file_version(qtbot, tmp_path):
+    path = tmp_path / "part.gcode"
+    path.write_bytes(PRUSA)
+    indexer = GcodeLayerIndexer()
+    with qtbot.waitSignal(indexer.index_ready, timeout=5000) as blocker:
+        indexer.request(str(path))
+    assert blocker.args[0] == str(path)
+    assert indexer.get(str(path)) is blocker.args[1]
+    path.write_bytes(PRUSA + b";LAYER_CHANGE\n;Z:0.65\n")
+    assert indexer.get(str(path)) is None
+    indexer.shutdown()
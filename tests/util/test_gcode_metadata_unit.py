@@ -0,0 +1,120 @@
+"""Unit tests for BlocksScreen.lib.gcode_metadata."""
+
+import base64
+
+import pytest
+from PyQt6 import QtCore, QtGui
+
+from BlocksScreen.lib.gcode_metadata import (
+    LocalMetadataParser,
+    parse_duration,
+    parse_gcode_metadata,
+)
+
+
+def _thumbnail(width, height):
+    image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_ARGB32)
+    image.fill(QtGui.QColor("red"))
+    buffer = QtCore.QBuffer()
+    buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    encoded = base64.b64encode(bytes(buffer.data()))
+    lines = [encoded[i : i + 78] for i in range(0, len(encoded), 78)]
+    return (
+        f"; thumbnail begin {width}x{height} {len(encoded)}\n".encode()
+        + b"".join(b"; " + line + b"\n" for line in lines)
+        + b"; thumbnail end\n"
+    )
+
+
+def _prusa_file(qapp):
+    return (
+        b"; generated by PrusaSlicer 2.7.1+linux-x64 on 2024-01-01\n\n"
+        + _thumbnail(32, 32)
+        + _thumbnail(16, 16)
+        + b"\nM73 P0 R10\n;LAYER_CHANGE\n;Z:0.2\nG1 Z0.2\nG1 X10 E1\n"
+        b";LAYER_CHANGE\n;Z:12.4\nG1 Z12.4\nG1 X20 E2\nM107\n"
+        b"; filament used [mm] = 1234.56\n"
+        b"; filament used [g] = 3.70\n"
+        b"; estimated printing time (normal mode) = 1h 2m 3s\n"
+        b"; filament_type = PETG;PLA\n"
+        b"; first_layer_temperature = 240,215\n"
+        b"; first_layer_bed_temperature = 80\n"
+        b"; layer_height = 0.15\n"
+        b"; nozzle_diameter = 0.4,0.4\n"
+    )
+
+
+CURA = (
+    b";FLAVOR:Marlin\n;TIME:3600\n;Filament used: 1.5m\n;Layer height: 0.2\n"
+    b";MAXZ:20.2\n;Generated with Cura_SteamEngine 5.4.0\n"
+    b";EXTRUDER_TRAIN.0.INITIAL_TEMPERATURE:205\n"
+    b";BUILD_PLATE.INITIAL_TEMPERATURE:60\n;LAYER_COUNT:101\n"
+    b"M140 S60\n;LAYER:0\nG1 Z0.2\nG1 X1 E1\n;End of Gcode\n"
+)
+
+
+@pytest.mark.unit
+class TestParse:
+    @pytest.mark.parametrize(
+        "text, seconds",
+        [("3600", 3600), ("1h 2m 3s", 3723), ("1d 0h 1m", 86460), ("", 0)],
+    )
+    def test_parse_duration(self, text, seconds):
+        assert parse_duration(text) == seconds
+
+    def test_prusaslicer(self, tmp_path, qapp):
+        data = _prusa_file(qapp)
+        path = tmp_path / "part.gcode"
+        path.write_bytes(data)
+        metadata, thumbnails = parse_gcode_metadata(path)
+        assert metadata["slicer"] == "PrusaSlicer"
+        assert metadata["slicer_version"].startswith("2.7.1")
+        assert metadata["estimated_time"] == 3723
+        assert metadata["filament_total"] == pytest.approx(1234.56)
+        assert metadata["filament_weight_total"] == pytest.approx(3.7)
+        assert metadata["filament_type"] == "PETG"
+        assert metadata["first_layer_extruder_temp"] == 240.0
+        assert metadata["first_layer_bed_temp"] == 80.0
+        assert metadata["layer_height"] == 0.15
+        assert metadata["object_height"] == pytest.approx(12.4)
+        assert metadata["size"] == len(data)
+        assert data[metadata["gcode_start_byte"] :].startswith(b"M73 P0")
+        assert data[: metadata["gcode_end_byte"]].endswith(b"M107\n")
+        assert [image.width() for image in thumbnails] == [16, 32]
+
+    def test_cura(self, tmp_path):
+        path = tmp_path / "cura.gcode"
+        path.write_bytes(CURA)
+        metadata, thumbnails = parse_gcode_metadata(path)
+        assert metadata["slicer"] == "Cura_SteamEngine"
+        assert metadata["estimated_time"] == 3600
+        assert metadata["filament_total"] == pytest.approx(1500.0)
+        assert metadata["layer_count"] == 101
+        assert metadata["object_height"] == pytest.approx(20.2)
+        assert metadata["first_layer_extruder_temp"] == 205.0
+        assert metadata["first_layer_bed_temp"] == 60.0
+        assert thumbnails == []
+
+    def test_only_head_and_tail_are_read(self, tmp_path, qapp):
+        data = _prusa_file(qapp)
+        path = tmp_path / "big.gcode"
+        middle = b"G1 X1 Y1 E0.01\n" * 100000
+        path.write_bytes(data[:200] + middle + data[200:])
+        metadata, _ = parse_gcode_metadata(path, head_bytes=4096, tail_bytes=4096)
+        assert metadata["estimated_time"] == 3723
+
+
+@pytest.mark.unit
+def test_parser_pool_emits_and_caches(qtbot, tmp_path):
+    path = tmp_path / "cura.gcode"
+    path.write_bytes(CURA)
+    parser = LocalMetadataParser()
+    with qtbot.waitSignal(parser.parsed, timeout=5000) as blocker:
+        assert parser.request("cura.gcode", path)
+    filename, metadata, _ = blocker.args
+    assert filename == "cura.gcode" and metadata["filename"] == "cura.gcode"
+    with qtbot.waitSignal(parser.parsed, timeout=1000):
+        parser.request("cura.gcode", path)  # Cached, emitted right away
+    assert not parser.request("missing.gcode", tmp_path / "missing.gcode")
+    parser.shutdown()
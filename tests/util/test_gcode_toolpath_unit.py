@@ -0,0 +1,220 @@
+"""Unit tests for BlocksScreen.lib.gcode_toolpath."""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from BlocksScreen.lib import gcode_layers
+
+# BlocksScreen/ must be on sys.path so ``from lib...`` resolves, the
+# network conftest may have stubbed the ``lib`` package already
+_bs_dir = str(Path(__file__).resolve().parents[2] / "BlocksScreen")
+if _bs_dir not in sys.path:
+    sys.path.insert(0, _bs_dir)
+sys.modules.setdefault("lib.gcode_layers", gcode_layers)
+
+from BlocksScreen.lib import gcode_toolpath  # noqa: E402
+from BlocksScreen.lib.gcode_toolpath import (  # noqa: E402
+    Toolpath,
+    ToolpathLoader,
+    cache_key,
+    parse_toolpath,
+)
+
+# Absolute extrusion, z-hop travel, a G92 reset and a relative move
+GCODE = b"""G28 ; home
+G90
+M82
+G1 Z0.2 F720
+G1 X10 Y10
+G1 X20 Y10 E1.0
+G1 X20 Y20 E2.0 ; comment
+G1 Z0.6
+G0 X0 Y0
+G1 Z0.4
+G92 E0
+G1 X10 Y0 E0.5
+G91
+G1 X0 Y10 E0.5
+G90
+"""
+
+ARC = b"""M83
+G1 Z0.2
+G1 X10 Y0
+G3 X-10 Y0 I-10 J0 E1
+"""
+
+
+# Slicer markers, the z-hop travel before the second one stays in layer 1
+MARKERS = b"""M83
+;LAYER_CHANGE
+;Z:0.2
+G1 Z0.2
+G1 X10 Y0 E1
+G1 Z0.6
+G0 X0 Y0
+;LAYER_CHANGE
+;Z:0.4
+G1 Z0.4
+G1 X0 Y10 E1
+"""
+
+
+@pytest.fixture
+def gcode_file(tmp_path):
+    path = tmp_path / "part.gcode"
+    path.write_bytes(GCODE)
+    return path
+
+
+@pytest.mark.unit
+def test_parse_toolpath_layers_and_segments(gcode_file):
+    toolpath = parse_toolpath(gcode_file)
+
+    assert len(toolpath) == 2
+    np.testing.assert_allclose(toolpath.heights, [0.2, 0.4])
+    assert toolpath.offsets[0] == GCODE.index(b"G1 Z0.2")
+    assert toolpath.offsets[1] == GCODE.index(b"G1 Z0.4")
+    segments, extruding = toolpath.layer(1)
+    # The travel to the layer start and the z-hop travel belong to layer 1
+    assert extruding.tolist() == [False, True, True, False]
+    np.testing.assert_allclose(segments[1], [10, 10, 20, 10])
+    segments, extruding = toolpath.layer(2)
+    assert extruding.tolist() == [True, True]
+    np.testing.assert_allclose(segments[1], [10, 0, 10, 10])
+    np.testing.assert_allclose(toolpath.bounds, [0, 0, 20, 20])
+
+
+@pytest.mark.unit
+def test_layer_at_follows_file_position(gcode_file):
+    toolpath = parse_toolpath(gcode_file)
+
+    assert toolpath.layer_at(0) == 0
+    assert toolpath.layer_at(GCODE.index(b"G1 X20 Y20")) == 1
+    assert toolpath.layer_at(len(GCODE)) == 2
+    assert toolpath.layer(3)[0].shape == (0, 4)
+
+
+@pytest.mark.unit
+def test_arcs_are_linearized_on_the_circle(tmp_path):
+    path = tmp_path / "arc.gcode"
+    path.write_bytes(ARC)
+
+    segments, extruding = parse_toolpath(path).layer(1)
+
+    # The travel to the arc start, then 18 chords of 10 degrees
+    assert not extruding[0] and extruding[1:].all()
+    segments = segments[1:]
+    assert len(segments) == 18
+    radii = np.hypot(segments[:, 2], segments[:, 3])
+    np.testing.assert_allclose(radii, 10, atol=1e-4)
+    # Counter clockwise from (10, 0) goes through the positive Y side
+    assert segments[:, 3].max() == pytest.approx(10, abs=0.1)
+    np.testing.assert_allclose(segments[-1, 2:], [-10, 0], atol=1e-5)
+
+
+@pytest.mark.unit
+def test_layers_match_the_layer_index(tmp_path):
+    path = tmp_path / "markers.gcode"
+    path.write_bytes(MARKERS)
+
+    toolpath = parse_toolpath(path)
+
+    index = gcode_layers.build_layer_index(path)
+    np.testing.assert_array_equal(toolpath.offsets, index.offsets)
+    np.testing.assert_allclose(toolpath.heights, [0.2, 0.4])
+    assert toolpath.layer(1)[1].tolist() == [True, False]
+    assert toolpath.layer(2)[1].tolist() == [True]
+
+
+@pytest.mark.unit
+def test_g92_resets_positions(tmp_path):
+    path = tmp_path / "reset.gcode"
+    path.write_bytes(
+        b"M82\nG1 Z0.2\nG1 X10 Y10 E5\nG92\nG1 X5 Y0 E1\nG92 X0 Y0 Z1\nG1 X0 Y5 E2\n"
+    )
+
+    segments, extruding = parse_toolpath(path).layer(1)
+
+    assert extruding.tolist() == [True, True, True]
+    np.testing.assert_allclose(segments[1:], [[0, 0, 5, 0], [0, 0, 0, 5]])
+
+
+@pytest.mark.unit
+def test_parse_toolpath_cancelled(gcode_file):
+    cancelled = threading.Event()
+    cancelled.set()
+
+    with pytest.raises(InterruptedError):
+        parse_toolpath(gcode_file, cancelled)
+
+
+@pytest.mark.unit
+def test_toolpath_save_load_round_trip(gcode_file, tmp_path):
+    toolpath = parse_toolpath(gcode_file)
+    toolpath.save(tmp_path / "cached.npz")
+
+    loaded = Toolpath.load(tmp_path / "cached.npz")
+
+    assert len(loaded) == len(toolpath)
+    np.testing.assert_array_equal(loaded.segments, toolpath.segments)
+    np.testing.assert_array_equal(loaded.layer_starts, toolpath.layer_starts)
+
+
+@pytest.mark.unit
+def test_loader_caches_on_disk(qtbot, gcode_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    loader = ToolpathLoader(cache_dir=cache_dir, memory_items=0)
+    try:
+        with qtbot.waitSignal(loader.toolpath_ready, timeout=5000) as blocker:
+            assert loader.request("part.gcode", gcode_file)
+        name, toolpath = blocker.args
+        assert name == "part.gcode" and len(toolpath) == 2
+        assert (cache_dir / cache_key(gcode_file)).exists()
+
+        with qtbot.waitSignal(loader.toolpath_ready, timeout=5000) as blocker:
+            loader.request("part.gcode", gcode_file)
+        np.testing.assert_array_equal(blocker.args[1].segments, toolpath.segments)
+    finally:
+        loader.shutdown()
+
+
+@pytest.mark.unit
+def test_loader_missing_file(tmp_path):
+    loader = ToolpathLoader(cache_dir=tmp_path)
+    try:
+        assert not loader.request("missing.gcode", tmp_path / "missing.gcode")
+    finally:
+        loader.shutdown()
+
+
+@pytest.mark.unit
+def test_new_request_on_a_channel_cancels_the_previous(qtbot, tmp_path):
+    first, second = tmp_path / "first.gcode", tmp_path / "second.gcode"
+    first.write_bytes(GCODE)
+    second.write_bytes(MARKERS)
+    started = threading.Event()
+    real_parse = gcode_toolpath.parse_toolpath
+
+    def parse(path, cancelled):
+        if path == str(first):
+            started.set()
+            assert cancelled.wait(5)
+        return real_parse(path, cancelled)
+
+    loader = ToolpathLoader(cache_dir=tmp_path / "cache")
+    try:
+        with patch.object(gcode_toolpath, "parse_toolpath", parse):
+            with qtbot.waitSignal(loader.toolpath_ready, timeout=5000) as blocker:
+                loader.request("first", first, channel="files")
+                assert started.wait(5)
+                loader.request("second", second, channel="files")
+        assert blocker.args[0] == "second"
+        assert not (tmp_path / "cache" / cache_key(first)).exists()
+    finally:
+        loader.shutdown()
@@ -0,0 +1,138 @@
+"""Unit tests for BlocksScreen.lib.gui_handoff."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from PyQt6 import QtCore
+
+from BlocksScreen.lib.ws_metrics import WebSocketMetrics
+
+# BlocksScreen/ must be on sys.path so ``from events import ...`` resolves
+# (matching the runtime import style used inside the package).
+_bs_dir = str(Path(__file__).resolve().parent.parent.parent / "BlocksScreen")
+if _bs_dir not in sys.path:
+    sys.path.append(_bs_dir)
+
+from events import WebSocketMessageReceived  # noqa: E402
+
+from BlocksScreen.lib.gui_handoff import (  # noqa: E402
+    GuiHandoff,
+    is_mergeable,
+    merge_status,
+)
+
+
+class _Target(QtCore.QObject):
+    def __init__(self):
+        super().__init__()
+        self.received = []
+
+    def event(self, event):
+        if isinstance(event, WebSocketMessageReceived):
+            self.received.append(event)
+            return True
+        return super().event(event)
+
+
+def _status(status, eventtime=1.0):
+    return WebSocketMessageReceived(
+        method="notify_status_update",
+        data={"method": "notify_status_update", "params": [status, eventtime]},
+    )
+
+
+def _response(method="server.info"):
+    return WebSocketMessageReceived(method=method, data={"ok": True}, metadata=[])
+
+
+@pytest.fixture
+def handoff(qapp):
+    target = _Target()
+    handoff = GuiHandoff(target, lag_threshold=60.0, max_pending=1)
+    handoff.target = target
+    return handoff
+
+
+@pytest.mark.unit
+class TestMergeRules:
+    def test_status_delta_is_mergeable(self):
+        assert is_mergeable(_status({"extruder": {"temperature": 200.0}}))
+
+    def test_state_transition_is_not_mergeable(self):
+        assert not is_mergeable(_status({"print_stats": {"state": "printing"}}))
+
+    def test_response_is_not_mergeable(self):
+        assert not is_mergeable(_response())
+
+    def test_merge_keeps_fields_missing_from_newer(self):
+        older = {"params": [{"extruder": {"temperature": 1.0, "target": 200.0}}, 1.0]}
+        newer = {
+            "params": [{"extruder": {"temperature": 2.0}, "fan": {"speed": 1}}, 2.0]
+        }
+        assert merge_status(older, newer) == 1
+        assert older["params"] == [
+            {"extruder": {"temperature": 2.0, "target": 200.0}, "fan": {"speed": 1}},
+            2.0,
+        ]
+
+
+@pytest.mark.unit
+class TestGuiHandoff:
+    def test_delivers_in_order_when_not_lagging(self, qapp):
+        target = _Target()
+        handoff = GuiHandoff(target, lag_threshold=60.0)
+        events = [_status({"extruder": {"temperature": t}}) for t in (1.0, 2.0)]
+        for event in events:
+            handoff.put(event)
+        assert handoff.drain() == 2
+        assert target.received == events
+
+    def test_superseded_deltas_are_merged_when_lagging(self, handoff):
+        handoff.put(_status({"extruder": {"temperature": 1.0}}, 1.0))
+        handoff.put(_status({"extruder": {"temperature": 2.0}}, 2.0))
+        handoff.put(_status({"heater_bed": {"temperature": 60.0}}, 3.0))
+        assert handoff.drain() == 1
+        assert handoff.target.received[0].data["params"] == [
+            {"extruder": {"temperature": 2.0}, "heater_bed": {"temperature": 60.0}},
+            3.0,
+        ]
+        stats = handoff.stats()
+        assert stats["merged"] == 2
+        assert stats["superseded_fields"] == 1
+
+    def test_responses_and_state_changes_are_never_dropped(self, handoff):
+        sequence = [
+            _status({"extruder": {"temperature": 1.0}}),
+            _response(),
+            _status({"extruder": {"temperature": 2.0}}),
+            _status({"print_stats": {"state": "complete"}}),
+            _status({"extruder": {"temperature": 3.0}}),
+            _status({"extruder": {"temperature": 4.0}}),
+        ]
+        for event in sequence:
+            handoff.put(event)
+        handoff.drain()
+        received = handoff.target.received
+        assert received[:4] == sequence[:4]
+        assert len(received) == 5
+        assert received[4].data["params"][0] == {"extruder": {"temperature": 4.0}}
+
+    def test_wakeup_event_drains_queue(self, qapp):
+        target = _Target()
+        handoff = GuiHandoff(target)
+        handoff.put(_response())
+        assert handoff.pending == 1
+        qapp.processEvents()
+        assert handoff.pending == 0
+        assert len(target.received) == 1
+
+    def test_lag_and_drops_reach_metrics(self, qapp):
+        metrics = WebSocketMetrics()
+        handoff = GuiHandoff(_Target(), max_pending=1, metrics=metrics)
+        handoff.put(_status({"extruder": {"temperature": 1.0}}))
+        handoff.put(_status({"extruder": {"temperature": 2.0}}))
+        handoff.drain()
+        snapshot = metrics.snapshot()
+        assert snapshot["dropped_status_updates"] == 1
+        assert snapshot["gui_lag"]["count"] == 1
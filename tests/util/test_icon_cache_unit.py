@@ -0,0 +1,98 @@
+"""Unit tests for BlocksScreen.lib.icon_cache."""
+
+import pytest
+from PyQt6 import QtCore, QtGui
+
+from BlocksScreen.lib.icon_cache import IconCache
+
+SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="20" height="10"
+viewBox="0 0 20 10"><rect width="20" height="10" fill="#000000"/></svg>"""
+
+
+@pytest.fixture
+def svg(tmp_path):
+    path = tmp_path / "wide.svg"
+    path.write_text(SVG)
+    return str(path)
+
+
+@pytest.mark.unit
+def test_icon_is_fitted_and_cached(qapp, svg):
+    cache = IconCache()
+
+    icon = cache.icon(svg, QtCore.QSize(40, 40), 2.0)
+
+    assert icon.size() == QtCore.QSize(80, 40)
+    assert icon.deviceIndependentSize() == QtCore.QSizeF(40, 20)
+    assert cache.icon(svg, QtCore.QSize(40, 40), 2.0).cacheKey() == icon.cacheKey()
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.icon(svg, QtCore.QSize(0, 40)).isNull()
+
+
+@pytest.mark.unit
+def test_tint_is_part_of_the_key(qapp, svg):
+    cache = IconCache()
+
+    plain = cache.icon(svg, QtCore.QSize(20, 10))
+    red = cache.icon(svg, QtCore.QSize(20, 10), tint=QtGui.QColor(255, 0, 0))
+
+    assert plain.cacheKey() != red.cacheKey()
+    assert plain.toImage().pixelColor(5, 5) == QtGui.QColor(0, 0, 0)
+    assert red.toImage().pixelColor(5, 5) == QtGui.QColor(255, 0, 0)
+
+
+@pytest.mark.unit
+def test_lru_is_bounded_by_bytes(qapp, svg):
+    # A 20x10 ARGB icon takes 800 bytes
+    cache = IconCache(max_bytes=2000)
+    for width in (20, 22, 24, 26):
+        cache.icon(svg, QtCore.QSize(width, 1000))
+
+    assert cache.used_bytes <= 2000
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.used_bytes == 0 and len(cache) == 0
+
+
+@pytest.mark.unit
+def test_scaled_rasterizes_known_pixmaps_from_source(qapp, svg):
+    cache = IconCache()
+    natural = cache.pixmap(svg)
+    assert cache.pixmap(svg).cacheKey() == natural.cacheKey()
+
+    scaled = cache.scaled(natural, QtCore.QSize(100, 100))
+
+    assert scaled.cacheKey() == cache.icon(svg, QtCore.QSize(100, 100)).cacheKey()
+    assert scaled.size() == QtCore.QSize(100, 50)
+
+
+@pytest.mark.unit
+def test_scaled_caches_foreign_pixmaps(qapp):
+    cache = IconCache()
+    pixmap = QtGui.QPixmap(30, 10)
+    pixmap.fill(QtGui.QColor(0, 0, 255))
+
+    scaled = cache.scaled(pixmap, QtCore.QSize(15, 15))
+
+    assert scaled.size() == QtCore.QSize(15, 5)
+    assert cache.scaled(pixmap, QtCore.QSize(15, 15)).cacheKey() == scaled.cacheKey()
+    assert cache.scaled(QtGui.QPixmap(), QtCore.QSize(15, 15)).isNull()
+
+
+@pytest.mark.unit
+def test_disk_cache_is_filled_and_reused(qapp, svg, tmp_path, monkeypatch):
+    directory = tmp_path / "icons"
+    first = IconCache(disk_dir=directory)
+    expected = first.icon(svg, QtCore.QSize(20, 10)).toImage()
+    first.shutdown()
+    assert len(list(directory.glob("*.png"))) == 1
+
+    second = IconCache(disk_dir=directory)
+    monkeypatch.setattr(
+        IconCache, "_rasterize", staticmethod(lambda *args: pytest.fail("rendered"))
+    )
+    loaded = second.icon(svg, QtCore.QSize(20, 10)).toImage()
+    second.shutdown()
+
+    assert loaded.size() == expected.size()
+    assert loaded.pixelColor(5, 5) == expected.pixelColor(5, 5)
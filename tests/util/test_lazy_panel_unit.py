@@ -0,0 +1,134 @@
+"""Unit tests for BlocksScreen.lib.panels.lazy_panel."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from PyQt6 import QtWidgets
+
+from BlocksScreen.lib import startup_profiler
+
+# BlocksScreen/ must be on sys.path so ``from lib...`` resolves, the
+# network conftest may have stubbed the ``lib`` package already
+_bs_dir = str(Path(__file__).resolve().parents[2] / "BlocksScreen")
+if _bs_dir not in sys.path:
+    sys.path.insert(0, _bs_dir)
+sys.modules.setdefault("lib.startup_profiler", startup_profiler)
+
+from BlocksScreen.lib.panels.lazy_panel import (  # noqa: E402
+    QUEUE_LIMIT,
+    LazyPanel,
+    PanelRegistry,
+)
+
+
+class Panel(QtWidgets.QWidget):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self.child = QtWidgets.QLabel(self)
+
+    def record(self, *args):
+        self.calls.append(args)
+
+
+@pytest.mark.unit
+def test_panel_is_built_once_on_first_use(qapp):
+    built = []
+    panel = LazyPanel("panel", lambda: built.append(Panel()) or built[-1])
+
+    assert panel.instance is None and not built
+    first = panel.get()
+
+    assert panel.get() is first and panel.instance is first
+    assert len(built) == 1
+
+
+@pytest.mark.unit
+def test_when_built_runs_wiring_after_the_build(qapp):
+    panel = LazyPanel("panel", Panel)
+    wired = []
+    panel.when_built(wired.append)
+
+    assert not wired
+    instance = panel.get()
+    panel.when_built(wired.append)
+
+    assert wired == [instance, instance]
+
+
+@pytest.mark.unit
+def test_slot_proxy_queues_until_built(qapp):
+    panel = LazyPanel("panel", Panel)
+    record = panel.slot("record")
+    dropped = panel.slot("child.setText", queue=False)
+
+    record("a", 1)
+    dropped("ignored")
+    instance = panel.get()
+    record("b", 2)
+
+    assert instance.calls == [("a", 1), ("b", 2)]
+    assert instance.child.text() == ""
+    dropped("shown")
+    assert instance.child.text() == "shown"
+
+
+@pytest.mark.unit
+def test_slot_proxy_queue_is_bounded(qapp):
+    panel = LazyPanel("panel", Panel)
+    record = panel.slot("record")
+    for value in range(QUEUE_LIMIT + 5):
+        record(value)
+
+    calls = panel.get().calls
+
+    assert len(calls) == QUEUE_LIMIT
+    assert calls[-1] == (QUEUE_LIMIT + 4,)
+
+
+@pytest.mark.unit
+def test_tab_change_builds_the_tab_panel(qapp):
+    tabs = QtWidgets.QTabWidget()
+    first, second = QtWidgets.QWidget(), QtWidgets.QWidget()
+    tabs.addTab(first, "first")
+    tabs.addTab(second, "second")
+    registry = PanelRegistry()
+    registry.add("first", Panel, first)
+    registry.add("second", Panel, second)
+    tabs.currentChanged.connect(registry.on_tab_changed)
+
+    tabs.setCurrentIndex(1)
+
+    assert registry.pending == ["first"]
+    assert registry.instances() == [registry["second"].instance]
+
+
+@pytest.mark.unit
+def test_prefetch_builds_everything_in_order(qtbot):
+    registry = PanelRegistry()
+    order = []
+    for name in ("a", "b", "c"):
+        registry.add(name, lambda name=name: order.append(name) or Panel())
+    registry.get("b")
+
+    with qtbot.waitSignal(registry.prefetched, timeout=2000):
+        registry.prefetch()
+
+    assert order == ["b", "a", "c"]
+    assert registry.pending == []
+
+
+@pytest.mark.unit
+def test_prefetch_starts_after_first_paint(qtbot):
+    window = QtWidgets.QWidget()
+    qtbot.addWidget(window)
+    registry = PanelRegistry()
+    registry.add("panel", Panel)
+    registry.prefetch_after_first_paint(window)
+
+    assert registry.pending == ["panel"]
+    with qtbot.waitSignal(registry.prefetched, timeout=2000):
+        window.show()
+
+    assert registry.pending == []
@@ -1,9 +1,25 @@
 """Unit tests for EntryListModel.reconcile() — locks behaviour before refactoring."""
 
+import sys
+from pathlib import Path
+
 import pytest
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+from BlocksScreen.lib import icon_cache
+
+# BlocksScreen/ must be on sys.path so ``from lib...`` resolves, the
+# network conftest may have stubbed the ``lib`` package already
+_bs_dir = str(Path(__file__).resolve().parents[2] / "BlocksScreen")
+if _bs_dir not in sys.path:
+    sys.path.insert(0, _bs_dir)
+sys.modules.setdefault("lib.icon_cache", icon_cache)
 
-from BlocksScreen.lib.utils.list_model import EntryListModel, ListItem
+from BlocksScreen.lib.utils import list_model  # noqa: E402
+from BlocksScreen.lib.utils.list_model import (  # noqa: E402
+    EntryListModel,
+    ListItem,
+)
 
 
 def _item(text, right_text=""):
@@ -75,3 +91,100 @@ class TestReconcile:
         model.reconcile([_item("A"), _item("B"), _item("C")], _key)
         model.reconcile([], _key)
         assert model.rowCount() == 0
+
+
+def _option(width, top=0, height=66):
+    option = QtWidgets.QStyleOptionViewItem()
+    option.font = QtWidgets.QApplication.font()
+    option.fontMetrics = QtGui.QFontMetrics(option.font)
+    option.rect = QtCore.QRect(0, top, width, height)
+    return option
+
+
+@pytest.fixture
+def entries(qapp):
+    m = list_model.EntryListModel()
+    yield m
+    m.deleteLater()
+
+
+def _entry(text, right_text=""):
+    return list_model.ListItem(text=text, right_text=right_text)
+
+
+class TestEntryLayout:
+    LONG = "A long entry name that does not fit on one line of a narrow list"
+
+    def test_size_hint_reuses_layout(self, entries):
+        delegate = list_model.EntryDelegate()
+        entries.add_item(_entry(self.LONG))
+        index = entries.index(0)
+        item = entries.entries[0]
+
+        size = delegate.sizeHint(_option(200), index)
+        layout = next(iter(item._layouts.values()))
+
+        assert delegate.sizeHint(_option(200), index) == size
+        assert next(iter(item._layouts.values())) is layout
+        assert item.needs_expansion
+
+    def test_layout_follows_item_changes(self, entries):
+        delegate = list_model.EntryDelegate()
+        entries.add_item(_entry(self.LONG))
+        index = entries.index(0)
+        item = entries.entries[0]
+        delegate.sizeHint(_option(200), index)
+
+        item.text = "Short"
+        delegate.sizeHint(_option(200), index)
+        assert not item.needs_expansion
+
+        item.text = self.LONG
+        collapsed = delegate.sizeHint(_option(200), index)
+        entries.setData(index, True, list_model.EntryListModel.ExpandRole)
+        assert delegate.sizeHint(_option(200), index).height() > collapsed.height()
+
+        item.clear_cache()
+        assert not item._layouts
+
+    def test_layout_per_width_and_bounded(self, entries):
+        delegate = list_model.EntryDelegate()
+        entries.add_item(_entry(self.LONG))
+        index = entries.index(0)
+        item = entries.entries[0]
+
+        delegate.sizeHint(_option(200), index)
+        assert item.needs_expansion
+        delegate.sizeHint(_option(2000), index)
+        assert not item.needs_expansion
+        assert len(item._layouts) == 2
+
+        for width in range(300, 1000, 100):
+            delegate.sizeHint(_option(width), index)
+        assert len(item._layouts) <= 4
+
+    def test_paint_reuses_layout_across_rows(self, entries):
+        delegate = list_model.EntryDelegate()
+        entries.add_item(_entry(self.LONG, right_text="12 min"))
+        index = entries.index(0)
+        item = entries.entries[0]
+        image = QtGui.QImage(400, 400, QtGui.QImage.Format.Format_ARGB32)
+        image.fill(0)
+
+        painter = QtGui.QPainter(image)
+        delegate.paint(painter, _option(400, top=0), index)
+        layouts = dict(item._layouts)
+        delegate.paint(painter, _option(400, top=200), index)
+        painter.end()
+
+        assert item._layouts == layouts
+        layout = next(iter(layouts.values()))
+        assert layout.text.endswith("…") and layout.text != item.text
+        # Both rows are painted, the layout is moved to each of them
+        assert image.pixelColor(200, 33) == image.pixelColor(200, 233)
+        assert image.pixelColor(200, 33).alpha() > 0
+
+    def test_layouts_do_not_affect_equality(self):
+        first, second = _entry("A"), _entry("A")
+        first._layouts[("size", 100, "")] = None
+        assert first == second
@@ -0,0 +1,76 @@
+"""Unit tests for BlocksScreen.lib.perf_hud."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from PyQt6 import QtCore, QtWidgets
+
+from BlocksScreen.lib import frame_scheduler, stall_watchdog
+
+# BlocksScreen/ must be on sys.path so ``from lib...`` resolves, the
+# network conftest may have stubbed the ``lib`` package already
+_bs_dir = str(Path(__file__).resolve().parents[2] / "BlocksScreen")
+if _bs_dir not in sys.path:
+    sys.path.insert(0, _bs_dir)
+sys.modules.setdefault("lib.frame_scheduler", frame_scheduler)
+sys.modules.setdefault("lib.stall_watchdog", stall_watchdog)
+
+from BlocksScreen.lib.perf_hud import (  # noqa: E402
+    PerformanceHud,
+    SlowHandlers,
+    handler_name,
+)
+
+
+@pytest.mark.unit
+def test_slow_handlers_keep_the_worst_run_of_the_window():
+    slow = SlowHandlers(window=10.0)
+    slow.add("a", 0.010, now=0.0)
+    slow.add("b", 0.050, now=1.0)
+    slow.add("a", 0.030, now=2.0)
+    slow.add("c", 0.020, now=3.0)
+
+    assert slow.top(2, now=5.0) == [("b", 0.050), ("a", 0.030)]
+    assert slow.top(now=11.5) == [("a", 0.030), ("c", 0.020)]
+
+
+@pytest.mark.unit
+def test_notify_times_only_the_outermost_handler(qapp):
+    hud = PerformanceHud()
+    receiver = QtCore.QObject()
+    receiver.setObjectName("panel")
+    event = QtCore.QEvent(QtCore.QEvent.Type.Timer)
+
+    def inner(obj, ev):
+        time.sleep(0.005)
+        return True
+
+    def outer(obj, ev):
+        return hud.notify(inner, obj, ev)
+
+    assert hud.notify(outer, receiver, event)
+    top = hud.slow.top()
+
+    assert [name for name, _ in top] == [handler_name(receiver, event)]
+    assert top[0][0] == "QObject(panel).Timer"
+
+
+@pytest.mark.unit
+def test_overlay_follows_the_enabled_state(qtbot):
+    window = QtWidgets.QWidget()
+    window.resize(400, 300)
+    qtbot.addWidget(window)
+    window.show()
+    hud = PerformanceHud()
+    hud.attach(window)
+
+    assert hud.overlay is None
+    hud.set_enabled(True)
+
+    assert hud.overlay.isVisible()
+    assert hud.overlay.lines[0].startswith("fps")
+    assert any(line.startswith("rss") for line in hud.overlay.lines)
+    hud.set_enabled(False)
+    assert not hud.overlay.isVisible()
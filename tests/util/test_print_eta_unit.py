@@ -0,0 +1,89 @@
+"""Unit tests for BlocksScreen.lib.print_eta."""
+
+import pytest
+
+from BlocksScreen.lib.print_eta import PrintEta, blend_estimates, file_progress
+from BlocksScreen.lib.printer_state import PrinterState
+
+
+@pytest.mark.unit
+class TestHelpers:
+    def test_file_progress_uses_gcode_range(self):
+        assert file_progress(600, 1000, 200, 1000) == pytest.approx(0.5)
+        assert file_progress(100, 1000, 200, 1000) == 0.0
+        assert file_progress(500, 1000) == pytest.approx(0.5)
+        assert file_progress(10, 0) == 0.0
+
+    def test_blend(self):
+        assert blend_estimates(0.0) is None
+        assert blend_estimates(0.0, slicer=100.0) == 100.0
+        assert blend_estimates(0.5, extrapolated=80.0, rate=120.0) == 100.0
+        assert blend_estimates(0.25, 100.0, 200.0) == pytest.approx(125.0)
+
+
+@pytest.fixture
+def engine(qapp):
+    state = PrinterState()
+    eta = PrintEta(state, smoothing=0.5)
+    eta.on_fileinfo(
+        {
+            "filename": "part.gcode",
+            "estimated_time": 1000,
+            "gcode_start_byte": 0,
+            "gcode_end_byte": 10000,
+        }
+    )
+    state.apply(
+        {
+            "print_stats": {
+                "filename": "part.gcode",
+                "state": "printing",
+                "print_duration": 0.0,
+            },
+            "virtual_sdcard": {"file_position": 0, "file_size": 10000},
+        }
+    )
+    yield state, eta
+    eta._timer.stop()
+
+
+@pytest.mark.unit
+class TestPrintEta:
+    def test_slicer_estimate_at_start(self, engine):
+        state, eta = engine
+        assert eta.active
+        estimate = eta.compute(now=eta._duration_at)
+        assert estimate.remaining == pytest.approx(1000.0)
+        assert estimate.completion > 0.0
+
+    def test_measured_rate_takes_over(self, engine):
+        state, eta = engine
+        eta.compute(now=eta._duration_at)
+        # Half the file in 250 s: twice as fast as the slicer estimate
+        state.apply(
+            {
+                "print_stats": {"print_duration": 250.0},
+                "virtual_sdcard": {"file_position": 5000},
+            }
+        )
+        estimate = eta.compute(now=eta._duration_at)
+        assert estimate.progress == pytest.approx(0.5)
+        assert estimate.remaining < 1000.0
+        assert estimate.print_duration == pytest.approx(250.0)
+
+    def test_pause_holds_remaining(self, engine):
+        state, eta = engine
+        start = eta._duration_at
+        first = eta.compute(now=start).remaining
+        state.apply({"print_stats": {"state": "paused"}})
+        paused = eta.compute(now=start + 600.0)
+        assert paused.remaining == pytest.approx(first)
+        assert paused.print_duration == 0.0
+
+    def test_complete_ends_at_zero(self, engine):
+        state, eta = engine
+        received = []
+        eta.eta_update.connect(received.append)
+        state.apply({"print_stats": {"state": "complete"}})
+        assert not eta.active
+        assert received[-1].remaining == 0.0
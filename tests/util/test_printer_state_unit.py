@@ -0,0 +1,122 @@
+"""Unit tests for BlocksScreen.lib.printer_state."""
+
+import logging
+
+import pytest
+
+from BlocksScreen.lib.printer_state import (
+    Fan,
+    GenericObject,
+    Heater,
+    PrinterState,
+    merge_fields,
+    state_class,
+)
+
+
+@pytest.mark.unit
+class TestStateClasses:
+    @pytest.mark.parametrize(
+        "name, cls",
+        [
+            ("extruder", Heater),
+            ("extruder1", Heater),
+            ("heater_bed", Heater),
+            ("heater_generic chamber", Heater),
+            ("fan", Fan),
+            ("controller_fan board", Fan),
+            ("bed_mesh", GenericObject),
+        ],
+    )
+    def test_state_class(self, name, cls):
+        assert state_class(name) is cls
+
+    def test_merge_reports_changed_fields(self):
+        heater = Heater(temperature=20.0)
+        changed = merge_fields(heater, {"temperature": 20.0, "target": 60.0})
+        assert changed == {"target"}
+        assert heater.target == 60.0
+
+    def test_unknown_fields_go_to_extra(self):
+        heater = Heater()
+        assert merge_fields(heater, {"motion_queue": None}) == {"motion_queue"}
+        assert heater.extra == {"motion_queue": None}
+        assert merge_fields(heater, {"motion_queue": None}) == frozenset()
+
+    def test_extra_is_not_overwritten(self):
+        heater = Heater()
+        merge_fields(heater, {"extra": 1})
+        assert heater.extra == {"extra": 1}
+
+
+@pytest.mark.unit
+class TestPrinterState:
+    def test_apply_returns_changes(self):
+        state = PrinterState()
+        first = state.apply({"extruder": {"temperature": 0.0, "target": 0.0}})
+        assert first == {"extruder": {"temperature", "target"}}
+        assert state.apply({"extruder": {"temperature": 0.0}}) == {}
+        assert state.apply({"extruder": {"temperature": 21.5}}) == {
+            "extruder": {"temperature"}
+        }
+        assert "extruder" in state
+        assert state.get("extruder").temperature == 21.5
+        assert state.value("extruder", "target") == 0.0
+        assert state.value("toolhead", "position", "missing") == "missing"
+
+    def test_subscriber_field_filter(self):
+        state = PrinterState()
+        calls = []
+        state.subscribe(
+            "heater_bed", lambda *args: calls.append(args), ("temperature",)
+        )
+        state.apply({"heater_bed": {"temperature": 25.0, "power": 0.0}})
+        state.apply({"heater_bed": {"power": 0.5}})
+        state.apply({"extruder": {"temperature": 25.0}})
+        assert len(calls) == 1
+        name, heater, changed = calls[0]
+        assert name == "heater_bed" and heater.temperature == 25.0
+        assert changed == {"temperature", "power"}
+
+    def test_unsubscribe(self):
+        state = PrinterState()
+        calls = []
+
+        def callback(*args):
+            calls.append(args)
+
+        state.subscribe("fan", callback)
+        state.apply({"fan": {"speed": 0.5}})
+        state.unsubscribe(callback)
+        state.apply({"fan": {"speed": 1.0}})
+        assert len(calls) == 1
+
+    def test_failing_subscriber_does_not_stop_dispatch(self, caplog):
+        state = PrinterState()
+        calls = []
+
+        def broken(*_):
+            raise RuntimeError("boom")
+
+        state.subscribe("fan", broken)
+        state.subscribe("fan", lambda *args: calls.append(args))
+        with caplog.at_level(logging.ERROR):
+            state.apply({"fan": {"speed": 0.5}})
+        assert len(calls) == 1
+        # The traceback of the broken subscriber is logged
+        assert caplog.records[-1].exc_info[0] is RuntimeError
+
+    def test_objects_changed_signal(self):
+        state = PrinterState()
+        emitted = []
+        state.objects_changed.connect(emitted.append)
+        state.apply({"fan": {"speed": 0.5}})
+        state.apply({"fan": {"speed": 0.5}})
+        assert emitted == [{"fan": frozenset({"speed"})}]
+
+    def test_reset(self):
+        state = PrinterState()
+        state.apply({"fan": {"speed": 0.5}})
+        state.reset()
+        assert "fan" not in state
+        assert state.apply({"fan": {"speed": 0.5}}) == {"fan": {"speed"}}
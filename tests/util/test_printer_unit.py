@@ -0,0 +1,55 @@
+"""Unit tests for the configfile handling of BlocksScreen.lib.printer."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import BlocksScreen.lib  # noqa: F401, resolved before BlocksScreen/ shadows it
+
+# BlocksScreen/ must be on sys.path so ``from lib...`` resolves
+_bs_dir = str(Path(__file__).resolve().parents[2] / "BlocksScreen")
+if _bs_dir not in sys.path:
+    sys.path.insert(0, _bs_dir)
+
+from BlocksScreen.lib.printer import Printer  # noqa: E402
+
+CONFIG = {
+    "stepper_x": {"position_max": "250"},
+    "stepper_z": {"position_max": "300"},
+    "bltouch": {"z_offset": "1.2"},
+}
+
+
+@pytest.fixture
+def printer(qapp):
+    printer = Printer(None, MagicMock())
+    printer.configs, printer.removed = [], []
+    printer.printer_config.connect(printer.configs.append)
+    printer.printer_config_removed.connect(printer.removed.append)
+    return printer
+
+
+@pytest.mark.unit
+class TestConfigfile:
+    def test_unchanged_config_is_not_emitted_again(self, printer):
+        printer._configfile_object_updated({"config": CONFIG})
+        printer._configfile_object_updated({"config": dict(CONFIG)})
+        assert printer.configs == [CONFIG]
+
+    def test_restart_with_unchanged_config(self, printer):
+        printer._configfile_object_updated({"config": CONFIG})
+        printer.on_klippy_status("shutdown")
+        assert not len(printer.config_index)
+        printer._configfile_object_updated({"config": dict(CONFIG)})
+        assert printer.configs == [CONFIG, CONFIG]
+        assert printer.get_config("stepper_z") == {"position_max": "300"}
+
+    def test_removed_sections_are_signalled(self, printer):
+        printer._configfile_object_updated({"config": CONFIG})
+        config = dict(CONFIG, stepper_x={"position_max": "200"})
+        del config["bltouch"]
+        printer._configfile_object_updated({"config": config})
+        assert printer.removed == [["bltouch"]]
+        assert printer.configs[-1] == {"stepper_x": {"position_max": "200"}}
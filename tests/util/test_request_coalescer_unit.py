@@ -0,0 +1,174 @@
+"""Unit tests for BlocksScreen.lib.request_coalescer."""
+
+from unittest.mock import patch
+
+import pytest
+
+from BlocksScreen.lib.request_coalescer import Disposition, RequestCoalescer
+
+_META = "server.files.metadata"
+_DIR = "server.files.get_directory"
+
+
+@pytest.fixture
+def coalescer():
+    return RequestCoalescer(ttl=2.0)
+
+
+@pytest.mark.unit
+class TestInFlight:
+    def test_first_request_is_sent(self, coalescer):
+        assert coalescer.submit(1, _META, {"filename": "a.gcode"})[0] is (
+            Disposition.SEND
+        )
+
+    def test_identical_request_joins(self, coalescer):
+        coalescer.submit(1, _META, {"filename": "a.gcode"})
+        assert coalescer.submit(2, _META, {"filename": "a.gcode"})[0] is (
+            Disposition.JOINED
+        )
+
+    def test_param_order_does_not_matter(self, coalescer):
+        coalescer.submit(1, _DIR, {"path": "gcodes/", "extended": True})
+        disposition, _ = coalescer.submit(2, _DIR, {"extended": True, "path": "gcodes/"})
+        assert disposition is Disposition.JOINED
+
+    def test_different_params_are_sent(self, coalescer):
+        coalescer.submit(1, _META, {"filename": "a.gcode"})
+        assert coalescer.submit(2, _META, {"filename": "b.gcode"})[0] is (
+            Disposition.SEND
+        )
+
+    def test_resolve_returns_waiters_in_order(self, coalescer):
+        for request_id in (1, 2, 3):
+            coalescer.submit(request_id, _META, {"filename": "a.gcode"})
+        assert coalescer.resolve(1, {"result": {}}) == [2, 3]
+
+    def test_error_response_is_fanned_out_but_not_cached(self, coalescer):
+        coalescer.submit(1, _META, {"filename": "a.gcode"})
+        coalescer.submit(2, _META, {"filename": "a.gcode"})
+        assert coalescer.resolve(1, {"error": {"code": 404}}) == [2]
+        assert coalescer.submit(3, _META, {"filename": "a.gcode"})[0] is (
+            Disposition.SEND
+        )
+
+    def test_unknown_id_resolves_to_nothing(self, coalescer):
+        assert coalescer.resolve(42, {"result": "ok"}) == []
+
+    def test_mutating_methods_are_never_coalesced(self, coalescer):
+        params = {"script": "G28"}
+        coalescer.submit(1, "printer.gcode.script", params)
+        assert coalescer.submit(2, "printer.gcode.script", params)[0] is (
+            Disposition.SEND
+        )
+
+    def test_metascan_is_never_coalesced(self, coalescer):
+        params = {"filename": "a.gcode"}
+        coalescer.submit(1, "server.files.metascan", params)
+        assert coalescer.submit(2, "server.files.metascan", params)[0] is (
+            Disposition.SEND
+        )
+        assert coalescer.resolve(1, {"result": {}}) == []
+
+
+@pytest.mark.unit
+class TestCache:
+    def test_cache_hit_after_response(self, coalescer):
+        coalescer.submit(1, _META, {"filename": "a.gcode"})
+        coalescer.resolve(1, {"result": {"filename": "a.gcode"}})
+        disposition, result = coalescer.submit(2, _META, {"filename": "a.gcode"})
+        assert disposition is Disposition.CACHED
+        assert result == {"filename": "a.gcode"}
+
+    def test_results_are_copies(self, coalescer):
+        response = {"result": {"thumbnails": [{"width": 32}]}}
+        coalescer.submit(1, _META, {"filename": "a.gcode"})
+        coalescer.submit(2, _META, {"filename": "a.gcode"})
+        assert coalescer.resolve(1, response) == [2]
+        waiter = coalescer.waiter_response(response)
+        waiter["result"]["thumbnails"].clear()
+        assert response["result"]["thumbnails"] == [{"width": 32}]
+        response["result"]["thumbnails"].clear()
+        _, cached = coalescer.submit(3, _META, {"filename": "a.gcode"})
+        cached["thumbnails"][0]["width"] = 0
+        _, cached = coalescer.submit(4, _META, {"filename": "a.gcode"})
+        assert cached == {"thumbnails": [{"width": 32}]}
+
+    def test_cache_expires(self, coalescer):
+        with patch("BlocksScreen.lib.request_coalescer.time.monotonic") as clock:
+            clock.return_value = 100.0
+            coalescer.submit(1, _META, {"filename": "a.gcode"})
+            coalescer.resolve(1, {"result": {}})
+            clock.return_value = 103.0
+            assert coalescer.submit(2, _META, {"filename": "a.gcode"})[0] is (
+                Disposition.SEND
+            )
+
+    def test_query_results_are_not_cached(self, coalescer):
+        params = {"objects": {"toolhead": None}}
+        coalescer.submit(1, "printer.objects.query", params)
+        coalescer.resolve(1, {"result": {}})
+        assert coalescer.submit(2, "printer.objects.query", params)[0] is (
+            Disposition.SEND
+        )
+
+    def test_invalidate_by_prefix(self, coalescer):
+        coalescer.submit(1, _META, {"filename": "a.gcode"})
+        coalescer.resolve(1, {"result": {}})
+        coalescer.invalidate("server.files.")
+        assert coalescer.submit(2, _META, {"filename": "a.gcode"})[0] is (
+            Disposition.SEND
+        )
+
+    def test_file_mutation_invalidates_file_cache(self, coalescer):
+        coalescer.submit(1, _META, {"filename": "a.gcode"})
+        coalescer.resolve(1, {"result": {}})
+        coalescer.submit(2, "server.files.delete_file", {"path": "gcodes/a.gcode"})
+        assert coalescer.submit(3, _META, {"filename": "a.gcode"})[0] is (
+            Disposition.SEND
+        )
+
+    def test_reset_clears_everything(self, coalescer):
+        coalescer.submit(1, _META, {"filename": "a.gcode"})
+        coalescer.reset()
+        assert coalescer.stats()["in_flight"] == 0
+        assert coalescer.submit(2, _META, {"filename": "a.gcode"})[0] is (
+            Disposition.SEND
+        )
+
+
+@pytest.mark.unit
+class TestOrderedMethods:
+    def test_no_join_across_a_newer_request(self, coalescer):
+        coalescer.submit(1, _DIR, {"path": "gcodes/"})
+        coalescer.submit(2, _DIR, {"path": "gcodes/USB-sda1"})
+        assert coalescer.submit(3, _DIR, {"path": "gcodes/"})[0] is Disposition.SEND
+        assert coalescer.resolve(1, {"result": {}}) == []
+        assert coalescer.resolve(2, {"result": {}}) == []
+        assert coalescer.resolve(3, {"result": {}}) == []
+
+    def test_join_latest(self, coalescer):
+        coalescer.submit(1, _DIR, {"path": "gcodes/"})
+        assert coalescer.submit(2, _DIR, {"path": "gcodes/"})[0] is (
+            Disposition.JOINED
+        )
+
+    def test_no_cache_hit_while_same_method_in_flight(self, coalescer):
+        coalescer.submit(1, _DIR, {"path": "gcodes/"})
+        coalescer.resolve(1, {"result": {}})
+        coalescer.submit(2, _DIR, {"path": "gcodes/USB-sda1"})
+        assert coalescer.submit(3, _DIR, {"path": "gcodes/"})[0] is Disposition.SEND
+
+
+@pytest.mark.unit
+def test_stats_count_saved_round_trips(coalescer):
+    coalescer.submit(1, _META, {"filename": "a.gcode"})
+    coalescer.submit(2, _META, {"filename": "a.gcode"})
+    coalescer.resolve(1, {"result": {}})
+    coalescer.submit(3, _META, {"filename": "a.gcode"})
+    stats = coalescer.stats()
+    assert stats["submitted"] == 3
+    assert stats["sent"] == 1
+    assert stats["coalesced"] == 1
+    assert stats["cache_hits"] == 1
+    assert stats["saved_round_trips"] == 2 == coalescer.saved_round_trips
@@ -0,0 +1,82 @@
+"""Unit tests for BlocksScreen.lib.resource_loader."""
+
+import os
+import struct
+
+import pytest
+from PyQt6 import QtCore
+
+from BlocksScreen.lib import resource_loader
+from BlocksScreen.lib.ui.resources import graphic_resources_rc, top_bar_resources_rc
+
+GRAPHIC = "/graphics/media/graphics/babystep_graphic.png"
+TOP_BAR = "/top_bar_icons/media/topbar/bed_temp_topbar.svg"
+
+
+def read(path):
+    resource = QtCore.QFile(path)
+    assert resource.open(QtCore.QIODevice.OpenModeFlag.ReadOnly)
+    try:
+        return bytes(resource.readAll())
+    finally:
+        resource.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "module, path, header",
+    [(graphic_resources_rc, GRAPHIC, 20), (top_bar_resources_rc, TOP_BAR, 24)],
+)
+def test_rcc_round_trip(qapp, tmp_path, module, path, header):
+    rcc = tmp_path / "bundle.rcc"
+    size = resource_loader.write_rcc(module, rcc)
+    image = rcc.read_bytes()
+    assert size == len(image) and image[:4] == resource_loader.RCC_MAGIC
+    (data_offset,) = struct.unpack_from(">I", image, 12)
+    assert data_offset == header
+
+    root = f"/rcc_test_{header}"
+    assert QtCore.QResource.registerResource(str(rcc), root)
+    try:
+        assert read(f":{root}{path}") == read(f":{path}")
+    finally:
+        QtCore.QResource.unregisterResource(str(rcc), root)
+
+
+@pytest.mark.unit
+def test_resource_mode_environment_wins(monkeypatch):
+    monkeypatch.setenv(resource_loader.MODE_ENV, "RCC")
+    assert resource_loader.resource_mode() == "rcc"
+    monkeypatch.setenv(resource_loader.MODE_ENV, "mmap")
+    assert resource_loader.resource_mode() == "python"
+    monkeypatch.delenv(resource_loader.MODE_ENV)
+    assert resource_loader.resource_mode() == "python"
+
+
+@pytest.mark.unit
+def test_load_resources_falls_back_to_modules(qapp, tmp_path):
+    package = "BlocksScreen.lib.ui.resources"
+
+    loaded = resource_loader.load_resources(
+        "rcc", ["graphic_resources"], tmp_path, package
+    )
+
+    assert loaded == {"graphic_resources": "python"}
+
+
+@pytest.mark.unit
+def test_stale_rcc_is_not_registered(qapp, tmp_path):
+    package = "BlocksScreen.lib.ui.resources"
+    rcc = resource_loader.rcc_path("graphic_resources", tmp_path)
+    resource_loader.write_rcc(graphic_resources_rc, rcc)
+    assert resource_loader.load_resources(
+        "rcc", ["graphic_resources"], tmp_path, package
+    ) == {"graphic_resources": "rcc"}
+
+    (tmp_path / "graphic_resources_rc.py").write_text("")
+    QtCore.QResource.unregisterResource(str(rcc))
+    older = rcc.stat().st_mtime_ns - 10**9
+    os.utime(rcc, ns=(older, older))
+    assert resource_loader.load_resources(
+        "rcc", ["graphic_resources"], tmp_path, package
+    ) == {"graphic_resources": "python"}
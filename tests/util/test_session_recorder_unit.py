@@ -0,0 +1,95 @@
+"""Unit tests for BlocksScreen.lib.session_recorder."""
+
+import gzip
+import json
+
+import pytest
+
+from BlocksScreen.lib.session_recorder import (
+    FRAME_IN,
+    FRAME_OUT,
+    SessionRecorder,
+    SessionReplayer,
+    read_session,
+)
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.received = []
+        self.requests = []
+
+    def on_message(self, frame):
+        self.received.append(frame)
+
+    def replay_request(self, frame):
+        self.requests.append(frame)
+
+
+def _write_session(path, frames):
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        file.write(json.dumps({"t": 0.0, "dir": "meta", "frame": {}}) + "\n")
+        for timestamp, direction, frame in frames:
+            file.write(
+                json.dumps({"t": timestamp, "dir": direction, "frame": frame}) + "\n"
+            )
+
+
+@pytest.mark.unit
+def test_record_and_read_roundtrip(tmp_path):
+    path = tmp_path / "logs" / "session.jsonl.gz"
+    recorder = SessionRecorder(path)
+    recorder.record(FRAME_OUT, '{"id": 1, "method": "server.info"}')
+    recorder.record(FRAME_IN, '{"id": 1, "result": {}}')
+    recorder.close()
+
+    frames = list(read_session(path))
+    assert [direction for _, direction, _ in frames] == [FRAME_OUT, FRAME_IN]
+    assert frames[1][2] == '{"id": 1, "result": {}}'
+    assert frames[0][0] <= frames[1][0]
+    assert recorder.frame_count == 2
+
+
+@pytest.mark.unit
+def test_read_skips_malformed_lines(tmp_path):
+    path = tmp_path / "session.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        file.write("not json\n\n")
+        file.write(json.dumps({"t": 1.0, "dir": FRAME_IN, "frame": "{}"}) + "\n")
+    assert list(read_session(path)) == [(1.0, FRAME_IN, "{}")]
+
+
+@pytest.mark.unit
+def test_replayer_routes_frames_by_direction(tmp_path):
+    path = tmp_path / "session.jsonl.gz"
+    _write_session(
+        path,
+        [
+            (0.1, FRAME_OUT, "request"),
+            (0.2, FRAME_IN, "response"),
+            (5.0, FRAME_IN, "notification"),
+        ],
+    )
+    ws = _FakeWebSocket()
+    finished = []
+    replayer = SessionReplayer(ws, path, speed=0, on_finished=finished.append)
+    replayer.start()
+    replayer.join(timeout=5)
+
+    assert ws.requests == ["request"]
+    assert ws.received == ["response", "notification"]
+    assert finished and finished[0]["frames"] == 3
+    assert finished[0]["recorded_duration"] == 5.0
+
+
+@pytest.mark.unit
+def test_replayer_stop(tmp_path):
+    path = tmp_path / "session.jsonl.gz"
+    _write_session(path, [(0.0, FRAME_IN, "first"), (60.0, FRAME_IN, "late")])
+    ws = _FakeWebSocket()
+    replayer = SessionReplayer(ws, path, speed=1.0)
+    replayer.start()
+    replayer.stop()
+    replayer.join(timeout=5)
+    assert not replayer.is_alive()
+    assert "late" not in ws.received
@@ -0,0 +1,66 @@
+"""Unit tests for BlocksScreen.lib.stall_watchdog."""
+
+import time
+
+import pytest
+
+from BlocksScreen.lib.stall_watchdog import BUCKETS, StallWatchdog, bucket_label
+
+
+@pytest.fixture
+def watchdog(qapp):
+    dog = StallWatchdog()
+    dog.interval = 0.02
+    dog.threshold = 0.2
+    yield dog
+    dog.stop()
+
+
+def blocking_handler():
+    time.sleep(0.5)
+
+
+@pytest.mark.unit
+def test_stalls_are_counted_by_duration():
+    dog = StallWatchdog()
+    for duration in (0.6, 1.5, 1.9, 45.0):
+        dog.record_stall(duration)
+
+    assert dog.stalls == [1, 2, 0, 0, 0, 1]
+    assert dog.summary() == "0-1s 1, 1-2s 2, >30s 1"
+    assert bucket_label(len(BUCKETS)) == ">30s"
+
+
+@pytest.mark.unit
+def test_blocked_loop_logs_the_gui_stack(qtbot, watchdog, caplog):
+    watchdog.start()
+    qtbot.wait(100)
+
+    blocking_handler()
+    qtbot.wait(100)
+
+    assert "blocking_handler" in watchdog.last_stack
+    assert sum(watchdog.stalls) == 1
+    assert "GUI thread stack" in caplog.text
+
+
+@pytest.mark.unit
+def test_lag_is_measured_between_beats(qtbot, watchdog):
+    watchdog.threshold = 10.0
+    watchdog.start()
+    qtbot.wait(60)
+    time.sleep(0.1)
+    qtbot.wait(60)
+
+    assert watchdog.take_max_lag() >= 0.05
+    assert watchdog.take_max_lag() < 0.05
+    assert watchdog.last_stack == "" and not any(watchdog.stalls)
+
+
+@pytest.mark.unit
+def test_disabled_watchdog_does_not_start(qapp):
+    dog = StallWatchdog()
+    dog.enabled = False
+    dog.start()
+
+    assert not dog.running
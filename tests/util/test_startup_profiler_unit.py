@@ -0,0 +1,114 @@
+"""Unit tests for BlocksScreen.lib.startup_profiler."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6 import QtCore, QtWidgets
+
+from BlocksScreen.lib.startup_profiler import ENV, StartupProfiler
+
+
+class Section:
+    def __init__(self, **options):
+        self.options = options
+
+    def get(self, option, parser=str, default=None):
+        return parser(self.options.get(option, default))
+
+    def getboolean(self, option, default=None):
+        return self.options.get(option, default)
+
+    def getfloat(self, option, default=None):
+        return float(self.options.get(option, default))
+
+
+class Config:
+    def __init__(self, **options):
+        self.section = Section(**options)
+
+    def get_section(self, name, fallback=None):
+        return self.section if name == "startup_profiler" else fallback
+
+
+class WebSocket(QtCore.QObject):
+    connected_signal = QtCore.pyqtSignal()
+    klippy_state_signal = QtCore.pyqtSignal(str)
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.delenv(ENV, raising=False)
+    return StartupProfiler()
+
+
+@pytest.mark.unit
+def test_trace_nests_phases_and_marks(profiler):
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            profiler.mark("main_window")
+    profiler.mark("main_window")
+
+    events = profiler.trace()["traceEvents"]
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    marks = [e for e in events if e["ph"] == "i"]
+
+    outer, inner = spans["outer"], spans["inner"]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert [m["name"] for m in marks] == ["profiler_import", "main_window"]
+    assert {e["tid"] for e in events if e["ph"] != "M"} == {0}
+    assert profiler.elapsed("main_window") == pytest.approx(marks[1]["ts"] / 1e3)
+    assert "main_window" in profiler.summary()
+
+
+@pytest.mark.unit
+def test_finish_writes_trace_only_when_enabled(profiler, tmp_path):
+    path = tmp_path / "logs" / "startup.json"
+    profiler.configure(Config(enabled=True, file=str(path)))
+    with profiler.phase("setup_ui"):
+        pass
+
+    profiler.finish()
+    profiler.mark("late")
+
+    trace = json.loads(path.read_text())
+    names = {e["name"] for e in trace["traceEvents"]}
+    assert "setup_ui" in names and "late" not in names
+
+    disabled = StartupProfiler()
+    disabled.configure(Config(enabled=False, file=str(tmp_path / "off.json")))
+    disabled.finish()
+    assert not (tmp_path / "off.json").exists()
+
+
+@pytest.mark.unit
+def test_environment_overrides_config(monkeypatch, tmp_path):
+    monkeypatch.setenv(ENV, str(tmp_path / "env.json"))
+    profiler = StartupProfiler()
+
+    profiler.configure(Config(enabled=False, file="ignored.json", timeout=5))
+
+    assert profiler.enabled
+    assert profiler.path == str(tmp_path / "env.json")
+    assert profiler.timeout == 5
+
+
+@pytest.mark.unit
+def test_watch_marks_paint_and_finishes_on_klippy_ready(qtbot, profiler):
+    profiler.finish = MagicMock(wraps=profiler.finish)
+    window = QtWidgets.QWidget()
+    qtbot.addWidget(window)
+    ws = WebSocket()
+    profiler.watch(window, ws)
+
+    window.show()
+    qtbot.waitUntil(lambda: profiler.elapsed("first_paint") is not None)
+    ws.connected_signal.emit()
+    ws.klippy_state_signal.emit("startup")
+    assert not profiler.finished
+    ws.klippy_state_signal.emit("ready")
+
+    assert profiler.finished
+    assert profiler.elapsed("websocket_connected") <= profiler.elapsed("klippy_ready")
+    profiler.finish.assert_called_once_with()
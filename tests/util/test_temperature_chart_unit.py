@@ -0,0 +1,111 @@
+"""Unit tests for BlocksScreen.lib.utils.temperature_chart."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PyQt6 import QtGui
+
+from BlocksScreen.lib.temperature_history import TemperatureHistory
+from BlocksScreen.lib.utils.temperature_chart import TemperatureChart, decimate
+
+_CLOCK = "BlocksScreen.lib.utils.temperature_chart.time.monotonic"
+
+
+@pytest.mark.unit
+def test_decimate_min_max_per_column():
+    times = np.array([0.1, 0.5, 1.2, 3.4, 3.9])
+    values = np.array([5.0, 1.0, 7.0, 2.0, 4.0], dtype=np.float32)
+    columns, mins, maxs = decimate(times, values, 1.0)
+    assert columns.tolist() == [0, 1, 3]
+    assert mins.tolist() == [1.0, 7.0, 2.0]
+    assert maxs.tolist() == [5.0, 7.0, 4.0]
+
+
+@pytest.fixture
+def history(qapp):
+    history = TemperatureHistory(capacity=8000)
+    names = ["extruder", "extruder1", "heater_bed"] + [
+        f"temperature_sensor s{index}" for index in range(3)
+    ]
+    times = np.arange(0.0, 1800.0, 0.25)
+    for offset, name in enumerate(names):
+        values = 20.0 + offset * 30.0 + 5.0 * np.sin(times / 60.0)
+        history.buffer(name).extend(times, values)
+    return history
+
+
+def _render(chart):
+    image = QtGui.QImage(chart.size(), QtGui.QImage.Format.Format_ARGB32)
+    image.fill(0)
+    chart.render(image)
+    return image
+
+
+@pytest.mark.unit
+class TestTemperatureChart:
+    def test_draws_every_temperature_channel(self, qtbot, history):
+        chart = TemperatureChart()
+        qtbot.addWidget(chart)
+        chart.resize(400, 200)
+        chart.set_history(history)
+        with patch(_CLOCK, return_value=1800.0):
+            _render(chart)
+        assert len(chart._series) == 6
+        assert all(series.path.elementCount() > 0 for series in chart._series)
+        assert chart._value_range()[0] <= 15.0
+
+    def test_path_is_extended_not_rebuilt(self, qtbot, history):
+        chart = TemperatureChart()
+        qtbot.addWidget(chart)
+        chart.resize(400, 200)
+        chart.set_series([("extruder", "temperature")])
+        chart.set_history(history)
+        with patch(_CLOCK, return_value=1700.0):
+            _render(chart)
+        series = chart._series[0]
+        path, count = series.path, series.path.elementCount()
+        with patch(_CLOCK, return_value=1800.0):
+            _render(chart)
+        assert series.path is path
+        assert series.path.elementCount() > count
+
+    def test_seed_rebuilds(self, qtbot, history):
+        chart = TemperatureChart()
+        qtbot.addWidget(chart)
+        chart.resize(400, 200)
+        chart.set_history(history)
+        with patch(_CLOCK, return_value=1800.0):
+            _render(chart)
+            path = chart._series[0].path
+            history.seed({"extruder": {"temperatures": [200.0] * 10}}, now=1800.0)
+            _render(chart)
+        assert chart._series[0].path is not path
+
+    def test_frame_timer_skips_unchanged_columns(self, qtbot, history):
+        chart = TemperatureChart()
+        qtbot.addWidget(chart)
+        chart.resize(400, 200)
+        chart.set_history(history)
+        chart.show()
+        with patch(_CLOCK, return_value=1800.0):
+            _render(chart)
+            with patch.object(chart, "update") as update:
+                chart._on_frame_timer()
+                update.assert_not_called()
+        with (
+            patch(_CLOCK, return_value=1900.0),
+            patch.object(chart, "update") as update,
+        ):
+            chart._on_frame_timer()
+            update.assert_called_once()
+
+    def test_six_series_frame_time(self, qtbot, history):
+        chart = TemperatureChart()
+        qtbot.addWidget(chart)
+        chart.resize(700, 250)
+        chart.set_history(history)
+        with patch(_CLOCK, return_value=1800.0):
+            _render(chart)  # Builds the paths
+            _render(chart)
+        assert chart.last_frame_time < 0.05
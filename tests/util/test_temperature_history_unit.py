@@ -0,0 +1,128 @@
+"""Unit tests for BlocksScreen.lib.temperature_history."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from BlocksScreen.lib.temperature_history import (
+    RingBuffer,
+    TemperatureHistory,
+    is_tracked,
+)
+
+
+@pytest.mark.unit
+class TestRingBuffer:
+    def test_view_before_wrap(self):
+        buffer = RingBuffer(4)
+        for index in range(3):
+            buffer.append(float(index), index * 10.0)
+        times, values = buffer.view()
+        assert times.tolist() == [0.0, 1.0, 2.0]
+        assert values.tolist() == [0.0, 10.0, 20.0]
+
+    def test_view_after_wrap_is_chronological(self):
+        buffer = RingBuffer(4)
+        for index in range(6):
+            buffer.append(float(index), float(index))
+        assert len(buffer) == 4
+        assert buffer.view()[0].tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert buffer.last() == (5.0, 5.0)
+
+    def test_extend_keeps_most_recent(self):
+        buffer = RingBuffer(3)
+        buffer.append(0.0, 0.0)
+        buffer.extend(np.arange(1.0, 6.0), np.arange(1.0, 6.0))
+        assert buffer.view()[1].tolist() == [3.0, 4.0, 5.0]
+
+    def test_window(self):
+        buffer = RingBuffer(10)
+        buffer.extend(np.arange(10.0), np.arange(10.0))
+        assert buffer.window(7.0)[0].tolist() == [7.0, 8.0, 9.0]
+
+
+@pytest.mark.unit
+def test_is_tracked():
+    assert is_tracked("extruder1")
+    assert is_tracked("temperature_sensor chamber")
+    assert is_tracked("heater_bed")
+    assert not is_tracked("toolhead")
+    assert not is_tracked("gcode_macro PRINT_START")
+
+
+@pytest.fixture
+def history(qapp):
+    return TemperatureHistory(capacity=100)
+
+
+@pytest.mark.unit
+class TestTemperatureHistory:
+    def test_status_report_appends_tracked_fields(self, history):
+        history.on_object_report(
+            [
+                {
+                    "extruder": {"temperature": 200.5, "target": 210.0},
+                    "fan": {"speed": 0.5},
+                    "toolhead": {"position": [0, 0, 0, 0]},
+                },
+                123.0,
+            ]
+        )
+        assert set(history.channels()) == {
+            ("extruder", "temperature"),
+            ("extruder", "target"),
+            ("fan", "speed"),
+        }
+        assert history.buffer("extruder").last()[1] == pytest.approx(200.5)
+
+    def test_seed_from_temperature_store(self, history):
+        store = {
+            "heater_bed": {
+                "temperatures": [20.0, 21.0, 22.0],
+                "targets": [0.0, 60.0, 60.0],
+                "powers": [0.0, 1.0, 1.0],
+            },
+            "temperature_sensor mcu": {"temperatures": [40.0] * 150},
+        }
+        history.seed(store, now=1000.0)
+        times, values = history.buffer("heater_bed").view()
+        assert times.tolist() == [998.0, 999.0, 1000.0]
+        assert values.tolist() == [20.0, 21.0, 22.0]
+        assert len(history.buffer("temperature_sensor mcu")) == 100
+
+    def test_stats_window(self, history):
+        with patch("BlocksScreen.lib.temperature_history.time.monotonic") as clock:
+            for second, value in enumerate([10.0, 20.0, 30.0, 40.0]):
+                history.append("extruder", "temperature", value, float(second))
+            clock.return_value = 3.0
+            assert history.stats("extruder", seconds=1.5) == (30.0, 40.0, 35.0)
+            assert history.stats("heater_bed") is None
+
+    def test_downsample_min_max_per_bucket(self, history):
+        history.buffer("extruder").extend(
+            np.arange(10.0), np.array([1, 5, 2, 8, 3, 9, 4, 7, 6, 0], dtype=float)
+        )
+        starts, minimums, maximums = history.downsample(
+            "extruder", buckets=5, seconds=10.0, now=10.0
+        )
+        assert starts.tolist() == [0.0, 2.0, 4.0, 6.0, 8.0]
+        assert minimums.tolist() == [1.0, 2.0, 3.0, 4.0, 0.0]
+        assert maximums.tolist() == [5.0, 8.0, 9.0, 7.0, 6.0]
+
+    def test_downsample_skips_empty_buckets(self, history):
+        history.append("extruder", "temperature", 1.0, 0.5)
+        history.append("extruder", "temperature", 2.0, 9.5)
+        starts, minimums, _ = history.downsample(
+            "extruder", buckets=10, seconds=10.0, now=10.0
+        )
+        assert starts.tolist() == [0.0, 9.0]
+        assert minimums.tolist() == [1.0, 2.0]
+
+    def test_klippy_ready_requests_store(self, qapp):
+        ws = MagicMock()
+        history = TemperatureHistory(ws=ws)
+        history.on_klippy_state("startup")
+        ws.api.request_temperature_cached_data.assert_not_called()
+        history.on_klippy_state("ready")
+        ws.api.request_temperature_cached_data.assert_called_once()
@@ -0,0 +1,83 @@
+"""Unit tests for BlocksScreen.lib.ws_metrics."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from BlocksScreen.lib.ws_metrics import LatencyHistogram, WebSocketMetrics
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(0.95) == 0.0
+        assert histogram.to_dict()["count"] == 0
+
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram()
+        for value in [0.5] * 90 + [150.0] * 9 + [20000.0]:
+            histogram.add(value)
+        summary = histogram.to_dict()
+        assert summary["buckets"]["le_1"] == 90
+        assert summary["buckets"]["le_200"] == 9
+        assert summary["buckets"]["inf"] == 1
+        assert summary["p50_ms"] == 1.0
+        assert summary["p95_ms"] == 200.0
+        assert summary["p99_ms"] == 200.0
+        assert histogram.percentile(1.0) == 20000.0
+
+
+@pytest.mark.unit
+class TestWebSocketMetrics:
+    def test_round_trip_latency_per_method(self):
+        metrics = WebSocketMetrics()
+        with patch("BlocksScreen.lib.ws_metrics.time.perf_counter") as clock:
+            clock.return_value = 10.0
+            metrics.request_sent(1, "server.info", 60)
+            clock.return_value = 10.015
+            assert metrics.response_received(1) == pytest.approx(15.0)
+        latency = metrics.snapshot()["latency"]["server.info"]
+        assert latency["count"] == 1
+        assert latency["buckets"]["le_20"] == 1
+
+    def test_unknown_response_is_ignored(self):
+        metrics = WebSocketMetrics()
+        assert metrics.response_received(99) is None
+        assert metrics.snapshot()["latency"] == {}
+
+    def test_traffic_counters(self):
+        metrics = WebSocketMetrics()
+        metrics.message_received("notify_status_update", 100, 0.0001)
+        metrics.message_received("notify_status_update", 50, 0.0002)
+        metrics.message_received("response", 10, 0.0)
+        metrics.request_sent(1, "printer.info", 40)
+        snapshot = metrics.snapshot()
+        assert snapshot["incoming"]["notify_status_update"] == {
+            "count": 2,
+            "bytes": 150,
+        }
+        assert snapshot["outgoing"]["printer.info"] == {"count": 1, "bytes": 40}
+        assert snapshot["decode"]["count"] == 3
+        assert snapshot["in_flight"] == 1
+
+    def test_connection_lost_counts_unanswered(self):
+        metrics = WebSocketMetrics()
+        metrics.request_sent(1, "printer.info", 40)
+        metrics.connection_lost()
+        snapshot = metrics.snapshot()
+        assert snapshot["in_flight"] == 0
+        assert snapshot["unanswered"] == 1
+
+    def test_dump_appends_json_lines(self, tmp_path):
+        metrics = WebSocketMetrics()
+        metrics.request_sent(1, "server.info", 10)
+        metrics.response_received(1)
+        path = tmp_path / "logs" / "metrics.jsonl"
+        metrics.dump(path)
+        metrics.dump(path)
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["latency"]["server.info"]["count"] == 1
+        assert "server.info n=1" in metrics.summary()
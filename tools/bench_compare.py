@@ -0,0 +1,89 @@
+"""Compare two rendering benchmark results files.
+
+The files are written by the benchmark suite in ``tests/benchmarks``.
+Every timing of the results that is slower than the baseline by more
+than ``--threshold`` (relative) and ``--min-delta`` milliseconds is
+reported as a regression and the exit status is 1, so CI can fail on it.
+
+Usage::
+
+    pytest -m benchmark tests/benchmarks
+    python tools/bench_compare.py baseline.json benchmark-results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import typing
+
+METRICS = ("construct_ms", "first_paint_ms", "repaint_ms")
+
+
+def _load(path: pathlib.Path) -> dict[str, dict[str, typing.Any]]:
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def compare(
+    baseline: dict[str, dict[str, typing.Any]],
+    results: dict[str, dict[str, typing.Any]],
+    threshold: float,
+    min_delta: float,
+) -> tuple[list[str], list[str]]:
+    """Report lines of every timing and of the regressions alone"""
+    lines, regressions = [], []
+    for name in sorted(baseline.keys() | results.keys()):
+        if name not in results:
+            lines.append(f"  {name:<28} missing from the results")
+            continue
+        if name not in baseline:
+            lines.append(f"  {name:<28} new, no baseline")
+            continue
+        for metric in METRICS:
+            old, new = baseline[name].get(metric), results[name].get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            line = (
+                f"  {name:<28} {metric:<15} {old:9.2f} -> {new:9.2f} ms  {change:+7.1%}"
+            )
+            if new - old > min_delta and change > threshold:
+                line += "  REGRESSION"
+                regressions.append(line)
+            lines.append(line)
+    return lines, regressions
+
+
+def main(argv: typing.Optional[list[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=pathlib.Path)
+    parser.add_argument("results", type=pathlib.Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative slowdown reported as a regression (default 0.25)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=1.0,
+        help="Slowdown in ms below which timings are noise (default 1.0)",
+    )
+    args = parser.parse_args(argv)
+    lines, regressions = compare(
+        _load(args.baseline), _load(args.results), args.threshold, args.min_delta
+    )
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        print("\n".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
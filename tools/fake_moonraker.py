@@ -0,0 +1,805 @@
+"""Standalone asyncio stand-in for Moonraker, for load testing BlocksScreen.
+
+Speaks the parts of the Moonraker API that ``MoonRest`` and
+``MoonWebSocket`` use: ``GET /access/oneshot_token``, ``GET /server/info``
+and the JSON-RPC 2.0 websocket at ``/websocket``.  The simulated printer
+is configurable (number of extruders, temperature sensors, fans,
+``gcode_macro`` sections), so are the status update rate and the size of
+the gcode file tree.  Only the standard library is used, the websocket
+framing (RFC 6455) is implemented here.
+
+Usage::
+
+    python tools/fake_moonraker.py --port 7125 --extruders 2 --sensors 8 \\
+        --macros 400 --rate 200 --files 10000
+
+Point ``[server] host/port`` in ``BlocksScreen.cfg`` at it.  The server
+prints a traffic summary on exit (Ctrl+C).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+import math
+import random
+import secrets
+import struct
+import time
+import typing
+
+logger = logging.getLogger("fake_moonraker")
+
+_WS_MAGIC = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OP_CONTINUATION = 0x0
+_OP_TEXT = 0x1
+_OP_BINARY = 0x2
+_OP_CLOSE = 0x8
+_OP_PING = 0x9
+_OP_PONG = 0xA
+
+
+@dataclasses.dataclass
+class FakePrinterConfig:
+    """Shape of the simulated printer and of the generated traffic"""
+
+    extruders: int = 1
+    temperature_sensors: int = 2
+    fans: int = 2
+    macros: int = 20
+    update_rate: float = 4.0  # notify_status_update messages per second
+    file_count: int = 100
+    files_per_dir: int = 500  # 0 puts every file in the root directory
+    file_size: int = 2_000_000
+    klippy_state: str = "ready"
+
+
+class FakePrinter:
+    """Printer object model, file tree and JSON-RPC method handlers"""
+
+    def __init__(self, config: FakePrinterConfig, seed: int = 0) -> None:
+        self.config = config
+        self._random = random.Random(seed)
+        self.extruder_names = ["extruder"] + [
+            f"extruder{index}" for index in range(1, config.extruders)
+        ]
+        self.sensor_names = [
+            f"temperature_sensor sensor_{index}"
+            for index in range(config.temperature_sensors)
+        ]
+        self.fan_names = ["fan"] + [
+            f"fan_generic fan_{index}" for index in range(1, config.fans)
+        ]
+        self.macro_names = [
+            f"gcode_macro MACRO_{index}" for index in range(config.macros)
+        ]
+        self.objects: dict[str, dict] = self._build_objects()
+        self.files: dict[str, dict] = self._build_files()
+        self.print_started: float = 0.0
+
+    def _build_objects(self) -> dict[str, dict]:
+        objects: dict[str, dict] = {
+            "webhooks": {"state": self.config.klippy_state, "state_message": "Ready"},
+            "idle_timeout": {"state": "Idle", "printing_time": 0.0},
+            "print_stats": {
+                "filename": "",
+                "total_duration": 0.0,
+                "print_duration": 0.0,
+                "filament_used": 0.0,
+                "state": "standby",
+                "message": "",
+                "info": {"total_layer": None, "current_layer": None},
+            },
+            "virtual_sdcard": {
+                "progress": 0.0,
+                "is_active": False,
+                "file_position": 0,
+                "file_size": 0,
+            },
+            "display_status": {"message": None, "progress": 0.0},
+            "toolhead": {
+                "homed_axes": "xyz",
+                "print_time": 0.0,
+                "estimated_print_time": 0.0,
+                "extruder": "extruder",
+                "position": [0.0, 0.0, 0.0, 0.0],
+                "max_velocity": 300.0,
+                "max_accel": 3000.0,
+                "max_accel_to_decel": 1500.0,
+                "square_corner_velocity": 5.0,
+            },
+            "gcode_move": {
+                "speed_factor": 1.0,
+                "speed": 1500.0,
+                "extrude_factor": 1.0,
+                "absolute_coordinates": True,
+                "absolute_extrude": True,
+                "homing_origin": [0.0, 0.0, 0.0, 0.0],
+                "position": [0.0, 0.0, 0.0, 0.0],
+                "gcode_position": [0.0, 0.0, 0.0, 0.0],
+            },
+            "heater_bed": {"temperature": 22.0, "target": 0.0, "power": 0.0},
+        }
+        for name in self.extruder_names:
+            objects[name] = {
+                "temperature": 22.0,
+                "target": 0.0,
+                "power": 0.0,
+                "can_extrude": False,
+                "pressure_advance": 0.04,
+                "smooth_time": 0.04,
+            }
+        for name in self.sensor_names:
+            objects[name] = {
+                "temperature": 30.0,
+                "measured_min_temp": 20.0,
+                "measured_max_temp": 40.0,
+            }
+        for name in self.fan_names:
+            objects[name] = {"speed": 0.0, "rpm": None}
+        for name in self.macro_names:
+            objects[name] = {}
+        config_sections: dict[str, dict] = {
+            "printer": {"kinematics": "corexy", "max_velocity": "300"},
+            "heater_bed": {
+                "heater_pin": "PA1",
+                "sensor_type": "EPCOS 100K B57560G104F",
+            },
+            "virtual_sdcard": {"path": "~/printer_data/gcodes"},
+        }
+        for name in self.extruder_names:
+            config_sections[name] = {"nozzle_diameter": "0.400", "max_temp": "300"}
+        for name in self.sensor_names + self.fan_names:
+            config_sections[name] = {"sensor_type": "temperature_host"}
+        for name in self.macro_names:
+            config_sections[name] = {"gcode": "\nM117 macro"}
+        objects["configfile"] = {
+            "config": config_sections,
+            "settings": {
+                name.lower(): dict(section) for name, section in config_sections.items()
+            },
+            "save_config_pending": False,
+            "save_config_pending_items": {},
+            "warnings": [],
+        }
+        return objects
+
+    def _build_files(self) -> dict[str, dict]:
+        files: dict[str, dict] = {}
+        now = time.time()
+        per_dir = self.config.files_per_dir
+        for index in range(self.config.file_count):
+            name = f"part_{index:05d}.gcode"
+            if per_dir > 0 and index >= per_dir:
+                name = f"batch_{index // per_dir:03d}/{name}"
+            files[name] = {
+                "path": name,
+                "modified": now - index * 60,
+                "size": self.config.file_size,
+                "permissions": "rw",
+            }
+        return files
+
+    def object_names(self) -> list[str]:
+        """Names reported by ``printer.objects.list``"""
+        return list(self.objects)
+
+    def query(self, requested: dict) -> dict:
+        """Build a status dict for a query or subscription request"""
+        status = {}
+        for name, fields in (requested or {}).items():
+            if name not in self.objects:
+                continue
+            values = self.objects[name]
+            status[name] = (
+                dict(values) if not fields else {f: values.get(f) for f in fields}
+            )
+        return status
+
+    def tick(self, eventtime: float) -> dict:
+        """Advance the simulation and return the changed fields"""
+        delta: dict[str, dict] = {}
+        for name in self.extruder_names + ["heater_bed"] + self.sensor_names:
+            values = self.objects[name]
+            target = values.get("target", 0.0) or 30.0
+            temperature = values["temperature"]
+            temperature += (target - temperature) * 0.05 + self._random.uniform(
+                -0.2, 0.2
+            )
+            values["temperature"] = round(temperature, 2)
+            delta[name] = {"temperature": values["temperature"]}
+        toolhead = self.objects["toolhead"]
+        angle = eventtime % (2 * math.pi)
+        toolhead["position"] = [
+            round(150 + 100 * math.cos(angle), 3),
+            round(150 + 100 * math.sin(angle), 3),
+            toolhead["position"][2],
+            toolhead["position"][3],
+        ]
+        toolhead["print_time"] = eventtime
+        delta["toolhead"] = {
+            "position": toolhead["position"],
+            "print_time": eventtime,
+        }
+        if self.objects["print_stats"]["state"] == "printing":
+            delta.update(self._advance_print(eventtime))
+        return delta
+
+    def _advance_print(self, eventtime: float) -> dict:
+        sdcard = self.objects["virtual_sdcard"]
+        stats = self.objects["print_stats"]
+        elapsed = eventtime - self.print_started
+        size = sdcard["file_size"] or 1
+        position = min(size, sdcard["file_position"] + size // 3600 + 1)
+        sdcard["file_position"] = position
+        sdcard["progress"] = round(position / size, 4)
+        stats["print_duration"] = elapsed
+        stats["total_duration"] = elapsed
+        stats["filament_used"] = round(elapsed * 2.5, 2)
+        gcode_move = self.objects["gcode_move"]
+        z = round(0.2 + int(sdcard["progress"] * 250) * 0.2, 2)
+        gcode_move["gcode_position"] = [0.0, 0.0, z, 0.0]
+        changed = {
+            "virtual_sdcard": {
+                "file_position": position,
+                "progress": sdcard["progress"],
+            },
+            "print_stats": {
+                "print_duration": elapsed,
+                "total_duration": elapsed,
+                "filament_used": stats["filament_used"],
+            },
+            "gcode_move": {"gcode_position": gcode_move["gcode_position"]},
+        }
+        if position >= size:
+            stats["state"] = "complete"
+            sdcard["is_active"] = False
+            changed["print_stats"]["state"] = "complete"
+            changed["virtual_sdcard"]["is_active"] = False
+        return changed
+
+    def list_directory(self, path: str, extended: bool = False) -> dict:
+        """Build a ``server.files.get_directory`` result"""
+        path = path.removeprefix("gcodes").strip("/")
+        prefix = f"{path}/" if path else ""
+        dirs: dict[str, dict] = {}
+        files = []
+        for name, item in self.files.items():
+            if not name.startswith(prefix):
+                continue
+            rest = name[len(prefix) :]
+            if "/" in rest:
+                dirname = rest.split("/", 1)[0]
+                dirs.setdefault(
+                    dirname,
+                    {"dirname": dirname, "modified": item["modified"], "size": 4096},
+                )
+                continue
+            entry = {
+                "filename": rest,
+                "modified": item["modified"],
+                "size": item["size"],
+                "permissions": "rw",
+            }
+            if extended:
+                entry.update(self.metadata(name))
+            files.append(entry)
+        return {
+            "dirs": list(dirs.values()),
+            "files": files,
+            "disk_usage": {"total": 2**35, "used": 2**33, "free": 2**34},
+            "root_info": {"name": "gcodes", "permissions": "rw"},
+        }
+
+    def metadata(self, filename: str) -> dict:
+        """Build a ``server.files.metadata`` result"""
+        item = self.files[filename]
+        return {
+            "filename": filename,
+            "size": item["size"],
+            "modified": item["modified"],
+            "slicer": "OrcaSlicer",
+            "slicer_version": "2.1.1",
+            "layer_height": 0.2,
+            "first_layer_height": 0.2,
+            "object_height": 50.0,
+            "filament_total": 5230.4,
+            "filament_type": "PLA",
+            "filament_name": "Generic PLA",
+            "filament_weight_total": 15.6,
+            "estimated_time": 3600,
+            "first_layer_extruder_temp": 215.0,
+            "first_layer_bed_temp": 60.0,
+            "nozzle_diameter": 0.4,
+            "gcode_start_byte": 4096,
+            "gcode_end_byte": item["size"] - 4096,
+            "thumbnails": [],
+        }
+
+    def start_print(self, filename: str, eventtime: float) -> dict:
+        """Move the printer into the printing state"""
+        stats = self.objects["print_stats"]
+        sdcard = self.objects["virtual_sdcard"]
+        stats.update({"filename": filename, "state": "printing"})
+        size = self.files.get(filename, {}).get("size", self.config.file_size)
+        sdcard.update({"is_active": True, "file_position": 0, "file_size": size})
+        self.print_started = eventtime
+        return {
+            "print_stats": {"filename": filename, "state": "printing"},
+            "virtual_sdcard": {"is_active": True, "file_position": 0},
+        }
+
+    def set_print_state(self, state: str) -> dict:
+        """Change the print state (pause, resume, cancel)"""
+        self.objects["print_stats"]["state"] = state
+        return {"print_stats": {"state": state}}
+
+
+class _WebSocketConnection:
+    """Server side of a single websocket connection"""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.subscription: dict = {}
+        self.closed = False
+
+    async def receive(self) -> typing.Optional[str]:
+        """Read the next text message, ``None`` once the connection closes"""
+        fragments: list[bytes] = []
+        while True:
+            header = await self.reader.readexactly(2)
+            opcode = header[0] & 0x0F
+            final = bool(header[0] & 0x80)
+            masked = bool(header[1] & 0x80)
+            length = header[1] & 0x7F
+            if length == 126:
+                (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+            elif length == 127:
+                (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+            mask = await self.reader.readexactly(4) if masked else b""
+            payload = await self.reader.readexactly(length)
+            if masked:
+                payload = bytes(
+                    byte ^ mask[index % 4] for index, byte in enumerate(payload)
+                )
+            if opcode == _OP_CLOSE:
+                await self.send_frame(_OP_CLOSE, payload[:2])
+                return None
+            if opcode == _OP_PING:
+                await self.send_frame(_OP_PONG, payload)
+                continue
+            if opcode == _OP_PONG:
+                continue
+            if opcode in (_OP_TEXT, _OP_BINARY, _OP_CONTINUATION):
+                fragments.append(payload)
+                if final:
+                    return b"".join(fragments).decode("utf-8")
+
+    async def send_frame(self, opcode: int, payload: bytes) -> int:
+        """Write a single unmasked frame, returns the bytes written"""
+        if self.closed:
+            return 0
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 2**16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        try:
+            self.writer.write(header + payload)
+            await self.writer.drain()
+        except (ConnectionError, RuntimeError):
+            self.closed = True
+            return 0
+        return len(header) + length
+
+    async def send_json(self, message: dict) -> int:
+        """Send *message* as a text frame"""
+        return await self.send_frame(_OP_TEXT, json.dumps(message).encode("utf-8"))
+
+
+class FakeMoonraker:
+    """The fake server, owns the printer model and every client connection"""
+
+    def __init__(
+        self,
+        config: typing.Optional[FakePrinterConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 7125,
+    ) -> None:
+        self.config = config or FakePrinterConfig()
+        self.host = host
+        self.port = port
+        self.printer = FakePrinter(self.config)
+        self.connections: set[_WebSocketConnection] = set()
+        self.stats = {
+            "requests": 0,
+            "notifications": 0,
+            "bytes_sent": 0,
+            "http_requests": 0,
+            "connections": 0,
+        }
+        self._server: typing.Optional[asyncio.base_events.Server] = None
+        self._update_task: typing.Optional[asyncio.Task] = None
+        self._started = time.monotonic()
+
+    @property
+    def eventtime(self) -> float:
+        """Seconds since the server started, like Klipper's eventtime"""
+        return time.monotonic() - self._started
+
+    async def start(self) -> None:
+        """Start listening and publishing status updates"""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+        self._update_task = asyncio.create_task(self._publish_updates())
+        logger.info("Fake Moonraker listening on %s:%d", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop the server and close every connection"""
+        if self._update_task is not None:
+            self._update_task.cancel()
+        for connection in list(self.connections):
+            connection.closed = True
+            connection.writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def serve_forever(self) -> None:
+        """Start and run until cancelled"""
+        await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request_line = (await reader.readline()).decode("latin-1").strip()
+            headers: dict[str, str] = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            parts = request_line.split(" ")
+            if len(parts) < 2:
+                writer.close()
+                return
+            path = parts[1].split("?", 1)[0]
+            if (
+                path == "/websocket"
+                and headers.get("upgrade", "").lower() == "websocket"
+            ):
+                await self._handle_websocket(reader, writer, headers)
+            else:
+                await self._handle_http(writer, parts[0], path)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_http(
+        self, writer: asyncio.StreamWriter, verb: str, path: str
+    ) -> None:
+        self.stats["http_requests"] += 1
+        routes = {
+            "/access/oneshot_token": lambda: secrets.token_urlsafe(24),
+            "/server/info": self._server_info,
+            "/printer/info": self._printer_info,
+            "/printer/firmware_restart": lambda: "ok",
+        }
+        handler = routes.get(path)
+        if handler is None:
+            status, body = (
+                "404 Not Found",
+                {"error": {"code": 404, "message": "Not Found"}},
+            )
+        else:
+            status, body = "200 OK", {"result": handler()}
+        payload = json.dumps(body).encode("utf-8")
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            + payload
+        )
+        await writer.drain()
+
+    async def _handle_websocket(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        headers: dict[str, str],
+    ) -> None:
+        key = headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(
+            hashlib.sha1((key + _WS_MAGIC).encode()).digest()
+        ).decode()
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode("latin-1")
+        )
+        await writer.drain()
+        connection = _WebSocketConnection(reader, writer)
+        self.connections.add(connection)
+        self.stats["connections"] += 1
+        try:
+            while True:
+                message = await connection.receive()
+                if message is None:
+                    break
+                await self._handle_rpc(connection, message)
+        finally:
+            connection.closed = True
+            self.connections.discard(connection)
+
+    async def _handle_rpc(self, connection: _WebSocketConnection, message: str) -> None:
+        self.stats["requests"] += 1
+        try:
+            request = json.loads(message)
+        except json.JSONDecodeError:
+            return
+        method = request.get("method", "")
+        params = request.get("params") or {}
+        handler = getattr(self, "_rpc_" + method.replace(".", "_"), None)
+        if handler is None:
+            response = {
+                "error": {"code": -32601, "message": f"Method not found: {method}"}
+            }
+        else:
+            try:
+                result = handler(connection, params)
+                response = {"result": result}
+            except KeyError as e:
+                response = {
+                    "error": {"code": 404, "message": f"Not found: <{e.args[0]}>"}
+                }
+        if "id" in request:
+            response.update({"jsonrpc": "2.0", "id": request["id"]})
+            self.stats["bytes_sent"] += await connection.send_json(response)
+
+    async def _notify(self, method: str, params: list) -> None:
+        message = {"jsonrpc": "2.0", "method": method, "params": params}
+        payload = json.dumps(message).encode("utf-8")
+        for connection in list(self.connections):
+            self.stats["bytes_sent"] += await connection.send_frame(_OP_TEXT, payload)
+            self.stats["notifications"] += 1
+
+    async def _publish_updates(self) -> None:
+        interval = 1.0 / self.config.update_rate if self.config.update_rate > 0 else 1.0
+        next_tick = time.monotonic()
+        while True:
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+            if self.config.update_rate <= 0 or not self.connections:
+                continue
+            eventtime = self.eventtime
+            delta = self.printer.tick(eventtime)
+            for connection in list(self.connections):
+                status = {
+                    name: values
+                    for name, values in delta.items()
+                    if name in connection.subscription
+                }
+                if not status:
+                    continue
+                message = {
+                    "jsonrpc": "2.0",
+                    "method": "notify_status_update",
+                    "params": [status, eventtime],
+                }
+                self.stats["bytes_sent"] += await connection.send_json(message)
+                self.stats["notifications"] += 1
+
+    def _server_info(self) -> dict:
+        return {
+            "klippy_connected": True,
+            "klippy_state": self.config.klippy_state,
+            "components": ["file_manager", "update_manager", "history"],
+            "failed_components": [],
+            "registered_directories": ["config", "gcodes", "logs"],
+            "warnings": [],
+            "websocket_count": len(self.connections),
+            "moonraker_version": "v0.9.3-fake",
+            "api_version": [1, 5, 0],
+            "api_version_string": "1.5.0",
+        }
+
+    def _printer_info(self) -> dict:
+        return {
+            "state": self.config.klippy_state,
+            "state_message": "Printer is ready",
+            "hostname": "fake-moonraker",
+            "software_version": "v0.12.0-fake",
+            "cpu_info": "fake",
+            "klipper_path": "/home/pi/klipper",
+            "python_path": "/home/pi/klippy-env/bin/python",
+            "log_file": "/tmp/klippy.log",
+            "config_file": "/home/pi/printer_data/config/printer.cfg",
+        }
+
+    # JSON-RPC handlers, named after the method with dots replaced by "_"
+    def _rpc_server_info(self, _connection, _params) -> dict:
+        return self._server_info()
+
+    def _rpc_server_connection_identify(self, _connection, _params) -> dict:
+        return {"connection_id": id(_connection)}
+
+    def _rpc_printer_info(self, _connection, _params) -> dict:
+        return self._printer_info()
+
+    def _rpc_printer_objects_list(self, _connection, _params) -> dict:
+        return {"objects": self.printer.object_names()}
+
+    def _rpc_printer_objects_query(self, _connection, params) -> dict:
+        return {
+            "eventtime": self.eventtime,
+            "status": self.printer.query(params.get("objects", {})),
+        }
+
+    def _rpc_printer_objects_subscribe(self, connection, params) -> dict:
+        requested = params.get("objects", {})
+        connection.subscription = dict(requested)
+        return {"eventtime": self.eventtime, "status": self.printer.query(requested)}
+
+    def _rpc_printer_gcode_script(self, _connection, _params) -> str:
+        return "ok"
+
+    def _rpc_printer_gcode_help(self, _connection, _params) -> dict:
+        return {
+            name.split(" ", 1)[1]: "fake macro" for name in self.printer.macro_names
+        }
+
+    def _rpc_printer_print_start(self, _connection, params) -> str:
+        delta = self.printer.start_print(params.get("filename", ""), self.eventtime)
+        asyncio.ensure_future(
+            self._notify("notify_status_update", [delta, self.eventtime])
+        )
+        return "ok"
+
+    def _rpc_printer_print_pause(self, _connection, _params) -> str:
+        delta = self.printer.set_print_state("paused")
+        asyncio.ensure_future(
+            self._notify("notify_status_update", [delta, self.eventtime])
+        )
+        return "ok"
+
+    def _rpc_printer_print_resume(self, _connection, _params) -> str:
+        delta = self.printer.set_print_state("printing")
+        asyncio.ensure_future(
+            self._notify("notify_status_update", [delta, self.eventtime])
+        )
+        return "ok"
+
+    def _rpc_printer_print_cancel(self, _connection, _params) -> str:
+        delta = self.printer.set_print_state("cancelled")
+        asyncio.ensure_future(
+            self._notify("notify_status_update", [delta, self.eventtime])
+        )
+        return "ok"
+
+    def _rpc_printer_firmware_restart(self, _connection, _params) -> str:
+        return "ok"
+
+    def _rpc_server_files_roots(self, _connection, _params) -> list:
+        return [
+            {
+                "name": "gcodes",
+                "path": "/home/pi/printer_data/gcodes",
+                "permissions": "rw",
+            }
+        ]
+
+    def _rpc_server_files_list(self, _connection, _params) -> list:
+        return list(self.printer.files.values())
+
+    def _rpc_server_files_get_directory(self, _connection, params) -> dict:
+        return self.printer.list_directory(
+            params.get("path", "gcodes"), bool(params.get("extended", False))
+        )
+
+    def _rpc_server_files_metadata(self, _connection, params) -> dict:
+        return self.printer.metadata(params.get("filename", ""))
+
+    def _rpc_server_files_metascan(self, _connection, params) -> dict:
+        return self.printer.metadata(params.get("filename", ""))
+
+    def _rpc_server_files_thumbnails(self, _connection, _params) -> list:
+        return []
+
+    def _rpc_server_temperature_store(self, _connection, _params) -> dict:
+        store = {}
+        for name in (
+            self.printer.extruder_names + ["heater_bed"] + self.printer.sensor_names
+        ):
+            temperature = self.printer.objects[name]["temperature"]
+            entry = {"temperatures": [temperature] * 1200}
+            if "target" in self.printer.objects[name]:
+                entry["targets"] = [self.printer.objects[name]["target"]] * 1200
+                entry["powers"] = [0.0] * 1200
+            store[name] = entry
+        return store
+
+    def _rpc_machine_update_status(self, _connection, _params) -> dict:
+        return {"busy": False, "github_rate_limit": 60, "version_info": {}}
+
+
+def _parse_args(argv: typing.Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7125)
+    parser.add_argument("--extruders", type=int, default=1)
+    parser.add_argument("--sensors", type=int, default=2, help="temperature sensors")
+    parser.add_argument("--fans", type=int, default=2)
+    parser.add_argument("--macros", type=int, default=20, help="gcode_macro sections")
+    parser.add_argument(
+        "--rate", type=float, default=4.0, help="status updates per second"
+    )
+    parser.add_argument("--files", type=int, default=100, help="gcode files")
+    parser.add_argument(
+        "--files-per-dir",
+        type=int,
+        default=500,
+        help="files per directory, 0 keeps every file in the root",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: typing.Optional[list[str]] = None) -> None:
+    """Command line entry point"""
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    server = FakeMoonraker(
+        FakePrinterConfig(
+            extruders=args.extruders,
+            temperature_sensors=args.sensors,
+            fans=args.fans,
+            macros=args.macros,
+            update_rate=args.rate,
+            file_count=args.files,
+            files_per_dir=args.files_per_dir,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        elapsed = max(server.eventtime, 1e-9)
+        logger.info(
+            "Served %d requests, %d notifications (%.1f/s), %.1f KiB in %.0f s",
+            server.stats["requests"],
+            server.stats["notifications"],
+            server.stats["notifications"] / elapsed,
+            server.stats["bytes_sent"] / 1024,
+            elapsed,
+        )
+
+
+if __name__ == "__main__":
+    main()
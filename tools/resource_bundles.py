@@ -0,0 +1,107 @@
+"""Build and benchmark the binary ``.rcc`` resource bundles.
+
+``build`` writes one ``.rcc`` file per generated ``*_rc.py`` module next
+to it, from the module's own data, so both resource modes carry the same
+resources.  ``bench`` starts a fresh interpreter per run and mode,
+registers every bundle with ``lib.resource_loader.load_resources`` and
+reports the median wall time and the resident memory afterwards.
+
+Usage::
+
+    python tools/resource_bundles.py build
+    python tools/resource_bundles.py bench --runs 5
+
+Select the mode at runtime with ``[resources] mode: rcc`` in
+``BlocksScreen.cfg`` or the ``BLOCKSSCREEN_RESOURCES`` environment
+variable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+import typing
+
+SOURCE_DIR = pathlib.Path(__file__).resolve().parent.parent / "BlocksScreen"
+
+# Runs in a fresh interpreter, prints a JSON result line
+_PROBE = """
+import json, time
+start = time.perf_counter()
+from PyQt6 import QtCore
+from lib.resource_loader import load_resources
+loaded = load_resources({mode!r})
+elapsed = time.perf_counter() - start
+rss = 0
+with open("/proc/self/status") as status:
+    for line in status:
+        if line.startswith("VmRSS:"):
+            rss = int(line.split()[1])
+print(json.dumps({{
+    "seconds": elapsed,
+    "rss_kib": rss,
+    "loaded": loaded,
+    "resource_ok": QtCore.QFile.exists(":/ui/media/btn_icons/back.svg"),
+}}))
+"""
+
+
+def build() -> None:
+    """Write the ``.rcc`` bundles"""
+    sys.path.insert(0, str(SOURCE_DIR))
+    from lib import resource_loader
+
+    for bundle in resource_loader.BUNDLES:
+        module = importlib.import_module(
+            f"{resource_loader.RESOURCE_PACKAGE}.{bundle}_rc"
+        )
+        path = resource_loader.rcc_path(bundle)
+        size = resource_loader.write_rcc(module, path)
+        print(f"  {path.relative_to(SOURCE_DIR.parent)}  {size / 1024:.0f} KiB")
+
+
+def _probe(mode: str) -> dict[str, typing.Any]:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(mode=mode)],
+        cwd=SOURCE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench(runs: int) -> None:
+    """Print the median load time and resident memory of each mode"""
+    for mode in ("python", "rcc"):
+        results = [_probe(mode) for _ in range(runs)]
+        used = sorted(set(results[-1]["loaded"].values()))
+        print(
+            f"{mode:>6}: {statistics.median(r['seconds'] for r in results) * 1e3:7.1f}"
+            f" ms  {statistics.median(r['rss_kib'] for r in results) / 1024:6.1f} MiB"
+            f"  loaded as {'/'.join(used)}"
+            f"  resources {'ok' if results[-1]['resource_ok'] else 'MISSING'}"
+        )
+
+
+def main(argv: typing.Optional[list[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build", help="Write the .rcc bundles")
+    bench_parser = commands.add_parser("bench", help="Compare both modes")
+    bench_parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        build()
+    else:
+        bench(args.runs)
+
+
+if __name__ == "__main__":
+    main()